@@ -1,4 +1,5 @@
 import asyncio
+import codecs
 import copy
 import enum
 import json
@@ -6,6 +7,11 @@ import logging
 import os
 import tempfile
 import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from deprecated import deprecated
 
 from astrbot.core.utils.astrbot_path import get_astrbot_data_path
 from astrbot.core.utils.auth_password import (
@@ -22,6 +28,67 @@ DASHBOARD_INITIAL_PASSWORD_ENV = "ASTRBOT_DASHBOARD_INITIAL_PASSWORD"
 DASHBOARD_RESET_PASSWORD_ENV = "ASTRBOT_RESET_DASHBOARD_PASSWORD"
 logger = logging.getLogger("astrbot")
 
+# abspath -> (stat key, file content without BOM), least recently used first
+_LOADED_CACHE: OrderedDict[str, tuple[tuple[int, ...], bytes]] = OrderedDict()
+_LOADED_CACHE_MAX_ENTRIES = 64
+_LOADED_CACHE_LOCK = threading.Lock()
+
+
+def _stat_key(stat: os.stat_result) -> tuple[int, ...]:
+    """Build the cache validation key for a config file.
+
+    ``st_ino`` catches atomic replaces and ``st_ctime_ns`` catches rewrites
+    whose size and (restored or coarse) mtime are unchanged.
+    """
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+
+
+def _load_raw(path: str) -> dict:
+    """Load and parse a config file, skipping the read when it is unchanged.
+
+    The raw file content is cached by inode, mtime, ctime and size. A hit only
+    re-parses the cached bytes, so every caller still gets an independent dict.
+    The cache keeps at most ``_LOADED_CACHE_MAX_ENTRIES`` paths.
+
+    Args:
+        path: Path of the JSON config file.
+
+    Returns:
+        The parsed configuration.
+    """
+    abspath = os.path.abspath(path)
+    key = _stat_key(os.stat(abspath))
+    with _LOADED_CACHE_LOCK:
+        cached = _LOADED_CACHE.get(abspath)
+        if cached is not None and cached[0] == key:
+            _LOADED_CACHE.move_to_end(abspath)
+            return json.loads(cached[1])
+
+    with open(abspath, "rb") as f:
+        key = _stat_key(os.fstat(f.fileno()))
+        data = f.read()
+    # Handle UTF-8 BOM if present
+    while data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8) :]
+    with _LOADED_CACHE_LOCK:
+        _LOADED_CACHE[abspath] = (key, data)
+        _LOADED_CACHE.move_to_end(abspath)
+        while len(_LOADED_CACHE) > _LOADED_CACHE_MAX_ENTRIES:
+            _LOADED_CACHE.popitem(last=False)
+    return json.loads(data)
+
+
+def _invalidate_loaded_cache(path: str) -> None:
+    with _LOADED_CACHE_LOCK:
+        _LOADED_CACHE.pop(os.path.abspath(path), None)
+
+
+def _write_all(fd: int, payload: bytes) -> None:
+    """Write the whole payload to a raw file descriptor."""
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view) :]
+
 
 class RateLimitStrategy(enum.Enum):
     STALL = "stall"
@@ -32,7 +99,7 @@ class AstrBotConfig(dict):
     """从配置文件中加载的配置，支持直接通过点号操作符访问根配置项。
 
     - 初始化时会将传入的 default_config 与配置文件进行比对，如果配置文件中缺少配置项则会自动插入默认值并进行一次写入操作。会递归检查配置项。
-    - 如果配置文件路径对应的文件不存在，则会自动创建并写入默认配置。
+    - 如果配置文件路径对应的文件不存在，则会自动创建并写入默认配置；auto_create 为 False 时改为抛出 FileNotFoundError。
     - 如果传入了 schema，将会通过 schema 解析出 default_config，此时传入的 default_config 会被忽略。
     """
 
@@ -45,6 +112,7 @@ class AstrBotConfig(dict):
         config_path: str = ASTRBOT_CONFIG_PATH,
         default_config: dict = DEFAULT_CONFIG,
         schema: dict | None = None,
+        auto_create: bool = True,
     ) -> None:
         super().__init__()
 
@@ -56,22 +124,22 @@ class AstrBotConfig(dict):
         object.__setattr__(self, "_save_commit_lock", threading.Lock())
         object.__setattr__(self, "_save_revision", 0)
         object.__setattr__(self, "_save_committed_revision", 0)
+        object.__setattr__(self, "_batch_depth", 0)
+        object.__setattr__(self, "_batch_dirty_indent", None)
+        object.__setattr__(self, "_last_written", None)
 
         if schema:
             default_config = self._config_schema_to_default_config(schema)
 
-        if not self.check_exist():
+        if not self.exists(config_path):
             """不存在时载入默认配置"""
+            if not auto_create:
+                raise FileNotFoundError(f"配置文件不存在: {config_path}")
             self.update(default_config)
             self.save_config(indent=4)
             object.__setattr__(self, "first_deploy", True)  # 标记第一次部署
 
-        with open(config_path, encoding="utf-8-sig") as f:
-            conf_str = f.read()
-            # Handle UTF-8 BOM if present
-            if conf_str.startswith("\ufeff"):
-                conf_str = conf_str[1:]
-            conf = json.loads(conf_str)
+        conf = _load_raw(config_path)
         dashboard_conf = conf.get("dashboard")
         stored_dashboard_password_change_required = bool(
             isinstance(dashboard_conf, dict)
@@ -149,22 +217,19 @@ class AstrBotConfig(dict):
 
         def _parse_schema(schema: dict, conf: dict) -> None:
             for k, v in schema.items():
-                if v["type"] not in DEFAULT_VALUE_MAP:
+                value_type = v["type"]
+                if value_type not in DEFAULT_VALUE_MAP:
                     raise TypeError(
-                        f"不受支持的配置类型 {v['type']}。支持的类型有：{DEFAULT_VALUE_MAP.keys()}",
+                        f"不受支持的配置类型 {value_type}。支持的类型有：{DEFAULT_VALUE_MAP.keys()}",
                     )
-                if "default" in v:
-                    default = v["default"]
-                else:
-                    default = DEFAULT_VALUE_MAP[v["type"]]
 
-                if v["type"] == "object":
+                if value_type == "object":
                     conf[k] = {}
                     _parse_schema(v["items"], conf[k])
-                elif v["type"] == "template_list":
-                    conf[k] = default
+                elif "default" in v:
+                    conf[k] = v["default"]
                 else:
-                    conf[k] = default
+                    conf[k] = DEFAULT_VALUE_MAP[value_type]
 
         _parse_schema(schema, conf)
 
@@ -238,6 +303,8 @@ class AstrBotConfig(dict):
             replace_config: Values to merge into the configuration before saving.
             indent: Number of spaces used to indent the JSON output.
         """
+        if self._defer_save(replace_config, indent):
+            return
         snapshot, revision = self._prepare_config_snapshot(replace_config)
         self._write_config_snapshot(snapshot, revision, indent)
 
@@ -252,8 +319,10 @@ class AstrBotConfig(dict):
 
         Returns:
             Whether this snapshot was committed. A newer committed snapshot supersedes
-            an older snapshot.
+            an older snapshot. Saves deferred by ``batched_update`` return False.
         """
+        if self._defer_save(replace_config, indent):
+            return False
         snapshot, revision = self._prepare_config_snapshot(replace_config)
         return await asyncio.to_thread(
             self._write_config_snapshot,
@@ -262,6 +331,51 @@ class AstrBotConfig(dict):
             indent,
         )
 
+    @contextmanager
+    def batched_update(self) -> Iterator["AstrBotConfig"]:
+        """Coalesce every save requested inside the block into one write on exit.
+
+        Nested blocks only flush when the outermost one exits. Nothing is written
+        if no save was requested inside the block, or if the block raises: the
+        pending save is dropped so a half-applied update never reaches disk.
+        """
+        with self._save_state_lock:
+            object.__setattr__(self, "_batch_depth", self._batch_depth + 1)
+        try:
+            yield self
+        except BaseException:
+            with self._save_state_lock:
+                object.__setattr__(self, "_batch_depth", self._batch_depth - 1)
+                object.__setattr__(self, "_batch_dirty_indent", None)
+            raise
+        else:
+            with self._save_state_lock:
+                depth = self._batch_depth - 1
+                object.__setattr__(self, "_batch_depth", depth)
+                indent = self._batch_dirty_indent if depth == 0 else None
+                if indent is not None:
+                    object.__setattr__(self, "_batch_dirty_indent", None)
+            if indent is not None:
+                self.save_config(indent=indent)
+
+    def _defer_save(self, replace_config: dict | None, indent: int) -> bool:
+        """Record a save requested inside ``batched_update`` instead of writing.
+
+        Args:
+            replace_config: Values to merge into the configuration right away.
+            indent: Indentation to use for the deferred write.
+
+        Returns:
+            Whether the save was deferred.
+        """
+        with self._save_state_lock:
+            if not self._batch_depth:
+                return False
+            if replace_config:
+                self.update(replace_config)
+            object.__setattr__(self, "_batch_dirty_indent", indent)
+            return True
+
     def _prepare_config_snapshot(self, replace_config: dict | None) -> tuple[dict, int]:
         """Create an isolated snapshot and allocate its save revision.
 
@@ -293,6 +407,15 @@ class AstrBotConfig(dict):
         Returns:
             Whether the snapshot replaced the current configuration file.
         """
+        payload = json.dumps(snapshot, indent=indent, ensure_ascii=False).encode(
+            "utf-8-sig"
+        )
+        with self._save_commit_lock:
+            if self._is_last_written(payload):
+                if revision <= self._save_committed_revision:
+                    return False
+                object.__setattr__(self, "_save_committed_revision", revision)
+                return True
         directory = os.path.dirname(os.path.abspath(self.config_path)) or "."
         fd, temp_path = tempfile.mkstemp(
             dir=directory,
@@ -301,13 +424,16 @@ class AstrBotConfig(dict):
         )
         committed = False
         try:
-            with os.fdopen(fd, "w", encoding="utf-8-sig") as f:
-                json.dump(snapshot, f, indent=indent, ensure_ascii=False)
-                f.flush()
-                os.fsync(f.fileno())
+            try:
+                _write_all(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
             with self._save_commit_lock:
                 if revision > self._save_committed_revision:
                     os.replace(temp_path, self.config_path)
+                    _invalidate_loaded_cache(self.config_path)
+                    self._remember_written(payload)
                     object.__setattr__(
                         self,
                         "_save_committed_revision",
@@ -322,11 +448,42 @@ class AstrBotConfig(dict):
                     pass
         return committed
 
-    def __getattr__(self, item):
+    def _remember_written(self, payload: bytes) -> None:
+        """Record the payload just committed together with the file identity.
+
+        Args:
+            payload: Bytes that now make up the configuration file.
+        """
         try:
-            return self[item]
-        except KeyError:
-            return None
+            stat = os.stat(self.config_path)
+        except OSError:
+            object.__setattr__(self, "_last_written", None)
+            return
+        object.__setattr__(self, "_last_written", (_stat_key(stat), payload))
+
+    def _is_last_written(self, payload: bytes) -> bool:
+        """Check whether the file on disk still holds exactly ``payload``.
+
+        The file counts as unchanged only if it is the same file we last wrote,
+        so edits made outside this instance are never masked.
+
+        Args:
+            payload: Serialized configuration about to be written.
+
+        Returns:
+            Whether writing ``payload`` would leave the file unchanged.
+        """
+        last_written = self._last_written
+        if last_written is None or last_written[1] != payload:
+            return False
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return False
+        return last_written[0] == _stat_key(stat)
+
+    def __getattr__(self, item):
+        return self.get(item)
 
     def __delattr__(self, key) -> None:
         try:
@@ -338,7 +495,15 @@ class AstrBotConfig(dict):
     def __setattr__(self, key, value) -> None:
         self[key] = value
 
-    def check_exist(self) -> bool:
-        if not self.config_path:  # 加判空
+    @staticmethod
+    def exists(config_path: str) -> bool:
+        """只检查配置文件是否存在，不会创建文件。"""
+        if not config_path:  # 加判空
             return False
-        return os.path.exists(self.config_path)
+        return os.path.exists(config_path)
+
+    @deprecated(
+        reason="Use AstrBotConfig.exists(config_path) instead", version="4.26.7"
+    )
+    def check_exist(self) -> bool:
+        return self.exists(self.config_path)
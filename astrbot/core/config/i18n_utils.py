@@ -6,6 +6,10 @@
 
 from typing import Any
 
+# 需要替换为国际化键的属性，按写入结果的顺序排列
+_I18N_ATTRS: tuple[str, ...] = ("description", "hint", "labels", "name")
+_I18N_ATTR_SET: frozenset[str] = frozenset(_I18N_ATTRS)
+
 
 class ConfigMetadataI18n:
     """配置元数据国际化转换器"""
@@ -30,66 +34,69 @@ class ConfigMetadataI18n:
             return f"{group}.{section}.{attr}"
 
     @staticmethod
-    def convert_to_i18n_keys(metadata: dict[str, Any]) -> dict[str, Any]:
+    def _convert_items(
+        group: str, section: str, items: dict[str, Any]
+    ) -> dict[str, Any]:
         """
-        将配置元数据转换为使用国际化键
+        将配置节下的字段（含嵌套的 items / template_schema）转换为国际化键
 
-        Args:
-            metadata: 原始配置元数据字典
-
-        Returns:
-            使用国际化键的配置元数据字典
+        使用显式栈迭代遍历，避免深层嵌套时的递归开销。
         """
-        result = {}
-
-        def convert_items(
-            group: str, section: str, items: dict[str, Any], prefix: str = ""
-        ) -> dict[str, Any]:
-            items_result: dict[str, Any] = {}
-
-            for field_key, field_data in items.items():
+        root: dict[str, Any] = {}
+        stack: list[tuple[dict[str, Any], dict[str, Any], str]] = [(items, root, "")]
+        while stack:
+            source, target, prefix = stack.pop()
+            for field_key, field_data in source.items():
                 if not isinstance(field_data, dict):
-                    items_result[field_key] = field_data
+                    target[field_key] = field_data
                     continue
 
-                field_name = field_key
-                field_path = f"{prefix}.{field_name}" if prefix else field_name
+                field_path = f"{prefix}.{field_key}" if prefix else field_key
+                key_prefix = f"{group}.{section}.{field_path}"
 
                 field_result = {
                     key: value
                     for key, value in field_data.items()
-                    if key not in {"description", "hint", "labels", "name"}
+                    if key not in _I18N_ATTR_SET
                 }
-
-                if "description" in field_data:
-                    field_result["description"] = (
-                        f"{group}.{section}.{field_path}.description"
-                    )
-                if "hint" in field_data:
-                    field_result["hint"] = f"{group}.{section}.{field_path}.hint"
-                if "labels" in field_data:
-                    field_result["labels"] = f"{group}.{section}.{field_path}.labels"
-                if "name" in field_data:
-                    field_result["name"] = f"{group}.{section}.{field_path}.name"
+                for attr in _I18N_ATTRS:
+                    if attr in field_data:
+                        field_result[attr] = f"{key_prefix}.{attr}"
 
                 if "items" in field_data and isinstance(field_data["items"], dict):
-                    field_result["items"] = convert_items(
-                        group, section, field_data["items"], field_path
+                    field_result["items"] = {}
+                    stack.append(
+                        (field_data["items"], field_result["items"], field_path)
                     )
 
                 if "template_schema" in field_data and isinstance(
                     field_data["template_schema"], dict
                 ):
-                    field_result["template_schema"] = convert_items(
-                        group,
-                        section,
-                        field_data["template_schema"],
-                        f"{field_path}.template_schema",
+                    field_result["template_schema"] = {}
+                    stack.append(
+                        (
+                            field_data["template_schema"],
+                            field_result["template_schema"],
+                            f"{field_path}.template_schema",
+                        )
                     )
 
-                items_result[field_key] = field_result
+                target[field_key] = field_result
 
-            return items_result
+        return root
+
+    @staticmethod
+    def convert_to_i18n_keys(metadata: dict[str, Any]) -> dict[str, Any]:
+        """
+        将配置元数据转换为使用国际化键
+
+        Args:
+            metadata: 原始配置元数据字典
+
+        Returns:
+            使用国际化键的配置元数据字典
+        """
+        result = {}
 
         for group_key, group_data in metadata.items():
             group_result = {
@@ -101,7 +108,7 @@ class ConfigMetadataI18n:
                 section_result = {
                     key: value
                     for key, value in section_data.items()
-                    if key not in {"description", "hint", "labels", "name"}
+                    if key not in _I18N_ATTR_SET
                 }
                 section_result["description"] = f"{group_key}.{section_key}.description"
 
@@ -109,7 +116,7 @@ class ConfigMetadataI18n:
                     section_result["hint"] = f"{group_key}.{section_key}.hint"
 
                 if "items" in section_data and isinstance(section_data["items"], dict):
-                    section_result["items"] = convert_items(
+                    section_result["items"] = ConfigMetadataI18n._convert_items(
                         group_key, section_key, section_data["items"]
                     )
 
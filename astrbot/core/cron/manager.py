@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import json
 import re
 from collections.abc import Awaitable, Callable
@@ -88,6 +89,20 @@ def _normalize_crontab_day_of_week(day_of_week: str) -> str:
     return ",".join(normalized_parts)
 
 
+@functools.lru_cache(maxsize=256)
+def _crontab_trigger(cron_expression: str, tzinfo: ZoneInfo | None) -> CronTrigger:
+    """Build an APScheduler trigger from a standard five-part crontab expression.
+
+    Triggers are immutable, so jobs sharing an expression and timezone share a
+    single parsed trigger.
+    """
+    minute, hour, day, month, day_of_week = cron_expression.split()
+    normalized_cron_expression = " ".join(
+        [minute, hour, day, month, _normalize_crontab_day_of_week(day_of_week)]
+    )
+    return CronTrigger.from_crontab(normalized_cron_expression, timezone=tzinfo)
+
+
 class CronJobSchedulingError(Exception):
     """Raised when a cron job fails to be scheduled."""
 
@@ -244,19 +259,7 @@ class CronJobManager:
             else:
                 if not job.cron_expression:
                     raise ValueError("recurring job missing cron_expression")
-                minute, hour, day, month, day_of_week = job.cron_expression.split()
-                normalized_cron_expression = " ".join(
-                    [
-                        minute,
-                        hour,
-                        day,
-                        month,
-                        _normalize_crontab_day_of_week(day_of_week),
-                    ]
-                )
-                trigger = CronTrigger.from_crontab(
-                    normalized_cron_expression, timezone=tzinfo
-                )
+                trigger = _crontab_trigger(job.cron_expression, tzinfo)
             self.scheduler.add_job(
                 self._run_job,
                 id=job.job_id,
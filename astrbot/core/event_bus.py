@@ -39,19 +39,23 @@ class EventBus:
     async def dispatch(self) -> None:
         while True:
             event: AstrMessageEvent = await self.event_queue.get()
-            conf_info = self.astrbot_config_mgr.get_conf_info(event.unified_msg_origin)
-            conf_id = conf_info["id"]
-            conf_name = conf_info.get("name") or conf_id
-            self._print_event(event, conf_name)
-            scheduler = self.pipeline_scheduler_mapping.get(conf_id)
-            if not scheduler:
-                logger.error(
-                    f"PipelineScheduler not found for id: {conf_id}, event ignored."
-                )
-                continue
-            task = asyncio.create_task(scheduler.execute(event))
-            self._pending_tasks.add(task)
-            task.add_done_callback(self._on_task_done)
+            self._dispatch_event(event)
+
+    def _dispatch_event(self, event: AstrMessageEvent) -> None:
+        """将单个事件交给对应配置的 pipeline 调度器, 以后台任务执行"""
+        conf_info = self.astrbot_config_mgr.get_conf_info(event.unified_msg_origin)
+        conf_id = conf_info["id"]
+        conf_name = conf_info.get("name") or conf_id
+        self._print_event(event, conf_name)
+        scheduler = self.pipeline_scheduler_mapping.get(conf_id)
+        if not scheduler:
+            logger.error(
+                f"PipelineScheduler not found for id: {conf_id}, event ignored."
+            )
+            return
+        task = asyncio.create_task(scheduler.execute(event))
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._on_task_done)
 
     def _on_task_done(self, task: asyncio.Task) -> None:
         """pipeline 任务结束回调: 移除强引用并暴露未捕获的异常"""
@@ -69,13 +73,25 @@ class EventBus:
             event (AstrMessageEvent): 事件对象
 
         """
+        sender_name = event.get_sender_name()
         # 如果有发送者名称: [平台名] 发送者名称/发送者ID: 消息概要
-        if event.get_sender_name():
+        if sender_name:
             logger.info(
-                f"[{conf_name}] [{event.get_platform_id()}({event.get_platform_name()})] {event.get_sender_name()}/{event.get_sender_id()}: {event.get_message_outline()}",
+                "[%s] [%s(%s)] %s/%s: %s",
+                conf_name,
+                event.get_platform_id(),
+                event.get_platform_name(),
+                sender_name,
+                event.get_sender_id(),
+                event.get_message_outline(),
             )
         # 没有发送者名称: [平台名] 发送者ID: 消息概要
         else:
             logger.info(
-                f"[{conf_name}] [{event.get_platform_id()}({event.get_platform_name()})] {event.get_sender_id()}: {event.get_message_outline()}",
+                "[%s] [%s(%s)] %s: %s",
+                conf_name,
+                event.get_platform_id(),
+                event.get_platform_name(),
+                event.get_sender_id(),
+                event.get_message_outline(),
             )
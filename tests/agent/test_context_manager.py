@@ -5,8 +5,6 @@ from pathlib import Path
 from typing import Literal
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 # Add parent directory to path to avoid circular import issues
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -94,7 +92,6 @@ class TestContextManager:
 
         assert isinstance(manager.compressor, TruncateByTurnsCompressor)
 
-    @pytest.mark.asyncio
     async def test_llm_compressor_keeps_history_when_summary_is_empty(self):
         from astrbot.core.agent.context.compressor import LLMSummaryCompressor
 
@@ -113,7 +110,6 @@ class TestContextManager:
             "LLM context compression returned an empty summary."
         )
 
-    @pytest.mark.asyncio
     async def test_llm_compressor_handles_textpart_content(self):
         from astrbot.core.agent.context.compressor import LLMSummaryCompressor
 
@@ -153,7 +149,6 @@ class TestContextManager:
         assert "Hello" in result[0].content
         assert result[-1].content == [TextPart(text="Sure")]
 
-    @pytest.mark.asyncio
     async def test_llm_compressor_preserves_system_and_pads_before_instruction(self):
         from astrbot.core.agent.context.compressor import LLMSummaryCompressor
 
@@ -186,7 +181,6 @@ class TestContextManager:
         assert result[0] is messages[0]
         assert result[-1] is messages[-1]
 
-    @pytest.mark.asyncio
     async def test_llm_compressor_summarizes_single_long_round(self):
         from astrbot.core.agent.context.compressor import LLMSummaryCompressor
 
@@ -229,7 +223,6 @@ class TestContextManager:
         assert all(original not in result for original in messages)
         assert len(result) == 2
 
-    @pytest.mark.asyncio
     async def test_llm_compressor_preserves_active_user_request(self):
         from astrbot.core.agent.context.compressor import LLMSummaryCompressor
 
@@ -255,7 +248,6 @@ class TestContextManager:
         )
         assert result[-1] is messages[2]
 
-    @pytest.mark.asyncio
     async def test_llm_compressor_does_not_summarize_only_active_user_request(self):
         from astrbot.core.agent.context.compressor import LLMSummaryCompressor
 
@@ -272,7 +264,6 @@ class TestContextManager:
         assert result == messages
         assert provider.last_text_chat_kwargs is None
 
-    @pytest.mark.asyncio
     async def test_llm_compressor_summarizes_system_plus_single_completed_round(self):
         from astrbot.core.agent.context.compressor import LLMSummaryCompressor
 
@@ -299,7 +290,6 @@ class TestContextManager:
         assert result[1].role == "user"
         assert result[2].role == "assistant"
 
-    @pytest.mark.asyncio
     async def test_llm_compressor_sanitizes_context_for_text_only_provider(self):
         from astrbot.core.agent.context.compressor import LLMSummaryCompressor
 
@@ -349,7 +339,6 @@ class TestContextManager:
             "content": "[Tool result]\ntool output",
         }
 
-    @pytest.mark.asyncio
     async def test_llm_compressor_keeps_recent_by_token_ratio(self):
         from astrbot.core.agent.context.compressor import LLMSummaryCompressor
 
@@ -378,7 +367,6 @@ class TestContextManager:
 
     # ==================== Empty and Edge Cases ====================
 
-    @pytest.mark.asyncio
     async def test_process_empty_messages(self):
         """Test processing an empty message list."""
         config = ContextConfig()
@@ -388,7 +376,6 @@ class TestContextManager:
 
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_process_single_message(self):
         """Test processing a single message."""
         config = ContextConfig()
@@ -400,7 +387,6 @@ class TestContextManager:
         assert len(result) == 1
         assert result[0].content == "Hello"
 
-    @pytest.mark.asyncio
     async def test_process_with_no_limits(self):
         """Test processing when no limits are set (no truncation or compression)."""
         config = ContextConfig(max_context_tokens=0, enforce_max_turns=-1)
@@ -414,7 +400,6 @@ class TestContextManager:
 
     # ==================== Enforce Max Turns Tests ====================
 
-    @pytest.mark.asyncio
     async def test_enforce_max_turns_basic(self):
         """Test basic enforce_max_turns functionality."""
         config = ContextConfig(enforce_max_turns=3, truncate_turns=1)
@@ -427,7 +412,6 @@ class TestContextManager:
         # Should keep only 3 most recent turns (6 messages)
         assert len(result) <= 8  # May vary due to truncation logic
 
-    @pytest.mark.asyncio
     async def test_enforce_max_turns_zero(self):
         """Test enforce_max_turns with value 0 (should keep nothing)."""
         config = ContextConfig(enforce_max_turns=0, truncate_turns=1)
@@ -439,7 +423,6 @@ class TestContextManager:
         # Should result in empty or minimal message list
         assert len(result) <= 2
 
-    @pytest.mark.asyncio
     async def test_enforce_max_turns_negative(self):
         """Test enforce_max_turns with -1 (no limit)."""
         config = ContextConfig(enforce_max_turns=-1)
@@ -450,7 +433,6 @@ class TestContextManager:
 
         assert len(result) == 20
 
-    @pytest.mark.asyncio
     async def test_enforce_max_turns_with_system_messages(self):
         """Test enforce_max_turns preserves system messages."""
         config = ContextConfig(enforce_max_turns=2, truncate_turns=1)
@@ -469,7 +451,6 @@ class TestContextManager:
 
     # ==================== Token-based Compression Tests ====================
 
-    @pytest.mark.asyncio
     async def test_token_compression_not_triggered_below_threshold(self):
         """Test that compression is not triggered below threshold."""
         config = ContextConfig(max_context_tokens=1000)
@@ -492,7 +473,6 @@ class TestContextManager:
                 mock_compress.assert_not_called()
                 assert result == messages
 
-    @pytest.mark.asyncio
     async def test_token_compression_triggered_above_threshold(self):
         """Test that compression is triggered above threshold."""
         config = ContextConfig(max_context_tokens=100, truncate_turns=1)
@@ -529,7 +509,6 @@ class TestContextManager:
         # Result should be the compressed version
         assert len(result) <= len(messages)
 
-    @pytest.mark.asyncio
     async def test_token_compression_with_zero_max_tokens(self):
         """Test that compression is skipped when max_context_tokens is 0."""
         config = ContextConfig(max_context_tokens=0)
@@ -546,7 +525,6 @@ class TestContextManager:
             mock_compress.assert_not_called()
             assert result == messages
 
-    @pytest.mark.asyncio
     async def test_token_compression_with_negative_max_tokens(self):
         """Test that compression is skipped when max_context_tokens is negative."""
         config = ContextConfig(max_context_tokens=-100)
@@ -563,7 +541,6 @@ class TestContextManager:
             mock_compress.assert_not_called()
             assert result == messages
 
-    @pytest.mark.asyncio
     async def test_double_check_after_compression(self):
         """Test that halving is applied if still over threshold after compression."""
         config = ContextConfig(max_context_tokens=100)
@@ -591,7 +568,6 @@ class TestContextManager:
 
     # ==================== Combined Truncation and Compression Tests ====================
 
-    @pytest.mark.asyncio
     async def test_combined_enforce_turns_and_token_limit(self):
         """Test combining enforce_max_turns and token limit."""
         config = ContextConfig(
@@ -607,7 +583,6 @@ class TestContextManager:
         # Should be truncated by both mechanisms
         assert len(result) < 30
 
-    @pytest.mark.asyncio
     async def test_sequential_processing_order(self):
         """Test that enforce_max_turns happens before token compression."""
         config = ContextConfig(enforce_max_turns=5, max_context_tokens=1000)
@@ -628,7 +603,6 @@ class TestContextManager:
 
     # ==================== Error Handling Tests ====================
 
-    @pytest.mark.asyncio
     async def test_error_handling_returns_original_messages(self):
         """Test that errors during processing return original messages."""
         config = ContextConfig(max_context_tokens=100)
@@ -645,7 +619,6 @@ class TestContextManager:
             # Should return original messages despite error
             assert result == messages
 
-    @pytest.mark.asyncio
     async def test_error_handling_logs_exception(self):
         """Test that errors are logged."""
         config = ContextConfig(max_context_tokens=100)
@@ -670,7 +643,6 @@ class TestContextManager:
 
     # ==================== Multi-modal Content Tests ====================
 
-    @pytest.mark.asyncio
     async def test_process_messages_with_textpart_content(self):
         """Test processing messages with TextPart content."""
         config = ContextConfig()
@@ -686,7 +658,6 @@ class TestContextManager:
         assert len(result) == 2
         assert result == messages
 
-    @pytest.mark.asyncio
     async def test_token_counting_with_multimodal_content(self):
         """Test token counting works with multi-modal content."""
         config = ContextConfig(max_context_tokens=50)
@@ -707,7 +678,6 @@ class TestContextManager:
 
     # ==================== Tool Calls Tests ====================
 
-    @pytest.mark.asyncio
     async def test_process_messages_with_tool_calls(self):
         """Test processing messages with tool calls."""
         config = ContextConfig()
@@ -734,7 +704,6 @@ class TestContextManager:
 
     # ==================== Compressor should_compress Tests ====================
 
-    @pytest.mark.asyncio
     async def test_should_compress_empty_messages(self):
         """Test should_compress with empty messages."""
         config = ContextConfig(max_context_tokens=100)
@@ -744,7 +713,6 @@ class TestContextManager:
         needs_compression = manager.compressor.should_compress([], 0, 100)
         assert not needs_compression
 
-    @pytest.mark.asyncio
     async def test_should_compress_below_threshold(self):
         """Test should_compress when below compression threshold."""
         config = ContextConfig(max_context_tokens=1000)
@@ -756,7 +724,6 @@ class TestContextManager:
         needs_compression = manager.compressor.should_compress(messages, tokens, 1000)
         assert not needs_compression
 
-    @pytest.mark.asyncio
     async def test_should_compress_above_threshold(self):
         """Test should_compress when above compression threshold."""
         config = ContextConfig(max_context_tokens=100)
@@ -804,7 +771,6 @@ class TestContextManager:
 
     # ==================== Complex Scenarios ====================
 
-    @pytest.mark.asyncio
     async def test_multiple_compression_cycles(self):
         """Test that compression can be triggered multiple times in sequence."""
         config = ContextConfig(max_context_tokens=50, truncate_turns=1)
@@ -820,7 +786,6 @@ class TestContextManager:
         # Each cycle should maintain or reduce message count
         assert len(result3) <= len(result2) <= len(result1)
 
-    @pytest.mark.asyncio
     async def test_alternating_roles_preserved(self):
         """Test that user/assistant alternation is preserved after processing."""
         config = ContextConfig(enforce_max_turns=3, truncate_turns=1)
@@ -835,7 +800,6 @@ class TestContextManager:
             # Should start with user
             assert non_system[0].role == "user"
 
-    @pytest.mark.asyncio
     async def test_compression_threshold_default(self):
         """Test that compression threshold is used correctly."""
         config = ContextConfig(max_context_tokens=100)
@@ -852,7 +816,6 @@ class TestContextManager:
         # Should not compress if below threshold
         assert needs_compression == (tokens > 82)
 
-    @pytest.mark.asyncio
     async def test_large_batch_processing(self):
         """Test processing a large batch of messages."""
         config = ContextConfig(
@@ -869,7 +832,6 @@ class TestContextManager:
         assert len(result) < 100
         assert len(result) > 0
 
-    @pytest.mark.asyncio
     async def test_config_persistence(self):
         """Test that config settings are respected throughout processing."""
         config = ContextConfig(
@@ -888,7 +850,6 @@ class TestContextManager:
 
     # ==================== Run Compression Tests ====================
 
-    @pytest.mark.asyncio
     async def test_run_compression_calls_compressor(self):
         """Test _run_compression calls compressor."""
         config = ContextConfig(max_context_tokens=100)
@@ -910,7 +871,6 @@ class TestContextManager:
         mock_compressor.assert_called_once_with(messages)
         assert result == compressed
 
-    @pytest.mark.asyncio
     async def test_run_compression_applies_compressor_through_process(self):
         """Test _run_compression calls compressor when needed through process()."""
         config = ContextConfig(max_context_tokens=100, truncate_turns=1)
@@ -942,7 +902,6 @@ class TestContextManager:
         mock_compressor.assert_called_once()
         assert len(result) <= len(messages)
 
-    @pytest.mark.asyncio
     async def test_llm_compression_with_mock_provider(self):
         """Test LLM compression using MockProvider."""
         mock_provider = MockProvider()
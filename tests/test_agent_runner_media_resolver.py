@@ -1,7 +1,6 @@
 import base64
 from io import BytesIO
 
-import pytest
 from PIL import Image as PILImage
 
 from astrbot.core.agent.runners.coze.coze_agent_runner import CozeAgentRunner
@@ -18,7 +17,6 @@ def _png_data_url() -> tuple[str, bytes]:
     )
 
 
-@pytest.mark.asyncio
 async def test_dify_image_upload_uses_media_resolver_for_data_url():
     image_ref, image_bytes = _png_data_url()
     captured: dict[str, object] = {}
@@ -43,7 +41,6 @@ async def test_dify_image_upload_uses_media_resolver_for_data_url():
     assert captured["file_name"] == "image.png"
 
 
-@pytest.mark.asyncio
 async def test_coze_image_upload_uses_media_resolver_for_data_url():
     image_ref, image_bytes = _png_data_url()
     captured: dict[str, bytes] = {}
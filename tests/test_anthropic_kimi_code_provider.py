@@ -174,7 +174,6 @@ def test_create_http_client_falls_back_to_global_httpx_module(monkeypatch):
     assert captured["httpx_module"] is anthropic_source.httpx
 
 
-@pytest.mark.asyncio
 async def test_anthropic_get_models_retries_transient_request_error(monkeypatch):
     monkeypatch.setattr(request_retry, "REQUEST_RETRY_WAIT_MIN_S", 0)
     monkeypatch.setattr(request_retry, "REQUEST_RETRY_WAIT_MAX_S", 0)
@@ -204,7 +203,6 @@ async def test_anthropic_get_models_retries_transient_request_error(monkeypatch)
     assert models.calls == 2
 
 
-@pytest.mark.asyncio
 async def test_text_chat_wraps_string_system_prompt_as_list(monkeypatch):
     monkeypatch.setattr(anthropic_source, "AsyncAnthropic", _FakeAsyncAnthropic)
 
@@ -231,7 +229,6 @@ async def test_text_chat_wraps_string_system_prompt_as_list(monkeypatch):
     assert captured_payloads["system"] == [{"type": "text", "text": "You are helpful."}]
 
 
-@pytest.mark.asyncio
 async def test_text_chat_passes_through_list_system_prompt(monkeypatch):
     monkeypatch.setattr(anthropic_source, "AsyncAnthropic", _FakeAsyncAnthropic)
 
@@ -702,7 +699,6 @@ def _setup_provider_with_mock_client(monkeypatch) -> anthropic_source.ProviderAn
     return provider
 
 
-@pytest.mark.asyncio
 async def test_query_handles_none_usage_when_content_filtered(monkeypatch):
     provider = _setup_provider_with_mock_client(monkeypatch)
     content_filter_message = (
@@ -736,7 +732,6 @@ async def test_query_handles_none_usage_when_content_filtered(monkeypatch):
     assert llm_response.usage.output == 0
 
 
-@pytest.mark.asyncio
 async def test_tool_choice_auto_converts_to_dict(monkeypatch):
     """tool_choice='auto' 应转换为 {'type': 'auto'}"""
     provider = _setup_provider_with_mock_client(monkeypatch)
@@ -750,7 +745,6 @@ async def test_tool_choice_auto_converts_to_dict(monkeypatch):
     assert _capture_payloads_create.last_kwargs["tool_choice"] == {"type": "auto"}
 
 
-@pytest.mark.asyncio
 async def test_tool_choice_any_converts_to_dict(monkeypatch):
     """tool_choice='any' 应转换为 {'type': 'any'}"""
     provider = _setup_provider_with_mock_client(monkeypatch)
@@ -764,7 +758,6 @@ async def test_tool_choice_any_converts_to_dict(monkeypatch):
     assert _capture_payloads_create.last_kwargs["tool_choice"] == {"type": "any"}
 
 
-@pytest.mark.asyncio
 async def test_tool_choice_none_converts_to_dict(monkeypatch):
     """tool_choice='none' 应转换为 {'type': 'none'}"""
     provider = _setup_provider_with_mock_client(monkeypatch)
@@ -778,7 +771,6 @@ async def test_tool_choice_none_converts_to_dict(monkeypatch):
     assert _capture_payloads_create.last_kwargs["tool_choice"] == {"type": "none"}
 
 
-@pytest.mark.asyncio
 async def test_tool_choice_required_legacy_compat(monkeypatch):
     """tool_choice='required'(OpenAI 命名) 应兼容转换为 {'type': 'any'}"""
     provider = _setup_provider_with_mock_client(monkeypatch)
@@ -792,7 +784,6 @@ async def test_tool_choice_required_legacy_compat(monkeypatch):
     assert _capture_payloads_create.last_kwargs["tool_choice"] == {"type": "any"}
 
 
-@pytest.mark.asyncio
 async def test_tool_choice_dict_passthrough(monkeypatch):
     """tool_choice 为 dict 时应直接透传"""
     provider = _setup_provider_with_mock_client(monkeypatch)
@@ -809,7 +800,6 @@ async def test_tool_choice_dict_passthrough(monkeypatch):
     }
 
 
-@pytest.mark.asyncio
 async def test_tool_choice_default_when_not_set(monkeypatch):
     """未传 tool_choice 时，默认应为 {'type': 'auto'}"""
     provider = _setup_provider_with_mock_client(monkeypatch)
@@ -822,7 +812,6 @@ async def test_tool_choice_default_when_not_set(monkeypatch):
     assert _capture_payloads_create.last_kwargs["tool_choice"] == {"type": "auto"}
 
 
-@pytest.mark.asyncio
 async def test_tool_choice_invalid_string_falls_back_to_auto(monkeypatch):
     """无效的 tool_choice 字符串应回退为 {'type': 'auto'}"""
     provider = _setup_provider_with_mock_client(monkeypatch)
@@ -836,7 +825,6 @@ async def test_tool_choice_invalid_string_falls_back_to_auto(monkeypatch):
     assert _capture_payloads_create.last_kwargs["tool_choice"] == {"type": "auto"}
 
 
-@pytest.mark.asyncio
 async def test_tool_choice_no_tools_skips_tool_choice(monkeypatch):
     """无工具时不应设置 tool_choice"""
     provider = _setup_provider_with_mock_client(monkeypatch)
@@ -850,7 +838,6 @@ async def test_tool_choice_no_tools_skips_tool_choice(monkeypatch):
     assert "tool_choice" not in _capture_payloads_create.last_kwargs
 
 
-@pytest.mark.asyncio
 async def test_tool_choice_empty_tool_list_skips_tool_choice(monkeypatch):
     """ToolSet 存在但工具列表为空时，不应设置 tools 和 tool_choice"""
     provider = _setup_provider_with_mock_client(monkeypatch)
@@ -111,7 +111,6 @@ async def authenticated_header(
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.mark.asyncio
 async def test_api_key_scope_and_revoke(
     app: FastAPIAppAdapter, authenticated_header: dict
 ):
@@ -174,7 +173,6 @@ async def test_api_key_scope_and_revoke(
     assert revoked_access_res.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_open_send_message_with_api_key(
     app: FastAPIAppAdapter, authenticated_header: dict
 ):
@@ -200,7 +198,6 @@ async def test_open_send_message_with_api_key(
     assert send_data["status"] == "ok"
 
 
-@pytest.mark.asyncio
 async def test_open_chat_send_auto_session_id_and_username(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -288,7 +285,6 @@ async def test_open_chat_send_auto_session_id_and_username(
     assert missing_username_data["message"] == "Missing key: username"
 
 
-@pytest.mark.asyncio
 async def test_open_chat_sessions_pagination(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -353,7 +349,6 @@ async def test_open_chat_sessions_pagination(
     assert missing_username_data["message"] == "Missing key: username"
 
 
-@pytest.mark.asyncio
 async def test_open_chat_configs_list(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -383,7 +378,6 @@ async def test_open_chat_configs_list(
         assert isinstance(item["is_default"], bool)
 
 
-@pytest.mark.asyncio
 async def test_open_api_auth_validation_and_key_carriers(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -427,7 +421,6 @@ async def test_open_api_auth_validation_and_key_carriers(
         assert isinstance(data["data"]["bot_ids"], list)
 
 
-@pytest.mark.asyncio
 async def test_open_chat_send_conversation_alias_and_blank_username(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -491,7 +484,6 @@ async def test_open_chat_send_conversation_alias_and_blank_username(
     assert blank_username_data["message"] == "username is empty"
 
 
-@pytest.mark.asyncio
 async def test_open_chat_send_config_resolution(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -630,7 +622,6 @@ async def test_open_chat_send_config_resolution(
     update_route.assert_awaited()
 
 
-@pytest.mark.asyncio
 async def test_open_chat_sessions_input_validation_and_filtering(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -707,7 +698,6 @@ async def test_open_chat_sessions_input_validation_and_filtering(
     assert empty_username_data["message"] == "username is empty"
 
 
-@pytest.mark.asyncio
 async def test_open_send_message_error_paths(
     app: FastAPIAppAdapter, authenticated_header: dict
 ):
@@ -764,7 +754,6 @@ async def test_open_send_message_error_paths(
     )
 
 
-@pytest.mark.asyncio
 async def test_open_api_key_scope_normalization(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -794,7 +783,6 @@ async def test_open_api_key_scope_normalization(
     assert set(extra_scope_data["data"]["scopes"]) == {"mcp", "skill"}
 
 
-@pytest.mark.asyncio
 async def test_file_scope_is_available_for_developer_api_key(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
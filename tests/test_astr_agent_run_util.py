@@ -1,7 +1,5 @@
 from types import SimpleNamespace
 
-import pytest
-
 from astrbot.core.agent.response import AgentResponse
 from astrbot.core.astr_agent_run_util import run_agent
 from astrbot.core.message.message_event_result import MessageChain
@@ -51,7 +49,6 @@ class _MalformedStreamingErrorRunner(_StreamingErrorRunner):
         yield AgentResponse(type="err", data={})
 
 
-@pytest.mark.asyncio
 async def test_run_agent_forwards_streaming_provider_error():
     error_text = (
         "LLM 响应错误: Not found the model k2.7-code-highspeed or Permission denied"
@@ -64,7 +61,6 @@ async def test_run_agent_forwards_streaming_provider_error():
     assert chains[0].get_plain_text() == error_text
 
 
-@pytest.mark.asyncio
 async def test_run_agent_replaces_malformed_streaming_provider_error():
     runner = _MalformedStreamingErrorRunner("unused")
 
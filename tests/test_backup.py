@@ -205,7 +205,6 @@ class TestAstrBotExporter:
         assert manifest["statistics"]["main_db"]["platform_stats"] == 1
         assert manifest["statistics"]["directories"] == dir_stats
 
-    @pytest.mark.asyncio
     async def test_export_all_creates_zip(
         self, mock_main_db, temp_backup_dir, temp_data_dir
     ):
@@ -602,7 +601,6 @@ class TestAstrBotImporter:
         assert [row["id"] for row in merged_rows] == [1, 2, 4]
         assert merged_rows[0]["count"] == 7
 
-    @pytest.mark.asyncio
     async def test_import_file_not_exists(self, mock_main_db, tmp_path):
         """测试导入不存在的文件"""
         importer = AstrBotImporter(main_db=mock_main_db)
@@ -612,7 +610,6 @@ class TestAstrBotImporter:
         assert result.success is False
         assert any("不存在" in err for err in result.errors)
 
-    @pytest.mark.asyncio
     async def test_import_invalid_zip(self, mock_main_db, tmp_path):
         """测试导入无效的 ZIP 文件"""
         # 创建一个无效的文件
@@ -625,7 +622,6 @@ class TestAstrBotImporter:
         assert result.success is False
         assert any("无效" in err or "ZIP" in err for err in result.errors)
 
-    @pytest.mark.asyncio
     async def test_import_missing_manifest(self, mock_main_db, tmp_path):
         """测试导入缺少 manifest 的 ZIP 文件"""
         # 创建一个没有 manifest 的 ZIP 文件
@@ -639,7 +635,6 @@ class TestAstrBotImporter:
         assert result.success is False
         assert any("manifest" in err.lower() for err in result.errors)
 
-    @pytest.mark.asyncio
     async def test_import_major_version_mismatch(self, mock_main_db, tmp_path):
         """测试导入主版本不匹配的备份"""
         # 创建一个主版本不匹配的备份
@@ -659,7 +654,6 @@ class TestAstrBotImporter:
         assert result.success is False
         assert any("主版本不兼容" in err for err in result.errors)
 
-    @pytest.mark.asyncio
     async def test_import_replace_fails_when_clear_main_db_fails(
         self, mock_main_db, tmp_path
     ):
@@ -1042,7 +1036,6 @@ class TestModelMappings:
 class TestBackupIntegration:
     """备份集成测试"""
 
-    @pytest.mark.asyncio
     async def test_export_import_roundtrip(self, tmp_path):
         """测试导出-导入往返"""
         backup_dir = tmp_path / "backups"
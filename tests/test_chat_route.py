@@ -52,7 +52,6 @@ def _decode_sse_event(event: str) -> dict:
     return json.loads(event.removeprefix("data: ").strip())
 
 
-@pytest.mark.asyncio
 async def test_resume_chat_run_does_not_expose_service_error():
     service = SimpleNamespace(
         build_chat_run_stream=AsyncMock(
@@ -70,7 +69,6 @@ async def test_resume_chat_run_does_not_expose_service_error():
     }
 
 
-@pytest.mark.asyncio
 async def test_chat_stream_disconnect_does_not_own_run_lifecycle(
     chat_service_instance,
 ):
@@ -127,7 +125,6 @@ async def test_chat_stream_disconnect_does_not_own_run_lifecycle(
         chat_service.webchat_queue_mgr.remove_queues(session_id)
 
 
-@pytest.mark.asyncio
 async def test_resumed_stream_starts_with_full_snapshot(chat_service_instance):
     service = chat_service_instance
     session_id = "resume-session"
@@ -200,7 +197,6 @@ async def test_resumed_stream_starts_with_full_snapshot(chat_service_instance):
         chat_service.webchat_queue_mgr.remove_queues(session_id)
 
 
-@pytest.mark.asyncio
 async def test_active_chat_runs_keep_creation_order(chat_service_instance):
     service = chat_service_instance
     session_id = "ordered-runs-session"
@@ -234,7 +230,6 @@ async def test_active_chat_runs_keep_creation_order(chat_service_instance):
         chat_service.webchat_queue_mgr.remove_queues(session_id)
 
 
-@pytest.mark.asyncio
 async def test_slow_chat_run_subscriber_is_closed_at_buffer_limit(
     chat_service_instance,
 ):
@@ -269,7 +264,6 @@ async def test_slow_chat_run_subscriber_is_closed_at_buffer_limit(
         chat_service.webchat_queue_mgr.remove_queues(session_id)
 
 
-@pytest.mark.asyncio
 async def test_resume_during_attachment_save_does_not_skip_attachment(
     chat_service_instance,
 ):
@@ -349,7 +343,6 @@ async def test_resume_during_attachment_save_does_not_skip_attachment(
         chat_service.webchat_queue_mgr.remove_queues(session_id)
 
 
-@pytest.mark.asyncio
 async def test_legacy_chat_stream_keeps_existing_event_shape(chat_service_instance):
     service = chat_service_instance
     session_id = "legacy-session"
@@ -387,7 +380,6 @@ async def test_legacy_chat_stream_keeps_existing_event_shape(chat_service_instan
         chat_service.webchat_queue_mgr.remove_queues(session_id)
 
 
-@pytest.mark.asyncio
 async def test_chat_stream_forwards_normalized_request_flags(chat_service_instance):
     """Test chat requests pass normalized flags to the WebChat adapter queue."""
     service = chat_service_instance
@@ -423,7 +415,6 @@ async def test_chat_stream_forwards_normalized_request_flags(chat_service_instan
         chat_service.webchat_queue_mgr.remove_queues(session_id)
 
 
-@pytest.mark.asyncio
 async def test_chat_stream_forwards_follow_up_status_by_default(
     chat_service_instance,
 ):
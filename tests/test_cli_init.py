@@ -1,12 +1,9 @@
 import json
 
-import pytest
-
 from astrbot.cli.commands import cmd_init
 from astrbot.core.utils.auth_password import verify_dashboard_password
 
 
-@pytest.mark.asyncio
 async def test_init_without_initial_password_env_does_not_create_config(
     monkeypatch,
     tmp_path,
@@ -23,7 +20,6 @@ async def test_init_without_initial_password_env_does_not_create_config(
     assert not (tmp_path / "data" / "cmd_config.json").exists()
 
 
-@pytest.mark.asyncio
 async def test_init_uses_initial_password_env_to_create_config(
     monkeypatch,
     tmp_path,
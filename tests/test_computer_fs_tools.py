@@ -65,7 +65,6 @@ def _make_sandbox_context(
     return ContextWrapper(context=astr_ctx)
 
 
-@pytest.mark.asyncio
 async def test_sandbox_file_download_handles_windows_remote_filename(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -103,7 +102,6 @@ async def test_sandbox_file_download_handles_windows_remote_filename(
     assert sent_file.name == "report.txt"
 
 
-@pytest.mark.asyncio
 async def test_sandbox_file_download_strips_trailing_remote_slash(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -293,7 +291,6 @@ def _make_epub_bytes(*, chapter_count: int = 1) -> bytes:
     return buffer.getvalue()
 
 
-@pytest.mark.asyncio
 async def test_restricted_local_member_can_read_plugin_provided_skill(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -318,7 +315,6 @@ async def test_restricted_local_member_can_read_plugin_provided_skill(
     assert result == "# Demo Skill\n\nRead plugin docs."
 
 
-@pytest.mark.asyncio
 async def test_restricted_local_member_can_read_plugin_skill_inventory_even_if_plugin_inactive(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -343,7 +339,6 @@ async def test_restricted_local_member_can_read_plugin_skill_inventory_even_if_p
     assert result == "# Demo Skill\n"
 
 
-@pytest.mark.asyncio
 async def test_restricted_local_member_cannot_write_plugin_provided_skill(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -371,7 +366,6 @@ async def test_restricted_local_member_cannot_write_plugin_provided_skill(
     assert plugin_skill.read_text(encoding="utf-8") == "# Demo Skill\n"
 
 
-@pytest.mark.asyncio
 async def test_restricted_local_member_rejects_workspace_hardlink_alias(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -407,7 +401,6 @@ def test_detect_text_encoding_allows_utf8_probe_cut_mid_character():
     assert file_read_utils.detect_text_encoding(sample) in {"utf-8", "utf-8-sig"}
 
 
-@pytest.mark.asyncio
 async def test_file_read_tool_rejects_large_full_text_read_before_local_stream_read(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -430,7 +423,6 @@ async def test_file_read_tool_rejects_large_full_text_read_before_local_stream_r
     assert "Use `offset` and `limit`" in result
 
 
-@pytest.mark.asyncio
 async def test_file_read_tool_allows_partial_read_for_large_text_file(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -450,7 +442,6 @@ async def test_file_read_tool_allows_partial_read_for_large_text_file(
     assert result == "".join(lines[1000:1003])
 
 
-@pytest.mark.asyncio
 async def test_file_read_tool_returns_image_call_tool_result_for_images(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -471,7 +462,6 @@ async def test_file_read_tool_returns_image_call_tool_result_for_images(
     assert base64.b64decode(result.content[0].data).startswith(b"\xff\xd8\xff")
 
 
-@pytest.mark.asyncio
 async def test_file_read_tool_treats_svg_as_text(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -491,7 +481,6 @@ async def test_file_read_tool_treats_svg_as_text(
     assert result == svg_text
 
 
-@pytest.mark.asyncio
 async def test_file_read_tool_reads_pdf_via_parser(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -513,7 +502,6 @@ async def test_file_read_tool_reads_pdf_via_parser(
     assert result == "page-1\npage-2\n"
 
 
-@pytest.mark.asyncio
 async def test_file_read_tool_reads_docx_via_parser_and_magic(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -547,7 +535,6 @@ def test_is_epub_bytes_rejects_plain_zip_archive():
     assert file_read_utils._is_epub_bytes(buffer.getvalue()) is False
 
 
-@pytest.mark.asyncio
 async def test_file_read_tool_reads_epub_via_parser_and_magic(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -569,7 +556,6 @@ async def test_file_read_tool_reads_epub_via_parser_and_magic(
     assert result == "# Chapter 1\n\nParagraph 1\n"
 
 
-@pytest.mark.asyncio
 async def test_file_read_tool_stores_long_converted_document_in_workspace(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -597,7 +583,6 @@ async def test_file_read_tool_stores_long_converted_document_in_workspace(
     assert "Read or grep that file with a narrow window." in result
 
 
-@pytest.mark.asyncio
 async def test_grep_tool_applies_result_limit(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
@@ -622,7 +607,6 @@ async def test_grep_tool_applies_result_limit(
     assert "[Truncated to first 2 result groups.]" in result
 
 
-@pytest.mark.asyncio
 async def test_file_read_tool_rejects_directory_with_clear_message(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path,
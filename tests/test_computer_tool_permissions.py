@@ -1,8 +1,6 @@
 import json
 from types import SimpleNamespace
 
-import pytest
-
 from astrbot.core.agent.run_context import ContextWrapper
 from astrbot.core.tools.computer_tools.shipyard_neo.browser import BrowserExecTool
 from astrbot.core.tools.computer_tools.shipyard_neo.neo_skills import (
@@ -43,7 +41,6 @@ def _make_run_context(require_admin: bool, role: str = "member") -> ContextWrapp
     return ContextWrapper(context=astr_ctx)
 
 
-@pytest.mark.asyncio
 async def test_browser_tool_allows_non_admin_when_admin_requirement_disabled(
     monkeypatch,
 ):
@@ -63,7 +60,6 @@ async def test_browser_tool_allows_non_admin_when_admin_requirement_disabled(
     assert json.loads(result)["ok"] is True
 
 
-@pytest.mark.asyncio
 async def test_neo_skill_tool_allows_non_admin_when_admin_requirement_disabled(
     monkeypatch,
 ):
@@ -88,7 +84,6 @@ async def test_neo_skill_tool_allows_non_admin_when_admin_requirement_disabled(
     assert payload["limit"] == 5
 
 
-@pytest.mark.asyncio
 async def test_browser_tool_still_denies_non_admin_when_admin_requirement_enabled():
     result = await BrowserExecTool().call(
         _make_run_context(require_admin=True),
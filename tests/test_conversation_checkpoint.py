@@ -120,7 +120,6 @@ def test_content_part_no_save_round_trip_from_dict():
     ]
 
 
-@pytest.mark.asyncio
 async def test_provider_request_assemble_context_preserves_temp_content_part_marker():
     request = ProviderRequest(
         prompt="hello",
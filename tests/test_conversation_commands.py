@@ -7,7 +7,6 @@ from astrbot.builtin_stars.builtin_commands.commands import (
 )
 
 
-@pytest.mark.asyncio
 async def test_clear_third_party_agent_runner_state_deletes_deerflow_thread_before_local_state(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -73,7 +72,6 @@ async def test_clear_third_party_agent_runner_state_deletes_deerflow_thread_befo
     )
 
 
-@pytest.mark.asyncio
 async def test_clear_third_party_agent_runner_state_removes_local_state_when_deerflow_cleanup_fails(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -136,7 +134,6 @@ async def test_clear_third_party_agent_runner_state_removes_local_state_when_dee
     ) in calls
 
 
-@pytest.mark.asyncio
 async def test_clear_third_party_agent_runner_state_removes_local_state_when_deerflow_client_init_fails(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -395,7 +395,6 @@ async def authenticated_header(
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.mark.asyncio
 async def test_auth_login(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -432,7 +431,6 @@ async def test_auth_login(
     assert "Secure" not in jwt_cookie_header
 
 
-@pytest.mark.asyncio
 async def test_auth_login_secure_cookie_override(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -460,7 +458,6 @@ async def test_auth_login_secure_cookie_override(
     _assert_cookie_samesite_strict(jwt_cookie_header)
 
 
-@pytest.mark.asyncio
 async def test_auth_rate_limit_uses_same_bucket_across_paths(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -496,7 +493,6 @@ async def test_auth_rate_limit_uses_same_bucket_across_paths(
         cfg["trust_proxy_headers"] = tp_original
 
 
-@pytest.mark.asyncio
 async def test_auth_rate_limit_separates_different_client_ips(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -544,7 +540,6 @@ async def test_auth_rate_limit_separates_different_client_ips(
         cfg["trust_proxy_headers"] = tp_original
 
 
-@pytest.mark.asyncio
 async def test_auth_rate_limit_applies_to_v1_login(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -584,7 +579,6 @@ async def test_auth_rate_limit_applies_to_v1_login(
         cfg["trust_proxy_headers"] = tp_original
 
 
-@pytest.mark.asyncio
 async def test_auth_rate_limit_ignores_proxy_headers_by_default(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -625,7 +619,6 @@ async def test_auth_rate_limit_ignores_proxy_headers_by_default(
         cfg["trust_proxy_headers"] = tp_original
 
 
-@pytest.mark.asyncio
 async def test_auth_login_requires_totp_when_enabled_and_not_trusted(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -661,7 +654,6 @@ async def test_auth_login_requires_totp_when_enabled_and_not_trusted(
         )
 
 
-@pytest.mark.asyncio
 async def test_auth_login_accepts_valid_totp_code(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -697,7 +689,6 @@ async def test_auth_login_accepts_valid_totp_code(
         )
 
 
-@pytest.mark.asyncio
 async def test_auth_login_rejects_invalid_totp_code(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -735,7 +726,6 @@ async def test_auth_login_rejects_invalid_totp_code(
         )
 
 
-@pytest.mark.asyncio
 async def test_auth_login_with_recovery_code_disables_totp(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -775,7 +765,6 @@ async def test_auth_login_with_recovery_code_disables_totp(
         )
 
 
-@pytest.mark.asyncio
 async def test_auth_login_sets_trusted_device_cookie_when_flag_true(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -824,7 +813,6 @@ async def test_auth_login_sets_trusted_device_cookie_when_flag_true(
         )
 
 
-@pytest.mark.asyncio
 async def test_auth_login_skips_totp_when_trusted_cookie_valid(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -871,7 +859,6 @@ async def test_auth_login_skips_totp_when_trusted_cookie_valid(
         )
 
 
-@pytest.mark.asyncio
 async def test_config_save_requires_two_factor_for_protected_totp_changes(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -917,7 +904,6 @@ async def test_config_save_requires_two_factor_for_protected_totp_changes(
         )
 
 
-@pytest.mark.asyncio
 async def test_config_save_accepts_totp_code_for_protected_totp_changes(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -964,7 +950,6 @@ async def test_config_save_accepts_totp_code_for_protected_totp_changes(
         )
 
 
-@pytest.mark.asyncio
 async def test_config_save_rejects_recovery_code_for_protected_totp_changes(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -1013,7 +998,6 @@ async def test_config_save_rejects_recovery_code_for_protected_totp_changes(
         )
 
 
-@pytest.mark.asyncio
 async def test_auth_totp_setup_with_valid_code_returns_recovery_code(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -1033,7 +1017,6 @@ async def test_auth_totp_setup_with_valid_code_returns_recovery_code(
     assert data["data"]["recovery_code_hash"]
 
 
-@pytest.mark.asyncio
 async def test_md5_dashboard_password_keeps_md5_auth_until_edit(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -1131,7 +1114,6 @@ async def test_md5_dashboard_password_keeps_md5_auth_until_edit(
         )
 
 
-@pytest.mark.asyncio
 async def test_md5_login_failure_includes_upgrade_faq_hint(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -1173,7 +1155,6 @@ async def test_md5_login_failure_includes_upgrade_faq_hint(
         )
 
 
-@pytest.mark.asyncio
 async def test_password_storage_flag_repairs_after_rollback_clears_pbkdf2(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -1221,7 +1202,6 @@ async def test_password_storage_flag_repairs_after_rollback_clears_pbkdf2(
         )
 
 
-@pytest.mark.asyncio
 async def test_version_endpoints_use_md5_password_hint(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -1249,7 +1229,6 @@ async def test_version_endpoints_use_md5_password_hint(
     assert _removed_md5_hint_alias_key() not in data["data"]
 
 
-@pytest.mark.asyncio
 async def test_public_versions_endpoint_does_not_require_auth(app: FastAPIAppAdapter):
     test_client = app.test_client()
 
@@ -1287,7 +1266,6 @@ def test_password_hash_lookup_falls_back_to_md5_when_pbkdf2_missing(
         core_lifecycle_td.astrbot_config["dashboard"] = dashboard_config
 
 
-@pytest.mark.asyncio
 async def test_generated_password_requires_password_change_until_changed(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -1360,7 +1338,6 @@ async def test_generated_password_requires_password_change_until_changed(
         )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("endpoint", "method"),
     [
@@ -1415,7 +1392,6 @@ async def test_account_edit_rejects_invalid_username(
         )
 
 
-@pytest.mark.asyncio
 async def test_account_edit_trims_valid_username(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -1459,7 +1435,6 @@ async def test_account_edit_trims_valid_username(
         )
 
 
-@pytest.mark.asyncio
 async def test_local_setup_can_skip_default_password_auth(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -1520,7 +1495,6 @@ async def test_local_setup_can_skip_default_password_auth(
         )
 
 
-@pytest.mark.asyncio
 async def test_authenticated_default_password_login_can_complete_setup(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -1581,7 +1555,6 @@ async def test_authenticated_default_password_login_can_complete_setup(
         )
 
 
-@pytest.mark.asyncio
 async def test_setup_skip_requires_local_host(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -1620,7 +1593,6 @@ async def test_setup_skip_requires_local_host(
         )
 
 
-@pytest.mark.asyncio
 async def test_plugin_web_api_supports_dynamic_route(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -1673,7 +1645,6 @@ def test_plugin_page_content_path_escapes_plugin_name():
     )
 
 
-@pytest.mark.asyncio
 async def test_plugin_get_excludes_scanned_pages(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -1695,7 +1666,6 @@ async def test_plugin_get_excludes_scanned_pages(
     assert PLUGIN_PAGE_DEMO_PAGE_NAME in plugin["pages"]
 
 
-@pytest.mark.asyncio
 async def test_plugin_detail_includes_scanned_page_component(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -1729,7 +1699,6 @@ async def test_plugin_detail_includes_scanned_page_component(
     ]
 
 
-@pytest.mark.asyncio
 async def test_plugin_page_entry_returns_signed_content_path(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -1755,7 +1724,6 @@ async def test_plugin_page_entry_returns_signed_content_path(
     assert "asset_token=" in data["data"]["content_path"]
 
 
-@pytest.mark.asyncio
 async def test_plugin_page_content_requires_auth(
     app: FastAPIAppAdapter,
     registered_plugin_page: StarMetadata,
@@ -1769,7 +1737,6 @@ async def test_plugin_page_content_requires_auth(
     assert data["status"] == "error"
 
 
-@pytest.mark.asyncio
 async def test_plugin_page_content_supports_cookie_auth(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -1823,7 +1790,6 @@ async def test_plugin_page_content_supports_cookie_auth(
     assert "AstrBotPluginPage" in bridge_content
 
 
-@pytest.mark.asyncio
 async def test_plugin_page_content_issues_scoped_asset_token(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -1895,7 +1861,6 @@ async def test_plugin_page_content_issues_scoped_asset_token(
     assert cross_page_response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_plugin_page_bridge_sdk_includes_is_dark_when_theme_param_provided(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -1946,7 +1911,6 @@ async def test_plugin_page_bridge_sdk_includes_is_dark_when_theme_param_provided
     assert '"isDark": false' in invalid_js
 
 
-@pytest.mark.asyncio
 async def test_plugin_page_content_propagates_theme_in_rewritten_urls(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2008,7 +1972,6 @@ async def test_plugin_page_content_propagates_theme_in_rewritten_urls(
     assert "color-scheme" not in no_theme_html
 
 
-@pytest.mark.asyncio
 async def test_plugin_page_assets_require_dashboard_auth(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2040,7 +2003,6 @@ async def test_plugin_page_assets_require_dashboard_auth(
     assert bridge_response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_plugin_page_content_blocks_path_traversal(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2054,7 +2016,6 @@ async def test_plugin_page_content_blocks_path_traversal(
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_logout_clears_cookie_for_plugin_page(
     app: FastAPIAppAdapter,
     core_lifecycle_td: AstrBotCoreLifecycle,
@@ -2101,7 +2062,6 @@ async def test_logout_clears_cookie_for_plugin_page(
     assert asset_response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_get_stat(app: FastAPIAppAdapter, authenticated_header: dict):
     test_client = app.test_client()
     response = await test_client.get("/api/stat/get")
@@ -2112,7 +2072,6 @@ async def test_get_stat(app: FastAPIAppAdapter, authenticated_header: dict):
     assert data["status"] == "ok" and "platform" in data["data"]
 
 
-@pytest.mark.asyncio
 async def test_dashboard_ssl_missing_cert_and_key_falls_back_to_http(
     core_lifecycle_td: AstrBotCoreLifecycle,
     monkeypatch,
@@ -2164,7 +2123,6 @@ async def test_dashboard_ssl_missing_cert_and_key_falls_back_to_http(
         core_lifecycle_td.astrbot_config["dashboard"] = original_dashboard_config
 
 
-@pytest.mark.asyncio
 async def test_subagent_config_accepts_default_persona(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2213,7 +2171,6 @@ async def test_subagent_config_accepts_default_persona(
         )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("payload", [[], "x"])
 async def test_batch_delete_sessions_rejects_non_object_payload(
     app: FastAPIAppAdapter, authenticated_header: dict, payload
@@ -2231,7 +2188,6 @@ async def test_batch_delete_sessions_rejects_non_object_payload(
     assert data["message"] == "Invalid JSON body: expected object"
 
 
-@pytest.mark.asyncio
 async def test_batch_delete_sessions_masks_internal_error(
     app: FastAPIAppAdapter, authenticated_header: dict, monkeypatch
 ):
@@ -2267,7 +2223,6 @@ async def test_batch_delete_sessions_masks_internal_error(
     assert data["data"]["failed_items"][0]["reason"] == "internal_error"
 
 
-@pytest.mark.asyncio
 async def test_batch_delete_sessions_uses_batch_lookup(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2316,7 +2271,6 @@ async def test_batch_delete_sessions_uses_batch_lookup(
     assert called["batch_lookup_count"] == 1
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "path_template",
     [
@@ -2361,7 +2315,6 @@ async def test_get_chat_session_rejects_session_owned_by_another_user(
     assert data["message"] == "Permission denied"
 
 
-@pytest.mark.asyncio
 async def test_plugins(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2501,7 +2454,6 @@ async def test_plugins(
         builder.cleanup(test_plugin_name)
 
 
-@pytest.mark.asyncio
 async def test_plugins_when_installed_at_unresolved(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2523,7 +2475,6 @@ async def test_plugins_when_installed_at_unresolved(
         assert plugin["installed_at"] is None
 
 
-@pytest.mark.asyncio
 async def test_commands_api(app: FastAPIAppAdapter, authenticated_header: dict):
     """Tests the command management API endpoints."""
     test_client = app.test_client()
@@ -2551,7 +2502,6 @@ async def test_commands_api(app: FastAPIAppAdapter, authenticated_header: dict):
     assert isinstance(data["data"], list)
 
 
-@pytest.mark.asyncio
 async def test_t2i_set_active_template_syncs_all_configs(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2618,7 +2568,6 @@ async def test_t2i_set_active_template_syncs_all_configs(
             )
 
 
-@pytest.mark.asyncio
 async def test_t2i_reset_default_template_syncs_all_configs(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2691,7 +2640,6 @@ async def test_t2i_reset_default_template_syncs_all_configs(
             )
 
 
-@pytest.mark.asyncio
 async def test_t2i_update_active_template_reloads_all_schedulers(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2769,7 +2717,6 @@ async def test_t2i_update_active_template_reloads_all_schedulers(
             )
 
 
-@pytest.mark.asyncio
 async def test_check_update(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2807,7 +2754,6 @@ async def test_check_update(
     assert data["data"]["has_new_version"] is False
 
 
-@pytest.mark.asyncio
 async def test_restart_core_rejects_desktop_managed_backend(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2836,7 +2782,6 @@ async def test_restart_core_rejects_desktop_managed_backend(
     assert restart_called is False
 
 
-@pytest.mark.asyncio
 async def test_do_update(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -2934,7 +2879,6 @@ async def test_do_update(
     assert progress_data["data"]["overall_percent"] == 100
 
 
-@pytest.mark.asyncio
 async def test_do_update_does_not_apply_files_when_core_download_fails(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -3000,7 +2944,6 @@ async def test_do_update_does_not_apply_files_when_core_download_fails(
     assert calls == ["download-dashboard", "download-core"]
 
 
-@pytest.mark.asyncio
 async def test_do_update_rejects_desktop_managed_backend(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -3038,7 +2981,6 @@ async def test_do_update_rejects_desktop_managed_backend(
     assert calls == []
 
 
-@pytest.mark.asyncio
 async def test_do_update_does_not_apply_files_when_package_verification_fails(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -3120,7 +3062,6 @@ def test_extract_dashboard_rejects_zip_path_traversal(tmp_path: Path):
     assert not (tmp_path / "evil.txt").exists()
 
 
-@pytest.mark.asyncio
 async def test_do_update_hides_internal_error_message_in_response_and_progress(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -3160,7 +3101,6 @@ async def test_do_update_hides_internal_error_message_in_response_and_progress(
     assert "secret stack trace" not in str(progress_data)
 
 
-@pytest.mark.asyncio
 async def test_install_pip_package_returns_generic_error_message(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -3248,7 +3188,6 @@ class _FakeNeoBayClient:
         return False
 
 
-@pytest.mark.asyncio
 async def test_neo_skills_routes(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -3370,7 +3309,6 @@ async def test_neo_skills_routes(
     assert data["data"]["skill_key"] == "neo.demo"
 
 
-@pytest.mark.asyncio
 async def test_batch_upload_skills_returns_error_when_all_files_invalid(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -3395,7 +3333,6 @@ async def test_batch_upload_skills_returns_error_when_all_files_invalid(
     assert data["message"] == "Upload failed for all 1 file(s)."
 
 
-@pytest.mark.asyncio
 async def test_batch_upload_skills_accepts_zip_files(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -3448,7 +3385,6 @@ async def test_batch_upload_skills_accepts_zip_files(
     assert data["data"]["failed"] == []
 
 
-@pytest.mark.asyncio
 async def test_batch_upload_skills_accepts_valid_skill_archive(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -3521,7 +3457,6 @@ async def test_batch_upload_skills_accepts_valid_skill_archive(
     assert (skills_dir / "demo_skill" / "SKILL.md").exists()
 
 
-@pytest.mark.asyncio
 async def test_github_skill_import_routes(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -3590,7 +3525,6 @@ async def test_github_skill_import_routes(
     assert install_data["data"]["name"] == "demo-skill"
 
 
-@pytest.mark.asyncio
 async def test_skills_sh_scan_and_install_routes(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -3686,7 +3620,6 @@ async def test_skills_sh_scan_and_install_routes(
     assert install_data["data"]["name"] == "demo-skill"
 
 
-@pytest.mark.asyncio
 async def test_batch_upload_skills_partial_success(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -3755,7 +3688,6 @@ async def test_batch_upload_skills_partial_success(
     ]
 
 
-@pytest.mark.asyncio
 async def test_skill_file_browser_and_editor_security(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
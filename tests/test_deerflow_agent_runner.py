@@ -1,7 +1,6 @@
 import base64
 from io import BytesIO
 
-import pytest
 from PIL import Image as PILImage
 
 from astrbot.core.agent.runners.deerflow.deerflow_agent_runner import (
@@ -51,7 +50,6 @@ def test_build_payload_includes_configurable_runtime_overrides_and_legacy_contex
     assert payload["context"] == expected_runtime
 
 
-@pytest.mark.asyncio
 async def test_build_user_content_resolved_supports_base64_scheme(
     tmp_path, monkeypatch
 ):
@@ -76,7 +74,6 @@ async def test_build_user_content_resolved_supports_base64_scheme(
     assert not list(tmp_path.iterdir())
 
 
-@pytest.mark.asyncio
 async def test_build_payload_resolved_supports_local_image_path(tmp_path, monkeypatch):
     monkeypatch.setattr(
         "astrbot.core.utils.media_utils.get_astrbot_temp_path",
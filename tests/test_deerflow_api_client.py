@@ -31,7 +31,6 @@ class _FakeSession:
         return self._response
 
 
-@pytest.mark.asyncio
 async def test_delete_thread_raises_api_error_with_thread_context():
     client = DeerFlowAPIClient(api_base="http://127.0.0.1:2026")
     client._session = _FakeSession(
@@ -1,8 +1,6 @@
 import asyncio
 import threading
 
-import pytest
-
 from astrbot.core.platform.sources.dingtalk import dingtalk_adapter
 from astrbot.core.platform.sources.dingtalk.dingtalk_adapter import (
     DINGTALK_RECONNECT_INITIAL_DELAY,
@@ -30,7 +28,6 @@ def test_dingtalk_reconnect_delay_is_capped():
     assert _dingtalk_reconnect_delay(20) == DINGTALK_RECONNECT_MAX_DELAY
 
 
-@pytest.mark.asyncio
 async def test_dingtalk_reconnect_delay_wakes_on_terminate(monkeypatch):
     class ObservedEvent:
         def __init__(self) -> None:
@@ -2,8 +2,6 @@ import base64
 from io import BytesIO
 from types import SimpleNamespace
 
-import pytest
-
 from astrbot.api.message_components import Image, Record
 from astrbot.core.message.message_event_result import MessageChain
 from astrbot.core.platform.sources.discord import (
@@ -24,7 +22,6 @@ _WAV_BYTES = b"RIFF\x24\x00\x00\x00WAVEfmt " + b"\x00" * 16
 _WAV_PATH = "/tmp/discord_voice.wav"
 
 
-@pytest.mark.asyncio
 async def test_discord_audio_attachment_resolves_to_wav_record(monkeypatch):
     class FakeMediaResolver:
         def __init__(self, media_ref: str, **kwargs) -> None:
@@ -70,7 +67,6 @@ async def test_discord_audio_attachment_resolves_to_wav_record(monkeypatch):
     assert abm.message[0].path == _WAV_PATH
 
 
-@pytest.mark.asyncio
 async def test_discord_send_image_resolves_data_uri_with_media_resolver(monkeypatch):
     captured = {}
 
@@ -101,7 +97,6 @@ async def test_discord_send_image_resolves_data_uri_with_media_resolver(monkeypa
     assert reference_message_id is None
 
 
-@pytest.mark.asyncio
 async def test_discord_send_record_resolves_audio_with_media_resolver(monkeypatch):
     captured = {}
 
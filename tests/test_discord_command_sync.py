@@ -38,7 +38,6 @@ def _build_adapter(monkeypatch: pytest.MonkeyPatch):
     return adapter
 
 
-@pytest.mark.asyncio
 async def test_discord_command_sync_ignores_daily_quota(monkeypatch):
     from astrbot.core.platform.sources.discord import discord_platform_adapter
 
@@ -168,14 +168,12 @@ def _make_epub_bytes_with_generic_content() -> bytes:
     return buffer.getvalue()
 
 
-@pytest.mark.asyncio
 async def test_select_parser_supports_epub():
     parser = await select_parser(".epub")
 
     assert isinstance(parser, EpubParser)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("ext", [".rst", ".adoc"])
 async def test_select_parser_supports_text_markup_formats(ext):
     parser = await select_parser(ext)
@@ -183,7 +181,6 @@ async def test_select_parser_supports_text_markup_formats(ext):
     assert isinstance(parser, MarkitdownParser)
 
 
-@pytest.mark.asyncio
 async def test_epub_parser_reads_spine_order_as_text():
     result = await EpubParser().parse(_make_epub_bytes(), "book.epub")
 
@@ -199,7 +196,6 @@ async def test_epub_parser_reads_spine_order_as_text():
     assert result.text.index("## Second") < result.text.index("# First")
 
 
-@pytest.mark.asyncio
 async def test_epub_parser_preserves_generic_container_text():
     result = await EpubParser().parse(
         _make_epub_bytes_with_generic_content(),
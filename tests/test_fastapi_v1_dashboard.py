@@ -991,7 +991,6 @@ def _jwt_headers() -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.mark.asyncio
 async def test_public_versions_route_uses_static_folder(
     fake_core_lifecycle,
     fake_db: FakeDb,
@@ -1032,7 +1031,6 @@ def test_fastapi_app_adapter_registers_on_app_state():
     assert app.state.dashboard_app_adapter is adapter
 
 
-@pytest.mark.asyncio
 async def test_v1_scope_dependencies_accept_dashboard_cookie(
     asgi_client: httpx.AsyncClient,
 ):
@@ -1053,7 +1051,6 @@ async def test_v1_scope_dependencies_accept_dashboard_cookie(
     assert isinstance(data["data"]["bots"], list)
 
 
-@pytest.mark.asyncio
 async def test_v1_openapi_is_served_by_fastapi(asgi_client: httpx.AsyncClient):
     response = await asgi_client.get("/api/v1/openapi.json")
 
@@ -1087,7 +1084,6 @@ def test_static_openapi_v1_paths_include_api_version():
     assert all(path.startswith("/api/v1/") for path in path_keys)
 
 
-@pytest.mark.asyncio
 async def test_dashboard_static_dist_files_are_served(
     fake_core_lifecycle,
     fake_db: FakeDb,
@@ -1136,7 +1132,6 @@ async def test_dashboard_static_dist_files_are_served(
     assert api_response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_v1_backup_path_rejects_traversal(asgi_client: httpx.AsyncClient):
     download_response = await asgi_client.get(
         "/api/v1/backups/%2E%2E/secret.zip",
@@ -1155,7 +1150,6 @@ async def test_v1_backup_path_rejects_traversal(asgi_client: httpx.AsyncClient):
     assert "非法路径" in delete_response.json()["message"]
 
 
-@pytest.mark.asyncio
 async def test_v1_openapi_uses_pydantic_request_bodies(
     asgi_client: httpx.AsyncClient,
 ):
@@ -1192,7 +1186,6 @@ async def test_v1_openapi_uses_pydantic_request_bodies(
     assert open_api_file_upload["x-astrbot-scope"] == "file"
 
 
-@pytest.mark.asyncio
 async def test_v1_knowledge_base_create_validation_uses_api_error_shape(
     asgi_client: httpx.AsyncClient,
 ):
@@ -1219,7 +1212,6 @@ async def test_v1_knowledge_base_create_validation_uses_api_error_shape(
     )
 
 
-@pytest.mark.asyncio
 async def test_v1_conversation_path_id_allows_slash(asgi_client: httpx.AsyncClient):
     response = await asgi_client.get(
         "/api/v1/conversations/conversation%2Fwith%2Fslash",
@@ -1233,7 +1225,6 @@ async def test_v1_conversation_path_id_allows_slash(asgi_client: httpx.AsyncClie
     assert payload["data"]["cid"] == "conversation/with/slash"
 
 
-@pytest.mark.asyncio
 async def test_v1_conversation_detail_requires_user_id(
     asgi_client: httpx.AsyncClient,
 ):
@@ -1245,7 +1236,6 @@ async def test_v1_conversation_detail_requires_user_id(
     assert response.status_code == 422
 
 
-@pytest.mark.asyncio
 async def test_dashboard_alias_conversation_detail_uses_fastapi_service(
     asgi_client: httpx.AsyncClient,
 ):
@@ -1264,7 +1254,6 @@ async def test_dashboard_alias_conversation_detail_uses_fastapi_service(
     assert payload["data"]["cid"] == "conversation/with/slash"
 
 
-@pytest.mark.asyncio
 async def test_v1_bots_matches_dashboard_platform_alias_list(
     asgi_client: httpx.AsyncClient,
 ):
@@ -1285,7 +1274,6 @@ async def test_v1_bots_matches_dashboard_platform_alias_list(
     assert v1_data["data"]["bots"] == dashboard_alias_data["data"]["platforms"]
 
 
-@pytest.mark.asyncio
 async def test_v1_bot_stats_match_platform_manager(asgi_client: httpx.AsyncClient):
     response = await asgi_client.get("/api/v1/bots/stats", headers=_jwt_headers())
 
@@ -1295,7 +1283,6 @@ async def test_v1_bot_stats_match_platform_manager(asgi_client: httpx.AsyncClien
     assert data["data"]["platforms"] == [{"id": "webchat-main", "status": "running"}]
 
 
-@pytest.mark.asyncio
 async def test_v1_config_routes_can_replace_all_routes(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -1323,7 +1310,6 @@ async def test_v1_config_routes_can_replace_all_routes(
     assert list_response.json()["data"]["routing"] == routing
 
 
-@pytest.mark.asyncio
 async def test_v1_active_umos_uses_session_service(
     asgi_client: httpx.AsyncClient,
 ):
@@ -1339,7 +1325,6 @@ async def test_v1_active_umos_uses_session_service(
     assert data["data"]["umo_infos"][0]["platform"] == "webchat"
 
 
-@pytest.mark.asyncio
 async def test_v1_system_config_update_preserves_independent_bot_provider_sections(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -1381,7 +1366,6 @@ async def test_v1_system_config_update_preserves_independent_bot_provider_sectio
     assert fake_core_lifecycle.reloaded_config_ids == ["default"]
 
 
-@pytest.mark.asyncio
 async def test_v1_system_config_returns_system_metadata(
     asgi_client: httpx.AsyncClient,
 ):
@@ -1397,7 +1381,6 @@ async def test_v1_system_config_returns_system_metadata(
     assert "platform_group" not in data["data"]["metadata"]
 
 
-@pytest.mark.asyncio
 async def test_v1_providers_matches_dashboard_provider_alias_list(
     asgi_client: httpx.AsyncClient,
 ):
@@ -1421,7 +1404,6 @@ async def test_v1_providers_matches_dashboard_provider_alias_list(
     assert v1_data["data"]["providers"] == dashboard_alias_data["data"]
 
 
-@pytest.mark.asyncio
 async def test_v1_provider_source_rename_updates_provider_refs(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -1460,7 +1442,6 @@ async def test_v1_provider_source_rename_updates_provider_refs(
     ]
 
 
-@pytest.mark.asyncio
 async def test_v1_provider_update_keeps_dashboard_id_rename_behavior(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -1487,7 +1468,6 @@ async def test_v1_provider_update_keeps_dashboard_id_rename_behavior(
     ]
 
 
-@pytest.mark.asyncio
 async def test_v1_create_standalone_provider_matches_dashboard_alias_capability(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -1515,7 +1495,6 @@ async def test_v1_create_standalone_provider_matches_dashboard_alias_capability(
     }
 
 
-@pytest.mark.asyncio
 async def test_v1_safe_provider_routes_accept_slash_ids(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -1618,7 +1597,6 @@ async def test_v1_safe_provider_routes_accept_slash_ids(
     assert source_providers_response.json()["data"]["providers"][0]["id"] == provider_id
 
 
-@pytest.mark.asyncio
 async def test_v1_safe_bot_routes_accept_slash_ids(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -1664,7 +1642,6 @@ async def test_v1_safe_bot_routes_accept_slash_ids(
     assert fake_core_lifecycle.terminated_platform_ids == [bot_id]
 
 
-@pytest.mark.asyncio
 async def test_v1_config_scope_includes_bot_and_provider(
     asgi_client: httpx.AsyncClient,
     fake_db: FakeDb,
@@ -1699,7 +1676,6 @@ async def test_v1_config_scope_includes_bot_and_provider(
     assert fake_db.touched_key_ids == ["config-key", "config-key", "config-key"]
 
 
-@pytest.mark.asyncio
 async def test_dashboard_alias_route_still_works_through_asgi_app(
     asgi_client: httpx.AsyncClient,
 ):
@@ -1711,7 +1687,6 @@ async def test_dashboard_alias_route_still_works_through_asgi_app(
     assert data["data"]["start_time"] == 1234567890
 
 
-@pytest.mark.asyncio
 async def test_v1_plugins_accept_api_key(
     asgi_client: httpx.AsyncClient,
     fake_db: FakeDb,
@@ -1730,7 +1705,6 @@ async def test_v1_plugins_accept_api_key(
     assert [item["name"] for item in data["data"]] == ["astrbot_plugin_demo"]
 
 
-@pytest.mark.asyncio
 async def test_v1_plugin_enabled_patch_calls_service(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -1749,7 +1723,6 @@ async def test_v1_plugin_enabled_patch_calls_service(
     assert plugin.activated is False
 
 
-@pytest.mark.asyncio
 async def test_v1_plugin_version_support_check_uses_service(
     asgi_client: httpx.AsyncClient,
 ):
@@ -1769,7 +1742,6 @@ async def test_v1_plugin_version_support_check_uses_service(
     }
 
 
-@pytest.mark.asyncio
 async def test_v1_plugin_validate_repo_uses_service(
     asgi_app: FastAPI,
     asgi_client: httpx.AsyncClient,
@@ -1812,7 +1784,6 @@ async def test_v1_plugin_validate_repo_uses_service(
     }
 
 
-@pytest.mark.asyncio
 async def test_v1_plugin_url_install_accepts_download_url_and_missing_body(
     asgi_app: FastAPI,
     asgi_client: httpx.AsyncClient,
@@ -1865,7 +1836,6 @@ async def test_v1_plugin_url_install_accepts_download_url_and_missing_body(
     assert "missing url" not in str(empty_body_data)
 
 
-@pytest.mark.asyncio
 async def test_plugin_service_market_install_uses_registry_entry(
     asgi_app: FastAPI,
     monkeypatch: pytest.MonkeyPatch,
@@ -1972,7 +1942,6 @@ async def test_plugin_service_market_install_uses_registry_entry(
     assert captured["synced"] is True
 
 
-@pytest.mark.asyncio
 async def test_plugin_service_validate_plugin_repo_fetches_metadata_file(
     asgi_app: FastAPI,
     monkeypatch: pytest.MonkeyPatch,
@@ -2077,7 +2046,6 @@ async def test_plugin_service_validate_plugin_repo_fetches_metadata_file(
     assert "timeout" in session_kwargs
 
 
-@pytest.mark.asyncio
 async def test_plugin_service_validate_plugin_repo_rejects_large_metadata_file(
     asgi_app: FastAPI,
     monkeypatch: pytest.MonkeyPatch,
@@ -2138,7 +2106,6 @@ async def test_plugin_service_validate_plugin_repo_rejects_large_metadata_file(
         )
 
 
-@pytest.mark.asyncio
 async def test_plugin_service_validate_plugin_repo_hides_internal_errors(
     asgi_app: FastAPI,
     monkeypatch: pytest.MonkeyPatch,
@@ -2185,7 +2152,6 @@ async def test_plugin_service_validate_plugin_repo_hides_internal_errors(
     assert "secret stack trace" not in exc_info.value.public_message
 
 
-@pytest.mark.asyncio
 async def test_plugin_service_bind_market_source_validates_and_persists(
     asgi_app: FastAPI,
     monkeypatch: pytest.MonkeyPatch,
@@ -2253,7 +2219,6 @@ async def test_plugin_service_bind_market_source_validates_and_persists(
     assert captured["records"]["astrbot_plugin_demo"] == record
 
 
-@pytest.mark.asyncio
 async def test_plugin_service_bind_repo_source_persists_github_method(
     asgi_app: FastAPI,
     monkeypatch: pytest.MonkeyPatch,
@@ -2300,7 +2265,6 @@ async def test_plugin_service_bind_repo_source_persists_github_method(
     assert captured["records"]["astrbot_plugin_demo"] == record
 
 
-@pytest.mark.asyncio
 async def test_plugin_service_bind_market_source_rejects_repo_mismatch(
     asgi_app: FastAPI,
     monkeypatch: pytest.MonkeyPatch,
@@ -2373,7 +2337,6 @@ def test_plugin_service_resolves_market_entry_by_repo_identifier(
     assert entry["repo"] == "https://www.github.com/AstrBotDevs/astrbot-plugin-demo"
 
 
-@pytest.mark.asyncio
 async def test_plugin_service_persist_install_source_resolves_registry_before_read(
     asgi_app: FastAPI,
     monkeypatch: pytest.MonkeyPatch,
@@ -2459,7 +2422,6 @@ def test_plugin_service_missing_install_source_is_implicit_for_display(
     assert record["marketplace_name"] == "astrbot-plugin-demo"
 
 
-@pytest.mark.asyncio
 async def test_plugin_service_update_missing_source_requires_selection(
     asgi_app: FastAPI,
     monkeypatch: pytest.MonkeyPatch,
@@ -2488,7 +2450,6 @@ async def test_plugin_service_update_missing_source_requires_selection(
     assert exc_info.value.public_message == PLUGIN_UPDATE_SOURCE_REQUIRED_MESSAGE
 
 
-@pytest.mark.asyncio
 async def test_plugin_service_update_github_source_uses_plugin_repo(
     asgi_app: FastAPI,
     monkeypatch: pytest.MonkeyPatch,
@@ -2523,7 +2484,6 @@ async def test_plugin_service_update_github_source_uses_plugin_repo(
     assert update_info["record"]["install_method"] == "github"
 
 
-@pytest.mark.asyncio
 async def test_v1_plugin_update_all_hides_internal_exceptions(
     asgi_client: httpx.AsyncClient,
 ):
@@ -2543,7 +2503,6 @@ async def test_v1_plugin_update_all_hides_internal_exceptions(
     assert "update_plugin" not in str(data)
 
 
-@pytest.mark.asyncio
 async def test_v1_plugin_extension_maps_nested_plugin_path(
     asgi_client: httpx.AsyncClient,
 ):
@@ -2564,7 +2523,6 @@ async def test_v1_plugin_extension_maps_nested_plugin_path(
     }
 
 
-@pytest.mark.asyncio
 async def test_v1_plugin_extension_supports_astrbot_web_api(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -2613,7 +2571,6 @@ async def test_v1_plugin_extension_supports_astrbot_web_api(
     }
 
 
-@pytest.mark.asyncio
 async def test_v1_plugin_extension_astrbot_web_api_reads_form_and_files(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -2683,7 +2640,6 @@ def test_astrbot_web_request_proxy_exposes_typed_methods():
     )
 
 
-@pytest.mark.asyncio
 async def test_v1_plugin_extension_supports_quart_request_context(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -2731,7 +2687,6 @@ async def test_v1_plugin_extension_supports_quart_request_context(
     }
 
 
-@pytest.mark.asyncio
 async def test_multipart_parts_preserves_duplicate_form_values():
     from starlette.datastructures import FormData
 
@@ -2747,7 +2702,6 @@ async def test_multipart_parts_preserves_duplicate_form_values():
     assert not files
 
 
-@pytest.mark.asyncio
 async def test_v1_plugin_config_file_routes_reach_service_layer(
     asgi_client: httpx.AsyncClient,
 ):
@@ -2777,7 +2731,6 @@ async def test_v1_plugin_config_file_routes_reach_service_layer(
     assert delete_response.json()["status"] == "error"
 
 
-@pytest.mark.asyncio
 async def test_v1_safe_plugin_routes_accept_slash_ids(
     asgi_app: FastAPI,
     asgi_client: httpx.AsyncClient,
@@ -2873,7 +2826,6 @@ async def test_v1_safe_plugin_routes_accept_slash_ids(
     }
 
 
-@pytest.mark.asyncio
 async def test_v1_safe_plugin_source_delete_accepts_slash_ids(
     asgi_client: httpx.AsyncClient,
     monkeypatch: pytest.MonkeyPatch,
@@ -2906,7 +2858,6 @@ async def test_v1_safe_plugin_source_delete_accepts_slash_ids(
     assert response.json()["data"]["sources"] == [{"id": "keep"}]
 
 
-@pytest.mark.asyncio
 async def test_v1_command_patch_updates_service(
     asgi_app: FastAPI,
     asgi_client: httpx.AsyncClient,
@@ -2939,7 +2890,6 @@ async def test_v1_command_patch_updates_service(
     }
 
 
-@pytest.mark.asyncio
 async def test_v1_bot_type_registration_uses_platform_service(
     asgi_app: FastAPI,
     asgi_client: httpx.AsyncClient,
@@ -2969,7 +2919,6 @@ async def test_v1_bot_type_registration_uses_platform_service(
     }
 
 
-@pytest.mark.asyncio
 async def test_v1_token_file_is_public(
     asgi_client: httpx.AsyncClient,
     tmp_path: Path,
@@ -3006,7 +2955,6 @@ def test_dashboard_config_aliases_are_registered_on_fastapi(asgi_app):
     )
 
 
-@pytest.mark.asyncio
 async def test_v1_mcp_enabled_patch_updates_stored_active_flag(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -3025,7 +2973,6 @@ async def test_v1_mcp_enabled_patch_updates_stored_active_flag(
     assert mcp_servers["demo-server"]["active"] is False
 
 
-@pytest.mark.asyncio
 async def test_v1_safe_mcp_routes_accept_slash_server_names(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -3071,7 +3018,6 @@ async def test_v1_safe_mcp_routes_accept_slash_server_names(
     assert fake_tools.synced_modelscope_tokens == ["token"]
 
 
-@pytest.mark.asyncio
 async def test_v1_mcp_scope_accepts_api_key(
     asgi_client: httpx.AsyncClient,
     fake_db: FakeDb,
@@ -3090,7 +3036,6 @@ async def test_v1_mcp_scope_accepts_api_key(
     assert any(server["name"] == "demo-server" for server in data["data"])
 
 
-@pytest.mark.asyncio
 async def test_v1_skill_scope_accepts_api_key_and_rejects_plural_scope(
     asgi_app: FastAPI,
     asgi_client: httpx.AsyncClient,
@@ -3128,7 +3073,6 @@ async def test_v1_skill_scope_accepts_api_key_and_rejects_plural_scope(
     assert data["data"]["skills"] == [{"name": "demo_skill"}]
 
 
-@pytest.mark.asyncio
 async def test_v1_safe_skill_routes_accept_slash_names(
     asgi_app: FastAPI,
     asgi_client: httpx.AsyncClient,
@@ -3226,7 +3170,6 @@ async def test_v1_safe_skill_routes_accept_slash_names(
     assert delete_response.json()["data"]["payload"] == {"name": skill_name}
 
 
-@pytest.mark.asyncio
 async def test_v1_skill_archive_errors_return_http_status(
     asgi_app: FastAPI,
     asgi_client: httpx.AsyncClient,
@@ -3303,7 +3246,6 @@ async def test_v1_skill_archive_errors_return_http_status(
     assert "Unexpected database error" not in server_error_response.text
 
 
-@pytest.mark.asyncio
 async def test_v1_safe_persona_routes_accept_slash_ids(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -3338,7 +3280,6 @@ async def test_v1_safe_persona_routes_accept_slash_ids(
     assert persona_id not in persona_mgr.personas
 
 
-@pytest.mark.asyncio
 async def test_v1_persona_by_id_update_preserves_explicit_null_tools_and_skills(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -3361,7 +3302,6 @@ async def test_v1_persona_by_id_update_preserves_explicit_null_tools_and_skills(
     assert persona.skills is None
 
 
-@pytest.mark.asyncio
 async def test_v1_im_routes_use_im_scope_and_running_platform(
     asgi_client: httpx.AsyncClient,
     fake_core_lifecycle,
@@ -3393,7 +3333,6 @@ async def test_v1_im_routes_use_im_scope_and_running_platform(
     assert message_chain.chain[0].text == "hello"
 
 
-@pytest.mark.asyncio
 async def test_v1_platform_webhook_is_public_route(
     asgi_client: httpx.AsyncClient,
 ):
@@ -3410,7 +3349,6 @@ async def test_v1_platform_webhook_is_public_route(
     }
 
 
-@pytest.mark.asyncio
 async def test_v1_platform_webhook_preserves_plain_response(
     asgi_client: httpx.AsyncClient,
 ):
@@ -3423,7 +3361,6 @@ async def test_v1_platform_webhook_preserves_plain_response(
     assert response.text == "success"
 
 
-@pytest.mark.asyncio
 async def test_v1_platform_webhook_preserves_tuple_response(
     asgi_client: httpx.AsyncClient,
 ):
@@ -119,7 +119,6 @@ async def authenticated_header(
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.mark.asyncio
 async def test_import_documents(
     app: FastAPIAppAdapter,
     authenticated_header: dict,
@@ -188,7 +187,6 @@ async def test_import_documents(
     assert kwargs2["pre_chunked_text"] == ["chunk3", "chunk4", "chunk5"]
 
 
-@pytest.mark.asyncio
 async def test_import_documents_returns_friendly_failure_message(
     core_lifecycle_td: AstrBotCoreLifecycle,
 ):
@@ -230,7 +228,6 @@ async def test_import_documents_returns_friendly_failure_message(
     kb_helper.upload_document.side_effect = None
 
 
-@pytest.mark.asyncio
 async def test_import_documents_invalid_input(
     app: FastAPIAppAdapter, authenticated_header: dict
 ):
@@ -318,7 +315,6 @@ def _make_service_with_mock_kb_helper():
     return service, kb_helper
 
 
-@pytest.mark.asyncio
 async def test_list_documents_clamps_page_and_page_size_below_one():
     """page and page_size below 1 are clamped to 1 before calling kb_helper."""
     service, kb_helper = _make_service_with_mock_kb_helper()
@@ -330,7 +326,6 @@ async def test_list_documents_clamps_page_and_page_size_below_one():
     kb_helper.list_documents.assert_awaited_once_with(offset=0, limit=1, search=None)
 
 
-@pytest.mark.asyncio
 async def test_list_documents_trims_search_and_turns_empty_to_none():
     """search is stripped; whitespace-only search becomes None."""
     service, kb_helper = _make_service_with_mock_kb_helper()
@@ -344,7 +339,6 @@ async def test_list_documents_trims_search_and_turns_empty_to_none():
     )
 
 
-@pytest.mark.asyncio
 async def test_list_documents_total_comes_from_count_documents():
     """total uses count_documents(search=normalized_search), not stale kb.doc_count."""
     service, kb_helper = _make_service_with_mock_kb_helper()
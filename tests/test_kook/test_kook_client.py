@@ -71,7 +71,6 @@ class FakeMediaResolver:
         return TEST_AUDIO_WAV_PATH
 
 
-@pytest.mark.asyncio
 async def test_kook_upload_asset_resolves_base64_scheme(monkeypatch):
     captured = {}
 
@@ -124,7 +123,6 @@ class JsonFieldPaths:
     message_str: list[int | str] = field(default_factory=list)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "expected_json_data_path, expected_message_str, expected_message_components",
     [
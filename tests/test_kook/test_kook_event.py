@@ -23,7 +23,6 @@ from tests.test_kook.shared import (
 )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "input_message,upload_asset_return, expected_output, expected_error",
     [
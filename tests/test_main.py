@@ -172,7 +172,6 @@ def test_version_info_comparisons():
     assert v3_11 >= v3_11  # Same instance
 
 
-@pytest.mark.asyncio
 async def test_check_dashboard_files_not_exists(tmp_path):
     """Tests dashboard download when files do not exist."""
     data_dir = tmp_path / "data"
@@ -197,7 +196,6 @@ async def test_check_dashboard_files_not_exists(tmp_path):
         )
 
 
-@pytest.mark.asyncio
 async def test_check_dashboard_files_exists_and_version_match(tmp_path):
     """Tests that dashboard is not downloaded when it exists and version matches."""
     from main import VERSION
@@ -215,7 +213,6 @@ async def test_check_dashboard_files_exists_and_version_match(tmp_path):
             mock_download.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_check_dashboard_files_exists_but_version_mismatch_downloads(tmp_path):
     """Tests that a mismatched dashboard is downloaded on startup."""
     from main import VERSION
@@ -246,7 +243,6 @@ async def test_check_dashboard_files_exists_but_version_mismatch_downloads(tmp_p
             assert "WebUI version mismatch" in call_args[0]
 
 
-@pytest.mark.asyncio
 async def test_check_dashboard_files_falls_back_to_stale_dist_when_download_fails(
     tmp_path,
 ):
@@ -284,7 +280,6 @@ async def test_check_dashboard_files_falls_back_to_stale_dist_when_download_fail
     )
 
 
-@pytest.mark.asyncio
 async def test_check_dashboard_files_downloads_when_matching_dist_is_incomplete(
     tmp_path,
 ):
@@ -360,7 +355,6 @@ def test_should_use_bundled_dashboard_dist_when_data_version_file_is_missing(tmp
         assert should_use_bundled_dashboard_dist(user_dist, "4.24.4") is True
 
 
-@pytest.mark.asyncio
 async def test_get_dashboard_version_uses_bundled_dist_when_data_dist_is_missing(
     tmp_path,
 ):
@@ -384,7 +378,6 @@ async def test_get_dashboard_version_uses_bundled_dist_when_data_dist_is_missing
             assert await get_dashboard_version() == f"v{VERSION}"
 
 
-@pytest.mark.asyncio
 async def test_check_dashboard_files_replaces_stale_data_dist_with_bundled_dist(
     tmp_path,
 ):
@@ -420,7 +413,6 @@ async def test_check_dashboard_files_replaces_stale_data_dist_with_bundled_dist(
     mock_download.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_check_dashboard_files_with_webui_dir_arg(monkeypatch):
     """Tests that providing a valid webui_dir skips all checks."""
     valid_dir = "/tmp/my-custom-webui"
@@ -2,8 +2,6 @@ import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 import astrbot.api.message_components as Comp
 from astrbot.core.platform.sources.mattermost.client import MattermostClient
 from astrbot.core.platform.sources.mattermost.mattermost_adapter import (
@@ -30,7 +28,6 @@ def _build_adapter() -> MattermostPlatformAdapter:
     return adapter
 
 
-@pytest.mark.asyncio
 async def test_mattermost_convert_message_strips_leading_self_mention():
     adapter = _build_adapter()
 
@@ -59,7 +56,6 @@ async def test_mattermost_convert_message_strips_leading_self_mention():
     )
 
 
-@pytest.mark.asyncio
 async def test_mattermost_parse_post_attachments_maps_media_types(tmp_path):
     client = MattermostClient("https://chat.example.com", "test_token")
     wav_path = str(tmp_path / "mattermost_voice.wav")
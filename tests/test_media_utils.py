@@ -18,7 +18,6 @@ from astrbot.core.utils.path_util import path_Mapping
 from astrbot.core.utils.tencent_record_helper import wav_to_tencent_silk
 
 
-@pytest.mark.asyncio
 async def test_resolve_audio_ref_to_base64_data_decodes_data_uri(tmp_path, monkeypatch):
     monkeypatch.setattr(media_utils, "get_astrbot_temp_path", lambda: str(tmp_path))
     audio_bytes = b"RIFF\x24\x00\x00\x00WAVEfmt " + b"\x00" * 16
@@ -36,7 +35,6 @@ async def test_resolve_audio_ref_to_base64_data_decodes_data_uri(tmp_path, monke
     assert not list(tmp_path.iterdir())
 
 
-@pytest.mark.asyncio
 async def test_media_resolver_context_cleans_materialized_audio(tmp_path, monkeypatch):
     monkeypatch.setattr(media_utils, "get_astrbot_temp_path", lambda: str(tmp_path))
     audio_bytes = b"RIFF\x24\x00\x00\x00WAVEfmt " + b"\x00" * 16
@@ -55,7 +53,6 @@ async def test_media_resolver_context_cleans_materialized_audio(tmp_path, monkey
     assert not list(tmp_path.iterdir())
 
 
-@pytest.mark.asyncio
 async def test_media_resolver_to_path_detaches_for_component_lifetimes(
     tmp_path, monkeypatch
 ):
@@ -74,7 +71,6 @@ async def test_media_resolver_to_path_detaches_for_component_lifetimes(
         Path(image_path).unlink(missing_ok=True)
 
 
-@pytest.mark.asyncio
 async def test_image_from_base64_uses_detected_image_suffix(tmp_path, monkeypatch):
     from PIL import Image as PILImage
 
@@ -93,7 +89,6 @@ async def test_image_from_base64_uses_detected_image_suffix(tmp_path, monkeypatc
         Path(image_path).unlink(missing_ok=True)
 
 
-@pytest.mark.asyncio
 async def test_http_image_without_suffix_uses_detected_image_suffix(
     tmp_path,
     monkeypatch,
@@ -122,7 +117,6 @@ async def test_http_image_without_suffix_uses_detected_image_suffix(
         Path(image_path).unlink(missing_ok=True)
 
 
-@pytest.mark.asyncio
 async def test_resolve_audio_ref_to_base64_data_decodes_base64_scheme(
     tmp_path, monkeypatch
 ):
@@ -142,7 +136,6 @@ async def test_resolve_audio_ref_to_base64_data_decodes_base64_scheme(
     assert not list(tmp_path.iterdir())
 
 
-@pytest.mark.asyncio
 async def test_resolve_audio_ref_to_base64_data_ignores_internal_whitespace(
     tmp_path, monkeypatch
 ):
@@ -163,7 +156,6 @@ async def test_resolve_audio_ref_to_base64_data_ignores_internal_whitespace(
     assert not list(tmp_path.iterdir())
 
 
-@pytest.mark.asyncio
 async def test_record_convert_to_file_path_accepts_bare_base64(tmp_path, monkeypatch):
     monkeypatch.setattr(media_utils, "get_astrbot_temp_path", lambda: str(tmp_path))
     audio_bytes = b"RIFF\x24\x00\x00\x00WAVEfmt " + b"\x00" * 16
@@ -178,7 +170,6 @@ async def test_record_convert_to_file_path_accepts_bare_base64(tmp_path, monkeyp
         Path(audio_path).unlink(missing_ok=True)
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_ref_to_base64_data_detects_png(tmp_path):
     from PIL import Image as PILImage
 
@@ -207,7 +198,6 @@ def test_detect_image_mime_type_accepts_path(tmp_path):
     )
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_ref_to_base64_data_decodes_data_uri(tmp_path, monkeypatch):
     from PIL import Image as PILImage
 
@@ -228,7 +218,6 @@ async def test_resolve_image_ref_to_base64_data_decodes_data_uri(tmp_path, monke
     assert not list(tmp_path.iterdir())
 
 
-@pytest.mark.asyncio
 async def test_ensure_jpeg_converts_png_to_temp_jpg(tmp_path, monkeypatch):
     from PIL import Image as PILImage
 
@@ -246,7 +235,6 @@ async def test_ensure_jpeg_converts_png_to_temp_jpg(tmp_path, monkeypatch):
         assert converted_img.format == "JPEG"
 
 
-@pytest.mark.asyncio
 async def test_ensure_jpeg_keeps_alpha_png(tmp_path, monkeypatch):
     from PIL import Image as PILImage
 
@@ -261,7 +249,6 @@ async def test_ensure_jpeg_keeps_alpha_png(tmp_path, monkeypatch):
     assert not temp_dir.exists()
 
 
-@pytest.mark.asyncio
 async def test_ensure_jpeg_keeps_animated_gif(tmp_path, monkeypatch):
     from PIL import Image as PILImage
 
@@ -283,7 +270,6 @@ async def test_ensure_jpeg_keeps_animated_gif(tmp_path, monkeypatch):
     assert not temp_dir.exists()
 
 
-@pytest.mark.asyncio
 async def test_ensure_jpeg_keeps_existing_jpg(tmp_path, monkeypatch):
     from PIL import Image as PILImage
 
@@ -298,7 +284,6 @@ async def test_ensure_jpeg_keeps_existing_jpg(tmp_path, monkeypatch):
     assert not temp_dir.exists()
 
 
-@pytest.mark.asyncio
 async def test_compress_image_preserves_alpha_png(tmp_path, monkeypatch):
     from PIL import Image as PILImage
 
@@ -324,7 +309,6 @@ async def test_compress_image_preserves_alpha_png(tmp_path, monkeypatch):
         compressed_path.unlink(missing_ok=True)
 
 
-@pytest.mark.asyncio
 async def test_compress_image_keeps_animated_gif(tmp_path, monkeypatch):
     from PIL import Image as PILImage
 
@@ -346,7 +330,6 @@ async def test_compress_image_keeps_animated_gif(tmp_path, monkeypatch):
     assert not list(temp_dir.iterdir())
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_ref_to_base64_data_keeps_base64_scheme_fallback(
     tmp_path, monkeypatch
 ):
@@ -363,7 +346,6 @@ async def test_resolve_image_ref_to_base64_data_keeps_base64_scheme_fallback(
     assert not list(tmp_path.iterdir())
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_ref_to_base64_data_accepts_bare_base64(
     tmp_path, monkeypatch
 ):
@@ -380,7 +362,6 @@ async def test_resolve_image_ref_to_base64_data_accepts_bare_base64(
     assert not list(tmp_path.iterdir())
 
 
-@pytest.mark.asyncio
 async def test_media_resolver_accepts_unpadded_base64_payloads(tmp_path, monkeypatch):
     monkeypatch.setattr(media_utils, "get_astrbot_temp_path", lambda: str(tmp_path))
     payload = base64.b64encode(b"abcd").decode().rstrip("=")
@@ -399,7 +380,6 @@ async def test_media_resolver_accepts_unpadded_base64_payloads(tmp_path, monkeyp
     assert not list(tmp_path.iterdir())
 
 
-@pytest.mark.asyncio
 async def test_media_resolver_cleans_materialized_file_when_audio_conversion_fails(
     tmp_path, monkeypatch
 ):
@@ -419,7 +399,6 @@ async def test_media_resolver_cleans_materialized_file_when_audio_conversion_fai
     assert not list(tmp_path.iterdir())
 
 
-@pytest.mark.asyncio
 async def test_media_resolver_cleans_http_target_when_download_fails(
     tmp_path, monkeypatch
 ):
@@ -450,7 +429,6 @@ def test_describe_media_ref_does_not_include_payload_or_query():
     assert described_url_ref == "https URL host='example.com' file='image.png' len=47"
 
 
-@pytest.mark.asyncio
 async def test_provider_request_assemble_context_uses_media_resolver(
     tmp_path, monkeypatch
 ):
@@ -485,7 +463,6 @@ async def test_provider_request_assemble_context_uses_media_resolver(
     assert not list(tmp_path.iterdir())
 
 
-@pytest.mark.asyncio
 async def test_image_and_record_components_use_media_resolver(tmp_path, monkeypatch):
     monkeypatch.setattr(media_utils, "get_astrbot_temp_path", lambda: str(tmp_path))
     image = Image.fromBase64("abcd")
@@ -507,7 +484,6 @@ async def test_image_and_record_components_use_media_resolver(tmp_path, monkeypa
         Path(record_path).unlink(missing_ok=True)
 
 
-@pytest.mark.asyncio
 async def test_video_component_uses_media_resolver_for_data_uri(tmp_path, monkeypatch):
     monkeypatch.setattr(media_utils, "get_astrbot_temp_path", lambda: str(tmp_path))
     video_bytes = b"\x00\x00\x00\x18ftypmp42" + b"\x00" * 8
@@ -524,7 +500,6 @@ async def test_video_component_uses_media_resolver_for_data_uri(tmp_path, monkey
         Path(video_path).unlink(missing_ok=True)
 
 
-@pytest.mark.asyncio
 async def test_record_and_video_components_accept_generic_data_uri(
     tmp_path, monkeypatch
 ):
@@ -616,7 +591,6 @@ def test_from_file_system_uses_pathlib_file_uri(tmp_path):
             assert not component.file.startswith("file:////")
 
 
-@pytest.mark.asyncio
 async def test_video_and_file_components_accept_standard_file_uri(tmp_path):
     video_path = tmp_path / "video.mp4"
     file_path = tmp_path / "document.txt"
@@ -632,7 +606,6 @@ async def test_video_and_file_components_accept_standard_file_uri(tmp_path):
     assert await file_component.get_file() == str(file_path)
 
 
-@pytest.mark.asyncio
 async def test_file_token_service_accepts_standard_file_uri(tmp_path):
     file_path = tmp_path / "document with space.txt"
     file_path.write_text("document", encoding="utf-8")
@@ -660,7 +633,6 @@ def test_path_mapping_accepts_standard_and_legacy_file_uri(tmp_path):
         assert path_Mapping(mapping, legacy_file_uri) == expected_path
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "rate, channels",
     [
@@ -737,7 +709,6 @@ class _FakePysilk:
         output_io.write(b"\x02#!SILK_V3")
 
 
-@pytest.mark.asyncio
 async def test_wav_to_tencent_silk_resamples_unsupported_rate(tmp_path, monkeypatch):
     """44100 Hz input must be resampled to 24 kHz before pysilk.encode."""
     fake = _FakePysilk()
@@ -755,7 +726,6 @@ async def test_wav_to_tencent_silk_resamples_unsupported_rate(tmp_path, monkeypa
     assert silk_path.read_bytes().startswith(b"\x02#!SILK_V3")
 
 
-@pytest.mark.asyncio
 async def test_wav_to_tencent_silk_resamples_stereo(tmp_path, monkeypatch):
     """Stereo input at a supported rate must still be downmixed to mono."""
     fake = _FakePysilk()
@@ -771,7 +741,6 @@ async def test_wav_to_tencent_silk_resamples_stereo(tmp_path, monkeypatch):
     assert fake.calls[0]["sample_rate"] == 48000
 
 
-@pytest.mark.asyncio
 async def test_wav_to_tencent_silk_skips_resample_for_supported_rate(
     tmp_path, monkeypatch
 ):
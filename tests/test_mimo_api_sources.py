@@ -179,7 +179,6 @@ def test_mimo_headers_use_single_authorization_method():
     }
 
 
-@pytest.mark.asyncio
 async def test_mimo_tts_get_audio_handles_empty_choices():
     provider = _make_tts_provider()
 
@@ -199,7 +198,6 @@ async def test_mimo_tts_get_audio_handles_empty_choices():
         await provider.get_audio("hello")
 
 
-@pytest.mark.asyncio
 async def test_mimo_stt_asr_model_payload_includes_audio_only(monkeypatch):
     """专用 ASR 模型按官方语音识别文档只传 input_audio，不带任何提示词。"""
     provider = _make_stt_provider(
@@ -269,7 +267,6 @@ def test_mimo_stt_default_model_is_v25_asr():
         asyncio.run(provider.terminate())
 
 
-@pytest.mark.asyncio
 async def test_mimo_stt_multimodal_model_payload_includes_transcription_prompts(
     monkeypatch,
 ):
@@ -334,7 +331,6 @@ async def test_mimo_stt_multimodal_model_payload_includes_transcription_prompts(
     ]
 
 
-@pytest.mark.asyncio
 async def test_mimo_stt_prepare_audio_input_returns_data_url(monkeypatch):
     class _ResolvedAudio:
         base64_data = MIMO_STT_TEST_AUDIO_BASE64
@@ -370,7 +366,6 @@ async def test_mimo_stt_prepare_audio_input_returns_data_url(monkeypatch):
     assert cleanup_paths == []
 
 
-@pytest.mark.asyncio
 async def test_mimo_stt_prepare_audio_input_rejects_non_wav_payload(monkeypatch):
     """上游 SILK→WAV 转换静默失败时应本地报错，而不是把坏字节发给 API（#9113）。"""
     silk_base64 = base64.b64encode(b"\x02#!SILK_V3" + b"\x00" * 16).decode()
@@ -405,7 +400,6 @@ def test_mimo_stt_wav_validation_accepts_unpadded_base64_header():
     _validate_wav_payload(wav_base64, "/tmp/test.wav")
 
 
-@pytest.mark.asyncio
 async def test_mimo_stt_get_text_uses_reasoning_content(monkeypatch):
     provider = _make_stt_provider()
 
@@ -435,7 +429,6 @@ async def test_mimo_stt_get_text_uses_reasoning_content(monkeypatch):
     assert await provider.get_text("/tmp/test.wav") == "转写结果"
 
 
-@pytest.mark.asyncio
 async def test_mimo_stt_get_text_handles_empty_choices(monkeypatch):
     provider = _make_stt_provider()
 
@@ -462,7 +455,6 @@ async def test_mimo_stt_get_text_handles_empty_choices(monkeypatch):
         await provider.get_text("/tmp/test.wav")
 
 
-@pytest.mark.asyncio
 async def test_mimo_stt_get_text_handles_null_message(monkeypatch):
     provider = _make_stt_provider()
 
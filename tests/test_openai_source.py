@@ -120,7 +120,6 @@ def test_create_http_client_falls_back_to_global_httpx_module(monkeypatch):
     assert captured["httpx_module"] is openai_source_module.httpx
 
 
-@pytest.mark.asyncio
 async def test_get_models_retries_transient_request_error(monkeypatch):
     monkeypatch.setattr(request_retry, "REQUEST_RETRY_WAIT_MIN_S", 0)
     monkeypatch.setattr(request_retry, "REQUEST_RETRY_WAIT_MAX_S", 0)
@@ -148,7 +147,6 @@ async def test_get_models_retries_transient_request_error(monkeypatch):
     assert models.calls == 2
 
 
-@pytest.mark.asyncio
 async def test_text_chat_passes_request_max_retries_to_query():
     captured: dict[str, object] = {}
 
@@ -171,7 +169,6 @@ async def test_text_chat_passes_request_max_retries_to_query():
     assert captured["request_max_retries"] == 2
 
 
-@pytest.mark.asyncio
 async def test_handle_api_error_content_moderated_removes_images():
     provider = _make_provider(
         {"image_moderation_error_patterns": ["file:content-moderated"]}
@@ -212,7 +209,6 @@ async def test_handle_api_error_content_moderated_removes_images():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_handle_api_error_model_not_vlm_removes_images_and_retries_text_only():
     provider = _make_provider()
     try:
@@ -251,7 +247,6 @@ async def test_handle_api_error_model_not_vlm_removes_images_and_retries_text_on
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_handle_api_error_model_not_vlm_after_fallback_raises():
     provider = _make_provider()
     try:
@@ -287,7 +282,6 @@ async def test_handle_api_error_model_not_vlm_after_fallback_raises():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_handle_api_error_content_moderated_with_unserializable_body():
     provider = _make_provider({"image_moderation_error_patterns": ["blocked"]})
     try:
@@ -337,7 +331,6 @@ def test_extract_error_text_candidates_truncates_long_response_text():
     )
 
 
-@pytest.mark.asyncio
 async def test_openai_payload_keeps_reasoning_content_in_assistant_history():
     provider = _make_provider()
     try:
@@ -364,7 +357,6 @@ async def test_openai_payload_keeps_reasoning_content_in_assistant_history():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_groq_payload_drops_reasoning_content_from_assistant_history():
     provider = _make_groq_provider()
     try:
@@ -392,7 +384,6 @@ async def test_groq_payload_drops_reasoning_content_from_assistant_history():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_handle_api_error_content_moderated_without_images_raises():
     provider = _make_provider(
         {"image_moderation_error_patterns": ["file:content-moderated"]}
@@ -424,7 +415,6 @@ async def test_handle_api_error_content_moderated_without_images_raises():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_handle_api_error_content_moderated_detects_structured_body():
     provider = _make_provider(
         {"image_moderation_error_patterns": ["content_moderated"]}
@@ -466,7 +456,6 @@ async def test_handle_api_error_content_moderated_detects_structured_body():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_handle_api_error_content_moderated_supports_custom_patterns():
     provider = _make_provider(
         {"image_moderation_error_patterns": ["blocked_by_policy_code_123"]}
@@ -505,7 +494,6 @@ async def test_handle_api_error_content_moderated_supports_custom_patterns():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_handle_api_error_content_moderated_without_patterns_raises():
     provider = _make_provider()
     try:
@@ -541,7 +529,6 @@ async def test_handle_api_error_content_moderated_without_patterns_raises():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_handle_api_error_unknown_image_error_raises():
     provider = _make_provider()
     try:
@@ -576,7 +563,6 @@ async def test_handle_api_error_unknown_image_error_raises():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_handle_api_error_invalid_attachment_removes_images_and_retries_text_only():
     provider = _make_provider()
     try:
@@ -622,7 +608,6 @@ async def test_handle_api_error_invalid_attachment_removes_images_and_retries_te
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_handle_api_error_invalid_attachment_without_images_raises():
     provider = _make_provider()
     try:
@@ -660,7 +645,6 @@ async def test_handle_api_error_invalid_attachment_without_images_raises():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_handle_api_error_invalid_attachment_after_fallback_raises():
     provider = _make_provider()
     try:
@@ -705,7 +689,6 @@ async def test_handle_api_error_invalid_attachment_after_fallback_raises():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_prepare_chat_payload_materializes_context_http_image_urls(monkeypatch):
     provider = _make_provider()
     try:
@@ -770,7 +753,6 @@ async def test_prepare_chat_payload_materializes_context_http_image_urls(monkeyp
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_prepare_chat_payload_skips_materialization_for_text_only_context(
     monkeypatch,
 ):
@@ -794,7 +776,6 @@ async def test_prepare_chat_payload_skips_materialization_for_text_only_context(
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_prepare_chat_payload_skips_materialization_for_text_only_parts(
     monkeypatch,
 ):
@@ -828,7 +809,6 @@ async def test_prepare_chat_payload_skips_materialization_for_text_only_parts(
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_prepare_chat_payload_materializes_context_http_image_urls_with_detected_mime(
     monkeypatch, tmp_path
 ):
@@ -871,7 +851,6 @@ async def test_prepare_chat_payload_materializes_context_http_image_urls_with_de
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_prepare_chat_payload_materializes_context_file_uri_image_urls(tmp_path):
     provider = _make_provider()
     try:
@@ -920,7 +899,6 @@ def test_file_uri_to_path_preserves_remote_netloc_as_unc_path():
     )
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_part_rejects_invalid_local_file(tmp_path):
     provider = _make_provider()
     try:
@@ -932,7 +910,6 @@ async def test_resolve_image_part_rejects_invalid_local_file(tmp_path):
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_part_rejects_invalid_file_uri(tmp_path):
     provider = _make_provider()
     try:
@@ -944,7 +921,6 @@ async def test_resolve_image_part_rejects_invalid_file_uri(tmp_path):
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_image_ref_to_data_url_mode_controls_invalid_file_behavior(tmp_path):
     provider = _make_provider()
     try:
@@ -961,7 +937,6 @@ async def test_image_ref_to_data_url_mode_controls_invalid_file_behavior(tmp_pat
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_materialize_context_image_parts_returns_new_messages(monkeypatch):
     provider = _make_provider()
     try:
@@ -1016,7 +991,6 @@ async def test_materialize_context_image_parts_returns_new_messages(monkeypatch)
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_encode_image_bs64_missing_file_raises(tmp_path):
     provider = _make_provider()
     try:
@@ -1027,7 +1001,6 @@ async def test_encode_image_bs64_missing_file_raises(tmp_path):
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_encode_image_bs64_invalid_file_raises(tmp_path):
     provider = _make_provider()
     try:
@@ -1040,7 +1013,6 @@ async def test_encode_image_bs64_invalid_file_raises(tmp_path):
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_encode_image_bs64_supports_base64_scheme():
     provider = _make_provider()
     try:
@@ -1051,7 +1023,6 @@ async def test_encode_image_bs64_supports_base64_scheme():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_encode_image_bs64_supports_file_uri(tmp_path):
     provider = _make_provider()
     try:
@@ -1065,7 +1036,6 @@ async def test_encode_image_bs64_supports_file_uri(tmp_path):
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_part_supports_base64_scheme():
     provider = _make_provider()
     try:
@@ -1077,7 +1047,6 @@ async def test_resolve_image_part_supports_base64_scheme():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_part_preserves_base64_png_mime_type():
     provider = _make_provider()
     try:
@@ -1098,7 +1067,6 @@ async def test_resolve_image_part_preserves_base64_png_mime_type():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_prepare_chat_payload_materializes_context_localhost_file_uri_image_urls(
     tmp_path,
 ):
@@ -1132,7 +1100,6 @@ async def test_prepare_chat_payload_materializes_context_localhost_file_uri_imag
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_resolve_audio_part_supports_data_audio_uri(tmp_path, monkeypatch):
     monkeypatch.setattr(
         "astrbot.core.utils.media_utils.get_astrbot_temp_path",
@@ -1157,7 +1124,6 @@ async def test_resolve_audio_part_supports_data_audio_uri(tmp_path, monkeypatch)
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_resolve_audio_part_supports_base64_scheme(tmp_path, monkeypatch):
     monkeypatch.setattr(
         "astrbot.core.utils.media_utils.get_astrbot_temp_path",
@@ -1182,7 +1148,6 @@ async def test_resolve_audio_part_supports_base64_scheme(tmp_path, monkeypatch):
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_audio_preprocess_failure_does_not_log_media_ref(monkeypatch):
     provider = _make_provider()
     captured: dict[str, object] = {}
@@ -1216,7 +1181,6 @@ async def test_audio_preprocess_failure_does_not_log_media_ref(monkeypatch):
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_prepare_chat_payload_keeps_original_context_image_when_materialization_fails(
     monkeypatch,
 ):
@@ -1271,7 +1235,6 @@ async def test_prepare_chat_payload_keeps_original_context_image_when_materializ
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_apply_provider_specific_request_overrides_disables_ollama_thinking():
     provider = _make_provider(
         {
@@ -1297,7 +1260,6 @@ async def test_apply_provider_specific_request_overrides_disables_ollama_thinkin
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_provider_specific_request_overrides_sets_minimax_m3_max_tokens():
     provider = _make_provider({"provider": "nvidia"})
     try:
@@ -1312,7 +1274,6 @@ async def test_provider_specific_request_overrides_sets_minimax_m3_max_tokens():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_minimax_m3_max_tokens_preserves_custom_extra_body_value():
     provider = _make_provider({"provider": "nvidia"})
     try:
@@ -1327,7 +1288,6 @@ async def test_minimax_m3_max_tokens_preserves_custom_extra_body_value():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_minimax_m3_max_tokens_preserves_standard_payload_value():
     provider = _make_provider({"provider": "nvidia"})
     try:
@@ -1345,7 +1305,6 @@ async def test_minimax_m3_max_tokens_preserves_standard_payload_value():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_nvidia_request_does_not_set_max_tokens_for_other_models():
     provider = _make_provider({"provider": "nvidia"})
     try:
@@ -1360,7 +1319,6 @@ async def test_nvidia_request_does_not_set_max_tokens_for_other_models():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_query_injects_reasoning_effort_none_for_ollama(monkeypatch):
     provider = _make_provider(
         {
@@ -1419,7 +1377,6 @@ async def test_query_injects_reasoning_effort_none_for_ollama(monkeypatch):
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_parse_openai_completion_raises_empty_model_output_error():
     provider = _make_provider()
     try:
@@ -1455,7 +1412,6 @@ async def test_parse_openai_completion_raises_empty_model_output_error():
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_query_stream_extracts_usage_from_empty_choices_chunk(monkeypatch):
     provider = _make_provider()
     try:
@@ -1688,7 +1644,6 @@ def test_sanitize_assistant_messages_resets_tool_ids_after_non_tool_message():
     ]
 
 
-@pytest.mark.asyncio
 async def test_query_filters_empty_assistant_message_without_tool_calls(monkeypatch):
     """Test that empty assistant messages without tool_calls are filtered out."""
     provider = _make_provider()
@@ -1743,7 +1698,6 @@ async def test_query_filters_empty_assistant_message_without_tool_calls(monkeypa
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_query_filters_null_content_assistant_message_without_tool_calls(
     monkeypatch,
 ):
@@ -1800,7 +1754,6 @@ async def test_query_filters_null_content_assistant_message_without_tool_calls(
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_query_converts_empty_content_to_none_with_tool_calls(monkeypatch):
     """Test that empty content with tool_calls is converted to None (OpenAI spec)."""
     provider = _make_provider()
@@ -1866,7 +1819,6 @@ async def test_query_converts_empty_content_to_none_with_tool_calls(monkeypatch)
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_query_keeps_valid_assistant_message_with_content(monkeypatch):
     """Test that valid assistant messages with content are kept."""
     provider = _make_provider()
@@ -1920,7 +1872,6 @@ async def test_query_keeps_valid_assistant_message_with_content(monkeypatch):
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_query_keeps_assistant_message_with_tool_calls_and_none_content(
     monkeypatch,
 ):
@@ -1988,7 +1939,6 @@ async def test_query_keeps_assistant_message_with_tool_calls_and_none_content(
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_query_does_not_filter_user_or_system_messages(monkeypatch):
     """Test that user and system messages are not affected by the filter."""
     provider = _make_provider()
@@ -2045,7 +1995,6 @@ async def test_query_does_not_filter_user_or_system_messages(monkeypatch):
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_query_stream_filters_empty_assistant_message(monkeypatch):
     """Regression for #7721: streaming path must also filter empty assistant messages.
 
@@ -2100,7 +2049,6 @@ async def test_query_stream_filters_empty_assistant_message(monkeypatch):
         await provider.terminate()
 
 
-@pytest.mark.asyncio
 async def test_query_filters_empty_list_content_assistant_message(monkeypatch):
     """Empty-list content (``content == []``) must also be filtered, not just ``""`` / ``None``."""
     provider = _make_provider()
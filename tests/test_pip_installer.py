@@ -94,7 +94,6 @@ def configure_run_pip_in_process_capture(monkeypatch):
     return _configure
 
 
-@pytest.mark.asyncio
 async def test_install_targets_site_packages_for_desktop_client(monkeypatch, tmp_path):
     monkeypatch.setenv("ASTRBOT_DESKTOP_CLIENT", "1")
     monkeypatch.delattr("sys.frozen", raising=False)
@@ -130,7 +129,6 @@ async def test_install_targets_site_packages_for_desktop_client(monkeypatch, tmp
     assert ensure_preferred_calls == [(str(site_packages_path), {"demo-package"})]
 
 
-@pytest.mark.asyncio
 async def test_install_keeps_target_upgrade_enabled_by_default_for_desktop_client(
     monkeypatch, tmp_path
 ):
@@ -156,7 +154,6 @@ async def test_install_keeps_target_upgrade_enabled_by_default_for_desktop_clien
     assert "--upgrade-strategy" in recorded_args
 
 
-@pytest.mark.asyncio
 async def test_install_skips_target_upgrade_when_disabled_for_desktop_client(
     monkeypatch, tmp_path
 ):
@@ -182,7 +179,6 @@ async def test_install_skips_target_upgrade_when_disabled_for_desktop_client(
     assert "--upgrade-strategy" not in recorded_args
 
 
-@pytest.mark.asyncio
 async def test_run_pip_in_process_streams_output_lines(monkeypatch):
     logged_lines = []
     first_line_seen = asyncio.Event()
@@ -228,7 +224,6 @@ async def test_run_pip_in_process_streams_output_lines(monkeypatch):
     ]
 
 
-@pytest.mark.asyncio
 async def test_run_pip_in_process_preserves_shared_stream_order(monkeypatch):
     logged_lines = []
 
@@ -257,7 +252,6 @@ async def test_run_pip_in_process_preserves_shared_stream_order(monkeypatch):
     assert logged_lines[-2:] == ["outerr", " line"]
 
 
-@pytest.mark.asyncio
 async def test_run_pip_in_process_preserves_blank_lines(monkeypatch):
     logged_lines = []
 
@@ -288,7 +282,6 @@ async def test_run_pip_in_process_preserves_blank_lines(monkeypatch):
     ]
 
 
-@pytest.mark.asyncio
 async def test_run_pip_in_process_preserves_trailing_blank_line_on_flush(monkeypatch):
     logged_lines = []
 
@@ -315,7 +308,6 @@ async def test_run_pip_in_process_preserves_trailing_blank_line_on_flush(monkeyp
     assert logged_lines[-2:] == ["Collecting demo-package", ""]
 
 
-@pytest.mark.asyncio
 async def test_run_pip_in_process_normalizes_crlf_without_extra_blank_lines(
     monkeypatch,
 ):
@@ -470,7 +462,6 @@ def test_build_packaged_windows_runtime_build_env_matches_snapshot_keys_case_ins
     }
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("include_exists", "libs_exists"),
     [
@@ -513,7 +504,6 @@ async def test_run_pip_in_process_injects_windows_runtime_build_env(
     assert pip_installer_module.os.environ["LIB"] == EXISTING_WINDOWS_LIB_DIR
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("include_exists", "libs_exists"),
     [
@@ -553,7 +543,6 @@ async def test_run_pip_in_process_injects_windows_runtime_build_env_without_exis
     assert "LIB" not in pip_installer_module.os.environ
 
 
-@pytest.mark.asyncio
 async def test_run_pip_in_process_does_not_inject_when_runtime_dirs_missing(
     configure_run_pip_in_process_capture,
 ):
@@ -577,7 +566,6 @@ async def test_run_pip_in_process_does_not_inject_when_runtime_dirs_missing(
     assert pip_installer_module.os.environ["LIB"] == EXISTING_WINDOWS_LIB_DIR
 
 
-@pytest.mark.asyncio
 async def test_run_pip_in_process_uses_latest_env_when_building_runtime_paths(
     monkeypatch,
     configure_run_pip_in_process_capture,
@@ -614,7 +602,6 @@ async def test_run_pip_in_process_uses_latest_env_when_building_runtime_paths(
     assert pip_installer_module.os.environ["LIB"] == updated_lib
 
 
-@pytest.mark.asyncio
 async def test_run_pip_in_process_does_not_modify_env_on_non_windows(
     configure_run_pip_in_process_capture,
 ):
@@ -636,7 +623,6 @@ async def test_run_pip_in_process_does_not_modify_env_on_non_windows(
     assert pip_installer_module.os.environ["LIB"] == existing_lib
 
 
-@pytest.mark.asyncio
 async def test_run_pip_in_process_does_not_inject_env_when_not_packaged(
     configure_run_pip_in_process_capture,
 ):
@@ -658,7 +644,6 @@ async def test_run_pip_in_process_does_not_inject_env_when_not_packaged(
     assert "LIB" not in pip_installer_module.os.environ
 
 
-@pytest.mark.asyncio
 async def test_run_pip_in_process_classifies_nonstandard_conflict_output(monkeypatch):
     def fake_pip_main(args):
         del args
@@ -687,7 +672,6 @@ async def test_run_pip_in_process_classifies_nonstandard_conflict_output(monkeyp
     assert "The conflict is caused by:" in exc_info.value.errors
 
 
-@pytest.mark.asyncio
 async def test_install_raises_dedicated_pip_install_error_on_non_conflict_failure(
     monkeypatch,
 ):
@@ -706,7 +690,6 @@ async def test_install_raises_dedicated_pip_install_error_on_non_conflict_failur
         await installer.install(package_name="demo-package")
 
 
-@pytest.mark.asyncio
 async def test_run_pip_with_classification_raises_install_error_on_non_conflict_failure(
     monkeypatch,
 ):
@@ -725,7 +708,6 @@ async def test_run_pip_with_classification_raises_install_error_on_non_conflict_
         await installer._run_pip_with_classification(["install", "demo-package"])
 
 
-@pytest.mark.asyncio
 async def test_run_pip_in_process_bounds_retained_conflict_lines(monkeypatch):
     def fake_pip_main(args):
         del args
@@ -1069,7 +1051,6 @@ def test_core_constraints_file_propagates_inner_conflict_without_fake_warning(
     assert warning_logs == []
 
 
-@pytest.mark.asyncio
 async def test_install_adds_desktop_core_lock_constraints_for_packaged_runtime(
     monkeypatch, tmp_path
 ):
@@ -1207,7 +1188,6 @@ def test_build_pip_args_appends_default_index_when_not_overridden():
     assert requested == {"demo-package"}
 
 
-@pytest.mark.asyncio
 async def test_install_splits_space_separated_packages(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1222,7 +1202,6 @@ async def test_install_splits_space_separated_packages(monkeypatch):
     assert recorded_args[0:3] == ["install", "demo-package", "another-package>=1.0"]
 
 
-@pytest.mark.asyncio
 async def test_install_splits_three_space_separated_packages(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1244,7 +1223,6 @@ async def test_install_splits_three_space_separated_packages(monkeypatch):
     ]
 
 
-@pytest.mark.asyncio
 async def test_install_splits_three_bare_packages(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1264,7 +1242,6 @@ async def test_install_splits_three_bare_packages(monkeypatch):
     ]
 
 
-@pytest.mark.asyncio
 async def test_install_tracks_multiline_packages_for_desktop_client(
     monkeypatch, tmp_path
 ):
@@ -1301,7 +1278,6 @@ async def test_install_tracks_multiline_packages_for_desktop_client(
     ]
 
 
-@pytest.mark.asyncio
 async def test_install_splits_space_separated_packages_within_multiline_input(
     monkeypatch,
 ):
@@ -1325,7 +1301,6 @@ async def test_install_splits_space_separated_packages_within_multiline_input(
     ]
 
 
-@pytest.mark.asyncio
 async def test_install_keeps_single_requirement_with_marker_intact(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1343,7 +1318,6 @@ async def test_install_keeps_single_requirement_with_marker_intact(monkeypatch):
     ]
 
 
-@pytest.mark.asyncio
 async def test_install_keeps_single_requirement_with_compact_marker_intact(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1361,7 +1335,6 @@ async def test_install_keeps_single_requirement_with_compact_marker_intact(monke
     ]
 
 
-@pytest.mark.asyncio
 async def test_install_keeps_single_requirement_with_version_range_intact(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1379,7 +1352,6 @@ async def test_install_keeps_single_requirement_with_version_range_intact(monkey
     ]
 
 
-@pytest.mark.asyncio
 async def test_install_tracks_only_real_requirement_names_for_spaced_single_requirement(
     monkeypatch, tmp_path
 ):
@@ -1444,7 +1416,6 @@ def test_prefer_installed_dependencies_prefers_modules_for_requirements_in_deskt
     assert preferred_calls == [(str(site_packages_path), {"demo-package"})]
 
 
-@pytest.mark.asyncio
 async def test_install_multiline_input_strips_comments_and_splits_options(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1471,7 +1442,6 @@ async def test_install_multiline_input_strips_comments_and_splits_options(monkey
     ]
 
 
-@pytest.mark.asyncio
 async def test_install_single_line_input_strips_inline_comment(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1486,7 +1456,6 @@ async def test_install_single_line_input_strips_inline_comment(monkeypatch):
     assert recorded_args[0:2] == ["install", "requests==2.31.0"]
 
 
-@pytest.mark.asyncio
 async def test_install_splits_single_line_editable_option_input(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1501,7 +1470,6 @@ async def test_install_splits_single_line_editable_option_input(monkeypatch):
     assert recorded_args[0:3] == ["install", "-e", "."]
 
 
-@pytest.mark.asyncio
 async def test_install_splits_single_line_option_with_url(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1525,7 +1493,6 @@ async def test_install_splits_single_line_option_with_url(monkeypatch):
     assert "-i" not in recorded_args
 
 
-@pytest.mark.asyncio
 async def test_install_tracks_requirement_name_for_single_line_option_input(
     monkeypatch, tmp_path
 ):
@@ -1558,7 +1525,6 @@ async def test_install_tracks_requirement_name_for_single_line_option_input(
     assert ensure_preferred_calls == [(str(site_packages_path), {"demo-package"})]
 
 
-@pytest.mark.asyncio
 async def test_install_keeps_equals_form_index_override(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1580,7 +1546,6 @@ async def test_install_keeps_equals_form_index_override(monkeypatch):
     assert "-i" not in recorded_args
 
 
-@pytest.mark.asyncio
 async def test_install_keeps_short_form_index_override(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1600,7 +1565,6 @@ async def test_install_keeps_short_form_index_override(monkeypatch):
     assert "-i" not in recorded_args
 
 
-@pytest.mark.asyncio
 async def test_install_preserves_url_fragment_in_option_input(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1652,7 +1616,6 @@ def test_find_missing_requirements_returns_none_for_editable_local_path_variants
     assert missing is None
 
 
-@pytest.mark.asyncio
 async def test_install_strips_inline_comment_from_option_line(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1676,7 +1639,6 @@ async def test_install_strips_inline_comment_from_option_line(monkeypatch):
     ]
 
 
-@pytest.mark.asyncio
 async def test_install_falls_back_to_raw_input_for_invalid_token_string(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1692,7 +1654,6 @@ async def test_install_falls_back_to_raw_input_for_invalid_token_string(monkeypa
     assert recorded_args[0:4] == ["install", "demo-package", "!!!", "another-package"]
 
 
-@pytest.mark.asyncio
 async def test_install_ignores_whitespace_only_package_string(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1704,7 +1665,6 @@ async def test_install_ignores_whitespace_only_package_string(monkeypatch):
     run_pip.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_install_ignores_missing_package_and_requirements(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1716,7 +1676,6 @@ async def test_install_ignores_missing_package_and_requirements(monkeypatch):
     run_pip.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_install_respects_index_override_in_pip_install_arg(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1737,7 +1696,6 @@ async def test_install_respects_index_override_in_pip_install_arg(monkeypatch):
     assert "https://pypi.org/simple" not in recorded_args
 
 
-@pytest.mark.asyncio
 async def test_install_respects_no_index_with_find_links(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1817,7 +1775,6 @@ def test_redact_pip_args_for_logging_redacts_inline_sensitive_values():
     ]
 
 
-@pytest.mark.asyncio
 async def test_install_logs_redacted_pip_argv_when_credentials_present(monkeypatch):
     run_pip = _make_run_pip_mock()
     logged_lines = []
@@ -1843,7 +1800,6 @@ async def test_install_logs_redacted_pip_argv_when_credentials_present(monkeypat
     assert "https://<redacted>@example.com/simple" in argv_logs[0]
 
 
-@pytest.mark.asyncio
 async def test_install_does_not_add_aliyun_trusted_host_for_default_index(monkeypatch):
     run_pip = _make_run_pip_mock()
 
@@ -1860,7 +1816,6 @@ async def test_install_does_not_add_aliyun_trusted_host_for_default_index(monkey
     assert "--trusted-host" not in recorded_args
 
 
-@pytest.mark.asyncio
 async def test_install_adds_aliyun_trusted_host_only_for_aliyun_index(monkeypatch):
     run_pip = _make_run_pip_mock()
 
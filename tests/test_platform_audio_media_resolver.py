@@ -1,4 +1,3 @@
-import pytest
 
 from astrbot.api.event import MessageChain
 from astrbot.api.message_components import Record
@@ -40,7 +39,6 @@ def _patch_resolver(monkeypatch, module) -> None:
     monkeypatch.setattr(module, "MediaResolver", FakeMediaResolver)
 
 
-@pytest.mark.asyncio
 async def test_line_audio_component_uses_media_resolver_for_external_url(monkeypatch):
     _patch_resolver(monkeypatch, line_adapter)
     adapter = LinePlatformAdapter.__new__(LinePlatformAdapter)
@@ -67,7 +65,6 @@ async def test_line_audio_component_uses_media_resolver_for_external_url(monkeyp
     ]
 
 
-@pytest.mark.asyncio
 async def test_lark_audio_component_uses_media_resolver_after_download(monkeypatch):
     _patch_resolver(monkeypatch, lark_adapter)
     adapter = LarkPlatformAdapter.__new__(LarkPlatformAdapter)
@@ -102,7 +99,6 @@ async def test_lark_audio_component_uses_media_resolver_after_download(monkeypat
     ]
 
 
-@pytest.mark.asyncio
 async def test_qqofficial_audio_attachment_uses_media_resolver(monkeypatch):
     _patch_resolver(monkeypatch, qqofficial_platform_adapter)
 
@@ -123,7 +119,6 @@ async def test_qqofficial_audio_attachment_uses_media_resolver(monkeypatch):
     ]
 
 
-@pytest.mark.asyncio
 async def test_qqofficial_send_record_resolves_to_tencent_silk(monkeypatch):
     _patch_resolver(monkeypatch, qqofficial_message_event)
 
@@ -141,7 +136,6 @@ async def test_qqofficial_send_record_resolves_to_tencent_silk(monkeypatch):
     ]
 
 
-@pytest.mark.asyncio
 async def test_misskey_audio_file_component_uses_media_resolver(monkeypatch):
     _patch_resolver(monkeypatch, misskey_utils)
 
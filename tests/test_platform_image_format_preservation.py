@@ -4,7 +4,6 @@ from io import BytesIO
 from pathlib import Path
 from unittest.mock import AsyncMock
 
-import pytest
 from PIL import Image as PILImage
 
 from astrbot.api.event import MessageChain
@@ -15,7 +14,6 @@ from astrbot.core.platform.sources.slack.slack_event import SlackMessageEvent
 from astrbot.core.platform.sources.webchat import webchat_event
 
 
-@pytest.mark.asyncio
 async def test_satori_image_data_url_preserves_png_mime_type():
     image_buffer = BytesIO()
     PILImage.new("RGBA", (2, 2), (255, 0, 0, 128)).save(
@@ -33,7 +31,6 @@ async def test_satori_image_data_url_preserves_png_mime_type():
     assert result.startswith('<img src="data:image/png;base64,')
 
 
-@pytest.mark.asyncio
 async def test_satori_image_data_url_preserves_jpeg_mime_type():
     image_buffer = BytesIO()
     PILImage.new("RGB", (2, 2), (0, 255, 0)).save(
@@ -51,7 +48,6 @@ async def test_satori_image_data_url_preserves_jpeg_mime_type():
     assert result.startswith('<img src="data:image/jpeg;base64,')
 
 
-@pytest.mark.asyncio
 async def test_webchat_image_attachment_uses_detected_extension(tmp_path, monkeypatch):
     image_buffer = BytesIO()
     PILImage.new("RGBA", (2, 2), (255, 0, 0, 128)).save(
@@ -86,7 +82,6 @@ async def test_webchat_image_attachment_uses_detected_extension(tmp_path, monkey
     assert (tmp_path / filename).exists()
 
 
-@pytest.mark.asyncio
 async def test_slack_image_upload_uses_resolved_filename(tmp_path):
     image_path = tmp_path / "transparent.png"
     PILImage.new("RGBA", (2, 2), (255, 0, 0, 128)).save(image_path)
@@ -105,7 +100,6 @@ async def test_slack_image_upload_uses_resolved_filename(tmp_path):
     assert web_client.files_upload_v2.await_args.kwargs["filename"] == "transparent.png"
 
 
-@pytest.mark.asyncio
 async def test_mattermost_image_upload_uses_detected_mime_type(tmp_path):
     image_path = tmp_path / "transparent.bin"
     PILImage.new("RGBA", (2, 2), (255, 0, 0, 128)).save(image_path, format="PNG")
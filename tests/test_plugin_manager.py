@@ -399,7 +399,6 @@ def local_updator(plugin_manager_pm):
 # --- Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("dependency_install_fails", [False, True])
 async def test_install_plugin_dependency_install_flow(
     plugin_manager_pm: PluginManager, monkeypatch, dependency_install_fails: bool
@@ -446,7 +445,6 @@ async def test_install_plugin_dependency_install_flow(
         assert events[1] == ("load", TEST_PLUGIN_DIR)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("dependency_install_fails", [False, True])
 async def test_install_plugin_from_file_dependency_install_flow(
     plugin_manager_pm: PluginManager,
@@ -487,7 +485,6 @@ async def test_install_plugin_from_file_dependency_install_flow(
         assert ("load", TEST_PLUGIN_DIR) in events
 
 
-@pytest.mark.asyncio
 async def test_install_plugin_from_file_conflict_keeps_failed_plugins_clean(
     plugin_manager_pm: PluginManager,
     local_updator: Path,
@@ -522,7 +519,6 @@ async def test_install_plugin_from_file_conflict_keeps_failed_plugins_clean(
     assert new_upload_dirs == []
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("dependency_install_fails", [False, True])
 async def test_reload_failed_plugin_dependency_install_flow(
     plugin_manager_pm: PluginManager,
@@ -566,7 +562,6 @@ async def test_reload_failed_plugin_dependency_install_flow(
         assert events[1] == ("load", TEST_PLUGIN_DIR)
 
 
-@pytest.mark.asyncio
 async def test_reload_all_unbinds_every_registered_plugin(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -617,7 +612,6 @@ async def test_reload_all_unbinds_every_registered_plugin(
     assert unbound == plugin_names
 
 
-@pytest.mark.asyncio
 async def test_turn_plugin_toggles_llm_tools_from_plugin_child_module(
     plugin_manager_pm: PluginManager,
     monkeypatch,
@@ -717,7 +711,6 @@ def test_is_plugin_llm_tool_requires_module_boundary():
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_plugin_preserves_user_disabled_llm_tools(
     plugin_manager_pm: PluginManager,
     monkeypatch,
@@ -772,7 +765,6 @@ async def test_turn_plugin_preserves_user_disabled_llm_tools(
         cast(Any, plugin_manager_pm.context).stars.remove(plugin)
 
 
-@pytest.mark.asyncio
 async def test_migrate_legacy_plugin_tool_inactivation_state(
     plugin_manager_pm: PluginManager,
     monkeypatch,
@@ -847,7 +839,6 @@ async def test_migrate_legacy_plugin_tool_inactivation_state(
         _clear_star_runtime_state()
 
 
-@pytest.mark.asyncio
 async def test_migrate_legacy_plugin_tool_inactivation_state_defers_without_loaded_plugin_tools(
     plugin_manager_pm: PluginManager,
     monkeypatch,
@@ -885,7 +876,6 @@ async def test_migrate_legacy_plugin_tool_inactivation_state_defers_without_load
         _clear_star_runtime_state()
 
 
-@pytest.mark.asyncio
 async def test_load_applies_manual_inactivation_to_non_plugin_tools(
     plugin_manager_pm: PluginManager,
     monkeypatch,
@@ -936,7 +926,6 @@ async def test_load_applies_manual_inactivation_to_non_plugin_tools(
         llm_tools.func_list = original_func_list
 
 
-@pytest.mark.asyncio
 async def test_load_reports_unregistered_plugin_without_index_error(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -986,7 +975,6 @@ async def test_load_reports_unregistered_plugin_without_index_error(
     assert plugin_name in plugin_manager_pm.failed_plugin_dict
 
 
-@pytest.mark.asyncio
 async def test_ensure_plugin_requirements_reraises_cancelled_error(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1008,7 +996,6 @@ async def test_ensure_plugin_requirements_reraises_cancelled_error(
         )
 
 
-@pytest.mark.asyncio
 async def test_ensure_plugin_requirements_wraps_generic_dependency_install_failure(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1034,7 +1021,6 @@ async def test_ensure_plugin_requirements_wraps_generic_dependency_install_failu
     assert isinstance(exc_info.value.__cause__, RuntimeError)
 
 
-@pytest.mark.asyncio
 async def test_ensure_plugin_requirements_wraps_pip_install_error(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1060,7 +1046,6 @@ async def test_ensure_plugin_requirements_wraps_pip_install_error(
     assert isinstance(exc_info.value.__cause__, PipInstallError)
 
 
-@pytest.mark.asyncio
 async def test_ensure_plugin_requirements_logs_requirements_file_install_for_missing_dependencies(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1088,7 +1073,6 @@ async def test_ensure_plugin_requirements_logs_requirements_file_install_for_mis
     assert any("installing them from requirements.txt" in line for line in logged_lines)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("version_mismatch_names", "expected_allow_target_upgrade"),
     [
@@ -1129,7 +1113,6 @@ async def test_ensure_plugin_requirements_sets_target_upgrade_based_on_version_m
     assert observed_calls[0]["allow_target_upgrade"] is expected_allow_target_upgrade
 
 
-@pytest.mark.asyncio
 async def test_import_plugin_prefers_installed_dependencies_before_first_import(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1172,7 +1155,6 @@ async def test_import_plugin_prefers_installed_dependencies_before_first_import(
     ]
 
 
-@pytest.mark.asyncio
 async def test_import_reserved_plugin_skips_preloading_user_site_dependencies(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1207,7 +1189,6 @@ async def test_import_reserved_plugin_skips_preloading_user_site_dependencies(
     ]
 
 
-@pytest.mark.asyncio
 async def test_import_plugin_skips_preloading_when_requirements_version_mismatch_detected(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1249,7 +1230,6 @@ async def test_import_plugin_skips_preloading_when_requirements_version_mismatch
     ]
 
 
-@pytest.mark.asyncio
 async def test_import_plugin_reinstalls_when_version_mismatch_import_fails(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1306,7 +1286,6 @@ async def test_import_plugin_reinstalls_when_version_mismatch_import_fails(
     ]
 
 
-@pytest.mark.asyncio
 async def test_import_plugin_skips_preloading_when_requirement_precheck_is_unavailable(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1344,7 +1323,6 @@ async def test_import_plugin_skips_preloading_when_requirement_precheck_is_unava
     ]
 
 
-@pytest.mark.asyncio
 async def test_import_plugin_attempts_dependency_recovery_when_precheck_is_unavailable(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1397,7 +1375,6 @@ async def test_import_plugin_attempts_dependency_recovery_when_precheck_is_unava
     ]
 
 
-@pytest.mark.asyncio
 async def test_import_plugin_does_not_recover_from_plain_import_error(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1448,7 +1425,6 @@ async def test_import_plugin_does_not_recover_from_plain_import_error(
     ]
 
 
-@pytest.mark.asyncio
 async def test_import_plugin_surfaces_unexpected_recovery_errors(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1499,7 +1475,6 @@ async def test_import_plugin_surfaces_unexpected_recovery_errors(
     ]
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("dependency_install_fails", [False, True])
 async def test_update_plugin_dependency_install_flow(
     plugin_manager_pm: PluginManager,
@@ -1545,7 +1520,6 @@ async def test_update_plugin_dependency_install_flow(
         assert ("reload", TEST_PLUGIN_DIR) in events
 
 
-@pytest.mark.asyncio
 async def test_install_plugin_skips_dependency_install_when_no_requirements_missing(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -1576,7 +1550,6 @@ async def test_install_plugin_skips_dependency_install_when_no_requirements_miss
     assert ("load", TEST_PLUGIN_DIR) in events
 
 
-@pytest.mark.asyncio
 async def test_install_plugin_runs_dependency_install_when_precheck_fails(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -1611,7 +1584,6 @@ async def test_install_plugin_runs_dependency_install_when_precheck_fails(
     assert ("load", TEST_PLUGIN_DIR) in events
 
 
-@pytest.mark.asyncio
 async def test_ensure_plugin_requirements_installs_only_missing_requirement_lines(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1643,7 +1615,6 @@ async def test_ensure_plugin_requirements_installs_only_missing_requirement_line
     assert not Path(used_path).exists()
 
 
-@pytest.mark.asyncio
 async def test_ensure_plugin_requirements_creates_temp_dir_before_filtered_install(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch, tmp_path
 ):
@@ -1671,7 +1642,6 @@ async def test_ensure_plugin_requirements_creates_temp_dir_before_filtered_insta
     assert len(events) == 1
 
 
-@pytest.mark.asyncio
 async def test_ensure_plugin_requirements_falls_back_when_missing_names_have_no_install_lines(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1700,7 +1670,6 @@ async def test_ensure_plugin_requirements_falls_back_when_missing_names_have_no_
     assert events == [("deps", str(requirements_path))]
 
 
-@pytest.mark.asyncio
 async def test_ensure_plugin_requirements_fallback_full_install_keeps_upgrade_for_version_mismatch(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch
 ):
@@ -1736,7 +1705,6 @@ async def test_ensure_plugin_requirements_fallback_full_install_keeps_upgrade_fo
     assert observed_calls[0]["allow_target_upgrade"] is True
 
 
-@pytest.mark.asyncio
 async def test_ensure_plugin_requirements_does_not_mask_install_error_when_cleanup_fails(
     plugin_manager_pm: PluginManager, local_updator: Path, monkeypatch, tmp_path
 ):
@@ -1788,7 +1756,6 @@ async def test_ensure_plugin_requirements_does_not_mask_install_error_when_clean
 # --- Tests for plugin_id KV cleanup logic ---
 
 
-@pytest.mark.asyncio
 async def test_cleanup_plugin_optional_artifacts_clears_kv_when_plugin_id_present(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -1811,7 +1778,6 @@ async def test_cleanup_plugin_optional_artifacts_clears_kv_when_plugin_id_presen
     assert cleared == [("plugin", "test_author/test_plugin")]
 
 
-@pytest.mark.asyncio
 async def test_cleanup_plugin_optional_artifacts_skips_kv_when_plugin_id_none(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -1834,7 +1800,6 @@ async def test_cleanup_plugin_optional_artifacts_skips_kv_when_plugin_id_none(
     assert cleared == []
 
 
-@pytest.mark.asyncio
 async def test_uninstall_plugin_reads_plugin_id_from_metadata(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -1884,7 +1849,6 @@ async def test_uninstall_plugin_reads_plugin_id_from_metadata(
     assert cleanup_calls[0]["plugin_id"] == "mock_author/mock_name"
 
 
-@pytest.mark.asyncio
 async def test_uninstall_plugin_handles_disabled_plugin_with_plugin_id(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -1933,7 +1897,6 @@ async def test_uninstall_plugin_handles_disabled_plugin_with_plugin_id(
     assert cleanup_calls[0]["plugin_id"] == "mock_author/mock_name"
 
 
-@pytest.mark.asyncio
 async def test_uninstall_failed_plugin_passes_plugin_id_from_record(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -1973,7 +1936,6 @@ async def test_uninstall_failed_plugin_passes_plugin_id_from_record(
     assert cleanup_calls[0]["plugin_id"] == "astrbot_team/helloworld"
 
 
-@pytest.mark.asyncio
 async def test_uninstall_failed_plugin_without_plugin_id_in_record(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -2015,7 +1977,6 @@ async def test_uninstall_failed_plugin_without_plugin_id_in_record(
 # --- reload + deactivated plugin regression tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("inactivated_plugins", "expected_activated"),
     [
@@ -2098,7 +2059,6 @@ async def test_load_syncs_existing_metadata_activation_from_preferences(
         _clear_star_runtime_state()
 
 
-@pytest.mark.asyncio
 async def test_reload_deactivated_plugin_preserves_tools(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -2142,7 +2102,6 @@ async def test_reload_deactivated_plugin_preserves_tools(
         _clear_star_runtime_state()
 
 
-@pytest.mark.asyncio
 async def test_reload_activated_plugin_still_unbinds(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -2181,7 +2140,6 @@ async def test_reload_activated_plugin_still_unbinds(
         _clear_star_runtime_state()
 
 
-@pytest.mark.asyncio
 async def test_full_reload_deactivated_plugin_stays_registered(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -2229,7 +2187,6 @@ async def test_full_reload_deactivated_plugin_stays_registered(
         _clear_star_runtime_state()
 
 
-@pytest.mark.asyncio
 async def test_turn_on_plugin_after_deactivated_reload_reactivates_tools(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -2291,7 +2248,6 @@ async def test_turn_on_plugin_after_deactivated_reload_reactivates_tools(
         _clear_star_runtime_state()
 
 
-@pytest.mark.asyncio
 async def test_repeated_deactivated_loads_bind_handlers_once_when_activated(
     plugin_manager_pm: PluginManager, monkeypatch
 ):
@@ -2,8 +2,6 @@ import base64
 from io import BytesIO
 from types import SimpleNamespace
 
-import pytest
-
 from astrbot.core.message.components import Image, Plain, Reply
 from astrbot.core.pipeline.preprocess_stage import stage as preprocess_stage
 from astrbot.core.pipeline.preprocess_stage.stage import PreProcessStage
@@ -28,7 +26,6 @@ class FakeEvent:
             self.temporary_local_files.append(path)
 
 
-@pytest.mark.asyncio
 async def test_preprocess_preserves_image_formats_and_tracks_temp_files(
     tmp_path, monkeypatch
 ):
@@ -102,7 +99,6 @@ async def test_preprocess_preserves_image_formats_and_tracks_temp_files(
         assert processed_img.n_frames == 2
 
 
-@pytest.mark.asyncio
 async def test_preprocess_path_mapping_accepts_file_uri(tmp_path):
     from PIL import Image as PILImage
 
@@ -173,7 +173,6 @@ class TestResolveProfile:
             profile=profile,
         )
 
-    @pytest.mark.asyncio
     async def test_user_specified_profile_honoured(self):
         """User explicitly sets a non-default profile → use it directly."""
         booter = self._make_booter(profile="browser-python")
@@ -181,7 +180,6 @@ class TestResolveProfile:
         result = await booter._resolve_profile(client)
         assert result == "browser-python"
 
-    @pytest.mark.asyncio
     async def test_user_specified_default_profile_honoured(self):
         """User explicitly sets python-default → use it directly."""
         booter = self._make_booter(profile="python-default")
@@ -189,7 +187,6 @@ class TestResolveProfile:
         result = await booter._resolve_profile(client)
         assert result == "python-default"
 
-    @pytest.mark.asyncio
     async def test_selects_browser_profile(self):
         """When profile is empty, prefer an available profile with browser."""
 
@@ -212,7 +209,6 @@ class TestResolveProfile:
         result = await booter._resolve_profile(client)
         assert result == "browser-python"
 
-    @pytest.mark.asyncio
     async def test_falls_back_to_default_on_api_error(self):
         """API error → graceful fallback to python-default."""
 
@@ -224,7 +220,6 @@ class TestResolveProfile:
         result = await booter._resolve_profile(client)
         assert result == "python-default"
 
-    @pytest.mark.asyncio
     async def test_falls_back_on_empty_profiles(self):
         """Empty profile list → python-default."""
 
@@ -236,7 +231,6 @@ class TestResolveProfile:
         result = await booter._resolve_profile(client)
         assert result == "python-default"
 
-    @pytest.mark.asyncio
     async def test_single_profile_selected(self):
         """Only one profile available → use it."""
 
@@ -255,7 +249,6 @@ class TestResolveProfile:
         result = await booter._resolve_profile(client)
         assert result == "python-data"
 
-    @pytest.mark.asyncio
     async def test_auth_error_not_silenced(self):
         """UnauthorizedError must propagate, not be downgraded to fallback."""
         from shipyard_neo.errors import UnauthorizedError
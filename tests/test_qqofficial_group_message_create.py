@@ -6,7 +6,6 @@ from unittest.mock import AsyncMock
 
 import botpy
 import botpy.message
-import pytest
 from botpy import ConnectionSession
 
 from astrbot.api.event import MessageChain
@@ -76,7 +75,6 @@ def _dispatch_group_message(payload: dict) -> tuple[str, botpy.message.GroupMess
     return dispatched[0]
 
 
-@pytest.mark.asyncio
 async def test_group_message_create_parser_is_registered_and_dispatches_group_message():
     QQOfficialPlatformAdapter(
         {
@@ -97,7 +95,6 @@ async def test_group_message_create_parser_is_registered_and_dispatches_group_me
     assert message.group_openid == "group-1"
 
 
-@pytest.mark.asyncio
 async def test_parse_group_message_create_plain_message_has_no_at_component():
     _, message = _dispatch_group_message(
         _make_group_payload(content="plain group message")
@@ -118,7 +115,6 @@ async def test_parse_group_message_create_plain_message_has_no_at_component():
     ] == ["plain group message"]
 
 
-@pytest.mark.asyncio
 async def test_parse_group_message_create_quoted_context():
     _, message = _dispatch_group_message(
         _make_group_payload(
@@ -161,7 +157,6 @@ async def test_parse_group_message_create_quoted_context():
     ][-1] == "answer"
 
 
-@pytest.mark.asyncio
 async def test_parse_group_message_create_bot_mention_cleans_plain_text():
     _, message = _dispatch_group_message(
         _make_group_payload(
@@ -185,7 +180,6 @@ async def test_parse_group_message_create_bot_mention_cleans_plain_text():
     assert abm.group_id == "group-1"
 
 
-@pytest.mark.asyncio
 async def test_legacy_group_at_path_forces_bot_mention_when_mentions_missing():
     message = botpy.message.GroupMessage(
         None,
@@ -206,7 +200,6 @@ async def test_legacy_group_at_path_forces_bot_mention_when_mentions_missing():
     assert abm.message[1].text == "legacy text"
 
 
-@pytest.mark.asyncio
 async def test_group_message_create_handler_maps_group_session_and_scene():
     _, message = _dispatch_group_message(_make_group_payload())
     committed: list = []
@@ -241,7 +234,6 @@ async def test_group_message_create_handler_maps_group_session_and_scene():
     assert committed[0].session_id == "group-1"
 
 
-@pytest.mark.asyncio
 async def test_ws_group_send_by_session_without_cached_msg_id_omits_msg_id():
     adapter = QQOfficialPlatformAdapter(
         {
@@ -274,7 +266,6 @@ async def test_ws_group_send_by_session_without_cached_msg_id_omits_msg_id():
     assert adapter._session_last_message_id["group-1"] == "sent-1"
 
 
-@pytest.mark.asyncio
 async def test_ws_group_send_by_session_with_cached_msg_id_still_omits_msg_id():
     adapter = QQOfficialPlatformAdapter(
         {
@@ -307,7 +298,6 @@ async def test_ws_group_send_by_session_with_cached_msg_id_still_omits_msg_id():
     assert "msg_seq" in kwargs
 
 
-@pytest.mark.asyncio
 async def test_webhook_group_send_by_session_without_cached_msg_id_omits_msg_id():
     adapter = QQOfficialWebhookPlatformAdapter(
         {
@@ -366,7 +356,6 @@ def test_qqofficial_webhook_remains_excluded_from_segmented_reply():
     assert stage.is_seg_reply_required(cast(Any, event)) is False
 
 
-@pytest.mark.asyncio
 async def test_result_decorate_segments_qqofficial_ws_plain_result():
     stage = ResultDecorateStage()
     stage.reply_prefix = ""
@@ -74,7 +74,6 @@ def test_decrypt_qqofficial_secret_rejects_invalid_payload():
         decrypt_qqofficial_secret("invalid", bind_key)
 
 
-@pytest.mark.asyncio
 async def test_qqofficial_webhook_registration_reuses_qr_binding(monkeypatch):
     async def fake_request_qqofficial_login_qr(platform_config: dict):
         assert platform_config["type"] == "qq_official_webhook"
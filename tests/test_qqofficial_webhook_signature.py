@@ -1,8 +1,6 @@
 import asyncio
 import json
 
-import pytest
-
 from astrbot.core.platform.sources.qqofficial_webhook.qo_webhook_server import (
     _SIGNATURE_HEADER,
     _SIGNATURE_TIMESTAMP_HEADER,
@@ -52,7 +50,6 @@ def test_qq_webhook_signature_verification_rejects_tampered_body():
     )
 
 
-@pytest.mark.asyncio
 async def test_qq_webhook_callback_rejects_missing_signature():
     webhook = object.__new__(QQOfficialWebhook)
     webhook.secret = "test-secret"
@@ -62,7 +59,6 @@ async def test_qq_webhook_callback_rejects_missing_signature():
     assert result == ({"error": "Invalid signature"}, 401)
 
 
-@pytest.mark.asyncio
 async def test_qq_webhook_callback_accepts_unsigned_validation():
     secret = "test-secret"
     event_ts = "1710000000"
@@ -82,7 +78,6 @@ async def test_qq_webhook_callback_accepts_unsigned_validation():
     }
 
 
-@pytest.mark.asyncio
 async def test_qq_webhook_callback_lazily_creates_botpy_connection():
     secret = "test-secret"
     timestamp = "1710000000"
@@ -56,7 +56,6 @@ def _make_event(
     )
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_text_from_reply_chain():
     reply = Reply(id="1", chain=[Plain(text="quoted content")], message_str="")
     event = _make_event(reply)
@@ -64,7 +63,6 @@ async def test_extract_quoted_message_text_from_reply_chain():
     assert text == "quoted content"
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_text_no_reply_component():
     event = SimpleNamespace(
         message_obj=SimpleNamespace(message=[Plain(text="unquoted message")]),
@@ -76,7 +74,6 @@ async def test_extract_quoted_message_text_no_reply_component():
     assert text is None
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_images_no_reply_component():
     event = SimpleNamespace(
         message_obj=SimpleNamespace(message=[Plain(text="unquoted message")]),
@@ -88,7 +85,6 @@ async def test_extract_quoted_message_images_no_reply_component():
     assert images == []
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("reply_id", [None, ""])
 async def test_extract_quoted_message_text_reply_without_id_does_not_call_get_msg(
     reply_id: str | None,
@@ -107,7 +103,6 @@ async def test_extract_quoted_message_text_reply_without_id_does_not_call_get_ms
     assert text == "quoted content"
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_text_fallback_get_msg_and_forward():
     reply = Reply(id="100", chain=None, message_str="")
     event = _make_event(
@@ -167,7 +162,6 @@ async def test_extract_quoted_message_text_fallback_get_msg_and_forward():
         "[转发消息]\n\n[合并转发]",
     ],
 )
-@pytest.mark.asyncio
 async def test_extract_quoted_message_text_forward_placeholder_variants_trigger_fallback(
     placeholder_text: str,
 ):
@@ -191,7 +185,6 @@ async def test_extract_quoted_message_text_forward_placeholder_variants_trigger_
     assert "Bob: [Image]world" in text
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_text_mixed_placeholder_does_not_trigger_fallback():
     reply = Reply(
         id="402",
@@ -210,7 +203,6 @@ async def test_extract_quoted_message_text_mixed_placeholder_does_not_trigger_fa
     assert "real text" in text
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_text_forward_placeholder_fallback_failure():
     reply = Reply(id="401", chain=[Plain(text="[Forward Message]")], message_str="")
     event = _make_event(reply, responses={})
@@ -219,7 +211,6 @@ async def test_extract_quoted_message_text_forward_placeholder_fallback_failure(
     assert text == "[Forward Message]"
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_text_multimsg_malformed_config_does_not_raise():
     reply = Reply(id="402", chain=None, message_str="")
     event = _make_event(
@@ -248,7 +239,6 @@ async def test_extract_quoted_message_text_multimsg_malformed_config_does_not_ra
     assert text == "still works"
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_images_from_reply_chain():
     reply = Reply(
         id="1",
@@ -264,7 +254,6 @@ async def test_extract_quoted_message_images_from_reply_chain():
     assert images == ["https://img.example.com/a.jpg"]
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_images_fallback_get_msg_direct_url():
     reply = Reply(id="200", chain=None, message_str="")
     event = _make_event(
@@ -287,7 +276,6 @@ async def test_extract_quoted_message_images_fallback_get_msg_direct_url():
     assert images == ["https://img.example.com/direct.jpg"]
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_images_data_image_ref_normalized_to_base64():
     data_image_ref = "data:image/png;base64,abcd1234=="
     reply = Reply(id="201", chain=None, message_str="")
@@ -308,7 +296,6 @@ async def test_extract_quoted_message_images_data_image_ref_normalized_to_base64
     assert images == ["base64://abcd1234=="]
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_images_file_url_with_query_string():
     url_with_query = "https://img.example.com/direct.jpg?token=abc123#frag"
     reply = Reply(id="205", chain=None, message_str="")
@@ -335,7 +322,6 @@ async def test_extract_quoted_message_images_file_url_with_query_string():
     assert images == [url_with_query]
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_images_accepts_legacy_file_uri(tmp_path):
     image_file = tmp_path / "quoted.png"
     image_file.write_bytes(b"image")
@@ -357,7 +343,6 @@ async def test_extract_quoted_message_images_accepts_legacy_file_uri(tmp_path):
     assert images == [str(image_file)]
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_images_non_image_local_path_is_ignored(tmp_path):
     non_image_file = tmp_path / "secret.txt"
     non_image_file.write_text("not an image", encoding="utf-8")
@@ -376,7 +361,6 @@ async def test_extract_quoted_message_images_non_image_local_path_is_ignored(tmp
     assert images == []
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_images_chain_placeholder_triggers_fallback():
     reply = Reply(id="210", chain=[Plain(text="[Forward Message]")], message_str="")
     event = _make_event(
@@ -401,7 +385,6 @@ async def test_extract_quoted_message_images_chain_placeholder_triggers_fallback
     assert images == ["https://img.example.com/from-fallback.jpg"]
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_images_fallback_resolve_file_id_with_get_image():
     reply = Reply(id="300", chain=None, message_str="")
     event = _make_event(
@@ -422,7 +405,6 @@ async def test_extract_quoted_message_images_fallback_resolve_file_id_with_get_i
     assert images == ["https://img.example.com/resolved.jpg"]
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_images_deduplicates_across_sources():
     dup_url = "https://img.example.com/dup.jpg"
     chain_only_url = "https://img.example.com/only-chain.jpg"
@@ -472,7 +454,6 @@ async def test_extract_quoted_message_images_deduplicates_across_sources():
     ]
 
 
-@pytest.mark.asyncio
 async def test_extract_quoted_message_nested_forward_id_is_resolved():
     nested_image = "https://img.example.com/nested.jpg"
     reply = Reply(id="320", chain=[Plain(text="[Forward Message]")], message_str="")
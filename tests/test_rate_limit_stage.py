@@ -16,7 +16,6 @@ class FakeEvent:
         """Stop event propagation for discard-strategy compatibility."""
 
 
-@pytest.mark.asyncio
 async def test_stalled_concurrent_events_use_current_time_after_lock(monkeypatch):
     """Ensure queued events do not reuse timestamps captured before lock waits."""
     virtual_seconds = 0.0
@@ -5,7 +5,6 @@ import astrbot.core.provider.sources.request_retry as request_retry
 from astrbot.core.provider.sources.request_retry import retry_provider_request
 
 
-@pytest.mark.asyncio
 async def test_retry_provider_request_uses_configured_max_retries(monkeypatch):
     monkeypatch.setattr(request_retry, "REQUEST_RETRY_WAIT_MIN_S", 0)
     monkeypatch.setattr(request_retry, "REQUEST_RETRY_WAIT_MAX_S", 0)
@@ -46,7 +46,6 @@ class TestWaitUntilReady:
             access_token="sk-bay-test",
         )
 
-    @pytest.mark.asyncio
     async def test_already_ready_returns_immediately(self):
         """Sandbox is READY on first poll → instant return (warm hit)."""
         booter = self._make_booter()
@@ -56,7 +55,6 @@ class TestWaitUntilReady:
 
         sandbox.delete.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_starting_then_ready(self):
         """Sandbox transitions STARTING → READY within timeout."""
         booter = self._make_booter()
@@ -66,7 +64,6 @@ class TestWaitUntilReady:
 
         sandbox.delete.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_failed_deletes_and_raises(self):
         """Sandbox reaches FAILED → delete called → RuntimeError raised."""
         booter = self._make_booter()
@@ -77,7 +74,6 @@ class TestWaitUntilReady:
 
         sandbox.delete.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_expired_deletes_and_raises(self):
         """Sandbox reaches EXPIRED → delete called → RuntimeError raised."""
         booter = self._make_booter()
@@ -88,7 +84,6 @@ class TestWaitUntilReady:
 
         sandbox.delete.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_timeout_deletes_and_raises(self):
         """Sandbox never reaches READY → delete called → TimeoutError raised."""
         booter = self._make_booter()
@@ -119,7 +114,6 @@ class TestWaitUntilReady:
 
         sandbox.delete.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_delete_failure_during_cleanup_is_safe(self):
         """If sandbox.delete() itself throws, the original error is still raised."""
         booter = self._make_booter()
@@ -148,7 +142,6 @@ class TestShutdown:
             access_token="sk-bay-test",
         )
 
-    @pytest.mark.asyncio
     async def test_delete_sandbox_true_calls_delete(self):
         """delete_sandbox=True → sandbox.delete() called, then client closed."""
         booter = self._make_booter()
@@ -169,7 +162,6 @@ class TestShutdown:
         assert booter._client is None
         assert booter._sandbox is None
 
-    @pytest.mark.asyncio
     async def test_delete_sandbox_false_does_not_call_delete(self):
         """delete_sandbox=False (default) → sandbox.delete() NOT called."""
         booter = self._make_booter()
@@ -190,7 +182,6 @@ class TestShutdown:
         assert booter._client is None
         assert booter._sandbox is None
 
-    @pytest.mark.asyncio
     async def test_delete_failure_still_closes_client(self):
         """If sandbox.delete() throws, HTTP client is still torn down."""
         booter = self._make_booter()
@@ -212,7 +203,6 @@ class TestShutdown:
         assert booter._client is None
         assert booter._sandbox is None
 
-    @pytest.mark.asyncio
     async def test_no_client_is_noop(self):
         """shutdown() on an uninitialised booter is a no-op."""
         booter = self._make_booter()
@@ -247,7 +237,6 @@ class TestGetBooterRebuild:
             get_config=lambda umo=None: _cfg,
         )
 
-    @pytest.mark.asyncio
     async def test_stale_neo_booter_calls_shutdown_with_delete(self, monkeypatch):
         """A stale ShipyardNeoBooter gets shutdown(delete_sandbox=True) on eviction."""
         from astrbot.core.computer import computer_client
@@ -298,7 +287,6 @@ class TestGetBooterRebuild:
         assert new_booter is not None
         assert new_booter is not stale
 
-    @pytest.mark.asyncio
     async def test_stale_non_neo_booter_calls_plain_shutdown(self, monkeypatch):
         """Non-neo booter (e.g. shipyard) → plain shutdown() without delete_sandbox."""
         from astrbot.core.computer import computer_client
@@ -3,8 +3,6 @@ import importlib
 import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 import astrbot.api.message_components as Comp
 from astrbot.core.platform.register import unregister_platform_adapters_by_module
 from tests.fixtures.helpers import (
@@ -82,7 +80,6 @@ def _build_context() -> MagicMock:
     return context
 
 
-@pytest.mark.asyncio
 async def test_telegram_document_caption_populates_message_text_and_plain():
     TelegramPlatformAdapter = _load_telegram_adapter()
     adapter = TelegramPlatformAdapter(
@@ -115,7 +112,6 @@ async def test_telegram_document_caption_populates_message_text_and_plain():
     )
 
 
-@pytest.mark.asyncio
 async def test_telegram_video_caption_populates_message_text_and_plain():
     TelegramPlatformAdapter = _load_telegram_adapter()
     adapter = TelegramPlatformAdapter(
@@ -142,7 +138,6 @@ async def test_telegram_video_caption_populates_message_text_and_plain():
     )
 
 
-@pytest.mark.asyncio
 async def test_telegram_voice_message_creates_record_component(tmp_path):
     TelegramPlatformAdapter = _load_telegram_adapter()
     adapter = TelegramPlatformAdapter(
@@ -181,7 +176,6 @@ async def test_telegram_voice_message_creates_record_component(tmp_path):
     assert result.message[0].url == str(wav_path)
 
 
-@pytest.mark.asyncio
 async def test_telegram_final_segment_splits_long_markdown_messages():
     TelegramPlatformEvent = _load_telegram_platform_event()
     client = MagicMock()
@@ -202,7 +196,6 @@ async def test_telegram_final_segment_splits_long_markdown_messages():
     assert second_call["parse_mode"] == "MarkdownV2"
 
 
-@pytest.mark.asyncio
 async def test_telegram_final_segment_splits_long_plaintext_when_markdown_fails():
     TelegramPlatformEvent = _load_telegram_platform_event()
     client = MagicMock()
@@ -227,7 +220,6 @@ async def test_telegram_final_segment_splits_long_plaintext_when_markdown_fails(
     assert "parse_mode" not in second_call
 
 
-@pytest.mark.asyncio
 async def test_telegram_polling_error_requests_rebuild_after_threshold():
     TelegramPlatformAdapter = _load_telegram_adapter()
     adapter = TelegramPlatformAdapter(
@@ -247,7 +239,6 @@ async def test_telegram_polling_error_requests_rebuild_after_threshold():
     assert adapter._polling_recovery_requested.is_set()
 
 
-@pytest.mark.asyncio
 async def test_telegram_run_rebuilds_application_after_repeated_polling_errors():
     TelegramPlatformAdapter = _load_telegram_adapter()
     module_globals = TelegramPlatformAdapter.__init__.__globals__
@@ -311,7 +302,6 @@ async def test_telegram_run_rebuilds_application_after_repeated_polling_errors()
     app_two.start.assert_awaited()
 
 
-@pytest.mark.asyncio
 async def test_telegram_recreate_application_is_skipped_during_termination():
     TelegramPlatformAdapter = _load_telegram_adapter()
     adapter = TelegramPlatformAdapter(
@@ -327,7 +317,6 @@ async def test_telegram_recreate_application_is_skipped_during_termination():
     assert not adapter._polling_recovery_requested.is_set()
 
 
-@pytest.mark.asyncio
 async def test_telegram_run_rebuilds_fresh_application_after_recreate_init_failure():
     TelegramPlatformAdapter = _load_telegram_adapter()
     module_globals = TelegramPlatformAdapter.__init__.__globals__
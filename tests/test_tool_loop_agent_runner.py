@@ -477,7 +477,6 @@ def _make_large_tool_result_text() -> str:
     return "x" * 100000
 
 
-@pytest.mark.asyncio
 async def test_max_step_limit_functionality(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -522,7 +521,6 @@ async def test_max_step_limit_functionality(
     assert last_message.role == "assistant", "最后一条消息应该是assistant的最终回答"
 
 
-@pytest.mark.asyncio
 async def test_max_step_final_request_includes_limit_prompt(
     runner, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -552,7 +550,6 @@ async def test_max_step_final_request_includes_limit_prompt(
     assert final_contexts[-1].content == runner.MAX_STEPS_REACHED_PROMPT
 
 
-@pytest.mark.asyncio
 async def test_tool_loop_next_request_includes_tool_result(
     runner, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -584,7 +581,6 @@ async def test_tool_loop_next_request_includes_tool_result(
     assert "工具执行结果" in tool_messages[0].content
 
 
-@pytest.mark.asyncio
 async def test_normal_completion_without_max_step(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -632,7 +628,6 @@ async def test_normal_completion_without_max_step(
     assert runner.req.func_tool is not None, "正常完成时工具不应该被禁用"
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("streaming", [False, True])
 async def test_stats_separate_latest_context_from_cumulative_usage(
     runner, provider_request, mock_tool_executor, mock_hooks, streaming
@@ -661,7 +656,6 @@ async def test_stats_separate_latest_context_from_cumulative_usage(
     assert runner.stats.to_dict()["current_context_tokens"] == 220
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("streaming", [False, True])
 async def test_stats_emit_update_after_each_completed_llm_request(
     runner, provider_request, mock_tool_executor, mock_hooks, streaming
@@ -712,7 +706,6 @@ async def test_stats_emit_update_after_each_completed_llm_request(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("streaming", [False, True])
 async def test_stats_clear_current_context_when_latest_usage_is_missing(
     runner, provider_request, mock_tool_executor, mock_hooks, streaming
@@ -740,7 +733,6 @@ async def test_stats_clear_current_context_when_latest_usage_is_missing(
     assert runner.stats.to_dict()["current_context_tokens"] == 0
 
 
-@pytest.mark.asyncio
 async def test_max_step_with_streaming(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -783,7 +775,6 @@ async def test_max_step_with_streaming(
     assert last_message.role == "assistant", "最后一条消息应该是assistant的最终回答"
 
 
-@pytest.mark.asyncio
 async def test_hooks_called_with_max_step(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -817,7 +808,6 @@ async def test_hooks_called_with_max_step(
     assert mock_hooks.tool_end_called, "on_tool_end应该被调用"
 
 
-@pytest.mark.asyncio
 async def test_tool_result_includes_all_calltoolresult_content(
     runner, mock_provider, provider_request, mock_hooks, monkeypatch
 ):
@@ -879,7 +869,6 @@ async def test_tool_result_includes_all_calltoolresult_content(
     ]
 
 
-@pytest.mark.asyncio
 async def test_runner_replaces_runtime_image_context_before_provider_call(
     runner, provider_request, mock_hooks
 ):
@@ -920,7 +909,6 @@ async def test_runner_replaces_runtime_image_context_before_provider_call(
     assert len(runner.run_context.messages[-2].content) == 2
 
 
-@pytest.mark.asyncio
 async def test_runner_builds_placeholder_for_unsupported_request_image(
     runner, mock_hooks, tool_set
 ):
@@ -951,7 +939,6 @@ async def test_runner_builds_placeholder_for_unsupported_request_image(
     ]
 
 
-@pytest.mark.asyncio
 async def test_runner_clears_tools_for_provider_without_tool_use(
     runner, provider_request, mock_hooks, mock_tool_executor
 ):
@@ -972,7 +959,6 @@ async def test_runner_clears_tools_for_provider_without_tool_use(
     assert provider.received_func_tools == [None]
 
 
-@pytest.mark.asyncio
 async def test_same_tool_consecutive_results_include_escalating_guidance(
     runner, mock_tool_executor, mock_hooks
 ):
@@ -1044,7 +1030,6 @@ async def test_same_tool_consecutive_results_include_escalating_guidance(
             assert level_3_notice in content
 
 
-@pytest.mark.asyncio
 async def test_same_tool_with_different_args_does_not_include_repeated_guidance(
     runner, mock_tool_executor, mock_hooks
 ):
@@ -1084,7 +1069,6 @@ async def test_same_tool_with_different_args_does_not_include_repeated_guidance(
     )
 
 
-@pytest.mark.asyncio
 async def test_same_tool_streak_resets_after_switching_tools(
     runner, mock_tool_executor, mock_hooks
 ):
@@ -1157,7 +1141,6 @@ async def test_same_tool_streak_resets_after_switching_tools(
             assert level_2_notice in content
 
 
-@pytest.mark.asyncio
 async def test_fallback_provider_used_when_primary_raises(
     runner, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -1186,7 +1169,6 @@ async def test_fallback_provider_used_when_primary_raises(
     assert fallback_provider.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_fallback_provider_used_when_primary_returns_err(
     runner, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -1215,7 +1197,6 @@ async def test_fallback_provider_used_when_primary_returns_err(
     assert fallback_provider.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_empty_output_is_retried_before_succeeding(
     runner, provider_request, mock_tool_executor, mock_hooks, monkeypatch
 ):
@@ -1242,7 +1223,6 @@ async def test_empty_output_is_retried_before_succeeding(
     assert provider.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_empty_output_retries_exhausted_then_uses_fallback_provider(
     runner, provider_request, mock_tool_executor, mock_hooks, monkeypatch
 ):
@@ -1276,7 +1256,6 @@ async def test_empty_output_retries_exhausted_then_uses_fallback_provider(
     assert fallback_provider.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_stop_signal_returns_aborted_and_persists_partial_message(
     runner, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -1312,7 +1291,6 @@ async def test_stop_signal_returns_aborted_and_persists_partial_message(
     assert runner.run_context.messages[-1].role == "assistant"
 
 
-@pytest.mark.asyncio
 async def test_stop_interrupts_pending_subagent_handoff(mock_hooks):
     subagent_context = BlockingSubagentContext()
     event = MockEvent("webchat:FriendMessage:webchat!user!session", "user")
@@ -1362,7 +1340,6 @@ async def test_stop_interrupts_pending_subagent_handoff(mock_hooks):
         await step_iter.__anext__()
 
 
-@pytest.mark.asyncio
 async def test_stop_interrupts_pending_regular_tool(mock_hooks):
     tool_state = BlockingToolState()
     event = MockEvent("webchat:FriendMessage:webchat!user!session", "user")
@@ -1414,7 +1391,6 @@ async def test_stop_interrupts_pending_regular_tool(mock_hooks):
         await step_iter.__anext__()
 
 
-@pytest.mark.asyncio
 async def test_tool_result_injects_follow_up_notice(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -1457,7 +1433,6 @@ async def test_tool_result_injects_follow_up_notice(
     assert ticket2.consumed is True
 
 
-@pytest.mark.asyncio
 async def test_follow_up_ticket_not_consumed_when_no_next_tool_call(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -1484,7 +1459,6 @@ async def test_follow_up_ticket_not_consumed_when_no_next_tool_call(
     assert ticket.consumed is False
 
 
-@pytest.mark.asyncio
 async def test_skills_like_requery_passes_extra_user_content_parts():
     """skills-like 模式 re-query 时应传递 extra_user_content_parts（如 image_caption）"""
     from astrbot.core.agent.message import TextPart
@@ -1565,7 +1539,6 @@ async def test_skills_like_requery_passes_extra_user_content_parts():
     assert parts[0].text == "<image_caption>一张猫的照片</image_caption>"
 
 
-@pytest.mark.asyncio
 async def test_follow_up_accepted_when_active_and_not_stopping(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -1581,7 +1554,6 @@ async def test_follow_up_accepted_when_active_and_not_stopping(
     )
 
 
-@pytest.mark.asyncio
 async def test_large_tool_result_is_spilled_to_file_and_replaced_with_read_notice(
     tmp_path,
 ):
@@ -1640,7 +1612,6 @@ async def test_large_tool_result_is_spilled_to_file_and_replaced_with_read_notic
     assert llm_results
 
 
-@pytest.mark.asyncio
 async def test_large_tool_result_keeps_preview_when_spill_fails(
     tmp_path,
     monkeypatch: pytest.MonkeyPatch,
@@ -1692,7 +1663,6 @@ async def test_large_tool_result_keeps_preview_when_spill_fails(
     assert "disk full" in tool_message_content
 
 
-@pytest.mark.asyncio
 async def test_follow_up_rejected_when_stop_requested(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -1717,7 +1687,6 @@ async def test_follow_up_rejected_when_stop_requested(
     assert len(runner._pending_follow_ups) == 0
 
 
-@pytest.mark.asyncio
 async def test_follow_up_rejected_when_runner_done(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -1744,7 +1713,6 @@ async def test_follow_up_rejected_when_runner_done(
     assert ticket is None, "Follow-up should be rejected when runner is done"
 
 
-@pytest.mark.asyncio
 async def test_follow_up_rejected_after_stop_before_tool_call(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -1778,7 +1746,6 @@ async def test_follow_up_rejected_after_stop_before_tool_call(
     assert runner._pending_follow_ups[0].text == "before stop"
 
 
-@pytest.mark.asyncio
 async def test_follow_up_merged_into_tool_result_before_stop(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -1824,7 +1791,6 @@ async def test_follow_up_merged_into_tool_result_before_stop(
     assert ticket2.consumed is True
 
 
-@pytest.mark.asyncio
 async def test_follow_up_rejected_and_runner_stops_without_execution(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -1867,7 +1833,6 @@ async def test_follow_up_rejected_and_runner_stops_without_execution(
     assert provider_request.tool_calls_result is None
 
 
-@pytest.mark.asyncio
 async def test_follow_up_after_stop_not_merged_into_tool_result(
     runner, mock_provider, provider_request, mock_tool_executor, mock_hooks
 ):
@@ -3,8 +3,6 @@ import sys
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-import pytest
-
 from astrbot.builtin_stars.builtin_commands.commands.name import NameCommand
 from astrbot.core.star.filter.permission import PermissionType, PermissionTypeFilter
 from astrbot.core.star.star_handler import star_handlers_registry
@@ -32,7 +30,6 @@ def make_group_event() -> SimpleNamespace:
     )
 
 
-@pytest.mark.asyncio
 async def test_umo_alias_upsert_updates_existing_record(temp_db):
     created = await temp_db.upsert_umo_alias(
         umo="qq:GroupMessage:1000",
@@ -58,7 +55,6 @@ async def test_umo_alias_upsert_updates_existing_record(temp_db):
     assert serialize_umo_alias(fetched, fetched.umo)["display_name"] == "New Alias"
 
 
-@pytest.mark.asyncio
 async def test_name_command_saves_group_alias_with_auto_name(temp_db):
     context = SimpleNamespace(get_db=lambda: temp_db)
     event = make_group_event()
@@ -78,7 +74,6 @@ async def test_name_command_saves_group_alias_with_auto_name(temp_db):
     )
 
 
-@pytest.mark.asyncio
 async def test_name_command_without_alias_shows_current_names(temp_db):
     await temp_db.upsert_umo_alias(
         umo="qq:GroupMessage:1000",
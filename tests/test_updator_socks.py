@@ -318,7 +318,6 @@ def fake_async_client_state() -> _FakeAsyncClientState:
     return _FakeAsyncClientState()
 
 
-@pytest.mark.asyncio
 async def test_plugin_updator_install_prefers_download_url(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -435,7 +434,6 @@ def test_plugin_validate_archive_rejects_empty_metadata_fields(
         PluginUpdator.validate_plugin_archive(str(zip_path))
 
 
-@pytest.mark.asyncio
 async def test_plugin_update_validates_archive_before_removing_existing_plugin(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -473,7 +471,6 @@ async def test_plugin_update_validates_archive_before_removing_existing_plugin(
     assert marker_path.read_text(encoding="utf-8") == "VALUE = 'old'\n"
 
 
-@pytest.mark.asyncio
 async def test_astrbot_updator_prefers_hosted_core_package(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -515,7 +512,6 @@ async def test_astrbot_updator_prefers_hosted_core_package(
     assert calls == ["https://cdn.example/core/v99.0.0/source.zip"]
 
 
-@pytest.mark.asyncio
 async def test_astrbot_updator_falls_back_when_hosted_core_package_fails(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -562,7 +558,6 @@ async def test_astrbot_updator_falls_back_when_hosted_core_package_fails(
     ]
 
 
-@pytest.mark.asyncio
 async def test_astrbot_updator_falls_back_when_hosted_core_package_is_not_zip(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -611,7 +606,6 @@ async def test_astrbot_updator_falls_back_when_hosted_core_package_is_not_zip(
     ]
 
 
-@pytest.mark.asyncio
 async def test_download_dashboard_falls_back_when_hosted_package_is_not_zip(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -653,7 +647,6 @@ async def test_download_dashboard_falls_back_when_hosted_package_is_not_zip(
     ]
 
 
-@pytest.mark.asyncio
 async def test_fetch_release_info_uses_httpx_client_with_env_proxy_support(
     monkeypatch: pytest.MonkeyPatch,
     fake_async_client_state: _FakeAsyncClientState,
@@ -712,7 +705,6 @@ async def test_fetch_release_info_uses_httpx_client_with_env_proxy_support(
     assert fake_async_client_state.init_kwargs["verify"] == certifi.where()
 
 
-@pytest.mark.asyncio
 async def test_download_from_repo_url_uses_httpx_stream_for_zip_download(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -759,7 +751,6 @@ async def test_download_from_repo_url_uses_httpx_stream_for_zip_download(
     assert fake_async_client_state.init_kwargs["verify"] == certifi.where()
 
 
-@pytest.mark.asyncio
 async def test_download_from_repo_url_uses_explicit_branch_without_default_branch_lookup(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -816,7 +807,6 @@ def test_create_httpx_client_uses_custom_verify_setting(
     assert fake_async_client_state.init_kwargs["verify"] == custom_verify
 
 
-@pytest.mark.asyncio
 async def test_fetch_release_info_logs_status_code_and_truncated_body_on_http_error(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -849,7 +839,6 @@ async def test_fetch_release_info_logs_status_code_and_truncated_body_on_http_er
     assert any("...[truncated]" in message for message in log_messages)
 
 
-@pytest.mark.asyncio
 async def test_download_file_removes_partial_file_when_stream_fails(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -873,7 +862,6 @@ async def test_download_file_removes_partial_file_when_stream_fails(
     assert not target_path.exists()
 
 
-@pytest.mark.asyncio
 async def test_download_file_logs_url_and_target_path_on_failure(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -1,11 +1,8 @@
 import asyncio
 
-import pytest
-
 from astrbot.core.platform.sources.webchat.webchat_queue_mgr import WebChatQueueMgr
 
 
-@pytest.mark.asyncio
 async def test_removed_back_queue_unblocks_pending_writer():
     queue_manager = WebChatQueueMgr(back_queue_maxsize=1)
     request_id = "request-1"
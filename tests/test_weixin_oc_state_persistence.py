@@ -1,7 +1,5 @@
 import asyncio
 
-import pytest
-
 from astrbot.core.platform.sources.weixin_oc import weixin_oc_adapter
 from astrbot.core.platform.sources.weixin_oc.weixin_oc_adapter import WeixinOCAdapter
 
@@ -16,7 +14,6 @@ class _Config(dict):
         return True
 
 
-@pytest.mark.asyncio
 async def test_save_account_state_uses_async_config_persistence(monkeypatch):
     calls: list[str] = []
     config = _Config(
@@ -51,7 +48,6 @@ async def test_save_account_state_uses_async_config_persistence(monkeypatch):
     assert adapter._context_tokens_dirty is False
 
 
-@pytest.mark.asyncio
 async def test_save_account_state_keeps_dirty_flag_for_new_context_token(monkeypatch):
     save_started = asyncio.Event()
     finish_save = asyncio.Event()
@@ -104,7 +100,6 @@ async def test_save_account_state_keeps_dirty_flag_for_new_context_token(monkeyp
     assert adapter._context_tokens_dirty is True
 
 
-@pytest.mark.asyncio
 async def test_save_account_state_keeps_dirty_flag_after_context_token_aba(
     monkeypatch,
 ):
@@ -28,7 +28,6 @@ def _make_provider() -> ProviderOpenAIWhisperAPI:
     return provider
 
 
-@pytest.mark.asyncio
 async def test_get_text_converts_opus_files_to_wav_before_transcription(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ):
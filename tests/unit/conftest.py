@@ -0,0 +1,52 @@
+"""
+单元测试共享 fixtures
+
+mock 在每个测试中重新构造，避免上一个测试配置的返回值、副作用或属性泄漏到后续测试。
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from astrbot.core.db import BaseDatabase
+from astrbot.core.log import LogBroker
+
+_DB_ASYNC_METHODS = (
+    "initialize",
+    "create_cron_job",
+    "get_cron_job",
+    "update_cron_job",
+    "delete_cron_job",
+    "list_cron_jobs",
+)
+
+
+@pytest.fixture
+def mock_log_broker():
+    """Create a mock log broker."""
+    return MagicMock(spec=LogBroker)
+
+
+@pytest.fixture
+def mock_db():
+    """Create a mock database.
+
+    Built fresh for every test: the cron manager schedules detached
+    ``update_cron_job`` tasks that may still run after a test returns, so a
+    pooled mock would let them record calls against the next test.
+    """
+    db = MagicMock(spec=BaseDatabase)
+    for name in _DB_ASYNC_METHODS:
+        setattr(db, name, AsyncMock())
+    db.list_cron_jobs.return_value = []
+    return db
+
+
+@pytest.fixture
+def mock_astrbot_config():
+    """Create a mock AstrBot config."""
+    config = MagicMock()
+    config.get = MagicMock(return_value="")
+    config.__getitem__ = MagicMock(return_value={})
+    config.copy = MagicMock(return_value={})
+    return config
@@ -70,7 +70,6 @@ def test_reply_to_dict_outputs_only_id():
 # ============================================================
 
 
-@pytest.mark.asyncio
 async def test_parse_onebot_json_reply_produces_extra_fields():
     """_parse_onebot_json 处理 Reply 时会输出多余字段。
 
@@ -101,7 +100,6 @@ async def test_parse_onebot_json_reply_produces_extra_fields():
 # ============================================================
 
 
-@pytest.mark.asyncio
 async def test_send_private_msg_with_reply_includes_extra_fields():
     """验证私聊发送带 Reply 的消息时，实际传给 bot.send_private_msg 的
     payload 包含多余字段。
@@ -142,7 +140,6 @@ async def test_send_private_msg_with_reply_includes_extra_fields():
         )
 
 
-@pytest.mark.asyncio
 async def test_send_group_msg_with_reply_also_includes_extra_fields():
     """对比：群聊发送带 Reply 的消息同样包含多余字段。
 
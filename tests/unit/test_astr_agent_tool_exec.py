@@ -73,7 +73,6 @@ def test_build_handoff_toolset_keeps_permission_guards_for_default_tools():
     assert toolset.get_tool("transfer_to_child") is None
 
 
-@pytest.mark.asyncio
 async def test_collect_handoff_image_urls_normalizes_filters_and_appends_event_image(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -102,7 +101,6 @@ async def test_collect_handoff_image_urls_normalizes_filters_and_appends_event_i
     ]
 
 
-@pytest.mark.asyncio
 async def test_collect_handoff_image_urls_skips_failed_event_image_conversion(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -120,7 +118,6 @@ async def test_collect_handoff_image_urls_skips_failed_event_image_conversion(
     assert image_urls == ["https://example.com/a.png"]
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("image_refs", "expected_supported_refs"),
     [
@@ -157,7 +154,6 @@ async def test_collect_handoff_image_urls_filters_supported_schemes_and_extensio
     assert set(result) == expected_supported_refs
 
 
-@pytest.mark.asyncio
 async def test_collect_handoff_image_urls_collects_event_image_when_args_is_none(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -175,7 +171,6 @@ async def test_collect_handoff_image_urls_collects_event_image_when_args_is_none
     assert image_urls == ["/tmp/event_only.png"]
 
 
-@pytest.mark.asyncio
 async def test_do_handoff_background_reports_prepared_image_urls(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -215,7 +210,6 @@ async def test_do_handoff_background_reports_prepared_image_urls(
     assert captured["tool_args"]["image_urls"] == ["https://example.com/raw.png"]
 
 
-@pytest.mark.asyncio
 async def test_execute_handoff_skips_renormalize_when_image_urls_prepared(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -268,7 +262,6 @@ async def test_execute_handoff_skips_renormalize_when_image_urls_prepared(
     assert captured["image_urls"] == ["https://example.com/raw.png"]
 
 
-@pytest.mark.asyncio
 async def test_collect_handoff_image_urls_keeps_extensionless_existing_event_file(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -292,7 +285,6 @@ async def test_collect_handoff_image_urls_keeps_extensionless_existing_event_fil
     assert image_urls == ["/tmp/astrbot-handoff-image"]
 
 
-@pytest.mark.asyncio
 async def test_collect_handoff_image_urls_filters_extensionless_missing_event_file(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -316,7 +308,6 @@ async def test_collect_handoff_image_urls_filters_extensionless_missing_event_fi
     assert image_urls == []
 
 
-@pytest.mark.asyncio
 async def test_execute_handoff_passes_tool_call_timeout_to_tool_loop_agent(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -365,7 +356,6 @@ async def test_execute_handoff_passes_tool_call_timeout_to_tool_loop_agent(
     assert captured["tool_call_timeout"] == 120
 
 
-@pytest.mark.asyncio
 async def test_background_wakeup_passes_provider_settings_to_main_agent(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -430,7 +420,6 @@ async def test_background_wakeup_passes_provider_settings_to_main_agent(
     assert config.provider_settings["fallback_chat_models"] == ["fallback-provider"]
 
 
-@pytest.mark.asyncio
 async def test_collect_handoff_image_urls_filters_extensionless_file_outside_temp_root(
     monkeypatch: pytest.MonkeyPatch,
 ):
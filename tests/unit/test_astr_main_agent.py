@@ -2,6 +2,7 @@
 
 import datetime
 import os
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -91,6 +92,14 @@ def mock_conversation():
     return conv
 
 
+@pytest.fixture
+def spy_logger(monkeypatch):
+    """Replace the astr_main_agent logger with a MagicMock for assertions."""
+    stub = MagicMock()
+    monkeypatch.setattr(ama, "logger", stub)
+    return stub
+
+
 def test_provider_supports_modality_requires_explicit_list():
     provider = MagicMock(spec=Provider)
 
@@ -287,7 +296,6 @@ class TestSelectProvider:
 class TestGetSessionConv:
     """Tests for _get_session_conv function."""
 
-    @pytest.mark.asyncio
     async def test_get_session_conv_existing(
         self, mock_event, mock_context, mock_conversation
     ):
@@ -307,7 +315,6 @@ class TestGetSessionConv:
             mock_event.unified_msg_origin, "existing-conv-id"
         )
 
-    @pytest.mark.asyncio
     async def test_get_session_conv_create_new(self, mock_event, mock_context):
         """Test creating new conversation when none exists."""
         module = ama
@@ -327,7 +334,6 @@ class TestGetSessionConv:
             mock_event.unified_msg_origin, mock_event.get_platform_id()
         )
 
-    @pytest.mark.asyncio
     async def test_get_session_conv_retry(self, mock_event, mock_context):
         """Test retrying conversation creation after failure."""
         module = ama
@@ -347,7 +353,6 @@ class TestGetSessionConv:
         assert conv_mgr.new_conversation.call_count == 1
         assert conv_mgr.get_conversation.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_get_session_conv_failure(self, mock_event, mock_context):
         """Test RuntimeError when conversation creation fails."""
         module = ama
@@ -363,7 +368,6 @@ class TestGetSessionConv:
 class TestApplyKb:
     """Tests for _apply_kb function."""
 
-    @pytest.mark.asyncio
     async def test_apply_kb_without_agentic_mode(self, mock_event, mock_context):
         """Test applying knowledge base in non-agentic mode."""
         module = ama
@@ -391,7 +395,6 @@ class TestApplyKb:
             {"role": "user", "content": [{"type": "text", "text": "test question"}]}
         ]
 
-    @pytest.mark.asyncio
     async def test_apply_kb_with_agentic_mode(self, mock_event, mock_context):
         """Test applying knowledge base in agentic mode."""
         module = ama
@@ -402,7 +405,6 @@ class TestApplyKb:
 
         assert req.func_tool is not None
 
-    @pytest.mark.asyncio
     async def test_apply_kb_no_prompt(self, mock_event, mock_context):
         """Test applying knowledge base when prompt is None."""
         module = ama
@@ -415,7 +417,6 @@ class TestApplyKb:
 
         assert req.system_prompt == "System"
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize("prompt", ["", "   \n\t"])
     async def test_apply_kb_blank_prompt(self, prompt, mock_event, mock_context):
         """Test applying knowledge base when prompt is blank."""
@@ -432,7 +433,6 @@ class TestApplyKb:
         retrieve.assert_not_awaited()
         assert req.system_prompt == "System"
 
-    @pytest.mark.asyncio
     async def test_apply_kb_no_result(self, mock_event, mock_context):
         """Test applying knowledge base when no result is returned."""
         module = ama
@@ -449,7 +449,6 @@ class TestApplyKb:
 
         assert req.system_prompt == "System"
 
-    @pytest.mark.asyncio
     async def test_apply_kb_with_existing_tools(self, mock_event, mock_context):
         """Test applying knowledge base with existing toolset."""
         module = ama
@@ -465,7 +464,6 @@ class TestApplyKb:
 class TestBuiltinToolInjection:
     """Tests for builtin tool injection paths."""
 
-    @pytest.mark.asyncio
     async def test_apply_web_search_tools_uses_builtin_tool_manager(
         self, mock_event, mock_context
     ):
@@ -490,7 +488,6 @@ class TestBuiltinToolInjection:
         assert req.func_tool is not None
         assert req.func_tool.get_tool("web_search_baidu") is builtin_tool
 
-    @pytest.mark.asyncio
     async def test_apply_web_search_tools_adds_firecrawl_search_and_extract_tools(
         self, mock_event, mock_context
     ):
@@ -582,7 +579,6 @@ class TestBuiltinToolInjection:
 class TestApplyFileExtract:
     """Tests for _apply_file_extract function."""
 
-    @pytest.mark.asyncio
     async def test_file_extract_basic(self, mock_event, sample_config):
         """Test basic file extraction."""
         module = ama
@@ -603,7 +599,6 @@ class TestApplyFileExtract:
         assert len(req.contexts) == 1
         assert "File Extract Results" in req.contexts[0]["content"]
 
-    @pytest.mark.asyncio
     async def test_file_extract_no_files(self, mock_event, sample_config):
         """Test file extraction when no files present."""
         module = ama
@@ -614,7 +609,6 @@ class TestApplyFileExtract:
 
         assert len(req.contexts) == 0
 
-    @pytest.mark.asyncio
     async def test_file_extract_in_reply(self, mock_event, sample_config):
         """Test file extraction from reply chain."""
         module = ama
@@ -636,7 +630,6 @@ class TestApplyFileExtract:
 
         assert len(req.contexts) == 1
 
-    @pytest.mark.asyncio
     async def test_file_extract_no_prompt(self, mock_event, sample_config):
         """Test file extraction when prompt is empty."""
         module = ama
@@ -656,7 +649,6 @@ class TestApplyFileExtract:
 
         assert req.prompt == "总结一下文件里面讲了什么？"
 
-    @pytest.mark.asyncio
     async def test_file_extract_no_api_key(self, mock_event):
         """Test file extraction when no API key is configured."""
         module = ama
@@ -758,7 +750,6 @@ class TestEnsurePersonaAndSkills:
 
         assert filtered == []
 
-    @pytest.mark.asyncio
     async def test_ensure_persona_from_session(self, mock_event, mock_context):
         """Test applying persona from session service config."""
         module = ama
@@ -775,7 +766,6 @@ class TestEnsurePersonaAndSkills:
 
         assert "You are helpful." in req.system_prompt
 
-    @pytest.mark.asyncio
     async def test_ensure_persona_from_conversation(self, mock_event, mock_context):
         """Test applying persona from conversation setting."""
         module = ama
@@ -791,7 +781,6 @@ class TestEnsurePersonaAndSkills:
 
         assert "Custom persona." in req.system_prompt
 
-    @pytest.mark.asyncio
     async def test_inline_genui_prompt_is_added_with_custom_persona(
         self, mock_event, mock_context
     ):
@@ -812,7 +801,6 @@ class TestEnsurePersonaAndSkills:
         assert "Custom persona." in req.system_prompt
         assert module.CHATUI_INLINE_GENUI_SYSTEM_PROMPT in req.system_prompt
 
-    @pytest.mark.asyncio
     async def test_inline_genui_prompt_does_not_require_conversation(
         self, mock_event, mock_context
     ):
@@ -828,7 +816,6 @@ class TestEnsurePersonaAndSkills:
         assert module.CHATUI_INLINE_GENUI_SYSTEM_PROMPT in req.system_prompt
         mock_context.persona_manager.resolve_selected_persona.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_default_system_prompt_can_be_disabled(
         self, mock_event, mock_context
     ):
@@ -848,7 +835,6 @@ class TestEnsurePersonaAndSkills:
 
         assert module.CHATUI_SPECIAL_DEFAULT_PERSONA_PROMPT not in req.system_prompt
 
-    @pytest.mark.asyncio
     async def test_ensure_persona_none_explicit(self, mock_event, mock_context):
         """Test that [%None] persona is explicitly set to no persona."""
         module = ama
@@ -863,7 +849,6 @@ class TestEnsurePersonaAndSkills:
 
         assert "Persona Instructions" not in req.system_prompt
 
-    @pytest.mark.asyncio
     async def test_ensure_skills_includes_workspace_skills(
         self,
         monkeypatch,
@@ -930,7 +915,6 @@ class TestEnsurePersonaAndSkills:
             in req.system_prompt
         )
 
-    @pytest.mark.asyncio
     async def test_ensure_skills_respects_empty_persona_skills_for_workspace(
         self,
         monkeypatch,
@@ -986,7 +970,6 @@ class TestEnsurePersonaAndSkills:
         assert "Workspace scoped skill." not in req.system_prompt
         assert "## Skills" not in req.system_prompt
 
-    @pytest.mark.asyncio
     async def test_ensure_skills_skips_workspace_skills_in_sandbox_runtime(
         self,
         monkeypatch,
@@ -1043,7 +1026,6 @@ class TestEnsurePersonaAndSkills:
         assert "Workspace scoped skill." not in req.system_prompt
         assert "## Skills" not in req.system_prompt
 
-    @pytest.mark.asyncio
     async def test_ensure_tools_from_persona(self, mock_event, mock_context):
         """Test applying tools from persona."""
         module = ama
@@ -1065,7 +1047,6 @@ class TestEnsurePersonaAndSkills:
 
         assert req.func_tool is not None
 
-    @pytest.mark.asyncio
     async def test_persona_empty_tools_keeps_late_builtin_tools(
         self, mock_event, mock_context, mock_provider
     ):
@@ -1117,7 +1098,6 @@ class TestEnsurePersonaAndSkills:
             if result.reset_coro:
                 result.reset_coro.close()
 
-    @pytest.mark.asyncio
     async def test_persona_empty_tools_keeps_local_runtime_builtin_tools(
         self, mock_event, mock_context, mock_provider
     ):
@@ -1161,7 +1141,6 @@ class TestEnsurePersonaAndSkills:
             if result.reset_coro:
                 result.reset_coro.close()
 
-    @pytest.mark.asyncio
     async def test_subagent_dedupe_uses_default_persona_tools(
         self, mock_event, mock_context
     ):
@@ -1223,7 +1202,6 @@ class TestEnsurePersonaAndSkills:
 class TestDecorateLlmRequest:
     """Tests for _decorate_llm_request function."""
 
-    @pytest.mark.asyncio
     async def test_decorate_llm_request_basic(
         self, mock_event, mock_context, sample_config
     ):
@@ -1236,7 +1214,6 @@ class TestDecorateLlmRequest:
         assert req.prompt == "Hello"
         assert req.system_prompt == "System"
 
-    @pytest.mark.asyncio
     async def test_decorate_llm_request_with_prefix(self, mock_event, mock_context):
         """Test LLM request decoration with prompt prefix."""
         module = ama
@@ -1252,7 +1229,6 @@ class TestDecorateLlmRequest:
 
         assert req.prompt == "AI: Hello"
 
-    @pytest.mark.asyncio
     async def test_decorate_llm_request_prefix_with_placeholder(
         self, mock_event, mock_context
     ):
@@ -1271,7 +1247,6 @@ class TestDecorateLlmRequest:
 
         assert req.prompt == "AI Hello - Please respond:"
 
-    @pytest.mark.asyncio
     async def test_decorate_llm_request_no_conversation(self, mock_event, mock_context):
         """Test decoration when no conversation exists."""
         module = ama
@@ -1373,7 +1348,20 @@ class TestPluginToolFix:
 class TestBuildMainAgent:
     """Tests for build_main_agent function."""
 
-    @pytest.mark.asyncio
+    @pytest.fixture(autouse=True)
+    def fast_runner(self, monkeypatch):
+        """Swap AgentRunner/AstrAgentContext with plain mocks for the whole class."""
+        runner = MagicMock()
+        runner.reset = AsyncMock()
+        monkeypatch.setattr(ama, "AgentRunner", MagicMock(return_value=runner))
+        monkeypatch.setattr(ama, "AstrAgentContext", MagicMock())
+        return runner
+
+    @pytest.fixture(autouse=True)
+    def _conv_setup(self, mock_context):
+        """Give every build a fresh conversation from the conversation manager."""
+        _setup_conversation_for_build(mock_context.conversation_manager)
+
     async def test_build_main_agent_basic(
         self, mock_event, mock_context, mock_provider
     ):
@@ -1383,60 +1371,36 @@ class TestBuildMainAgent:
         mock_context.get_using_provider.return_value = mock_provider
         mock_context.get_config.return_value = {}
 
-        conv_mgr = mock_context.conversation_manager
-        _setup_conversation_for_build(conv_mgr)
-
-        with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
-        ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
-            result = await module.build_main_agent(
-                event=mock_event,
-                plugin_context=mock_context,
-                config=module.MainAgentBuildConfig(tool_call_timeout=60),
-            )
+        result = await module.build_main_agent(
+            event=mock_event,
+            plugin_context=mock_context,
+            config=module.MainAgentBuildConfig(tool_call_timeout=60),
+        )
 
         assert result is not None
         assert isinstance(result, module.MainAgentBuildResult)
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_passes_max_context_length_to_runner(
-        self, mock_event, mock_context, mock_provider
+        self, mock_event, mock_context, mock_provider, fast_runner
     ):
         module = ama
         mock_context.get_provider_by_id.return_value = None
         mock_context.get_using_provider.return_value = mock_provider
         mock_context.get_config.return_value = {}
 
-        conv_mgr = mock_context.conversation_manager
-        _setup_conversation_for_build(conv_mgr)
-
-        with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
-        ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
-            result = await module.build_main_agent(
-                event=mock_event,
-                plugin_context=mock_context,
-                config=module.MainAgentBuildConfig(
-                    tool_call_timeout=60,
-                    max_context_length=7,
-                ),
-            )
+        result = await module.build_main_agent(
+            event=mock_event,
+            plugin_context=mock_context,
+            config=module.MainAgentBuildConfig(
+                tool_call_timeout=60,
+                max_context_length=7,
+            ),
+        )
 
         assert result is not None
-        mock_runner.reset.assert_awaited_once()
-        assert mock_runner.reset.await_args.kwargs["enforce_max_turns"] == 7
+        fast_runner.reset.assert_awaited_once()
+        assert fast_runner.reset.await_args.kwargs["enforce_max_turns"] == 7
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_no_provider(self, mock_event, mock_context):
         """Test building main agent when no provider is available."""
         module = ama
@@ -1451,7 +1415,6 @@ class TestBuildMainAgent:
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_with_wake_prefix(
         self, mock_event, mock_context, mock_provider
     ):
@@ -1462,28 +1425,16 @@ class TestBuildMainAgent:
         mock_context.get_using_provider.return_value = mock_provider
         mock_context.get_config.return_value = {}
 
-        conv_mgr = mock_context.conversation_manager
-        _setup_conversation_for_build(conv_mgr)
-
-        with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
-        ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
-            result = await module.build_main_agent(
-                event=mock_event,
-                plugin_context=mock_context,
-                config=module.MainAgentBuildConfig(
-                    tool_call_timeout=60, provider_wake_prefix="/"
-                ),
-            )
+        result = await module.build_main_agent(
+            event=mock_event,
+            plugin_context=mock_context,
+            config=module.MainAgentBuildConfig(
+                tool_call_timeout=60, provider_wake_prefix="/"
+            ),
+        )
 
         assert result is not None
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_no_wake_prefix(
         self, mock_event, mock_context, mock_provider
     ):
@@ -1503,7 +1454,6 @@ class TestBuildMainAgent:
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_with_images(
         self, mock_event, mock_context, mock_provider
     ):
@@ -1517,26 +1467,14 @@ class TestBuildMainAgent:
         mock_context.get_using_provider.return_value = mock_provider
         mock_context.get_config.return_value = {}
 
-        conv_mgr = mock_context.conversation_manager
-        _setup_conversation_for_build(conv_mgr)
-
-        with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
-        ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
-            result = await module.build_main_agent(
-                event=mock_event,
-                plugin_context=mock_context,
-                config=module.MainAgentBuildConfig(tool_call_timeout=60),
-            )
+        result = await module.build_main_agent(
+            event=mock_event,
+            plugin_context=mock_context,
+            config=module.MainAgentBuildConfig(tool_call_timeout=60),
+        )
 
         assert result is not None
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_skips_caption_when_main_provider_supports_images(
         self, mock_event, mock_context, mock_provider
     ):
@@ -1555,22 +1493,13 @@ class TestBuildMainAgent:
         mock_context.get_using_provider.return_value = mock_provider
         mock_context.get_config.return_value = {}
 
-        conv_mgr = mock_context.conversation_manager
-        _setup_conversation_for_build(conv_mgr)
-
         with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
             patch.object(
                 Image,
                 "convert_to_file_path",
                 AsyncMock(return_value="/tmp/quoted.jpg"),
             ),
         ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
             result = await module.build_main_agent(
                 event=mock_event,
                 plugin_context=mock_context,
@@ -1591,7 +1520,6 @@ class TestBuildMainAgent:
         )
         mock_provider.text_chat.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_does_not_caption_quoted_image_twice(
         self, mock_event, mock_context
     ):
@@ -1621,12 +1549,7 @@ class TestBuildMainAgent:
         mock_context.get_using_provider.return_value = text_provider
         mock_context.get_config.return_value = {}
 
-        conv_mgr = mock_context.conversation_manager
-        _setup_conversation_for_build(conv_mgr)
-
         with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
             patch.object(
                 Image,
                 "convert_to_file_path",
@@ -1637,10 +1560,6 @@ class TestBuildMainAgent:
                 AsyncMock(side_effect=lambda path, _settings: path),
             ),
         ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
             result = await module.build_main_agent(
                 event=mock_event,
                 plugin_context=mock_context,
@@ -1662,7 +1581,6 @@ class TestBuildMainAgent:
         assert "<image_caption>quoted image caption</image_caption>" in extra_text
         assert "[Image Caption in quoted message]" not in extra_text
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_does_not_retry_quoted_image_caption_when_empty(
         self, mock_event, mock_context
     ):
@@ -1692,12 +1610,7 @@ class TestBuildMainAgent:
         mock_context.get_using_provider.return_value = text_provider
         mock_context.get_config.return_value = {}
 
-        conv_mgr = mock_context.conversation_manager
-        _setup_conversation_for_build(conv_mgr)
-
         with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
             patch.object(
                 Image,
                 "convert_to_file_path",
@@ -1708,10 +1621,6 @@ class TestBuildMainAgent:
                 AsyncMock(side_effect=lambda path, _settings: path),
             ),
         ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
             result = await module.build_main_agent(
                 event=mock_event,
                 plugin_context=mock_context,
@@ -1733,9 +1642,8 @@ class TestBuildMainAgent:
         assert "<image_caption>" not in extra_text
         assert "[Image Caption in quoted message]" not in extra_text
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_uses_image_fallback_provider(
-        self, mock_event, mock_context
+        self, mock_event, mock_context, fast_runner
     ):
         """Test image requests use a fallback provider that supports images."""
         module = ama
@@ -1765,40 +1673,31 @@ class TestBuildMainAgent:
         )
         mock_context.get_config.return_value = {}
 
-        with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
-        ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
-            result = await module.build_main_agent(
-                event=mock_event,
-                plugin_context=mock_context,
-                config=module.MainAgentBuildConfig(
-                    tool_call_timeout=60,
-                    llm_safety_mode=False,
-                    computer_use_runtime="none",
-                    add_cron_tools=False,
-                    provider_settings={
-                        "fallback_chat_models": ["image-provider"],
-                    },
-                ),
-                provider=text_provider,
-                req=req,
-            )
+        result = await module.build_main_agent(
+            event=mock_event,
+            plugin_context=mock_context,
+            config=module.MainAgentBuildConfig(
+                tool_call_timeout=60,
+                llm_safety_mode=False,
+                computer_use_runtime="none",
+                add_cron_tools=False,
+                provider_settings={
+                    "fallback_chat_models": ["image-provider"],
+                },
+            ),
+            provider=text_provider,
+            req=req,
+        )
 
         assert result is not None
         assert result.provider is image_provider
         assert result.provider_request.image_urls == ["/tmp/image.jpg"]
         assert result.provider_request.model is None
-        assert mock_runner.reset.call_args.kwargs["provider"] is image_provider
-        assert mock_runner.reset.call_args.kwargs["fallback_providers"] == []
+        assert fast_runner.reset.call_args.kwargs["provider"] is image_provider
+        assert fast_runner.reset.call_args.kwargs["fallback_providers"] == []
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_keeps_text_provider_without_image_fallback(
-        self, mock_event, mock_context
+        self, mock_event, mock_context, fast_runner
     ):
         """Test image requests fall back to existing sanitizing when no image provider exists."""
         module = ama
@@ -1817,36 +1716,27 @@ class TestBuildMainAgent:
         mock_context.get_provider_by_id.return_value = None
         mock_context.get_config.return_value = {}
 
-        with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
-        ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
-            result = await module.build_main_agent(
-                event=mock_event,
-                plugin_context=mock_context,
-                config=module.MainAgentBuildConfig(
-                    tool_call_timeout=60,
-                    llm_safety_mode=False,
-                    computer_use_runtime="none",
-                    add_cron_tools=False,
-                    provider_settings={
-                        "fallback_chat_models": ["missing-provider"],
-                    },
-                ),
-                provider=text_provider,
-                req=req,
-            )
+        result = await module.build_main_agent(
+            event=mock_event,
+            plugin_context=mock_context,
+            config=module.MainAgentBuildConfig(
+                tool_call_timeout=60,
+                llm_safety_mode=False,
+                computer_use_runtime="none",
+                add_cron_tools=False,
+                provider_settings={
+                    "fallback_chat_models": ["missing-provider"],
+                },
+            ),
+            provider=text_provider,
+            req=req,
+        )
 
         assert result is not None
         assert result.provider is text_provider
         assert result.provider_request.image_urls == ["/tmp/image.jpg"]
-        assert mock_runner.reset.call_args.kwargs["provider"] is text_provider
+        assert fast_runner.reset.call_args.kwargs["provider"] is text_provider
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_with_video_attachment(
         self, mock_event, mock_context, mock_provider
     ):
@@ -1859,29 +1749,17 @@ class TestBuildMainAgent:
         mock_context.get_using_provider.return_value = mock_provider
         mock_context.get_config.return_value = {}
 
-        conv_mgr = mock_context.conversation_manager
-        _setup_conversation_for_build(conv_mgr)
-
-        with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
-        ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
-            result = await module.build_main_agent(
-                event=mock_event,
-                plugin_context=mock_context,
-                config=module.MainAgentBuildConfig(tool_call_timeout=60),
-            )
+        result = await module.build_main_agent(
+            event=mock_event,
+            plugin_context=mock_context,
+            config=module.MainAgentBuildConfig(tool_call_timeout=60),
+        )
 
         assert result is not None
         assert [
             part.text for part in result.provider_request.extra_user_content_parts
         ] == ["[Video Attachment: name video.mp4, path /path/to/video.mp4]"]
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_with_quoted_video_attachment(
         self, mock_event, mock_context, mock_provider
     ):
@@ -1900,22 +1778,11 @@ class TestBuildMainAgent:
         mock_context.get_using_provider.return_value = mock_provider
         mock_context.get_config.return_value = {}
 
-        conv_mgr = mock_context.conversation_manager
-        _setup_conversation_for_build(conv_mgr)
-
-        with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
-        ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
-            result = await module.build_main_agent(
-                event=mock_event,
-                plugin_context=mock_context,
-                config=module.MainAgentBuildConfig(tool_call_timeout=60),
-            )
+        result = await module.build_main_agent(
+            event=mock_event,
+            plugin_context=mock_context,
+            config=module.MainAgentBuildConfig(tool_call_timeout=60),
+        )
 
         assert result is not None
         assert (
@@ -1923,9 +1790,8 @@ class TestBuildMainAgent:
             "name quoted-video.mp4, path /path/to/quoted-video.mp4]"
         ) in [part.text for part in result.provider_request.extra_user_content_parts]
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_preserves_quoted_video_when_conversion_fails(
-        self, mock_event, mock_context, mock_provider
+        self, mock_event, mock_context, mock_provider, spy_logger
     ):
         """Test quoted video failures preserve the ref without error logging."""
         module = ama
@@ -1943,28 +1809,16 @@ class TestBuildMainAgent:
         mock_context.get_using_provider.return_value = mock_provider
         mock_context.get_config.return_value = {}
 
-        conv_mgr = mock_context.conversation_manager
-        _setup_conversation_for_build(conv_mgr)
-
         async def _raise_video_conversion_error(self):
             if self.file.endswith("direct.mp4"):
                 raise RuntimeError("direct")
             raise RuntimeError("quoted")
 
-        with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
-            patch("astrbot.core.astr_main_agent.logger") as mock_logger,
-            patch.object(
-                Video,
-                "convert_to_file_path",
-                AsyncMock(side_effect=_raise_video_conversion_error),
-            ),
+        with patch.object(
+            Video,
+            "convert_to_file_path",
+            AsyncMock(side_effect=_raise_video_conversion_error),
         ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
             result = await module.build_main_agent(
                 event=mock_event,
                 plugin_context=mock_context,
@@ -1980,17 +1834,16 @@ class TestBuildMainAgent:
             "name quoted.mp4, ref file:///path/to/quoted.mp4]"
         ) in extra_texts
         assert not any("[Video Attachment: name" in part for part in extra_texts)
-        assert mock_logger.error.call_count == 1
+        assert spy_logger.error.call_count == 1
         assert (
             "Error processing video attachment"
-            in mock_logger.error.call_args_list[0][0][0]
+            in spy_logger.error.call_args_list[0][0][0]
         )
         assert not any(
             "Error processing quoted video attachment" in call[0][0]
-            for call in mock_logger.error.call_args_list
+            for call in spy_logger.error.call_args_list
         )
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_no_prompt_no_images(
         self, mock_event, mock_context, mock_provider
     ):
@@ -2003,9 +1856,6 @@ class TestBuildMainAgent:
         mock_context.get_using_provider.return_value = mock_provider
         mock_context.get_config.return_value = {}
 
-        conv_mgr = mock_context.conversation_manager
-        _setup_conversation_for_build(conv_mgr)
-
         result = await module.build_main_agent(
             event=mock_event,
             plugin_context=mock_context,
@@ -2014,40 +1864,29 @@ class TestBuildMainAgent:
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_apply_reset_false(
-        self, mock_event, mock_context, mock_provider
+        self, mock_event, mock_context, mock_provider, fast_runner
     ):
         """Test building main agent without applying reset."""
         module = ama
         mock_context.get_provider_by_id.return_value = None
         mock_context.get_using_provider.return_value = mock_provider
         mock_context.get_config.return_value = {}
+        # A sync stand-in avoids creating a real coroutine that must be closed.
+        reset_coro = MagicMock()
+        fast_runner.reset = MagicMock(return_value=reset_coro)
 
-        conv_mgr = mock_context.conversation_manager
-        _setup_conversation_for_build(conv_mgr)
-
-        with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
-        ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
-            result = await module.build_main_agent(
-                event=mock_event,
-                plugin_context=mock_context,
-                config=module.MainAgentBuildConfig(tool_call_timeout=60),
-                apply_reset=False,
-            )
+        result = await module.build_main_agent(
+            event=mock_event,
+            plugin_context=mock_context,
+            config=module.MainAgentBuildConfig(tool_call_timeout=60),
+            apply_reset=False,
+        )
 
         assert result is not None
-        assert result.reset_coro is not None
-        mock_runner.reset.assert_called_once()
-        result.reset_coro.close()
+        assert result.reset_coro is reset_coro
+        fast_runner.reset.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_build_main_agent_with_existing_request(
         self, mock_event, mock_context, mock_provider
     ):
@@ -2058,21 +1897,13 @@ class TestBuildMainAgent:
             existing_req if k == "provider_request" else None
         )
 
-        with (
-            patch("astrbot.core.astr_main_agent.AgentRunner") as mock_runner_cls,
-            patch("astrbot.core.astr_main_agent.AstrAgentContext"),
-        ):
-            mock_runner = MagicMock()
-            mock_runner.reset = AsyncMock()
-            mock_runner_cls.return_value = mock_runner
-
-            result = await module.build_main_agent(
-                event=mock_event,
-                plugin_context=mock_context,
-                config=module.MainAgentBuildConfig(tool_call_timeout=60),
-                provider=mock_provider,
-                req=existing_req,
-            )
+        result = await module.build_main_agent(
+            event=mock_event,
+            plugin_context=mock_context,
+            config=module.MainAgentBuildConfig(tool_call_timeout=60),
+            provider=mock_provider,
+            req=existing_req,
+        )
 
         assert result is not None
         assert result.provider_request == existing_req
@@ -2081,330 +1912,226 @@ class TestBuildMainAgent:
 class TestHandleWebchat:
     """Tests for _handle_webchat function."""
 
-    @pytest.mark.asyncio
-    async def test_handle_webchat_generates_title(self, mock_event):
-        """Test generating title for webchat session without display name."""
-        module = ama
+    @pytest.fixture(autouse=True)
+    def stub_db_helper(self, monkeypatch):
+        """Swap ``astrbot.core.db_helper`` for a plain stub without a mock patcher."""
+        stub = SimpleNamespace(
+            get_platform_session_by_id=AsyncMock(),
+            update_platform_session=AsyncMock(),
+        )
+        monkeypatch.setattr("astrbot.core.db_helper", stub)
+        return stub
+
+    @pytest.fixture(autouse=True)
+    def _webchat_sid(self, mock_event):
+        """Give every test the same ChatUI session id."""
         mock_event.session_id = "platform!webchat-session-123"
 
+    async def test_handle_webchat_generates_title(self, mock_event, stub_db_helper):
+        """Test generating title for webchat session without display name."""
+        module = ama
         req = ProviderRequest(prompt="What is machine learning?")
-        prov = MagicMock(spec=Provider)
+        prov = MagicMock()
         llm_response = MagicMock()
         llm_response.completion_text = "Machine Learning Introduction"
-        prov.text_chat = AsyncMock(return_value=llm_response)
+
+        async def _text_chat(*args, **kwargs):
+            return llm_response
+
+        prov.text_chat = _text_chat
 
         mock_session = MagicMock()
         mock_session.display_name = None
 
-        with patch("astrbot.core.db_helper") as mock_db:
-            mock_db.get_platform_session_by_id = AsyncMock(return_value=mock_session)
-            mock_db.update_platform_session = AsyncMock()
+        stub_db_helper.get_platform_session_by_id.return_value = mock_session
 
-            await module._handle_webchat(mock_event, req, prov)
+        await module._handle_webchat(mock_event, req, prov)
 
-        mock_db.get_platform_session_by_id.assert_called_once_with(
+        stub_db_helper.get_platform_session_by_id.assert_called_once_with(
             "webchat-session-123"
         )
-        mock_db.update_platform_session.assert_called_once_with(
+        stub_db_helper.update_platform_session.assert_called_once_with(
             session_id="webchat-session-123",
             display_name="Machine Learning Introduction",
         )
 
-    @pytest.mark.asyncio
-    async def test_handle_webchat_no_user_prompt(self, mock_event):
-        """Test that title generation is skipped when no user prompt."""
-        module = ama
-        mock_event.session_id = "platform!webchat-session-123"
-
-        req = ProviderRequest(prompt=None)
-        prov = MagicMock(spec=Provider)
-
-        mock_session = MagicMock()
-        mock_session.display_name = None
-
-        with patch("astrbot.core.db_helper") as mock_db:
-            mock_db.get_platform_session_by_id = AsyncMock(return_value=mock_session)
-            await module._handle_webchat(mock_event, req, prov)
-
-        prov.text_chat.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_handle_webchat_empty_user_prompt(self, mock_event):
-        """Test that title generation is skipped when user prompt is empty."""
-        module = ama
-        mock_event.session_id = "platform!webchat-session-123"
-
-        req = ProviderRequest(prompt="")
-        prov = MagicMock(spec=Provider)
-
-        mock_session = MagicMock()
-        mock_session.display_name = None
-
-        with patch("astrbot.core.db_helper") as mock_db:
-            mock_db.get_platform_session_by_id = AsyncMock(return_value=mock_session)
-            await module._handle_webchat(mock_event, req, prov)
-
-        prov.text_chat.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_handle_webchat_session_already_has_display_name(self, mock_event):
-        """Test that title generation is skipped when session already has display name."""
-        module = ama
-        mock_event.session_id = "platform!webchat-session-123"
-
-        req = ProviderRequest(prompt="What is AI?")
-        prov = MagicMock(spec=Provider)
-
-        mock_session = MagicMock()
-        mock_session.display_name = "Existing Title"
-
-        with patch("astrbot.core.db_helper") as mock_db:
-            mock_db.get_platform_session_by_id = AsyncMock(return_value=mock_session)
-
-            await module._handle_webchat(mock_event, req, prov)
-
-        prov.text_chat.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_handle_webchat_no_session_found(self, mock_event):
-        """Test that title generation is skipped when session is not found."""
-        module = ama
-        mock_event.session_id = "platform!webchat-session-123"
-
-        req = ProviderRequest(prompt="What is AI?")
-        prov = MagicMock(spec=Provider)
-
-        with patch("astrbot.core.db_helper") as mock_db:
-            mock_db.get_platform_session_by_id = AsyncMock(return_value=None)
-
-            await module._handle_webchat(mock_event, req, prov)
-
-        prov.text_chat.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_handle_webchat_llm_returns_none_title(self, mock_event):
-        """Test that title is not updated when LLM returns <None>."""
-        module = ama
-        mock_event.session_id = "platform!webchat-session-123"
-
-        req = ProviderRequest(prompt="hi")
-        prov = MagicMock(spec=Provider)
-        llm_response = MagicMock()
-        llm_response.completion_text = "<None>"
-        prov.text_chat = AsyncMock(return_value=llm_response)
-
-        mock_session = MagicMock()
-        mock_session.display_name = None
-
-        with patch("astrbot.core.db_helper") as mock_db:
-            mock_db.get_platform_session_by_id = AsyncMock(return_value=mock_session)
-            mock_db.update_platform_session = AsyncMock()
-
-            await module._handle_webchat(mock_event, req, prov)
-
-        mock_db.update_platform_session.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_handle_webchat_llm_returns_empty_title(self, mock_event):
-        """Test that title is not updated when LLM returns empty string."""
-        module = ama
-        mock_event.session_id = "platform!webchat-session-123"
-
-        req = ProviderRequest(prompt="hello")
-        prov = MagicMock(spec=Provider)
-        llm_response = MagicMock()
-        llm_response.completion_text = "   "
-        prov.text_chat = AsyncMock(return_value=llm_response)
-
-        mock_session = MagicMock()
-        mock_session.display_name = None
-
-        with patch("astrbot.core.db_helper") as mock_db:
-            mock_db.get_platform_session_by_id = AsyncMock(return_value=mock_session)
-            mock_db.update_platform_session = AsyncMock()
-
-            await module._handle_webchat(mock_event, req, prov)
-
-        mock_db.update_platform_session.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_handle_webchat_llm_returns_none_response(self, mock_event):
-        """Test handling when LLM returns None response."""
-        module = ama
-        mock_event.session_id = "platform!webchat-session-123"
-
-        req = ProviderRequest(prompt="test question")
-        prov = MagicMock(spec=Provider)
-        prov.text_chat = AsyncMock(return_value=None)
-
-        mock_session = MagicMock()
-        mock_session.display_name = None
-
-        with patch("astrbot.core.db_helper") as mock_db:
-            mock_db.get_platform_session_by_id = AsyncMock(return_value=mock_session)
-            mock_db.update_platform_session = AsyncMock()
-
-            await module._handle_webchat(mock_event, req, prov)
-
-        mock_db.update_platform_session.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_handle_webchat_llm_returns_no_completion_text(self, mock_event):
-        """Test handling when LLM response has no completion_text."""
+    @pytest.mark.parametrize(
+        ("prompt", "session", "llm_response", "expect_llm_call"),
+        [
+            pytest.param(
+                None,
+                SimpleNamespace(display_name=None),
+                None,
+                False,
+                id="no_user_prompt",
+            ),
+            pytest.param(
+                "",
+                SimpleNamespace(display_name=None),
+                None,
+                False,
+                id="empty_user_prompt",
+            ),
+            pytest.param(
+                "What is AI?",
+                SimpleNamespace(display_name="Existing Title"),
+                None,
+                False,
+                id="session_already_has_display_name",
+            ),
+            pytest.param("What is AI?", None, None, False, id="no_session_found"),
+            pytest.param(
+                "hi",
+                SimpleNamespace(display_name=None),
+                SimpleNamespace(completion_text="<None>"),
+                True,
+                id="llm_returns_none_title",
+            ),
+            pytest.param(
+                "hello",
+                SimpleNamespace(display_name=None),
+                SimpleNamespace(completion_text="   "),
+                True,
+                id="llm_returns_empty_title",
+            ),
+            pytest.param(
+                "test question",
+                SimpleNamespace(display_name=None),
+                None,
+                True,
+                id="llm_returns_none_response",
+            ),
+            pytest.param(
+                "test question",
+                SimpleNamespace(display_name=None),
+                SimpleNamespace(completion_text=None),
+                True,
+                id="llm_returns_no_completion_text",
+            ),
+        ],
+    )
+    async def test_handle_webchat_does_not_update_title(
+        self,
+        mock_event,
+        stub_db_helper,
+        prompt,
+        session,
+        llm_response,
+        expect_llm_call,
+    ):
+        """Test that the session title is left untouched on every skip path."""
         module = ama
-        mock_event.session_id = "platform!webchat-session-123"
-
-        req = ProviderRequest(prompt="test question")
-        prov = MagicMock(spec=Provider)
-        llm_response = MagicMock()
-        llm_response.completion_text = None
+        req = ProviderRequest(prompt=prompt)
+        prov = MagicMock()
         prov.text_chat = AsyncMock(return_value=llm_response)
+        stub_db_helper.get_platform_session_by_id.return_value = session
 
-        mock_session = MagicMock()
-        mock_session.display_name = None
-
-        with patch("astrbot.core.db_helper") as mock_db:
-            mock_db.get_platform_session_by_id = AsyncMock(return_value=mock_session)
-            mock_db.update_platform_session = AsyncMock()
+        await module._handle_webchat(mock_event, req, prov)
 
-            await module._handle_webchat(mock_event, req, prov)
+        assert prov.text_chat.called is expect_llm_call
+        stub_db_helper.update_platform_session.assert_not_called()
 
-        mock_db.update_platform_session.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_handle_webchat_strips_title_whitespace(self, mock_event):
+    async def test_handle_webchat_strips_title_whitespace(
+        self, mock_event, stub_db_helper
+    ):
         """Test that generated title has whitespace stripped."""
         module = ama
-        mock_event.session_id = "platform!webchat-session-123"
-
         req = ProviderRequest(prompt="What is Python?")
-        prov = MagicMock(spec=Provider)
+        prov = MagicMock()
         llm_response = MagicMock()
         llm_response.completion_text = "  Python Programming Guide  "
-        prov.text_chat = AsyncMock(return_value=llm_response)
+
+        async def _text_chat(*args, **kwargs):
+            return llm_response
+
+        prov.text_chat = _text_chat
 
         mock_session = MagicMock()
         mock_session.display_name = None
 
-        with patch("astrbot.core.db_helper") as mock_db:
-            mock_db.get_platform_session_by_id = AsyncMock(return_value=mock_session)
-            mock_db.update_platform_session = AsyncMock()
+        stub_db_helper.get_platform_session_by_id.return_value = mock_session
 
-            await module._handle_webchat(mock_event, req, prov)
+        await module._handle_webchat(mock_event, req, prov)
 
-        mock_db.update_platform_session.assert_called_once_with(
+        stub_db_helper.update_platform_session.assert_called_once_with(
             session_id="webchat-session-123",
             display_name="Python Programming Guide",
         )
 
-    @pytest.mark.asyncio
-    async def test_handle_webchat_provider_exception_is_handled(self, mock_event):
+    async def test_handle_webchat_provider_exception_is_handled(
+        self, mock_event, stub_db_helper, spy_logger
+    ):
         """Test that provider exception during title generation is handled."""
         module = ama
-        mock_event.session_id = "platform!webchat-session-123"
-
         req = ProviderRequest(prompt="What is Python?")
-        prov = MagicMock(spec=Provider)
-        prov.text_chat = AsyncMock(side_effect=RuntimeError("provider failed"))
+        prov = MagicMock()
+
+        async def _text_chat(*args, **kwargs):
+            raise RuntimeError("provider failed")
+
+        prov.text_chat = _text_chat
 
         mock_session = MagicMock()
         mock_session.display_name = None
 
-        with (
-            patch("astrbot.core.db_helper") as mock_db,
-            patch("astrbot.core.astr_main_agent.logger") as mock_logger,
-        ):
-            mock_db.get_platform_session_by_id = AsyncMock(return_value=mock_session)
-            mock_db.update_platform_session = AsyncMock()
+        stub_db_helper.get_platform_session_by_id.return_value = mock_session
 
-            await module._handle_webchat(mock_event, req, prov)
+        await module._handle_webchat(mock_event, req, prov)
 
-        mock_logger.exception.assert_called_once()
-        mock_db.update_platform_session.assert_not_called()
+        spy_logger.exception.assert_called_once()
+        stub_db_helper.update_platform_session.assert_not_called()
+
+
+@pytest.fixture
+def req():
+    """A fresh ProviderRequest for the safety/sandbox tests."""
+    return ProviderRequest(prompt="Test", system_prompt="Original prompt")
 
 
 class TestApplyLlmSafetyMode:
     """Tests for _apply_llm_safety_mode function."""
 
-    def test_apply_llm_safety_mode_system_prompt_strategy(self):
-        """Test applying safety mode with system_prompt strategy."""
+    @pytest.mark.parametrize(
+        "original_prompt", ["Original prompt", "My custom prompt", None, ""]
+    )
+    def test_apply_llm_safety_mode_system_prompt_strategy(self, req, original_prompt):
+        """Test that the safety prompt is prepended to any original system prompt."""
         module = ama
         config = module.MainAgentBuildConfig(
             tool_call_timeout=60,
             llm_safety_mode=True,
             safety_mode_strategy="system_prompt",
         )
-        req = ProviderRequest(prompt="Test", system_prompt="Original prompt")
-
-        module._apply_llm_safety_mode(config, req)
-
-        assert "You are running in Safe Mode" in req.system_prompt
-        assert "Original prompt" in req.system_prompt
-
-    def test_apply_llm_safety_mode_prepends_safety_prompt(self):
-        """Test that safety prompt is prepended before original system prompt."""
-        module = ama
-        config = module.MainAgentBuildConfig(
-            tool_call_timeout=60,
-            safety_mode_strategy="system_prompt",
-        )
-        req = ProviderRequest(prompt="Test", system_prompt="My custom prompt")
+        req.system_prompt = original_prompt
 
         module._apply_llm_safety_mode(config, req)
 
         assert req.system_prompt.startswith("You are running in Safe Mode")
-        assert "My custom prompt" in req.system_prompt
+        if original_prompt:
+            assert original_prompt in req.system_prompt
 
-    def test_apply_llm_safety_mode_with_none_system_prompt(self):
-        """Test applying safety mode when original system_prompt is None."""
-        module = ama
-        config = module.MainAgentBuildConfig(
-            tool_call_timeout=60,
-            safety_mode_strategy="system_prompt",
-        )
-        req = ProviderRequest(prompt="Test", system_prompt=None)
-
-        module._apply_llm_safety_mode(config, req)
-
-        assert "You are running in Safe Mode" in req.system_prompt
-
-    def test_apply_llm_safety_mode_unsupported_strategy(self):
+    def test_apply_llm_safety_mode_unsupported_strategy(self, req, spy_logger):
         """Test that unsupported strategy logs warning and does nothing."""
         module = ama
         config = module.MainAgentBuildConfig(
             tool_call_timeout=60,
             safety_mode_strategy="unsupported_strategy",
         )
-        req = ProviderRequest(prompt="Test", system_prompt="Original")
+        req.system_prompt = "Original"
 
-        with patch("astrbot.core.astr_main_agent.logger") as mock_logger:
-            module._apply_llm_safety_mode(config, req)
+        module._apply_llm_safety_mode(config, req)
 
-        mock_logger.warning.assert_called_once()
+        spy_logger.warning.assert_called_once()
         assert (
-            "Unsupported llm_safety_mode strategy"
-            in mock_logger.warning.call_args[0][0]
+            "Unsupported llm_safety_mode strategy" in spy_logger.warning.call_args[0][0]
         )
         assert req.system_prompt == "Original"
 
-    def test_apply_llm_safety_mode_empty_system_prompt(self):
-        """Test applying safety mode when original system_prompt is empty."""
-        module = ama
-        config = module.MainAgentBuildConfig(
-            tool_call_timeout=60,
-            safety_mode_strategy="system_prompt",
-        )
-        req = ProviderRequest(prompt="Test", system_prompt="")
-
-        module._apply_llm_safety_mode(config, req)
-
-        assert "You are running in Safe Mode" in req.system_prompt
-
 
 class TestApplySandboxTools:
     """Tests for _apply_sandbox_tools function."""
 
-    def test_apply_sandbox_tools_creates_toolset_if_none(self, mock_context):
+    def test_apply_sandbox_tools_creates_toolset_if_none(self, mock_context, req):
         """Test that ToolSet is created when func_tool is None."""
         module = ama
         config = module.MainAgentBuildConfig(
@@ -2412,14 +2139,13 @@ class TestApplySandboxTools:
             computer_use_runtime="sandbox",
             sandbox_cfg={},
         )
-        req = ProviderRequest(prompt="Test", func_tool=None)
 
         module._apply_sandbox_tools(config, req, "session-123")
 
         assert req.func_tool is not None
         assert isinstance(req.func_tool, ToolSet)
 
-    def test_apply_sandbox_tools_adds_required_tools(self, mock_context):
+    def test_apply_sandbox_tools_adds_required_tools(self, mock_context, req):
         """Test that all required sandbox tools are added."""
         module = ama
         config = module.MainAgentBuildConfig(
@@ -2427,7 +2153,6 @@ class TestApplySandboxTools:
             computer_use_runtime="sandbox",
             sandbox_cfg={},
         )
-        req = ProviderRequest(prompt="Test", func_tool=None)
 
         module._apply_sandbox_tools(config, req, "session-123")
 
@@ -2437,7 +2162,7 @@ class TestApplySandboxTools:
         assert "astrbot_upload_file" in tool_names
         assert "astrbot_download_file" in tool_names
 
-    def test_apply_sandbox_tools_adds_sandbox_prompt(self, mock_context):
+    def test_apply_sandbox_tools_adds_sandbox_prompt(self, mock_context, req):
         """Test that sandbox mode prompt is added to system_prompt."""
         module = ama
         config = module.MainAgentBuildConfig(
@@ -2445,13 +2170,12 @@ class TestApplySandboxTools:
             computer_use_runtime="sandbox",
             sandbox_cfg={},
         )
-        req = ProviderRequest(prompt="Test", system_prompt="Original prompt")
 
         module._apply_sandbox_tools(config, req, "session-123")
 
         assert "sandboxed environment" in req.system_prompt
 
-    def test_apply_sandbox_tools_with_cua_adds_gui_guidance(self, mock_context):
+    def test_apply_sandbox_tools_with_cua_adds_gui_guidance(self, mock_context, req):
         """Test that CUA sandbox guidance nudges reliable GUI workflows."""
         module = ama
         config = module.MainAgentBuildConfig(
@@ -2459,7 +2183,6 @@ class TestApplySandboxTools:
             computer_use_runtime="sandbox",
             sandbox_cfg={"booter": "cua"},
         )
-        req = ProviderRequest(prompt="Test", system_prompt="Original prompt")
 
         module._apply_sandbox_tools(config, req, "session-123")
 
@@ -2481,7 +2204,9 @@ class TestApplySandboxTools:
         assert "send_to_user=true" in req.system_prompt
         assert "focused and empty or safe to append" in req.system_prompt
 
-    def test_apply_sandbox_tools_with_shipyard_booter(self, monkeypatch, mock_context):
+    def test_apply_sandbox_tools_with_shipyard_booter(
+        self, monkeypatch, mock_context, req
+    ):
         """Test sandbox tools with shipyard booter configuration."""
         module = ama
         config = module.MainAgentBuildConfig(
@@ -2493,59 +2218,50 @@ class TestApplySandboxTools:
                 "shipyard_access_token": "test-token",
             },
         )
-        req = ProviderRequest(prompt="Test", func_tool=None)
 
-        monkeypatch.delenv("SHIPYARD_ENDPOINT", raising=False)
-        monkeypatch.delenv("SHIPYARD_ACCESS_TOKEN", raising=False)
+        # The SUT writes the shipyard settings into os.environ; give it a
+        # throwaway copy so nothing leaks into the real process environment.
+        env = os.environ.copy()
+        env.pop("SHIPYARD_ENDPOINT", None)
+        env.pop("SHIPYARD_ACCESS_TOKEN", None)
+        monkeypatch.setattr(os, "environ", env)
 
         module._apply_sandbox_tools(config, req, "session-123")
 
-        assert os.environ.get("SHIPYARD_ENDPOINT") == "https://shipyard.example.com"
-        assert os.environ.get("SHIPYARD_ACCESS_TOKEN") == "test-token"
+        assert env.get("SHIPYARD_ENDPOINT") == "https://shipyard.example.com"
+        assert env.get("SHIPYARD_ACCESS_TOKEN") == "test-token"
 
-    def test_apply_sandbox_tools_shipyard_missing_endpoint(self, mock_context):
-        """Test that shipyard config is skipped when endpoint is missing."""
+    @pytest.mark.parametrize(
+        ("endpoint", "access_token"),
+        [
+            pytest.param("", "test-token", id="missing_endpoint"),
+            pytest.param("https://shipyard.example.com", "", id="missing_access_token"),
+        ],
+    )
+    def test_apply_sandbox_tools_shipyard_incomplete_config(
+        self, mock_context, req, spy_logger, endpoint, access_token
+    ):
+        """Test that shipyard config is skipped when endpoint or token is missing."""
         module = ama
         config = module.MainAgentBuildConfig(
             tool_call_timeout=60,
             computer_use_runtime="sandbox",
             sandbox_cfg={
                 "booter": "shipyard",
-                "shipyard_endpoint": "",
-                "shipyard_access_token": "test-token",
+                "shipyard_endpoint": endpoint,
+                "shipyard_access_token": access_token,
             },
         )
-        req = ProviderRequest(prompt="Test", func_tool=None)
 
-        with patch("astrbot.core.astr_main_agent.logger") as mock_logger:
-            module._apply_sandbox_tools(config, req, "session-123")
+        module._apply_sandbox_tools(config, req, "session-123")
 
-        mock_logger.error.assert_called_once()
+        spy_logger.error.assert_called_once()
         assert (
             "Shipyard sandbox configuration is incomplete"
-            in mock_logger.error.call_args[0][0]
+            in spy_logger.error.call_args[0][0]
         )
 
-    def test_apply_sandbox_tools_shipyard_missing_access_token(self, mock_context):
-        """Test that shipyard config is skipped when access token is missing."""
-        module = ama
-        config = module.MainAgentBuildConfig(
-            tool_call_timeout=60,
-            computer_use_runtime="sandbox",
-            sandbox_cfg={
-                "booter": "shipyard",
-                "shipyard_endpoint": "https://shipyard.example.com",
-                "shipyard_access_token": "",
-            },
-        )
-        req = ProviderRequest(prompt="Test", func_tool=None)
-
-        with patch("astrbot.core.astr_main_agent.logger") as mock_logger:
-            module._apply_sandbox_tools(config, req, "session-123")
-
-        mock_logger.error.assert_called_once()
-
-    def test_apply_sandbox_tools_preserves_existing_toolset(self, mock_context):
+    def test_apply_sandbox_tools_preserves_existing_toolset(self, mock_context, req):
         """Test that existing tools are preserved when adding sandbox tools."""
         module = ama
         config = module.MainAgentBuildConfig(
@@ -2557,14 +2273,16 @@ class TestApplySandboxTools:
         existing_tool = MagicMock()
         existing_tool.name = "existing_tool"
         existing_toolset.add_tool(existing_tool)
-        req = ProviderRequest(prompt="Test", func_tool=existing_toolset)
+        req.func_tool = existing_toolset
 
         module._apply_sandbox_tools(config, req, "session-123")
 
         assert "existing_tool" in req.func_tool.names()
         assert "astrbot_execute_shell" in req.func_tool.names()
 
-    def test_apply_sandbox_tools_appends_to_existing_system_prompt(self, mock_context):
+    def test_apply_sandbox_tools_appends_to_existing_system_prompt(
+        self, mock_context, req
+    ):
         """Test that sandbox prompt is appended to existing system prompt."""
         module = ama
         config = module.MainAgentBuildConfig(
@@ -2572,14 +2290,14 @@ class TestApplySandboxTools:
             computer_use_runtime="sandbox",
             sandbox_cfg={},
         )
-        req = ProviderRequest(prompt="Test", system_prompt="Base prompt")
+        req.system_prompt = "Base prompt"
 
         module._apply_sandbox_tools(config, req, "session-123")
 
         assert req.system_prompt.startswith("Base prompt")
         assert "sandboxed environment" in req.system_prompt
 
-    def test_apply_sandbox_tools_with_none_system_prompt(self, mock_context):
+    def test_apply_sandbox_tools_with_none_system_prompt(self, mock_context, req):
         """Test that sandbox prompt is applied when system_prompt is None."""
         module = ama
         config = module.MainAgentBuildConfig(
@@ -2587,7 +2305,7 @@ class TestApplySandboxTools:
             computer_use_runtime="sandbox",
             sandbox_cfg={},
         )
-        req = ProviderRequest(prompt="Test", system_prompt=None)
+        req.system_prompt = None
 
         module._apply_sandbox_tools(config, req, "session-123")
 
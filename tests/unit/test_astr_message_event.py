@@ -497,7 +497,6 @@ class TestIsAdmin:
 class TestProcessBuffer:
     """Tests for process_buffer method."""
 
-    @pytest.mark.asyncio
     async def test_process_buffer_splits_by_pattern(self, astr_message_event):
         """Test process_buffer splits buffer by pattern."""
         buffer = "Line 1\nLine 2\nLine 3\nRemaining"
@@ -512,7 +511,6 @@ class TestProcessBuffer:
             assert mock_send.call_count == 3
             assert result == "Remaining"
 
-    @pytest.mark.asyncio
     async def test_process_buffer_no_match(self, astr_message_event):
         """Test process_buffer returns original when no match."""
         buffer = "No newlines here"
@@ -624,7 +622,6 @@ class TestRequestLlm:
 class TestSendStreaming:
     """Tests for send_streaming method."""
 
-    @pytest.mark.asyncio
     async def test_send_streaming_sets_has_send_oper(self, astr_message_event):
         """Test send_streaming sets _has_send_oper flag."""
         assert astr_message_event._has_send_oper is False
@@ -644,7 +641,6 @@ class TestSendStreaming:
 class TestSendTyping:
     """Tests for send_typing method."""
 
-    @pytest.mark.asyncio
     async def test_send_typing_default_empty(self, astr_message_event):
         """Test send_typing default implementation is empty."""
         # Should not raise any exception
@@ -654,7 +650,6 @@ class TestSendTyping:
 class TestStopTyping:
     """Tests for stop_typing method."""
 
-    @pytest.mark.asyncio
     async def test_stop_typing_default_empty(self, astr_message_event):
         """Test stop_typing default implementation is empty."""
         await astr_message_event.stop_typing()
@@ -663,7 +658,6 @@ class TestStopTyping:
 class TestReact:
     """Tests for react method."""
 
-    @pytest.mark.asyncio
     async def test_react_sends_emoji(self, astr_message_event):
         """Test react sends emoji as message."""
         with patch.object(
@@ -682,13 +676,11 @@ class TestReact:
 class TestGetGroup:
     """Tests for get_group method."""
 
-    @pytest.mark.asyncio
     async def test_get_group_returns_none_for_private(self, astr_message_event):
         """Test get_group returns None for private chat."""
         result = await astr_message_event.get_group()
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_group_with_group_id_param(self, astr_message_event):
         """Test get_group with group_id parameter."""
         # Default implementation returns None
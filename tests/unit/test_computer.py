@@ -4,12 +4,15 @@ This module tests the ComputerClient, Booter implementations (local, shipyard, b
 filesystem operations, Python execution, shell execution, and security restrictions.
 """
 
-import shlex
-import sys
+import importlib.util
+import subprocess
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from astrbot.core.computer import computer_client
+from astrbot.core.computer.booters import local as local_module
 from astrbot.core.computer.booters.base import ComputerBooter
 from astrbot.core.computer.booters.local import (
     LocalBooter,
@@ -18,71 +21,89 @@ from astrbot.core.computer.booters.local import (
     LocalShellComponent,
     _is_safe_command,
 )
+from astrbot.core.computer.booters.shipyard import ShipyardBooter
+
+
+def _patch_roots(monkeypatch, root) -> None:
+    monkeypatch.setattr(local_module, "get_astrbot_root", lambda: str(root))
+
+
+class _FakePopen:
+    def __init__(self, stdout: bytes, stderr: bytes = b"", returncode: int = 0):
+        self._stdout = stdout
+        self._stderr = stderr
+        self.returncode = returncode
+        self.pid = 12345
+
+    def communicate(self, timeout=None):
+        return self._stdout, self._stderr
+
+    def wait(self, timeout=None):
+        pass
+
+
+@pytest.fixture(scope="session")
+def local_booter():
+    return LocalBooter()
+
+
+@pytest.fixture(scope="session")
+def shell_component(local_booter):
+    return local_booter.shell
+
+
+@pytest.fixture(scope="session")
+def python_component(local_booter):
+    return local_booter.python
+
+
+@pytest.fixture(scope="session")
+def fs_component(local_booter):
+    return local_booter.fs
 
 
 class TestLocalBooterInit:
     """Tests for LocalBooter initialization."""
 
-    def test_local_booter_init(self):
+    def test_local_booter_init(self, local_booter):
         """Test LocalBooter initializes with all components."""
-        booter = LocalBooter()
-        assert isinstance(booter, ComputerBooter)
-        assert isinstance(booter.fs, LocalFileSystemComponent)
-        assert isinstance(booter.python, LocalPythonComponent)
-        assert isinstance(booter.shell, LocalShellComponent)
+        assert isinstance(local_booter, ComputerBooter)
+        assert isinstance(local_booter.fs, LocalFileSystemComponent)
+        assert isinstance(local_booter.python, LocalPythonComponent)
+        assert isinstance(local_booter.shell, LocalShellComponent)
 
-    def test_local_booter_properties(self):
+    def test_local_booter_properties(self, local_booter):
         """Test LocalBooter properties return correct components."""
-        booter = LocalBooter()
-        assert booter.fs is booter._fs
-        assert booter.python is booter._python
-        assert booter.shell is booter._shell
+        assert local_booter.fs is local_booter._fs
+        assert local_booter.python is local_booter._python
+        assert local_booter.shell is local_booter._shell
 
 
 class TestLocalBooterLifecycle:
     """Tests for LocalBooter boot and shutdown."""
 
-    @pytest.mark.asyncio
-    async def test_boot(self):
-        """Test LocalBooter boot method."""
-        booter = LocalBooter()
-        # Should not raise any exception
-        await booter.boot("test-session-id")
-        # boot is a no-op for LocalBooter
-
-    @pytest.mark.asyncio
-    async def test_shutdown(self):
-        """Test LocalBooter shutdown method."""
-        booter = LocalBooter()
-        # Should not raise any exception
-        await booter.shutdown()
-
-    @pytest.mark.asyncio
-    async def test_available(self):
-        """Test LocalBooter available method returns True."""
-        booter = LocalBooter()
-        assert await booter.available() is True
+    async def test_lifecycle(self, local_booter):
+        """Test LocalBooter boot/shutdown are no-ops and it is always available."""
+        await local_booter.boot("test-session-id")
+        await local_booter.shutdown()
+        assert await local_booter.available() is True
 
 
 class TestLocalBooterUploadDownload:
     """Tests for LocalBooter file operations."""
 
-    @pytest.mark.asyncio
-    async def test_upload_file_not_supported(self):
+    async def test_upload_file_not_supported(self, local_booter):
         """Test LocalBooter upload_file raises NotImplementedError."""
-        booter = LocalBooter()
         with pytest.raises(NotImplementedError) as exc_info:
-            await booter.upload_file("local_path", "remote_path")
+            await local_booter.upload_file("local_path", "remote_path")
         assert "LocalBooter does not support upload_file operation" in str(
             exc_info.value
         )
 
-    @pytest.mark.asyncio
-    async def test_download_file_not_supported(self):
+    async def test_download_file_not_supported(self, local_booter):
         """Test LocalBooter download_file raises NotImplementedError."""
-        booter = LocalBooter()
         with pytest.raises(NotImplementedError) as exc_info:
-            await booter.download_file("remote_path", "local_path")
+            await local_booter.download_file("remote_path", "local_path")
         assert "LocalBooter does not support download_file operation" in str(
             exc_info.value
         )
@@ -91,9 +112,9 @@ class TestLocalBooterUploadDownload:
 class TestSecurityRestrictions:
     """Tests for security restrictions in LocalBooter."""
 
-    def test_is_safe_command_allowed(self):
-        """Test safe commands are allowed."""
-        allowed_commands = [
+    @pytest.mark.parametrize(
+        "cmd",
+        [
             "echo hello",
             "ls -la",
             "pwd",
@@ -102,13 +123,15 @@ class TestSecurityRestrictions:
             "git status",
             "npm install",
             "pip list",
-        ]
-        for cmd in allowed_commands:
-            assert _is_safe_command(cmd) is True, f"Command '{cmd}' should be allowed"
+        ],
+    )
+    def test_is_safe_command_allowed(self, cmd):
+        """Test safe commands are allowed."""
+        assert _is_safe_command(cmd) is True
 
-    def test_is_safe_command_blocked(self):
-        """Test dangerous commands are blocked."""
-        blocked_commands = [
+    @pytest.mark.parametrize(
+        "cmd",
+        [
             "rm -rf /",
             "rm -rf /tmp",
             "rm -fr /home",
@@ -122,277 +145,233 @@ class TestSecurityRestrictions:
             ":(){:|:&};:",
             "kill -9 -1",
             "killall python",
-        ]
-        for cmd in blocked_commands:
-            assert _is_safe_command(cmd) is False, f"Command '{cmd}' should be blocked"
+        ],
+    )
+    def test_is_safe_command_blocked(self, cmd):
+        """Test dangerous commands are blocked."""
+        assert _is_safe_command(cmd) is False
 
 
 class TestLocalShellComponent:
     """Tests for LocalShellComponent."""
 
-    @pytest.mark.asyncio
-    async def test_exec_safe_command(self):
+    @pytest.fixture(autouse=True)
+    def _tmp_root(self, monkeypatch, tmp_path):
+        _patch_roots(monkeypatch, tmp_path)
+
+    @pytest.fixture
+    def popen(self, monkeypatch):
+        popen = MagicMock(return_value=_FakePopen(stdout=b"hello\n"))
+        monkeypatch.setattr(local_module.subprocess, "Popen", popen)
+        return popen
+
+    async def test_exec_safe_command(self, shell_component, popen):
         """Test executing a safe command."""
-        shell = LocalShellComponent()
-        result = await shell.exec("echo hello")
+        result = await shell_component.exec("echo hello")
         assert result["exit_code"] == 0
-        assert "hello" in result["stdout"]
+        assert result["stdout"] == "hello\n"
+        assert popen.call_args.args == ("echo hello",)
 
-    @pytest.mark.asyncio
-    async def test_exec_blocked_command(self):
+    async def test_exec_blocked_command(self, shell_component):
         """Test executing a blocked command raises PermissionError."""
-        shell = LocalShellComponent()
         with pytest.raises(PermissionError) as exc_info:
-            await shell.exec("rm -rf /")
+            await shell_component.exec("rm -rf /")
         assert "Blocked unsafe shell command" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_exec_with_timeout(self):
-        """Test command with timeout."""
-        shell = LocalShellComponent()
-        # Sleep command should complete within timeout
-        result = await shell.exec("echo test", timeout=5)
-        assert result["exit_code"] == 0
+    async def test_exec_with_timeout(self, shell_component, popen, monkeypatch):
+        """Test a command exceeding its timeout is killed and the error re-raised."""
+        proc = MagicMock(pid=12345)
+        proc.communicate.side_effect = subprocess.TimeoutExpired(
+            cmd="sleep 10", timeout=5
+        )
+        popen.return_value = proc
+        monkeypatch.setattr(local_module.sys, "platform", "linux")
 
-    @pytest.mark.asyncio
-    async def test_exec_with_cwd(self, tmp_path):
-        """Test command execution with custom working directory."""
-        shell = LocalShellComponent()
-        # Create a test file
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("content")
+        with pytest.raises(subprocess.TimeoutExpired):
+            await shell_component.exec("sleep 10", timeout=5)
+        proc.communicate.assert_called_once_with(timeout=5)
+        proc.kill.assert_called_once()
 
-        with (
-            patch(
-                "astrbot.core.computer.booters.local.get_astrbot_root",
-                return_value=str(tmp_path),
-            ),
-        ):
-            # Use python to read file to avoid Windows vs Unix command differences
-            result = await shell.exec(
-                f'{shlex.quote(sys.executable)} -c "print(open(r\\"{test_file}\\").read())"',
-                cwd=str(tmp_path),
-            )
-            assert result["exit_code"] == 0
+    async def test_exec_with_cwd(self, shell_component, popen, tmp_path):
+        """Test command execution with custom working directory."""
+        result = await shell_component.exec("cat test.txt", cwd=str(tmp_path))
+        assert result["exit_code"] == 0
+        assert popen.call_args.kwargs["cwd"] == str(tmp_path)
 
-    @pytest.mark.asyncio
-    async def test_exec_with_env(self):
+    async def test_exec_with_env(self, shell_component, popen):
         """Test command execution with custom environment variables."""
-        shell = LocalShellComponent()
-        result = await shell.exec(
-            f'{shlex.quote(sys.executable)} -c "import os; print(os.environ.get(\\"TEST_VAR\\", \\"\\"))"',
-            env={"TEST_VAR": "test_value"},
+        popen.return_value = _FakePopen(stdout=b"test_value\n")
+        result = await shell_component.exec(
+            "echo $TEST_VAR", env={"TEST_VAR": "test_value"}
         )
         assert result["exit_code"] == 0
-        assert "test_value" in result["stdout"]
+        assert result["stdout"] == "test_value\n"
+        assert popen.call_args.kwargs["env"]["TEST_VAR"] == "test_value"
 
 
 class TestLocalPythonComponent:
     """Tests for LocalPythonComponent."""
 
-    @pytest.mark.asyncio
-    async def test_exec_simple_code(self):
+    @pytest.fixture
+    def run(self, monkeypatch):
+        run = MagicMock(
+            return_value=subprocess.CompletedProcess(
+                args=[], returncode=0, stdout=b"hello\n", stderr=b""
+            )
+        )
+        monkeypatch.setattr(local_module.subprocess, "run", run)
+        return run
+
+    async def test_exec_simple_code(self, python_component, run):
         """Test executing simple Python code."""
-        python = LocalPythonComponent()
-        result = await python.exec("print('hello')")
+        result = await python_component.exec("print('hello')")
         assert result["data"]["output"]["text"] == "hello\n"
+        assert run.call_args.args[0][1:] == ["-c", "print('hello')"]
 
-    @pytest.mark.asyncio
-    async def test_exec_with_error(self):
+    async def test_exec_with_error(self, python_component, run):
         """Test executing Python code with error."""
-        python = LocalPythonComponent()
-        result = await python.exec("raise ValueError('test error')")
-        assert "test error" in result["data"]["error"]
+        run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=1, stdout=b"", stderr=b"ValueError: test error\n"
+        )
+        result = await python_component.exec("raise ValueError('test error')")
+        assert result["data"]["error"] == "ValueError: test error\n"
 
-    @pytest.mark.asyncio
-    async def test_exec_with_timeout(self):
+    async def test_exec_with_timeout(self, python_component, run):
         """Test Python execution with timeout."""
-        python = LocalPythonComponent()
-        # This should timeout
-        result = await python.exec("import time; time.sleep(10)", timeout=1)
-        assert "timed out" in result["data"]["error"].lower()
+        run.side_effect = subprocess.TimeoutExpired(cmd="python", timeout=1)
+        result = await python_component.exec("import time; time.sleep(10)", timeout=1)
+        assert result["data"]["error"] == "Execution timed out."
+        assert run.call_args.kwargs["timeout"] == 1
 
-    @pytest.mark.asyncio
-    async def test_exec_silent_mode(self):
+    async def test_exec_silent_mode(self, python_component, run):
         """Test Python execution in silent mode."""
-        python = LocalPythonComponent()
-        result = await python.exec("print('hello')", silent=True)
+        result = await python_component.exec("print('hello')", silent=True)
         assert result["data"]["output"]["text"] == ""
 
-    @pytest.mark.asyncio
-    async def test_exec_return_value(self):
+    async def test_exec_return_value(self, python_component, run):
         """Test Python execution returns value correctly."""
-        python = LocalPythonComponent()
-        result = await python.exec("result = 1 + 1\nprint(result)")
-        assert "2" in result["data"]["output"]["text"]
+        run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=b"2\n", stderr=b""
+        )
+        result = await python_component.exec("result = 1 + 1\nprint(result)")
+        assert result["data"]["output"]["text"] == "2\n"
 
 
 class TestLocalFileSystemComponent:
     """Tests for LocalFileSystemComponent."""
 
-    @pytest.mark.asyncio
-    async def test_create_file(self, tmp_path):
+    @pytest.fixture
+    def root(self, tmp_path, monkeypatch):
+        _patch_roots(monkeypatch, tmp_path)
+        return tmp_path
+
+    async def test_create_file(self, fs_component, root):
         """Test creating a file."""
-        fs = LocalFileSystemComponent()
-        test_path = tmp_path / "test.txt"
+        test_path = root / "test.txt"
 
-        with (
-            patch(
-                "astrbot.core.computer.booters.local.get_astrbot_root",
-                return_value=str(tmp_path),
-            ),
-        ):
-            result = await fs.create_file(str(test_path), "test content")
-            assert result["success"] is True
-            assert test_path.exists()
-            assert test_path.read_text() == "test content"
+        result = await fs_component.create_file(str(test_path), "test content")
+        assert result["success"] is True
+        assert test_path.exists()
+        assert test_path.read_text() == "test content"
 
-    @pytest.mark.asyncio
-    async def test_read_file(self, tmp_path):
+    async def test_read_file(self, fs_component, root):
         """Test reading a file."""
-        fs = LocalFileSystemComponent()
-        test_path = tmp_path / "test.txt"
+        test_path = root / "test.txt"
         test_path.write_text("test content")
 
-        with (
-            patch(
-                "astrbot.core.computer.booters.local.get_astrbot_root",
-                return_value=str(tmp_path),
-            ),
-        ):
-            result = await fs.read_file(str(test_path))
-            assert result["success"] is True
-            assert result["content"] == "test content"
+        result = await fs_component.read_file(str(test_path))
+        assert result["success"] is True
+        assert result["content"] == "test content"
 
-    @pytest.mark.asyncio
-    async def test_write_file(self, tmp_path):
+    async def test_write_file(self, fs_component, root):
         """Test writing to a file."""
-        fs = LocalFileSystemComponent()
-        test_path = tmp_path / "test.txt"
+        test_path = root / "test.txt"
 
-        with (
-            patch(
-                "astrbot.core.computer.booters.local.get_astrbot_root",
-                return_value=str(tmp_path),
-            ),
-        ):
-            result = await fs.write_file(str(test_path), "new content")
-            assert result["success"] is True
-            assert test_path.read_text() == "new content"
+        result = await fs_component.write_file(str(test_path), "new content")
+        assert result["success"] is True
+        assert test_path.read_text() == "new content"
 
-    @pytest.mark.asyncio
-    async def test_delete_file(self, tmp_path):
+    async def test_delete_file(self, fs_component, root):
         """Test deleting a file."""
-        fs = LocalFileSystemComponent()
-        test_path = tmp_path / "test.txt"
+        test_path = root / "test.txt"
         test_path.write_text("test")
 
-        with (
-            patch(
-                "astrbot.core.computer.booters.local.get_astrbot_root",
-                return_value=str(tmp_path),
-            ),
-        ):
-            result = await fs.delete_file(str(test_path))
-            assert result["success"] is True
-            assert not test_path.exists()
+        result = await fs_component.delete_file(str(test_path))
+        assert result["success"] is True
+        assert not test_path.exists()
 
-    @pytest.mark.asyncio
-    async def test_delete_directory(self, tmp_path):
+    async def test_delete_directory(self, fs_component, root):
         """Test deleting a directory."""
-        fs = LocalFileSystemComponent()
-        test_dir = tmp_path / "testdir"
+        test_dir = root / "testdir"
         test_dir.mkdir()
         (test_dir / "file.txt").write_text("test")
 
-        with (
-            patch(
-                "astrbot.core.computer.booters.local.get_astrbot_root",
-                return_value=str(tmp_path),
-            ),
-        ):
-            result = await fs.delete_file(str(test_dir))
-            assert result["success"] is True
-            assert not test_dir.exists()
+        result = await fs_component.delete_file(str(test_dir))
+        assert result["success"] is True
+        assert not test_dir.exists()
 
-    @pytest.mark.asyncio
-    async def test_list_dir(self, tmp_path):
+    async def test_list_dir(self, fs_component, root):
         """Test listing directory contents."""
-        fs = LocalFileSystemComponent()
         # Create test files
-        (tmp_path / "file1.txt").write_text("content1")
-        (tmp_path / "file2.txt").write_text("content2")
-        (tmp_path / ".hidden").write_text("hidden")
-
-        with (
-            patch(
-                "astrbot.core.computer.booters.local.get_astrbot_root",
-                return_value=str(tmp_path),
-            ),
-        ):
-            # Without hidden files
-            result = await fs.list_dir(str(tmp_path), show_hidden=False)
-            assert result["success"] is True
-            assert "file1.txt" in result["entries"]
-            assert "file2.txt" in result["entries"]
-            assert ".hidden" not in result["entries"]
-
-            # With hidden files
-            result = await fs.list_dir(str(tmp_path), show_hidden=True)
-            assert ".hidden" in result["entries"]
-
-    @pytest.mark.asyncio
-    async def test_read_nonexistent_file(self, tmp_path):
+        (root / "file1.txt").write_text("content1")
+        (root / "file2.txt").write_text("content2")
+        (root / ".hidden").write_text("hidden")
+
+        # Without hidden files
+        result = await fs_component.list_dir(str(root), show_hidden=False)
+        assert result["success"] is True
+        assert "file1.txt" in result["entries"]
+        assert "file2.txt" in result["entries"]
+        assert ".hidden" not in result["entries"]
+
+        # With hidden files
+        result = await fs_component.list_dir(str(root), show_hidden=True)
+        assert ".hidden" in result["entries"]
+
+    async def test_read_nonexistent_file(self, fs_component, root):
         """Test reading a non-existent file raises error."""
-        fs = LocalFileSystemComponent()
-
-        with (
-            patch(
-                "astrbot.core.computer.booters.local.get_astrbot_root",
-                return_value=str(tmp_path),
-            ),
-        ):
-            # Should raise FileNotFoundError
-            with pytest.raises(FileNotFoundError):
-                await fs.read_file(str(tmp_path / "nonexistent.txt"))
+        # Should raise FileNotFoundError
+        with pytest.raises(FileNotFoundError):
+            await fs_component.read_file(str(root / "nonexistent.txt"))
 
 
 class TestComputerBooterBase:
     """Tests for ComputerBooter base class interface."""
 
-    def test_base_class_is_protocol(self):
+    def test_base_class_is_protocol(self, local_booter):
         """Test ComputerBooter has expected interface."""
-        booter = LocalBooter()
-        assert hasattr(booter, "fs")
-        assert hasattr(booter, "python")
-        assert hasattr(booter, "shell")
-        assert hasattr(booter, "boot")
-        assert hasattr(booter, "shutdown")
-        assert hasattr(booter, "upload_file")
-        assert hasattr(booter, "download_file")
-        assert hasattr(booter, "available")
+        assert hasattr(local_booter, "fs")
+        assert hasattr(local_booter, "python")
+        assert hasattr(local_booter, "shell")
+        assert hasattr(local_booter, "boot")
+        assert hasattr(local_booter, "shutdown")
+        assert hasattr(local_booter, "upload_file")
+        assert hasattr(local_booter, "download_file")
+        assert hasattr(local_booter, "available")
 
 
 class TestShipyardBooter:
     """Tests for ShipyardBooter."""
 
-    @pytest.mark.asyncio
+    @pytest.fixture(autouse=True)
+    def shipyard_client(self):
+        with patch(
+            "astrbot.core.computer.booters.shipyard.ShipyardClient"
+        ) as client_cls:
+            yield client_cls
+
     async def test_shipyard_booter_init(self):
         """Test ShipyardBooter initialization."""
-        with patch("astrbot.core.computer.booters.shipyard.ShipyardClient"):
-            from astrbot.core.computer.booters.shipyard import ShipyardBooter
-
-            booter = ShipyardBooter(
-                endpoint_url="http://localhost:8080",
-                access_token="test_token",
-                ttl=3600,
-                session_num=10,
-            )
-            assert booter._ttl == 3600
-            assert booter._session_num == 10
+        booter = ShipyardBooter(
+            endpoint_url="http://localhost:8080",
+            access_token="test_token",
+            ttl=3600,
+            session_num=10,
+        )
+        assert booter._ttl == 3600
+        assert booter._session_num == 10
 
-    @pytest.mark.asyncio
-    async def test_shipyard_booter_boot(self):
+    async def test_shipyard_booter_boot(self, shipyard_client):
         """Test ShipyardBooter boot method."""
         mock_ship = MagicMock()
         mock_ship.id = "test-ship-id"
@@ -402,132 +381,115 @@ class TestShipyardBooter:
 
         mock_client = MagicMock()
         mock_client.create_ship = AsyncMock(return_value=mock_ship)
+        shipyard_client.return_value = mock_client
 
-        with patch(
-            "astrbot.core.computer.booters.shipyard.ShipyardClient",
-            return_value=mock_client,
-        ):
-            from astrbot.core.computer.booters.shipyard import ShipyardBooter
-
-            booter = ShipyardBooter(
-                endpoint_url="http://localhost:8080",
-                access_token="test_token",
-            )
-            await booter.boot("test-session")
-            assert booter._ship == mock_ship
+        booter = ShipyardBooter(
+            endpoint_url="http://localhost:8080",
+            access_token="test_token",
+        )
+        await booter.boot("test-session")
+        assert booter._ship == mock_ship
 
-    @pytest.mark.asyncio
-    async def test_shipyard_available_healthy(self):
+    async def test_shipyard_available_healthy(self, shipyard_client):
         """Test ShipyardBooter available when healthy."""
         mock_ship = MagicMock()
         mock_ship.id = "test-ship-id"
 
         mock_client = MagicMock()
         mock_client.get_ship = AsyncMock(return_value={"status": 1})
+        shipyard_client.return_value = mock_client
 
-        with patch(
-            "astrbot.core.computer.booters.shipyard.ShipyardClient",
-            return_value=mock_client,
-        ):
-            from astrbot.core.computer.booters.shipyard import ShipyardBooter
-
-            booter = ShipyardBooter(
-                endpoint_url="http://localhost:8080",
-                access_token="test_token",
-            )
-            booter._ship = mock_ship
-            booter._sandbox_client = mock_client
+        booter = ShipyardBooter(
+            endpoint_url="http://localhost:8080",
+            access_token="test_token",
+        )
+        booter._ship = mock_ship
+        booter._sandbox_client = mock_client
 
-            result = await booter.available()
-            assert result is True
+        result = await booter.available()
+        assert result is True
 
-    @pytest.mark.asyncio
-    async def test_shipyard_available_unhealthy(self):
+    async def test_shipyard_available_unhealthy(self, shipyard_client):
         """Test ShipyardBooter available when unhealthy."""
         mock_ship = MagicMock()
         mock_ship.id = "test-ship-id"
 
         mock_client = MagicMock()
         mock_client.get_ship = AsyncMock(return_value={"status": 0})
+        shipyard_client.return_value = mock_client
 
-        with patch(
-            "astrbot.core.computer.booters.shipyard.ShipyardClient",
-            return_value=mock_client,
-        ):
-            from astrbot.core.computer.booters.shipyard import ShipyardBooter
-
-            booter = ShipyardBooter(
-                endpoint_url="http://localhost:8080",
-                access_token="test_token",
-            )
-            booter._ship = mock_ship
-            booter._sandbox_client = mock_client
+        booter = ShipyardBooter(
+            endpoint_url="http://localhost:8080",
+            access_token="test_token",
+        )
+        booter._ship = mock_ship
+        booter._sandbox_client = mock_client
 
-            result = await booter.available()
-            assert result is False
+        result = await booter.available()
+        assert result is False
 
 
+@pytest.mark.skipif(
+    importlib.util.find_spec("boxlite") is None, reason="boxlite is not installed"
+)
 class TestBoxliteBooter:
     """Tests for BoxliteBooter."""
 
-    @pytest.mark.asyncio
     async def test_boxlite_booter_init(self):
         """Test BoxliteBooter can be instantiated via __new__."""
-        # Need to mock boxlite module before importing
-        mock_boxlite = MagicMock()
-        mock_boxlite.SimpleBox = MagicMock()
+        from astrbot.core.computer.booters.boxlite import BoxliteBooter
 
-        with patch.dict(sys.modules, {"boxlite": mock_boxlite}):
-            from astrbot.core.computer.booters.boxlite import BoxliteBooter
-
-            # Just verify class exists and can be instantiated (boot is async)
-            booter = BoxliteBooter.__new__(BoxliteBooter)
-            assert booter is not None
+        # Just verify class exists and can be instantiated (boot is async)
+        booter = BoxliteBooter.__new__(BoxliteBooter)
+        assert booter is not None
 
 
 class TestComputerClient:
     """Tests for computer_client module functions."""
 
-    def test_get_local_booter(self):
-        """Test get_local_booter returns singleton LocalBooter."""
-        from astrbot.core.computer import computer_client
-
-        # Clear the global booter to test singleton
+    @pytest.fixture(autouse=True)
+    def _reset_session_booter(self):
+        computer_client.session_booter.clear()
+        computer_client.local_booter = None
+        yield
+        computer_client.session_booter.clear()
         computer_client.local_booter = None
 
+    @pytest.fixture
+    def make_context(self):
+        def _make(sandbox_cfg):
+            config = MagicMock()
+            config.get = lambda key, default=None: {
+                "provider_settings": {
+                    "computer_use_runtime": "sandbox",
+                    "sandbox": sandbox_cfg,
+                }
+            }.get(key, default)
+            context = MagicMock()
+            context.get_config = MagicMock(return_value=config)
+            return context
+
+        return _make
+
+    def test_get_local_booter(self):
+        """Test get_local_booter returns singleton LocalBooter."""
         booter1 = computer_client.get_local_booter()
         booter2 = computer_client.get_local_booter()
 
         assert isinstance(booter1, LocalBooter)
         assert booter1 is booter2  # Same instance (singleton)
 
-        # Reset for other tests
-        computer_client.local_booter = None
-
-    @pytest.mark.asyncio
-    async def test_get_booter_shipyard(self):
+    async def test_get_booter_shipyard(self, make_context):
         """Test get_booter with shipyard type."""
-        from astrbot.core.computer import computer_client
-        from astrbot.core.computer.booters.shipyard import ShipyardBooter
-
-        # Clear session booter
-        computer_client.session_booter.clear()
-
-        mock_context = MagicMock()
-        mock_config = MagicMock()
-        mock_config.get = lambda key, default=None: {
-            "provider_settings": {
-                "computer_use_runtime": "sandbox",
-                "sandbox": {
-                    "booter": "shipyard",
-                    "shipyard_endpoint": "http://localhost:8080",
-                    "shipyard_access_token": "test_token",
-                    "shipyard_ttl": 3600,
-                    "shipyard_max_sessions": 10,
-                },
+        mock_context = make_context(
+            {
+                "booter": "shipyard",
+                "shipyard_endpoint": "http://localhost:8080",
+                "shipyard_access_token": "test_token",
+                "shipyard_ttl": 3600,
+                "shipyard_max_sessions": 10,
             }
-        }.get(key, default)
-        mock_context.get_config = MagicMock(return_value=mock_config)
+        )
 
         # Mock the ShipyardBooter
         mock_ship = MagicMock()
@@ -555,53 +517,23 @@ class TestComputerClient:
             booter = await computer_client.get_booter(mock_context, "test-session-id")
             assert booter is mock_booter
 
-        # Cleanup
-        computer_client.session_booter.clear()
-
-    @pytest.mark.asyncio
-    async def test_get_booter_unknown_type(self):
+    async def test_get_booter_unknown_type(self, make_context):
         """Test get_booter with unknown booter type raises ValueError."""
-        from astrbot.core.computer import computer_client
-
-        computer_client.session_booter.clear()
-
-        mock_context = MagicMock()
-        mock_config = MagicMock()
-        mock_config.get = lambda key, default=None: {
-            "provider_settings": {
-                "computer_use_runtime": "sandbox",
-                "sandbox": {
-                    "booter": "unknown_type",
-                },
-            }
-        }.get(key, default)
-        mock_context.get_config = MagicMock(return_value=mock_config)
+        mock_context = make_context({"booter": "unknown_type"})
 
         with pytest.raises(ValueError) as exc_info:
             await computer_client.get_booter(mock_context, "test-session-id")
         assert "Unknown booter type" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_get_booter_reuses_existing(self):
+    async def test_get_booter_reuses_existing(self, make_context):
         """Test get_booter reuses existing booter for same session."""
-        from astrbot.core.computer import computer_client
-        from astrbot.core.computer.booters.shipyard import ShipyardBooter
-
-        computer_client.session_booter.clear()
-
-        mock_context = MagicMock()
-        mock_config = MagicMock()
-        mock_config.get = lambda key, default=None: {
-            "provider_settings": {
-                "computer_use_runtime": "sandbox",
-                "sandbox": {
-                    "booter": "shipyard",
-                    "shipyard_endpoint": "http://localhost:8080",
-                    "shipyard_access_token": "test_token",
-                },
+        mock_context = make_context(
+            {
+                "booter": "shipyard",
+                "shipyard_endpoint": "http://localhost:8080",
+                "shipyard_access_token": "test_token",
             }
-        }.get(key, default)
-        mock_context.get_config = MagicMock(return_value=mock_config)
+        )
 
         mock_booter = MagicMock()
         mock_booter.boot = AsyncMock()
@@ -623,36 +555,20 @@ class TestComputerClient:
             booter2 = await computer_client.get_booter(mock_context, "test-session")
             assert booter1 is booter2
 
-        # Cleanup
-        computer_client.session_booter.clear()
-
-    @pytest.mark.asyncio
-    async def test_get_booter_rebuild_unavailable(self):
+    async def test_get_booter_rebuild_unavailable(self, make_context):
         """Test get_booter rebuilds when existing booter is unavailable."""
-        from astrbot.core.computer import computer_client
-        from astrbot.core.computer.booters.shipyard import ShipyardBooter
-
-        computer_client.session_booter.clear()
-
-        mock_context = MagicMock()
-        mock_config = MagicMock()
-        mock_config.get = lambda key, default=None: {
-            "provider_settings": {
-                "computer_use_runtime": "sandbox",
-                "sandbox": {
-                    "booter": "shipyard",
-                    "shipyard_endpoint": "http://localhost:8080",
-                    "shipyard_access_token": "test_token",
-                },
+        mock_context = make_context(
+            {
+                "booter": "shipyard",
+                "shipyard_endpoint": "http://localhost:8080",
+                "shipyard_access_token": "test_token",
             }
-        }.get(key, default)
-        mock_context.get_config = MagicMock(return_value=mock_config)
-
-        mock_unavailable_booter = MagicMock(spec=ShipyardBooter)
-        mock_unavailable_booter.available = AsyncMock(return_value=False)
+        )
 
-        mock_new_booter = MagicMock(spec=ShipyardBooter)
-        mock_new_booter.boot = AsyncMock()
+        mock_unavailable_booter = SimpleNamespace(
+            available=AsyncMock(return_value=False), shutdown=AsyncMock()
+        )
+        mock_new_booter = SimpleNamespace(boot=AsyncMock())
 
         with (
             patch(
@@ -674,23 +590,18 @@ class TestComputerClient:
             )
 
             # Assert that a new booter was created and is now in the session
+            mock_unavailable_booter.shutdown.assert_awaited_once()
             mock_booter_cls.assert_called_once()
             mock_new_booter.boot.assert_awaited_once()
             assert new_booter_instance is mock_new_booter
             assert computer_client.session_booter[session_id] is mock_new_booter
 
-        # Cleanup
-        computer_client.session_booter.clear()
-
 
 class TestSyncSkillsToSandbox:
     """Tests for _sync_skills_to_sandbox function."""
 
-    @pytest.mark.asyncio
     async def test_sync_skills_no_skills_dir(self):
         """Test sync does nothing when skills directory doesn't exist."""
-        from astrbot.core.computer import computer_client
-
         mock_booter = MagicMock()
         mock_booter.shell.exec = AsyncMock()
         mock_booter.upload_file = AsyncMock(return_value={"success": True})
@@ -708,11 +619,8 @@ class TestSyncSkillsToSandbox:
             await computer_client._sync_skills_to_sandbox(mock_booter)
             mock_booter.upload_file.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_sync_skills_empty_dir(self):
         """Test sync does nothing when skills directory is empty."""
-        from astrbot.core.computer import computer_client
-
         mock_booter = MagicMock()
         mock_booter.shell.exec = AsyncMock()
         mock_booter.upload_file = AsyncMock(return_value={"success": True})
@@ -734,11 +642,8 @@ class TestSyncSkillsToSandbox:
             await computer_client._sync_skills_to_sandbox(mock_booter)
             mock_booter.upload_file.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_sync_skills_success(self):
         """Test successful skills sync."""
-        from astrbot.core.computer import computer_client
-
         mock_booter = MagicMock()
         mock_booter.shell.exec = AsyncMock(return_value={"exit_code": 0})
         mock_booter.upload_file = AsyncMock(return_value={"success": True})
@@ -4,9 +4,11 @@ import asyncio
 import json
 import os
 import threading
+from collections import OrderedDict
 
 import pytest
 
+from astrbot.core.config import astrbot_config
 from astrbot.core.config.astrbot_config import AstrBotConfig, RateLimitStrategy
 from astrbot.core.config.default import DEFAULT_VALUE_MAP
 from astrbot.core.config.i18n_utils import ConfigMetadataI18n
@@ -91,6 +93,97 @@ class TestAstrBotConfigLoad:
         assert config.platform_settings["unique_session"] is True
         assert config.provider_settings["enable"] is False
 
+    def test_reload_skips_reading_unchanged_file(
+        self, temp_config_path, minimal_default_config, monkeypatch
+    ):
+        """Test that reloading an unchanged config file does not re-open it."""
+        AstrBotConfig(
+            config_path=temp_config_path, default_config=minimal_default_config
+        )
+        opened = []
+
+        def tracking_open(*args, **kwargs):
+            opened.append(args[0])
+            return open(*args, **kwargs)
+
+        monkeypatch.setattr(
+            "astrbot.core.config.astrbot_config.open", tracking_open, raising=False
+        )
+        config = AstrBotConfig(
+            config_path=temp_config_path, default_config=minimal_default_config
+        )
+
+        assert opened == []
+        assert config.platform_settings["unique_session"] is False
+
+    def test_reload_picks_up_external_changes(
+        self, temp_config_path, minimal_default_config
+    ):
+        """Test that a config file changed on disk is re-read on reload."""
+        AstrBotConfig(
+            config_path=temp_config_path, default_config=minimal_default_config
+        )
+        with open(temp_config_path, encoding="utf-8-sig") as f:
+            on_disk = json.load(f)
+        on_disk["platform_settings"]["unique_session"] = True
+        with open(temp_config_path, "w", encoding="utf-8-sig") as f:
+            json.dump(on_disk, f)
+
+        config = AstrBotConfig(
+            config_path=temp_config_path, default_config=minimal_default_config
+        )
+
+        assert config.platform_settings["unique_session"] is True
+
+    @pytest.mark.parametrize("atomic", [False, True], ids=["in_place", "replace"])
+    def test_reload_detects_same_size_rewrite_with_pinned_mtime(
+        self, temp_config_path, minimal_default_config, atomic
+    ):
+        """Test that a same-size rewrite is re-read even if mtime is unchanged."""
+        AstrBotConfig(
+            config_path=temp_config_path, default_config=minimal_default_config
+        )
+        before = os.stat(temp_config_path)
+        with open(temp_config_path, "rb") as f:
+            raw = f.read()
+        rewritten = raw.replace(b'"count": 30', b'"count": 31')
+        assert rewritten != raw and len(rewritten) == len(raw)
+
+        target = temp_config_path + ".tmp" if atomic else temp_config_path
+        with open(target, "wb") as f:
+            f.write(rewritten)
+        os.utime(target, ns=(before.st_atime_ns, before.st_mtime_ns))
+        if atomic:
+            os.replace(target, temp_config_path)
+        after = os.stat(temp_config_path)
+        assert (after.st_mtime_ns, after.st_size) == (
+            before.st_mtime_ns,
+            before.st_size,
+        )
+
+        config = AstrBotConfig(
+            config_path=temp_config_path, default_config=minimal_default_config
+        )
+
+        assert config.platform_settings["rate_limit"]["count"] == 31
+
+    def test_load_cache_is_bounded(self, tmp_path, monkeypatch):
+        """Test that the raw-load cache evicts the least recently used path."""
+        monkeypatch.setattr(astrbot_config, "_LOADED_CACHE", OrderedDict())
+        monkeypatch.setattr(astrbot_config, "_LOADED_CACHE_MAX_ENTRIES", 2)
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.json"
+            path.write_text(json.dumps({"name": name}), encoding="utf-8")
+            paths.append(os.path.abspath(path))
+
+        astrbot_config._load_raw(paths[0])
+        astrbot_config._load_raw(paths[1])
+        astrbot_config._load_raw(paths[0])
+        astrbot_config._load_raw(paths[2])
+
+        assert list(astrbot_config._LOADED_CACHE) == [paths[0], paths[2]]
+
     def test_first_deploy_flag(self, temp_config_path, minimal_default_config):
         """Test first_deploy flag is set for new config."""
         config = AstrBotConfig(
@@ -174,7 +267,8 @@ class TestAstrBotConfigLoad:
             config_path=temp_config_path, default_config=minimal_default_config
         )
 
-        assert config.check_exist() is True
+        with pytest.deprecated_call():
+            assert config.check_exist() is True
 
         # Create a path that definitely doesn't exist
         import pathlib
@@ -191,9 +285,34 @@ class TestAstrBotConfigLoad:
         )
 
         # Now it exists
-        assert config2.check_exist() is True
+        with pytest.deprecated_call():
+            assert config2.check_exist() is True
         assert os.path.exists(non_existent_path)
 
+    def test_exists_does_not_create_file(self, temp_config_path):
+        """Test exists only probes the path."""
+        assert AstrBotConfig.exists(temp_config_path) is False
+        assert AstrBotConfig.exists("") is False
+        assert not os.path.exists(temp_config_path)
+
+        with open(temp_config_path, "w", encoding="utf-8") as f:
+            json.dump({}, f)
+
+        assert AstrBotConfig.exists(temp_config_path) is True
+
+    def test_init_without_auto_create_raises(
+        self, temp_config_path, minimal_default_config
+    ):
+        """Test auto_create=False refuses to write a missing config file."""
+        with pytest.raises(FileNotFoundError):
+            AstrBotConfig(
+                config_path=temp_config_path,
+                default_config=minimal_default_config,
+                auto_create=False,
+            )
+
+        assert not os.path.exists(temp_config_path)
+
     def test_empty_dashboard_password_generates_random_password(self, temp_config_path):
         """Test that an empty dashboard password is replaced with a random password."""
         default_config = {
@@ -559,7 +678,127 @@ class TestConfigHotReload:
 
         assert loaded_config["new_field"] == "new_value"
 
-    @pytest.mark.asyncio
+    def test_batched_update_writes_once_on_exit(
+        self, temp_config_path, minimal_default_config, monkeypatch
+    ):
+        """Test that saves inside batched_update are flushed as a single write."""
+        config = AstrBotConfig(
+            config_path=temp_config_path, default_config=minimal_default_config
+        )
+        config.temp_a = "a"
+        config.temp_b = "b"
+        replaced = []
+        original_replace = os.replace
+
+        def counting_replace(source, destination):
+            replaced.append(destination)
+            original_replace(source, destination)
+
+        monkeypatch.setattr(os, "replace", counting_replace)
+
+        with config.batched_update():
+            del config.temp_a
+            config.save_config(replace_config={"batched": True})
+            with config.batched_update():
+                del config.temp_b
+            assert replaced == []
+
+        assert replaced == [temp_config_path]
+        with open(temp_config_path, encoding="utf-8-sig") as f:
+            loaded_config = json.load(f)
+        assert loaded_config["batched"] is True
+        assert "temp_a" not in loaded_config
+        assert "temp_b" not in loaded_config
+
+    def test_batched_update_discards_saves_when_block_raises(
+        self, temp_config_path, minimal_default_config, monkeypatch
+    ):
+        """Test that a batched_update block that raises writes nothing."""
+        config = AstrBotConfig(
+            config_path=temp_config_path, default_config=minimal_default_config
+        )
+        replaced = []
+        monkeypatch.setattr(os, "replace", lambda *args: replaced.append(args))
+
+        with pytest.raises(RuntimeError):
+            with config.batched_update():
+                config.save_config(replace_config={"partial": True})
+                raise RuntimeError("boom")
+
+        assert replaced == []
+        assert config._batch_depth == 0
+        assert config._batch_dirty_indent is None
+
+    def test_batched_update_without_saves_does_not_write(
+        self, temp_config_path, minimal_default_config, monkeypatch
+    ):
+        """Test that an untouched batched_update block leaves the file alone."""
+        config = AstrBotConfig(
+            config_path=temp_config_path, default_config=minimal_default_config
+        )
+        replaced = []
+        monkeypatch.setattr(os, "replace", lambda *args: replaced.append(args))
+
+        with config.batched_update():
+            config["unsaved"] = True
+
+        assert replaced == []
+
+    def test_identical_save_skips_write(
+        self, temp_config_path, minimal_default_config, monkeypatch
+    ):
+        """Test that re-saving unchanged content does not rewrite the file."""
+        config = AstrBotConfig(
+            config_path=temp_config_path, default_config=minimal_default_config
+        )
+        config.save_config(replace_config={"field": "value"})
+        replaced = []
+        monkeypatch.setattr(os, "replace", lambda *args: replaced.append(args))
+
+        config.save_config(replace_config={"field": "value"})
+
+        assert replaced == []
+
+    def test_identical_save_rewrites_externally_modified_file(
+        self, temp_config_path, minimal_default_config
+    ):
+        """Test that an external edit is overwritten even if memory is unchanged."""
+        config = AstrBotConfig(
+            config_path=temp_config_path, default_config=minimal_default_config
+        )
+        config.save_config(replace_config={"field": "value"})
+        with open(temp_config_path, "w", encoding="utf-8-sig") as f:
+            json.dump({"field": "external"}, f)
+
+        config.save_config()
+
+        with open(temp_config_path, encoding="utf-8-sig") as f:
+            loaded_config = json.load(f)
+        assert loaded_config["field"] == "value"
+
+    def test_identical_save_rewrites_same_size_edit_with_pinned_mtime(
+        self, temp_config_path, minimal_default_config
+    ):
+        """Test that a same-size external edit with a restored mtime is rewritten."""
+        config = AstrBotConfig(
+            config_path=temp_config_path, default_config=minimal_default_config
+        )
+        config.save_config(replace_config={"count": 30})
+        before = os.stat(temp_config_path)
+        with open(temp_config_path, "rb") as f:
+            raw = f.read()
+        rewritten = raw.replace(b'"count": 30', b'"count": 31')
+        assert rewritten != raw and len(rewritten) == len(raw)
+        with open(temp_config_path, "wb") as f:
+            f.write(rewritten)
+        os.utime(temp_config_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+        config.save_config()
+
+        with open(temp_config_path, encoding="utf-8-sig") as f:
+            loaded_config = json.load(f)
+        assert loaded_config["count"] == 30
+
     async def test_save_config_async_keeps_event_loop_responsive(
         self, temp_config_path, minimal_default_config, monkeypatch
     ):
@@ -589,7 +828,6 @@ class TestConfigHotReload:
         with open(temp_config_path, encoding="utf-8-sig") as f:
             assert json.load(f)["async_field"] == "saved"
 
-    @pytest.mark.asyncio
     async def test_save_config_async_writes_stable_snapshot(
         self, temp_config_path, minimal_default_config, monkeypatch
     ):
@@ -598,14 +836,14 @@ class TestConfigHotReload:
         )
         dump_started = threading.Event()
         finish_dump = threading.Event()
-        original_dump = json.dump
+        original_dumps = json.dumps
 
-        def blocking_dump(snapshot, file_obj, **kwargs):
+        def blocking_dumps(snapshot, **kwargs):
             dump_started.set()
             assert finish_dump.wait(timeout=5)
-            original_dump(snapshot, file_obj, **kwargs)
+            return original_dumps(snapshot, **kwargs)
 
-        monkeypatch.setattr(json, "dump", blocking_dump)
+        monkeypatch.setattr(json, "dumps", blocking_dumps)
         config["snapshot_field"] = "captured"
 
         save_task = asyncio.create_task(config.save_config_async())
@@ -617,7 +855,6 @@ class TestConfigHotReload:
         with open(temp_config_path, encoding="utf-8-sig") as f:
             assert json.load(f)["snapshot_field"] == "captured"
 
-    @pytest.mark.asyncio
     async def test_save_config_async_does_not_block_next_snapshot_during_replace(
         self, temp_config_path, minimal_default_config, monkeypatch
     ):
@@ -655,7 +892,6 @@ class TestConfigHotReload:
         with open(temp_config_path, encoding="utf-8-sig") as f:
             assert json.load(f)["replace_order"] == "newer"
 
-    @pytest.mark.asyncio
     async def test_save_config_async_discards_older_late_write(
         self, temp_config_path, minimal_default_config, monkeypatch
     ):
@@ -693,7 +929,6 @@ class TestConfigHotReload:
         with open(temp_config_path, encoding="utf-8-sig") as f:
             assert json.load(f)["save_order"] == "newer"
 
-    @pytest.mark.asyncio
     async def test_save_config_commits_older_snapshot_when_newer_write_fails(
         self, temp_config_path, minimal_default_config, monkeypatch
     ):
@@ -764,15 +999,14 @@ class TestConfigHotReload:
         with open(temp_config_path, encoding="utf-8-sig") as f:
             original_content = f.read()
 
-        def failing_dump(*args, **kwargs):
-            file_obj = args[1]
-            file_obj.write("{")
+        def failing_write_all(fd, payload):
+            os.write(fd, payload[:1])
             raise RuntimeError("simulated interrupted write")
 
         config.new_field = "new_value"
         monkeypatch.setattr(
-            "astrbot.core.config.astrbot_config.json.dump",
-            failing_dump,
+            "astrbot.core.config.astrbot_config._write_all",
+            failing_write_all,
         )
 
         with pytest.raises(RuntimeError, match="simulated interrupted write"):
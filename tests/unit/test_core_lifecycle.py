@@ -1,47 +1,69 @@
 """Tests for AstrBotCoreLifecycle."""
 
 import asyncio
+import contextlib
+import logging
 import os
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from astrbot.core import core_lifecycle
 from astrbot.core.core_lifecycle import AstrBotCoreLifecycle
-from astrbot.core.log import LogBroker
 
 
 @pytest.fixture
-def mock_log_broker():
-    """Create a mock log broker."""
-    log_broker = MagicMock(spec=LogBroker)
-    return log_broker
+def lifecycle_logs(caplog: pytest.LogCaptureFixture):
+    """Capture records of the astrbot logger, which does not propagate to root."""
+    astrbot_logger = logging.getLogger("astrbot")
+    astrbot_logger.addHandler(caplog.handler)
+    try:
+        yield caplog
+    finally:
+        astrbot_logger.removeHandler(caplog.handler)
 
 
 @pytest.fixture
-def mock_db():
-    """Create a mock database."""
-    db = MagicMock()
-    db.initialize = AsyncMock()
-    return db
+def lifecycle(mock_log_broker, mock_db, monkeypatch: pytest.MonkeyPatch):
+    """Create a lifecycle whose proxy setup cannot leak out of the test."""
+    # __init__ rewrites the proxy variables, so let it work on a private copy.
+    monkeypatch.setattr(os, "environ", dict(os.environ))
+    return AstrBotCoreLifecycle(mock_log_broker, mock_db)
 
 
 @pytest.fixture
-def mock_astrbot_config():
-    """Create a mock AstrBot config."""
-    config = MagicMock()
-    config.get = MagicMock(return_value="")
-    config.__getitem__ = MagicMock(return_value={})
-    config.copy = MagicMock(return_value={})
-    return config
+def lifecycle_with_mocked_managers(lifecycle):
+    """Create a lifecycle with the minimal manager state start/stop rely on."""
+    lifecycle.temp_dir_cleaner = None
+    lifecycle.cron_manager = None
+    lifecycle.provider_manager = MagicMock(terminate=AsyncMock())
+    lifecycle.platform_manager = MagicMock(terminate=AsyncMock())
+    lifecycle.kb_manager = MagicMock(terminate=AsyncMock())
+    lifecycle.plugin_manager = MagicMock()
+    lifecycle.plugin_manager.context.get_all_stars = MagicMock(return_value=[])
+    lifecycle.dashboard_shutdown_event = asyncio.Event()
+    lifecycle.curr_tasks = []
+    return lifecycle
+
+
+async def _complete_normally():
+    pass
+
+
+async def _raise_value_error():
+    raise ValueError("Test error")
+
+
+async def _raise_cancelled_error():
+    raise asyncio.CancelledError()
 
 
 class TestAstrBotCoreLifecycleInit:
     """Tests for AstrBotCoreLifecycle initialization."""
 
-    def test_init(self, mock_log_broker, mock_db):
+    def test_init(self, mock_log_broker, mock_db, lifecycle):
         """Test AstrBotCoreLifecycle initialization."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
         assert lifecycle.log_broker == mock_log_broker
         assert lifecycle.db == mock_db
         assert lifecycle.subagent_orchestrator is None
@@ -62,11 +84,9 @@ class TestAstrBotCoreLifecycleInit:
                 "no_proxy": ["localhost", "127.0.0.1"],
             }.get(key, default)
         )
-        monkeypatch.delenv("http_proxy", raising=False)
-        monkeypatch.delenv("https_proxy", raising=False)
-        monkeypatch.delenv("no_proxy", raising=False)
+        monkeypatch.setattr(os, "environ", {})
 
-        with patch("astrbot.core.core_lifecycle.astrbot_config", mock_astrbot_config):
+        with patch.object(core_lifecycle, "astrbot_config", mock_astrbot_config):
             lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
 
             assert lifecycle.log_broker == mock_log_broker
@@ -87,10 +107,16 @@ class TestAstrBotCoreLifecycleInit:
         """Test initialization clears proxy settings when configured."""
         mock_astrbot_config.get = MagicMock(return_value="")
         # Set proxy in environment to test clearing
-        monkeypatch.setenv("http_proxy", "http://old-proxy:8080")
-        monkeypatch.setenv("https_proxy", "http://old-proxy:8080")
+        monkeypatch.setattr(
+            os,
+            "environ",
+            {
+                "http_proxy": "http://old-proxy:8080",
+                "https_proxy": "http://old-proxy:8080",
+            },
+        )
 
-        with patch("astrbot.core.core_lifecycle.astrbot_config", mock_astrbot_config):
+        with patch.object(core_lifecycle, "astrbot_config", mock_astrbot_config):
             lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
 
             assert lifecycle.log_broker == mock_log_broker
@@ -102,91 +128,98 @@ class TestAstrBotCoreLifecycleInit:
 class TestAstrBotCoreLifecycleStop:
     """Tests for AstrBotCoreLifecycle.stop method."""
 
-    @pytest.mark.asyncio
-    async def test_stop_without_initialize(self, mock_log_broker, mock_db):
-        """Test stop without initialize should not raise errors."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
-        # Set up minimal state to avoid None attribute errors
-        lifecycle.temp_dir_cleaner = None
-        lifecycle.cron_manager = None
-        lifecycle.provider_manager = MagicMock()
-        lifecycle.provider_manager.terminate = AsyncMock()
-        lifecycle.platform_manager = MagicMock()
-        lifecycle.platform_manager.terminate = AsyncMock()
-        lifecycle.kb_manager = MagicMock()
-        lifecycle.kb_manager.terminate = AsyncMock()
-        lifecycle.plugin_manager = MagicMock()
-        lifecycle.plugin_manager.context = MagicMock()
-        lifecycle.plugin_manager.context.get_all_stars = MagicMock(return_value=[])
-        lifecycle.curr_tasks = []
-        lifecycle.dashboard_shutdown_event = asyncio.Event()
+    @pytest.fixture
+    def stopping_lifecycle(self, request, lifecycle_with_mocked_managers):
+        """Prepare a lifecycle for one stop scenario.
+
+        ``empty`` stops a lifecycle that was never initialized, ``with_tasks``
+        has running tasks to cancel and ``plugin_raises`` has a plugin whose
+        termination fails.
+        """
+        lifecycle = lifecycle_with_mocked_managers
+        if request.param == "with_tasks":
+            lifecycle.curr_tasks = [
+                SimpleNamespace(cancel=MagicMock(), get_name=lambda: "task1"),
+                SimpleNamespace(cancel=MagicMock(), get_name=lambda: "task2"),
+            ]
+        elif request.param == "plugin_raises":
+            mock_plugin = MagicMock()
+            mock_plugin.name = "test_plugin"
+            lifecycle.plugin_manager.context.get_all_stars = MagicMock(
+                return_value=[mock_plugin]
+            )
+            lifecycle.plugin_manager._terminate_plugin = AsyncMock(
+                side_effect=Exception("Plugin termination failed")
+            )
+        return lifecycle
+
+    @pytest.mark.parametrize(
+        "stopping_lifecycle",
+        ["empty", "with_tasks", "plugin_raises"],
+        indirect=True,
+    )
+    async def test_stop(self, stopping_lifecycle, lifecycle_logs):
+        """Test that stop cancels tasks, terminates managers and survives plugins."""
+        lifecycle = stopping_lifecycle
+        tasks = list(lifecycle.curr_tasks)
+        plugins = lifecycle.plugin_manager.context.get_all_stars()
 
         # Should not raise
         await lifecycle.stop()
 
+        # Verify all managers were terminated
+        lifecycle.provider_manager.terminate.assert_awaited_once()
+        lifecycle.platform_manager.terminate.assert_awaited_once()
+        lifecycle.kb_manager.terminate.assert_awaited_once()
 
-class TestAstrBotCoreLifecycleTaskWrapper:
-    """Tests for AstrBotCoreLifecycle._task_wrapper method."""
+        # Verify tasks were cancelled
+        for task in tasks:
+            task.cancel.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_task_wrapper_normal_completion(self, mock_log_broker, mock_db):
-        """Test task wrapper with normal completion."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
+        # Verify warning was logged about plugin termination failure
+        warnings = [
+            record.getMessage()
+            for record in lifecycle_logs.records
+            if record.levelno == logging.WARNING
+        ]
+        for plugin in plugins:
+            assert any(plugin.name in message for message in warnings)
 
-        async def normal_task():
-            pass
 
-        task = asyncio.create_task(normal_task(), name="test_task")
+class TestAstrBotCoreLifecycleTaskWrapper:
+    """Tests for AstrBotCoreLifecycle._task_wrapper method."""
+
+    @pytest.mark.parametrize(
+        ("task_factory", "should_log"),
+        [
+            (_complete_normally, False),
+            (_raise_value_error, True),
+            (_raise_cancelled_error, False),
+        ],
+        ids=["normal", "exception", "cancelled"],
+    )
+    async def test_task_wrapper(
+        self, lifecycle, lifecycle_logs, task_factory, should_log
+    ):
+        """Test that only tasks failing with an exception are logged as errors."""
+        task = asyncio.create_task(task_factory(), name="test_task")
 
         # Should not raise
         await lifecycle._task_wrapper(task)
 
-    @pytest.mark.asyncio
-    async def test_task_wrapper_with_exception(self, mock_log_broker, mock_db):
-        """Test task wrapper with exception."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
-        async def failing_task():
-            raise ValueError("Test error")
-
-        task = asyncio.create_task(failing_task(), name="test_task")
-
-        with patch("astrbot.core.core_lifecycle.logger") as mock_logger:
-            await lifecycle._task_wrapper(task)
-
-            # Verify error was logged
-            mock_logger.error.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_task_wrapper_with_cancelled_error(self, mock_log_broker, mock_db):
-        """Test task wrapper with CancelledError."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
-        async def cancelled_task():
-            raise asyncio.CancelledError()
-
-        task = asyncio.create_task(cancelled_task(), name="test_task")
-
-        # Should not raise and should not log
-        with patch("astrbot.core.core_lifecycle.logger") as mock_logger:
-            await lifecycle._task_wrapper(task)
-
-            # CancelledError should be handled silently
-            assert not any(
-                "error" in str(call).lower()
-                for call in mock_logger.error.call_args_list
-            )
+        error_records = [
+            record
+            for record in lifecycle_logs.records
+            if record.levelno >= logging.ERROR
+        ]
+        assert bool(error_records) is should_log
 
 
 class TestAstrBotCoreLifecycleLoadPlatform:
     """Tests for AstrBotCoreLifecycle.load_platform method."""
 
-    @pytest.mark.asyncio
-    async def test_load_platform(self, mock_log_broker, mock_db):
+    async def test_load_platform(self, lifecycle):
         """Test load_platform method."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
         # Set up mock platform manager
         mock_platform_manager = MagicMock()
 
@@ -221,12 +254,10 @@ class TestAstrBotCoreLifecycleLoadPlatform:
 class TestAstrBotCoreLifecycleErrorHandling:
     """Tests for AstrBotCoreLifecycle error handling."""
 
-    @pytest.mark.asyncio
     async def test_subagent_orchestrator_error_is_logged(
-        self, mock_log_broker, mock_db, mock_astrbot_config
+        self, lifecycle, mock_astrbot_config, lifecycle_logs
     ):
         """Test that subagent orchestrator init errors are logged."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
         lifecycle.provider_manager = MagicMock()
         lifecycle.provider_manager.llm_tools = MagicMock()
         lifecycle.persona_mgr = MagicMock()
@@ -238,13 +269,11 @@ class TestAstrBotCoreLifecycleErrorHandling:
             side_effect=Exception("Orchestrator init failed")
         )
 
-        with (
-            patch(
-                "astrbot.core.core_lifecycle.SubAgentOrchestrator",
-                return_value=mock_subagent,
-            ) as mock_subagent_cls,
-            patch("astrbot.core.core_lifecycle.logger") as mock_logger,
-        ):
+        with patch.object(
+            core_lifecycle,
+            "SubAgentOrchestrator",
+            return_value=mock_subagent,
+        ) as mock_subagent_cls:
             await lifecycle._init_or_reload_subagent_orchestrator()
 
         mock_subagent_cls.assert_called_once_with(
@@ -252,10 +281,10 @@ class TestAstrBotCoreLifecycleErrorHandling:
             lifecycle.persona_mgr,
         )
         mock_subagent.reload_from_config.assert_awaited_once_with({})
-        assert mock_logger.error.called
         assert any(
-            "Subagent orchestrator init failed" in str(call)
-            for call in mock_logger.error.call_args_list
+            "Subagent orchestrator init failed" in record.getMessage()
+            for record in lifecycle_logs.records
+            if record.levelno == logging.ERROR
         )
 
 
@@ -268,10 +297,13 @@ class TestAstrBotCoreLifecycleDefaultChatProviderWarning:
         provider.provider_config = {"id": provider_id}
         return provider
 
+    @staticmethod
+    def _warnings(logs: pytest.LogCaptureFixture) -> list[logging.LogRecord]:
+        return [record for record in logs.records if record.levelno == logging.WARNING]
+
     def test_warns_for_multiple_enabled_chat_providers_without_default(
-        self, mock_log_broker, mock_db
+        self, lifecycle, lifecycle_logs
     ):
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
         provider_a = self._make_provider("openai_source/model-a")
         provider_b = self._make_provider("openai_source/model-b")
         lifecycle.provider_manager = MagicMock(
@@ -280,15 +312,13 @@ class TestAstrBotCoreLifecycleDefaultChatProviderWarning:
             curr_provider_inst=provider_b,
         )
 
-        with patch("astrbot.core.core_lifecycle.logger") as mock_logger:
-            lifecycle._warn_about_unset_default_chat_provider()
+        lifecycle._warn_about_unset_default_chat_provider()
 
-        mock_logger.warning.assert_called_once()
-        assert mock_logger.warning.call_args[0][1] == 2
-        assert mock_logger.warning.call_args[0][2] == "openai_source/model-b"
+        warnings = self._warnings(lifecycle_logs)
+        assert len(warnings) == 1
+        assert warnings[0].args == (2, "openai_source/model-b")
 
-    def test_warns_only_once_per_lifecycle(self, mock_log_broker, mock_db):
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
+    def test_warns_only_once_per_lifecycle(self, lifecycle, lifecycle_logs):
         lifecycle.provider_manager = MagicMock(
             provider_settings={"default_provider_id": ""},
             provider_insts=[
@@ -298,31 +328,27 @@ class TestAstrBotCoreLifecycleDefaultChatProviderWarning:
             curr_provider_inst=self._make_provider("openai_source/model-a"),
         )
 
-        with patch("astrbot.core.core_lifecycle.logger") as mock_logger:
-            lifecycle._warn_about_unset_default_chat_provider()
-            lifecycle._warn_about_unset_default_chat_provider()
+        lifecycle._warn_about_unset_default_chat_provider()
+        lifecycle._warn_about_unset_default_chat_provider()
 
-        mock_logger.warning.assert_called_once()
+        assert len(self._warnings(lifecycle_logs)) == 1
 
     def test_does_not_warn_with_single_enabled_chat_provider_without_default(
-        self, mock_log_broker, mock_db
+        self, lifecycle, lifecycle_logs
     ):
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
         lifecycle.provider_manager = MagicMock(
             provider_settings={"default_provider_id": ""},
             provider_insts=[self._make_provider("openai_source/model-a")],
             curr_provider_inst=self._make_provider("openai_source/model-a"),
         )
 
-        with patch("astrbot.core.core_lifecycle.logger") as mock_logger:
-            lifecycle._warn_about_unset_default_chat_provider()
+        lifecycle._warn_about_unset_default_chat_provider()
 
-        mock_logger.warning.assert_not_called()
+        assert self._warnings(lifecycle_logs) == []
 
     def test_does_not_warn_when_default_chat_provider_is_set(
-        self, mock_log_broker, mock_db
+        self, lifecycle, lifecycle_logs
     ):
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
         lifecycle.provider_manager = MagicMock(
             provider_settings={"default_provider_id": "openai_source/model-a"},
             provider_insts=[
@@ -332,15 +358,13 @@ class TestAstrBotCoreLifecycleDefaultChatProviderWarning:
             curr_provider_inst=self._make_provider("openai_source/model-a"),
         )
 
-        with patch("astrbot.core.core_lifecycle.logger") as mock_logger:
-            lifecycle._warn_about_unset_default_chat_provider()
+        lifecycle._warn_about_unset_default_chat_provider()
 
-        mock_logger.warning.assert_not_called()
+        assert self._warnings(lifecycle_logs) == []
 
     def test_warns_and_fallbacks_to_first_provider_when_curr_provider_inst_is_none(
-        self, mock_log_broker, mock_db
+        self, lifecycle, lifecycle_logs
     ):
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
         provider_a = self._make_provider("openai_source/model-a")
         provider_b = self._make_provider("openai_source/model-b")
         lifecycle.provider_manager = MagicMock(
@@ -349,17 +373,15 @@ class TestAstrBotCoreLifecycleDefaultChatProviderWarning:
             curr_provider_inst=None,
         )
 
-        with patch("astrbot.core.core_lifecycle.logger") as mock_logger:
-            lifecycle._warn_about_unset_default_chat_provider()
+        lifecycle._warn_about_unset_default_chat_provider()
 
-        mock_logger.warning.assert_called_once()
-        assert mock_logger.warning.call_args[0][1] == 2
-        assert mock_logger.warning.call_args[0][2] == "openai_source/model-a"
+        warnings = self._warnings(lifecycle_logs)
+        assert len(warnings) == 1
+        assert warnings[0].args == (2, "openai_source/model-a")
 
     def test_warns_when_default_provider_id_does_not_match_any_enabled_provider(
-        self, mock_log_broker, mock_db
+        self, lifecycle, lifecycle_logs
     ):
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
         lifecycle.provider_manager = MagicMock(
             provider_settings={"default_provider_id": "non-existent-id"},
             provider_insts=[
@@ -369,524 +391,196 @@ class TestAstrBotCoreLifecycleDefaultChatProviderWarning:
             curr_provider_inst=self._make_provider("openai_source/model-b"),
         )
 
-        with patch("astrbot.core.core_lifecycle.logger") as mock_logger:
-            lifecycle._warn_about_unset_default_chat_provider()
+        lifecycle._warn_about_unset_default_chat_provider()
 
-        mock_logger.warning.assert_called_once()
-        assert mock_logger.warning.call_args[0][1] == "non-existent-id"
-        assert mock_logger.warning.call_args[0][2] == "openai_source/model-b"
+        warnings = self._warnings(lifecycle_logs)
+        assert len(warnings) == 1
+        assert warnings[0].args == ("non-existent-id", "openai_source/model-b")
 
 
 class TestAstrBotCoreLifecycleInitialize:
     """Tests for AstrBotCoreLifecycle.initialize method."""
 
-    @pytest.mark.asyncio
+    @pytest.fixture
+    def init_deps(self, mock_astrbot_config, monkeypatch: pytest.MonkeyPatch):
+        """Replace every dependency created by initialize with a mock."""
+        deps = SimpleNamespace(
+            html_renderer=MagicMock(initialize=AsyncMock()),
+            umop_config_router=MagicMock(initialize=AsyncMock()),
+            astrbot_config_mgr=MagicMock(default_conf={}, confs={}),
+            persona_mgr=MagicMock(initialize=AsyncMock()),
+            provider_manager=MagicMock(initialize=AsyncMock()),
+            platform_manager=MagicMock(initialize=AsyncMock()),
+            conversation_manager=MagicMock(),
+            platform_message_history_manager=MagicMock(),
+            kb_manager=MagicMock(initialize=AsyncMock()),
+            cron_manager=MagicMock(),
+            star_context=MagicMock(_register_tasks=[]),
+            plugin_manager=MagicMock(reload=AsyncMock()),
+            pipeline_scheduler=MagicMock(initialize=AsyncMock()),
+            astrbot_updator=MagicMock(),
+            event_bus=MagicMock(),
+            migra=AsyncMock(),
+            update_llm_metadata=AsyncMock(),
+        )
+        monkeypatch.setattr(core_lifecycle, "astrbot_config", mock_astrbot_config)
+        monkeypatch.setattr(core_lifecycle, "html_renderer", deps.html_renderer)
+        monkeypatch.setattr(core_lifecycle, "migra", deps.migra)
+        monkeypatch.setattr(
+            core_lifecycle, "update_llm_metadata", deps.update_llm_metadata
+        )
+        for name, instance in (
+            ("UmopConfigRouter", deps.umop_config_router),
+            ("AstrBotConfigManager", deps.astrbot_config_mgr),
+            ("PersonaManager", deps.persona_mgr),
+            ("ProviderManager", deps.provider_manager),
+            ("PlatformManager", deps.platform_manager),
+            ("ConversationManager", deps.conversation_manager),
+            ("PlatformMessageHistoryManager", deps.platform_message_history_manager),
+            ("KnowledgeBaseManager", deps.kb_manager),
+            ("CronJobManager", deps.cron_manager),
+            ("Context", deps.star_context),
+            ("PluginManager", deps.plugin_manager),
+            ("PipelineScheduler", deps.pipeline_scheduler),
+            ("AstrBotUpdator", deps.astrbot_updator),
+            ("EventBus", deps.event_bus),
+        ):
+            monkeypatch.setattr(core_lifecycle, name, MagicMock(return_value=instance))
+        return deps
+
     async def test_initialize_sets_up_all_components(
-        self, mock_log_broker, mock_db, mock_astrbot_config
+        self, mock_db, lifecycle, init_deps
     ):
         """Test that initialize sets up all required components in correct order."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
-        # Mock all the dependencies
-        mock_db.initialize = AsyncMock()
-        mock_html_renderer = MagicMock()
-        mock_html_renderer.initialize = AsyncMock()
-
-        mock_umop_config_router = MagicMock()
-        mock_umop_config_router.initialize = AsyncMock()
-
-        mock_astrbot_config_mgr = MagicMock()
-        mock_astrbot_config_mgr.default_conf = {}
-        mock_astrbot_config_mgr.confs = {}
-
-        mock_persona_mgr = MagicMock()
-        mock_persona_mgr.initialize = AsyncMock()
-
-        mock_provider_manager = MagicMock()
-        mock_provider_manager.initialize = AsyncMock()
-
-        mock_platform_manager = MagicMock()
-        mock_platform_manager.initialize = AsyncMock()
-
-        mock_conversation_manager = MagicMock()
-
-        mock_platform_message_history_manager = MagicMock()
-
-        mock_kb_manager = MagicMock()
-        mock_kb_manager.initialize = AsyncMock()
-
-        mock_cron_manager = MagicMock()
-
-        mock_star_context = MagicMock()
-        mock_star_context._register_tasks = []
-
-        mock_plugin_manager = MagicMock()
-        mock_plugin_manager.reload = AsyncMock()
-
-        mock_pipeline_scheduler = MagicMock()
-        mock_pipeline_scheduler.initialize = AsyncMock()
-
-        mock_astrbot_updator = MagicMock()
-
-        mock_event_bus = MagicMock()
-
-        with (
-            patch("astrbot.core.core_lifecycle.astrbot_config", mock_astrbot_config),
-            patch("astrbot.core.core_lifecycle.html_renderer", mock_html_renderer),
-            patch(
-                "astrbot.core.core_lifecycle.UmopConfigRouter",
-                return_value=mock_umop_config_router,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.AstrBotConfigManager",
-                return_value=mock_astrbot_config_mgr,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.PersonaManager",
-                return_value=mock_persona_mgr,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.ProviderManager",
-                return_value=mock_provider_manager,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.PlatformManager",
-                return_value=mock_platform_manager,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.ConversationManager",
-                return_value=mock_conversation_manager,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.PlatformMessageHistoryManager",
-                return_value=mock_platform_message_history_manager,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.KnowledgeBaseManager",
-                return_value=mock_kb_manager,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.CronJobManager",
-                return_value=mock_cron_manager,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.Context", return_value=mock_star_context
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.PluginManager",
-                return_value=mock_plugin_manager,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.PipelineScheduler",
-                return_value=mock_pipeline_scheduler,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.AstrBotUpdator",
-                return_value=mock_astrbot_updator,
-            ),
-            patch("astrbot.core.core_lifecycle.EventBus", return_value=mock_event_bus),
-            patch("astrbot.core.core_lifecycle.migra", new_callable=AsyncMock),
-            patch(
-                "astrbot.core.core_lifecycle.update_llm_metadata",
-                new_callable=AsyncMock,
-            ),
-        ):
-            await lifecycle.initialize()
+        await lifecycle.initialize()
 
         # Verify database initialized
         mock_db.initialize.assert_awaited_once()
 
         # Verify html renderer initialized
-        mock_html_renderer.initialize.assert_awaited_once()
+        init_deps.html_renderer.initialize.assert_awaited_once()
 
         # Verify UMOP config router initialized
-        mock_umop_config_router.initialize.assert_awaited_once()
+        init_deps.umop_config_router.initialize.assert_awaited_once()
 
         # Verify persona manager initialized
-        mock_persona_mgr.initialize.assert_awaited_once()
+        init_deps.persona_mgr.initialize.assert_awaited_once()
 
         # Verify provider manager initialized
-        mock_provider_manager.initialize.assert_awaited_once()
+        init_deps.provider_manager.initialize.assert_awaited_once()
 
         # Verify platform manager initialized
-        mock_platform_manager.initialize.assert_awaited_once()
+        init_deps.platform_manager.initialize.assert_awaited_once()
 
         # Verify plugin manager reloaded
-        mock_plugin_manager.reload.assert_awaited_once()
+        init_deps.plugin_manager.reload.assert_awaited_once()
 
         # Verify knowledge base manager initialized
-        mock_kb_manager.initialize.assert_awaited_once()
+        init_deps.kb_manager.initialize.assert_awaited_once()
 
         # Verify pipeline scheduler loaded
         assert lifecycle.pipeline_scheduler_mapping is not None
 
-    @pytest.mark.asyncio
     async def test_initialize_handles_migration_failure(
-        self, mock_log_broker, mock_db, mock_astrbot_config
+        self, lifecycle, init_deps, lifecycle_logs
     ):
         """Test that initialize handles migration failures gracefully."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
-        mock_db.initialize = AsyncMock()
-
-        mock_html_renderer = MagicMock()
-        mock_html_renderer.initialize = AsyncMock()
-
-        mock_umop_config_router = MagicMock()
-        mock_umop_config_router.initialize = AsyncMock()
-
-        mock_astrbot_config_mgr = MagicMock()
-        mock_astrbot_config_mgr.default_conf = {}
-        mock_astrbot_config_mgr.confs = {}
+        init_deps.migra.side_effect = Exception("Migration failed")
 
-        # Mock components that need to be created for initialize to continue
-        with (
-            patch("astrbot.core.core_lifecycle.astrbot_config", mock_astrbot_config),
-            patch("astrbot.core.core_lifecycle.html_renderer", mock_html_renderer),
-            patch(
-                "astrbot.core.core_lifecycle.UmopConfigRouter",
-                return_value=mock_umop_config_router,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.AstrBotConfigManager",
-                return_value=mock_astrbot_config_mgr,
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.PersonaManager",
-                return_value=MagicMock(initialize=AsyncMock()),
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.ProviderManager",
-                return_value=MagicMock(initialize=AsyncMock()),
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.PlatformManager",
-                return_value=MagicMock(initialize=AsyncMock()),
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.ConversationManager",
-                return_value=MagicMock(),
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.PlatformMessageHistoryManager",
-                return_value=MagicMock(),
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.KnowledgeBaseManager",
-                return_value=MagicMock(initialize=AsyncMock()),
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.CronJobManager",
-                return_value=MagicMock(),
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.Context",
-                return_value=MagicMock(_register_tasks=[]),
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.PluginManager",
-                return_value=MagicMock(reload=AsyncMock()),
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.PipelineScheduler",
-                return_value=MagicMock(initialize=AsyncMock()),
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.AstrBotUpdator",
-                return_value=MagicMock(),
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.EventBus",
-                return_value=MagicMock(),
-            ),
-            patch(
-                "astrbot.core.core_lifecycle.migra",
-                AsyncMock(side_effect=Exception("Migration failed")),
-            ),
-            patch("astrbot.core.core_lifecycle.logger") as mock_logger,
-            patch(
-                "astrbot.core.core_lifecycle.update_llm_metadata",
-                new_callable=AsyncMock,
-            ),
-        ):
-            # Should not raise, just log the error
-            await lifecycle.initialize()
+        # Should not raise, just log the error
+        await lifecycle.initialize()
 
-            # Verify migration error was logged
-            mock_logger.error.assert_called()
+        # Verify migration error was logged
+        assert any(
+            "AstrBot migration failed" in record.getMessage()
+            for record in lifecycle_logs.records
+            if record.levelno == logging.ERROR
+        )
 
 
 class TestAstrBotCoreLifecycleStart:
     """Tests for AstrBotCoreLifecycle.start method."""
 
-    @pytest.mark.asyncio
-    async def test_start_loads_event_bus_and_runs(self, mock_log_broker, mock_db):
+    async def test_start_loads_event_bus_and_runs(self, lifecycle_with_mocked_managers):
         """Test that start loads event bus and runs tasks."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
+        lifecycle = lifecycle_with_mocked_managers
+        dispatched = asyncio.Event()
 
         # Set up minimal state
         lifecycle.event_bus = MagicMock()
-        lifecycle.event_bus.dispatch = AsyncMock()
-
-        lifecycle.cron_manager = None
-
-        lifecycle.temp_dir_cleaner = None
+        lifecycle.event_bus.dispatch = AsyncMock(side_effect=dispatched.set)
 
         lifecycle.star_context = MagicMock()
         lifecycle.star_context._register_tasks = []
 
-        lifecycle.plugin_manager = MagicMock()
-        lifecycle.plugin_manager.context = MagicMock()
-        lifecycle.plugin_manager.context.get_all_stars = MagicMock(return_value=[])
-
-        lifecycle.provider_manager = MagicMock()
-        lifecycle.provider_manager.terminate = AsyncMock()
-
-        lifecycle.platform_manager = MagicMock()
-        lifecycle.platform_manager.terminate = AsyncMock()
-
-        lifecycle.kb_manager = MagicMock()
-        lifecycle.kb_manager.terminate = AsyncMock()
-
-        lifecycle.dashboard_shutdown_event = asyncio.Event()
-
-        lifecycle.curr_tasks = []
-
-        with (
-            patch(
-                "astrbot.core.core_lifecycle.star_handlers_registry"
-            ) as mock_registry,
-            patch("astrbot.core.core_lifecycle.logger"),
-        ):
+        with patch.object(core_lifecycle, "star_handlers_registry") as mock_registry:
             mock_registry.get_handlers_by_event_type = MagicMock(return_value=[])
 
-            # Create a task that completes quickly for testing
-            async def quick_task():
-                return
-
-            # Run start but cancel after a brief moment to avoid hanging
+            # Run start until the event bus is dispatching
             start_task = asyncio.create_task(lifecycle.start())
+            await asyncio.wait_for(dispatched.wait(), timeout=1.0)
 
-            # Give it a moment to start
-            await asyncio.sleep(0.01)
+            lifecycle.event_bus.dispatch.assert_awaited_once()
 
-            # Cancel the start task
             start_task.cancel()
-
-            try:
+            with contextlib.suppress(asyncio.CancelledError):
                 await start_task
-            except asyncio.CancelledError:
-                pass
 
-    @pytest.mark.asyncio
-    async def test_start_calls_on_astrbot_loaded_hook(self, mock_log_broker, mock_db):
+    async def test_start_calls_on_astrbot_loaded_hook(
+        self, lifecycle_with_mocked_managers
+    ):
         """Test that start calls the OnAstrBotLoadedEvent handlers."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
+        lifecycle = lifecycle_with_mocked_managers
 
         # Set up minimal state
         lifecycle.event_bus = MagicMock()
         lifecycle.event_bus.dispatch = AsyncMock()
 
-        lifecycle.cron_manager = None
-        lifecycle.temp_dir_cleaner = None
-
         lifecycle.star_context = MagicMock()
         lifecycle.star_context._register_tasks = []
 
-        lifecycle.plugin_manager = MagicMock()
-        lifecycle.plugin_manager.context = MagicMock()
-        lifecycle.plugin_manager.context.get_all_stars = MagicMock(return_value=[])
-
-        lifecycle.provider_manager = MagicMock()
-        lifecycle.provider_manager.terminate = AsyncMock()
-
-        lifecycle.platform_manager = MagicMock()
-        lifecycle.platform_manager.terminate = AsyncMock()
-
-        lifecycle.kb_manager = MagicMock()
-        lifecycle.kb_manager.terminate = AsyncMock()
-
-        lifecycle.dashboard_shutdown_event = asyncio.Event()
-
-        lifecycle.curr_tasks = []
-
         # Create a mock handler
+        handler_called = asyncio.Event()
         mock_handler = MagicMock()
-        mock_handler.handler = AsyncMock()
+        mock_handler.handler = AsyncMock(side_effect=handler_called.set)
         mock_handler.handler_module_path = "test_module"
         mock_handler.handler_name = "test_handler"
 
         with (
-            patch(
-                "astrbot.core.core_lifecycle.star_handlers_registry"
-            ) as mock_registry,
-            patch(
-                "astrbot.core.core_lifecycle.star_map",
+            patch.object(core_lifecycle, "star_handlers_registry") as mock_registry,
+            patch.object(
+                core_lifecycle,
+                "star_map",
                 {"test_module": MagicMock(name="Test Handler")},
             ),
-            patch("astrbot.core.core_lifecycle.logger"),
         ):
             mock_registry.get_handlers_by_event_type = MagicMock(
                 return_value=[mock_handler]
             )
 
-            # Run start but cancel after a brief moment
+            # Run start until the hook has been called
             start_task = asyncio.create_task(lifecycle.start())
-            await asyncio.sleep(0.01)
-            start_task.cancel()
-
-            try:
-                await start_task
-            except asyncio.CancelledError:
-                pass
+            await asyncio.wait_for(handler_called.wait(), timeout=1.0)
 
             # Verify handler was called
             mock_handler.handler.assert_awaited_once()
 
-
-class TestAstrBotCoreLifecycleStopAdditional:
-    """Additional tests for AstrBotCoreLifecycle.stop method."""
-
-    @pytest.mark.asyncio
-    async def test_stop_cancels_all_tasks(self, mock_log_broker, mock_db):
-        """Test that stop cancels all current tasks."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
-        lifecycle.temp_dir_cleaner = None
-        lifecycle.cron_manager = None
-
-        lifecycle.plugin_manager = MagicMock()
-        lifecycle.plugin_manager.context = MagicMock()
-        lifecycle.plugin_manager.context.get_all_stars = MagicMock(return_value=[])
-
-        lifecycle.provider_manager = MagicMock()
-        lifecycle.provider_manager.terminate = AsyncMock()
-
-        lifecycle.platform_manager = MagicMock()
-        lifecycle.platform_manager.terminate = AsyncMock()
-
-        lifecycle.kb_manager = MagicMock()
-        lifecycle.kb_manager.terminate = AsyncMock()
-
-        lifecycle.dashboard_shutdown_event = asyncio.Event()
-
-        # Create mock tasks
-        mock_task1 = MagicMock(spec=asyncio.Task)
-        mock_task1.cancel = MagicMock()
-        mock_task1.get_name = MagicMock(return_value="task1")
-
-        mock_task2 = MagicMock(spec=asyncio.Task)
-        mock_task2.cancel = MagicMock()
-        mock_task2.get_name = MagicMock(return_value="task2")
-
-        lifecycle.curr_tasks = [mock_task1, mock_task2]
-
-        await lifecycle.stop()
-
-        # Verify tasks were cancelled
-        mock_task1.cancel.assert_called_once()
-        mock_task2.cancel.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_stop_terminates_all_managers(self, mock_log_broker, mock_db):
-        """Test that stop terminates all managers in correct order."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
-        lifecycle.temp_dir_cleaner = None
-        lifecycle.cron_manager = None
-
-        lifecycle.plugin_manager = MagicMock()
-        lifecycle.plugin_manager.context = MagicMock()
-        lifecycle.plugin_manager.context.get_all_stars = MagicMock(return_value=[])
-
-        lifecycle.provider_manager = MagicMock()
-        lifecycle.provider_manager.terminate = AsyncMock()
-
-        lifecycle.platform_manager = MagicMock()
-        lifecycle.platform_manager.terminate = AsyncMock()
-
-        lifecycle.kb_manager = MagicMock()
-        lifecycle.kb_manager.terminate = AsyncMock()
-
-        lifecycle.dashboard_shutdown_event = asyncio.Event()
-
-        lifecycle.curr_tasks = []
-
-        await lifecycle.stop()
-
-        # Verify all managers were terminated
-        lifecycle.provider_manager.terminate.assert_awaited_once()
-        lifecycle.platform_manager.terminate.assert_awaited_once()
-        lifecycle.kb_manager.terminate.assert_awaited_once()
-
-    @pytest.mark.asyncio
-    async def test_stop_handles_plugin_termination_error(
-        self, mock_log_broker, mock_db
-    ):
-        """Test that stop handles plugin termination errors gracefully."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
-        lifecycle.temp_dir_cleaner = None
-        lifecycle.cron_manager = None
-
-        # Create a mock plugin that raises exception on termination
-        mock_plugin = MagicMock()
-        mock_plugin.name = "test_plugin"
-
-        lifecycle.plugin_manager = MagicMock()
-        lifecycle.plugin_manager.context = MagicMock()
-        lifecycle.plugin_manager.context.get_all_stars = MagicMock(
-            return_value=[mock_plugin]
-        )
-        lifecycle.plugin_manager._terminate_plugin = AsyncMock(
-            side_effect=Exception("Plugin termination failed")
-        )
-
-        lifecycle.provider_manager = MagicMock()
-        lifecycle.provider_manager.terminate = AsyncMock()
-
-        lifecycle.platform_manager = MagicMock()
-        lifecycle.platform_manager.terminate = AsyncMock()
-
-        lifecycle.kb_manager = MagicMock()
-        lifecycle.kb_manager.terminate = AsyncMock()
-
-        lifecycle.dashboard_shutdown_event = asyncio.Event()
-
-        lifecycle.curr_tasks = []
-
-        with patch("astrbot.core.core_lifecycle.logger") as mock_logger:
-            # Should not raise
-            await lifecycle.stop()
-
-            # Verify warning was logged about plugin termination failure
-            mock_logger.warning.assert_called()
+            start_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await start_task
 
 
 class TestAstrBotCoreLifecycleRestart:
     """Tests for AstrBotCoreLifecycle.restart method."""
 
-    @pytest.mark.asyncio
     async def test_restart_terminates_managers_and_starts_thread(
-        self, mock_log_broker, mock_db
+        self, lifecycle_with_mocked_managers
     ):
         """Test that restart terminates managers and starts reboot thread."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
-        lifecycle.provider_manager = MagicMock()
-        lifecycle.provider_manager.terminate = AsyncMock()
-
-        lifecycle.platform_manager = MagicMock()
-        lifecycle.platform_manager.terminate = AsyncMock()
-
-        lifecycle.kb_manager = MagicMock()
-        lifecycle.kb_manager.terminate = AsyncMock()
-
-        lifecycle.dashboard_shutdown_event = asyncio.Event()
-
+        lifecycle = lifecycle_with_mocked_managers
         lifecycle.astrbot_updator = MagicMock()
 
-        with patch("astrbot.core.core_lifecycle.threading.Thread") as mock_thread:
+        with patch.object(core_lifecycle.threading, "Thread") as mock_thread:
             await lifecycle.restart()
 
             # Verify managers were terminated
@@ -902,53 +596,31 @@ class TestAstrBotCoreLifecycleRestart:
 class TestAstrBotCoreLifecycleLoadPipelineScheduler:
     """Tests for AstrBotCoreLifecycle.load_pipeline_scheduler method."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("num_configs", [1, 2, 5])
     async def test_load_pipeline_scheduler_creates_schedulers(
-        self, mock_log_broker, mock_db, mock_astrbot_config
+        self, lifecycle, num_configs
     ):
         """Test that load_pipeline_scheduler creates schedulers for each config."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
-        mock_astrbot_config_mgr = MagicMock()
-        mock_astrbot_config_mgr.confs = {
-            "config1": MagicMock(),
-            "config2": MagicMock(),
-        }
-
-        mock_plugin_manager = MagicMock()
-
-        mock_scheduler1 = MagicMock()
-        mock_scheduler1.initialize = AsyncMock()
-
-        mock_scheduler2 = MagicMock()
-        mock_scheduler2.initialize = AsyncMock()
+        confs = {f"config{i}": MagicMock() for i in range(num_configs)}
+        schedulers = [MagicMock(initialize=AsyncMock()) for _ in range(num_configs)]
+        lifecycle.astrbot_config_mgr = MagicMock(confs=confs)
+        lifecycle.plugin_manager = MagicMock()
 
         with (
-            patch(
-                "astrbot.core.core_lifecycle.PipelineScheduler"
-            ) as mock_scheduler_cls,
-            patch("astrbot.core.core_lifecycle.PipelineContext"),
+            patch.object(core_lifecycle, "PipelineScheduler", side_effect=schedulers),
+            patch.object(core_lifecycle, "PipelineContext"),
         ):
-            # Configure mock to return different schedulers
-            mock_scheduler_cls.side_effect = [mock_scheduler1, mock_scheduler2]
-
-            lifecycle.astrbot_config_mgr = mock_astrbot_config_mgr
-            lifecycle.plugin_manager = mock_plugin_manager
-
             result = await lifecycle.load_pipeline_scheduler()
 
-            # Verify schedulers were created for each config
-            assert len(result) == 2
-            assert "config1" in result
-            assert "config2" in result
+        # Verify schedulers were created and initialized for each config
+        assert result == dict(zip(confs, schedulers))
+        for scheduler in schedulers:
+            scheduler.initialize.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_reload_pipeline_scheduler_updates_existing(
-        self, mock_log_broker, mock_db, mock_astrbot_config
+        self, lifecycle, mock_astrbot_config
     ):
         """Test that reload_pipeline_scheduler updates existing scheduler."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
         mock_astrbot_config_mgr = MagicMock()
         mock_astrbot_config_mgr.confs = {
             "config1": MagicMock(),
@@ -964,10 +636,8 @@ class TestAstrBotCoreLifecycleLoadPipelineScheduler:
         lifecycle.pipeline_scheduler_mapping = {}
 
         with (
-            patch(
-                "astrbot.core.core_lifecycle.PipelineScheduler"
-            ) as mock_scheduler_cls,
-            patch("astrbot.core.core_lifecycle.PipelineContext"),
+            patch.object(core_lifecycle, "PipelineScheduler") as mock_scheduler_cls,
+            patch.object(core_lifecycle, "PipelineContext"),
         ):
             mock_scheduler_cls.return_value = mock_new_scheduler
 
@@ -977,13 +647,8 @@ class TestAstrBotCoreLifecycleLoadPipelineScheduler:
             assert "config1" in lifecycle.pipeline_scheduler_mapping
             mock_new_scheduler.initialize.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_reload_pipeline_scheduler_raises_for_missing_config(
-        self, mock_log_broker, mock_db
-    ):
+    async def test_reload_pipeline_scheduler_raises_for_missing_config(self, lifecycle):
         """Test that reload_pipeline_scheduler raises error for missing config."""
-        lifecycle = AstrBotCoreLifecycle(mock_log_broker, mock_db)
-
         mock_astrbot_config_mgr = MagicMock()
         mock_astrbot_config_mgr.confs = {}
 
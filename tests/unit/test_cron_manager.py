@@ -1,49 +1,63 @@
 """Tests for CronJobManager."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from zoneinfo import ZoneInfo
 
 import pytest
+import pytest_asyncio
 
+from astrbot.core.cron import manager as manager_module
 from astrbot.core.cron.manager import (
     CronJobManager,
     CronJobSchedulingError,
+    _crontab_trigger,
     _normalize_crontab_day_of_week,
 )
 from astrbot.core.db.po import CronJob
+from astrbot.core.star.context import Context
 
-
-@pytest.fixture
-def mock_db():
-    """Create a mock database."""
-    db = MagicMock()
-    db.create_cron_job = AsyncMock()
-    db.get_cron_job = AsyncMock()
-    db.update_cron_job = AsyncMock()
-    db.delete_cron_job = AsyncMock()
-    db.list_cron_jobs = AsyncMock(return_value=[])
-    return db
+FUTURE_RUN_AT = datetime(2099, 1, 1, tzinfo=timezone.utc)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_context():
-    """Create a mock Context."""
-    ctx = MagicMock()
+    """Create a mock Context shared by the session; tests must not mutate it."""
+    ctx = MagicMock(spec=Context)
     ctx.get_config = MagicMock(return_value={"admins_id": []})
     ctx.conversation_manager = MagicMock()
     return ctx
 
 
 @pytest.fixture
-def cron_manager(mock_db):
-    """Create a CronJobManager instance."""
-    return CronJobManager(mock_db)
+def captured_log(monkeypatch):
+    """Replace the cron manager logger with a mock for the test."""
+    recorder = MagicMock()
+    monkeypatch.setattr(manager_module, "logger", recorder)
+    return recorder
 
 
-@pytest.fixture
-def sample_cron_job():
-    """Create a sample CronJob."""
+@pytest_asyncio.fixture
+async def cron_manager(mock_db):
+    """Create a CronJobManager instance, shutting it down afterwards.
+
+    The event loop is shared by the whole session, so a scheduler started by
+    one test must not keep running into the next.
+    """
+    manager = CronJobManager(mock_db)
+    yield manager
+    await manager.shutdown()
+
+
+@pytest_asyncio.fixture
+async def started_cron_manager(cron_manager, mock_context):
+    """Create a started CronJobManager with no persisted jobs."""
+    await cron_manager.start(mock_context)
+    return cron_manager
+
+
+@pytest.fixture(scope="session")
+def _sample_cron_job_template():
     return CronJob(
         job_id="test-job-id",
         name="Test Job",
@@ -59,6 +73,13 @@ def sample_cron_job():
     )
 
 
+@pytest.fixture
+def sample_cron_job(_sample_cron_job_template):
+    """Create a sample CronJob."""
+    template = _sample_cron_job_template
+    return template.model_copy(update={"payload": dict(template.payload)})
+
+
 class TestCronJobManagerInit:
     """Tests for CronJobManager initialization."""
 
@@ -74,7 +95,6 @@ class TestCronJobManagerInit:
 class TestCronJobManagerStart:
     """Tests for CronJobManager.start method."""
 
-    @pytest.mark.asyncio
     async def test_start(self, cron_manager, mock_db, mock_context):
         """Test starting the cron manager."""
         mock_db.list_cron_jobs.return_value = []
@@ -84,7 +104,6 @@ class TestCronJobManagerStart:
         assert cron_manager._started is True
         assert cron_manager.ctx == mock_context
 
-    @pytest.mark.asyncio
     async def test_start_idempotent(self, cron_manager, mock_db, mock_context):
         """Test that start is idempotent."""
         mock_db.list_cron_jobs.return_value = []
@@ -99,7 +118,6 @@ class TestCronJobManagerStart:
 class TestCronJobManagerShutdown:
     """Tests for CronJobManager.shutdown method."""
 
-    @pytest.mark.asyncio
     async def test_shutdown(self, cron_manager, mock_db, mock_context):
         """Test shutting down the cron manager."""
         mock_db.list_cron_jobs.return_value = []
@@ -109,7 +127,6 @@ class TestCronJobManagerShutdown:
 
         assert cron_manager._started is False
 
-    @pytest.mark.asyncio
     async def test_shutdown_when_not_started(self, cron_manager):
         """Test shutdown when not started."""
         # Should not raise
@@ -119,68 +136,40 @@ class TestCronJobManagerShutdown:
 class TestAddBasicJob:
     """Tests for add_basic_job method."""
 
-    @pytest.mark.asyncio
-    async def test_add_basic_job(self, cron_manager, mock_db, sample_cron_job):
+    @pytest.mark.parametrize(
+        ("enabled", "tz"),
+        [(True, None), (False, None), (True, "Asia/Shanghai")],
+        ids=["enabled", "disabled", "with_timezone"],
+    )
+    async def test_add_basic_job(
+        self, cron_manager, mock_db, sample_cron_job, enabled, tz
+    ):
         """Test adding a basic cron job."""
+        sample_cron_job.enabled = enabled
         mock_db.create_cron_job.return_value = sample_cron_job
-
-        handler = MagicMock()
+        kwargs = {"timezone": tz} if tz else {}
 
         result = await cron_manager.add_basic_job(
             name="Test Job",
             cron_expression="0 9 * * *",
-            handler=handler,
+            handler=MagicMock(),
             description="A test job",
-            enabled=True,
-        )
-
-        assert result == sample_cron_job
-        assert sample_cron_job.job_id in cron_manager._basic_handlers
-        mock_db.create_cron_job.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_add_basic_job_disabled(self, cron_manager, mock_db, sample_cron_job):
-        """Test adding a disabled basic cron job."""
-        sample_cron_job.enabled = False
-        mock_db.create_cron_job.return_value = sample_cron_job
-
-        handler = MagicMock()
-
-        result = await cron_manager.add_basic_job(
-            name="Test Job",
-            cron_expression="0 9 * * *",
-            handler=handler,
-            enabled=False,
+            enabled=enabled,
+            **kwargs,
         )
 
         assert result == sample_cron_job
         assert sample_cron_job.job_id in cron_manager._basic_handlers
-
-    @pytest.mark.asyncio
-    async def test_add_basic_job_with_timezone(
-        self, cron_manager, mock_db, sample_cron_job
-    ):
-        """Test adding a basic job with timezone."""
-        mock_db.create_cron_job.return_value = sample_cron_job
-
-        handler = MagicMock()
-
-        await cron_manager.add_basic_job(
-            name="Test Job",
-            cron_expression="0 9 * * *",
-            handler=handler,
-            timezone="Asia/Shanghai",
-        )
-
         mock_db.create_cron_job.assert_called_once()
         call_kwargs = mock_db.create_cron_job.call_args.kwargs
-        assert call_kwargs["timezone"] == "Asia/Shanghai"
+        assert call_kwargs["enabled"] is enabled
+        if tz:
+            assert call_kwargs["timezone"] == tz
 
 
 class TestAddActiveJob:
     """Tests for add_active_job method."""
 
-    @pytest.mark.asyncio
     async def test_add_active_job(self, cron_manager, mock_db, sample_cron_job):
         """Test adding an active agent cron job."""
         sample_cron_job.job_type = "active_agent"
@@ -195,7 +184,6 @@ class TestAddActiveJob:
         assert result == sample_cron_job
         mock_db.create_cron_job.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_add_active_job_run_once(
         self, cron_manager, mock_db, sample_cron_job
     ):
@@ -204,26 +192,23 @@ class TestAddActiveJob:
         sample_cron_job.run_once = True
         mock_db.create_cron_job.return_value = sample_cron_job
 
-        run_at = datetime.now(timezone.utc) + timedelta(days=30)
-
         with pytest.raises(CronJobSchedulingError, match="Invalid isoformat string"):
             await cron_manager.add_active_job(
                 name="Test Run Once Job",
                 cron_expression=None,
                 payload={"session": "test:group:123"},
                 run_once=True,
-                run_at=run_at,
+                run_at=FUTURE_RUN_AT,
             )
 
         call_kwargs = mock_db.create_cron_job.call_args.kwargs
         assert call_kwargs["run_once"] is True
-        assert call_kwargs["payload"]["run_at"] == run_at.isoformat()
+        assert call_kwargs["payload"]["run_at"] == FUTURE_RUN_AT.isoformat()
 
 
 class TestUpdateJob:
     """Tests for update_job method."""
 
-    @pytest.mark.asyncio
     async def test_update_job(self, cron_manager, mock_db, sample_cron_job):
         """Test updating a cron job."""
         updated_job = CronJob(
@@ -240,7 +225,6 @@ class TestUpdateJob:
         assert result == updated_job
         mock_db.update_cron_job.assert_called()
 
-    @pytest.mark.asyncio
     async def test_update_job_not_found(self, cron_manager, mock_db):
         """Test updating a non-existent job."""
         mock_db.update_cron_job.return_value = None
@@ -253,7 +237,6 @@ class TestUpdateJob:
 class TestDeleteJob:
     """Tests for delete_job method."""
 
-    @pytest.mark.asyncio
     async def test_delete_job(self, cron_manager, mock_db):
         """Test deleting a cron job."""
         cron_manager._basic_handlers["test-job-id"] = MagicMock()
@@ -267,31 +250,20 @@ class TestDeleteJob:
 class TestListJobs:
     """Tests for list_jobs method."""
 
-    @pytest.mark.asyncio
-    async def test_list_all_jobs(self, cron_manager, mock_db, sample_cron_job):
-        """Test listing all jobs."""
-        mock_db.list_cron_jobs.return_value = [sample_cron_job]
-
-        result = await cron_manager.list_jobs()
-
-        assert len(result) == 1
-        mock_db.list_cron_jobs.assert_called_once_with(None)
-
-    @pytest.mark.asyncio
-    async def test_list_jobs_by_type(self, cron_manager, mock_db, sample_cron_job):
-        """Test listing jobs by type."""
+    @pytest.mark.parametrize("job_type", [None, "basic"], ids=["all", "by_type"])
+    async def test_list_jobs(self, cron_manager, mock_db, sample_cron_job, job_type):
+        """Test listing jobs, optionally filtered by type."""
         mock_db.list_cron_jobs.return_value = [sample_cron_job]
 
-        result = await cron_manager.list_jobs(job_type="basic")
+        result = await cron_manager.list_jobs(job_type=job_type)
 
         assert len(result) == 1
-        mock_db.list_cron_jobs.assert_called_once_with("basic")
+        mock_db.list_cron_jobs.assert_called_once_with(job_type)
 
 
 class TestSyncFromDb:
     """Tests for sync_from_db method."""
 
-    @pytest.mark.asyncio
     async def test_sync_from_db_empty(self, cron_manager, mock_db):
         """Test syncing from empty database."""
         mock_db.list_cron_jobs.return_value = []
@@ -300,7 +272,6 @@ class TestSyncFromDb:
 
         mock_db.list_cron_jobs.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_sync_from_db_skips_disabled(
         self, cron_manager, mock_db, sample_cron_job
     ):
@@ -314,7 +285,6 @@ class TestSyncFromDb:
         mock_db.list_cron_jobs.assert_called_once()
         mock_schedule.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_sync_from_db_skips_non_persistent(
         self, cron_manager, mock_db, sample_cron_job
     ):
@@ -328,26 +298,22 @@ class TestSyncFromDb:
         mock_db.list_cron_jobs.assert_called_once()
         mock_schedule.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_sync_from_db_basic_without_handler(
-        self, cron_manager, mock_db, sample_cron_job
+        self, cron_manager, mock_db, sample_cron_job, captured_log
     ):
         """Test that sync warns for basic jobs without handlers."""
         mock_db.list_cron_jobs.return_value = [sample_cron_job]
 
-        with patch("astrbot.core.cron.manager.logger") as mock_logger:
-            await cron_manager.sync_from_db()
+        await cron_manager.sync_from_db()
 
-        mock_logger.warning.assert_called()
+        captured_log.warning.assert_called()
 
 
 class TestRemoveScheduled:
     """Tests for _remove_scheduled method."""
 
-    @pytest.mark.asyncio
-    async def test_remove_scheduled_existing(self, cron_manager, mock_context):
+    async def test_remove_scheduled_existing(self, started_cron_manager):
         """Test removing a scheduled job."""
-        # Start the scheduler first
         job = CronJob(
             job_id="test-job-id",
             name="Test",
@@ -356,14 +322,11 @@ class TestRemoveScheduled:
             enabled=True,
             persistent=True,
         )
-        mock_db = cron_manager.db
-        mock_db.list_cron_jobs = AsyncMock(return_value=[job])
-        await cron_manager.start(mock_context)
+        started_cron_manager._schedule_job(job)
 
-        # Then remove it
-        cron_manager._remove_scheduled("test-job-id")
+        started_cron_manager._remove_scheduled("test-job-id")
 
-        # Should not raise
+        assert started_cron_manager.scheduler.get_job("test-job-id") is None
 
     def test_remove_scheduled_nonexistent(self, cron_manager):
         """Test removing a non-existent job."""
@@ -383,35 +346,32 @@ class TestScheduleJob:
         assert _normalize_crontab_day_of_week("0-6") == "*"
         assert _normalize_crontab_day_of_week("mon-fri") == "mon-fri"
 
-    @pytest.mark.asyncio
-    async def test_schedule_job_basic(
-        self, cron_manager, sample_cron_job, mock_context
-    ):
+    def test_crontab_trigger_is_shared(self):
+        """Test identical crontab expressions reuse one parsed trigger."""
+        tz = ZoneInfo("Asia/Shanghai")
+
+        trigger = _crontab_trigger("0 9 * * 0", tz)
+
+        assert _crontab_trigger("0 9 * * 0", tz) is trigger
+        assert _crontab_trigger("0 9 * * 0", ZoneInfo("UTC")) is not trigger
+
+    async def test_schedule_job_basic(self, started_cron_manager, sample_cron_job):
         """Test scheduling a basic job."""
-        mock_db = cron_manager.db
-        mock_db.list_cron_jobs = AsyncMock(return_value=[])
-        mock_db.update_cron_job = AsyncMock()
-        await cron_manager.start(mock_context)
-        cron_manager._schedule_job(sample_cron_job)
+        started_cron_manager._schedule_job(sample_cron_job)
 
         # Verify job was added to scheduler
-        assert cron_manager.scheduler.get_job("test-job-id") is not None
+        assert started_cron_manager.scheduler.get_job("test-job-id") is not None
 
-    @pytest.mark.asyncio
     async def test_schedule_job_uses_standard_crontab_weekday_numbers(
-        self, cron_manager, sample_cron_job, mock_context
+        self, started_cron_manager, sample_cron_job
     ):
         """Test Sunday=0 crontab jobs are scheduled for Sunday."""
         sample_cron_job.cron_expression = "0 9 * * 0"
         sample_cron_job.timezone = "Asia/Shanghai"
-        mock_db = cron_manager.db
-        mock_db.list_cron_jobs = AsyncMock(return_value=[])
-        mock_db.update_cron_job = AsyncMock()
 
-        await cron_manager.start(mock_context)
-        cron_manager._schedule_job(sample_cron_job)
+        started_cron_manager._schedule_job(sample_cron_job)
 
-        aps_job = cron_manager.scheduler.get_job("test-job-id")
+        aps_job = started_cron_manager.scheduler.get_job("test-job-id")
         assert aps_job is not None
         next_fire_time = aps_job.trigger.get_next_fire_time(
             None,
@@ -421,42 +381,29 @@ class TestScheduleJob:
             2026, 6, 28, 9, 0, tzinfo=ZoneInfo("Asia/Shanghai")
         )
 
-    @pytest.mark.asyncio
     async def test_schedule_job_with_timezone(
-        self, cron_manager, sample_cron_job, mock_context
+        self, started_cron_manager, sample_cron_job
     ):
         """Test scheduling a job with timezone."""
         sample_cron_job.timezone = "America/New_York"
-        mock_db = cron_manager.db
-        mock_db.list_cron_jobs = AsyncMock(return_value=[])
-        mock_db.update_cron_job = AsyncMock()
-        await cron_manager.start(mock_context)
-        cron_manager._schedule_job(sample_cron_job)
+        started_cron_manager._schedule_job(sample_cron_job)
 
-        assert cron_manager.scheduler.get_job("test-job-id") is not None
+        assert started_cron_manager.scheduler.get_job("test-job-id") is not None
 
-    @pytest.mark.asyncio
     async def test_schedule_job_invalid_timezone(
-        self, cron_manager, sample_cron_job, mock_context
+        self, started_cron_manager, sample_cron_job, captured_log
     ):
         """Test scheduling a job with invalid timezone."""
         sample_cron_job.timezone = "Invalid/Timezone"
-        mock_db = cron_manager.db
-        mock_db.list_cron_jobs = AsyncMock(return_value=[])
-        mock_db.update_cron_job = AsyncMock()
 
-        with patch("astrbot.core.cron.manager.logger") as mock_logger:
-            await cron_manager.start(mock_context)
-            cron_manager._schedule_job(sample_cron_job)
+        started_cron_manager._schedule_job(sample_cron_job)
 
         # Should still schedule with system timezone
-        assert cron_manager.scheduler.get_job("test-job-id") is not None
-        mock_logger.warning.assert_called()
+        assert started_cron_manager.scheduler.get_job("test-job-id") is not None
+        captured_log.warning.assert_called()
 
-    @pytest.mark.asyncio
-    async def test_schedule_job_run_once(self, cron_manager, mock_context):
+    async def test_schedule_job_run_once(self, started_cron_manager):
         """Test scheduling a run-once job."""
-        future_date = datetime.now(timezone.utc) + timedelta(days=30)
         job = CronJob(
             job_id="run-once-job",
             name="Run Once",
@@ -464,21 +411,16 @@ class TestScheduleJob:
             cron_expression=None,
             enabled=True,
             run_once=True,
-            payload={"run_at": future_date.isoformat()},
+            payload={"run_at": FUTURE_RUN_AT.isoformat()},
         )
-        mock_db = cron_manager.db
-        mock_db.list_cron_jobs = AsyncMock(return_value=[])
-        mock_db.update_cron_job = AsyncMock()
-        await cron_manager.start(mock_context)
-        cron_manager._schedule_job(job)
+        started_cron_manager._schedule_job(job)
 
-        assert cron_manager.scheduler.get_job("run-once-job") is not None
+        assert started_cron_manager.scheduler.get_job("run-once-job") is not None
 
 
 class TestRunJob:
     """Tests for _run_job method."""
 
-    @pytest.mark.asyncio
     async def test_run_job_disabled(self, cron_manager, mock_db, sample_cron_job):
         """Test running a disabled job."""
         sample_cron_job.enabled = False
@@ -489,7 +431,6 @@ class TestRunJob:
         # Should not update status
         mock_db.update_cron_job.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_run_job_not_found(self, cron_manager, mock_db):
         """Test running a non-existent job."""
         mock_db.get_cron_job.return_value = None
@@ -503,7 +444,6 @@ class TestRunJob:
 class TestRunBasicJob:
     """Tests for _run_basic_job method."""
 
-    @pytest.mark.asyncio
     async def test_run_basic_job_sync_handler(self, cron_manager, sample_cron_job):
         """Test running a basic job with sync handler."""
         handler = MagicMock(return_value=None)
@@ -514,7 +454,6 @@ class TestRunBasicJob:
 
         handler.assert_called_once_with(arg1="value1")
 
-    @pytest.mark.asyncio
     async def test_run_basic_job_async_handler(self, cron_manager, sample_cron_job):
         """Test running a basic job with async handler."""
         async_handler = AsyncMock()
@@ -525,7 +464,6 @@ class TestRunBasicJob:
 
         async_handler.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_run_basic_job_no_handler(self, cron_manager, sample_cron_job):
         """Test running a basic job without handler."""
         sample_cron_job.job_id = "no-handler-job"
@@ -537,7 +475,6 @@ class TestRunBasicJob:
 class TestRunActiveAgentJob:
     """Tests for active agent cron job execution."""
 
-    @pytest.mark.asyncio
     async def test_woke_main_agent_passes_provider_settings(self, cron_manager):
         """Test active cron agent keeps fallback chat model settings."""
         provider_settings = {
@@ -583,8 +520,9 @@ class TestRunActiveAgentJob:
                 "astrbot.core.astr_main_agent.build_main_agent",
                 side_effect=fake_build_main_agent,
             ),
-            patch(
-                "astrbot.core.cron.manager.persist_agent_history",
+            patch.object(
+                manager_module,
+                "persist_agent_history",
                 side_effect=fake_persist_agent_history,
             ),
         ):
@@ -603,18 +541,13 @@ class TestRunActiveAgentJob:
 class TestGetNextRunTime:
     """Tests for _get_next_run_time method."""
 
-    @pytest.mark.asyncio
     async def test_get_next_run_time_existing_job(
-        self, cron_manager, sample_cron_job, mock_context
+        self, started_cron_manager, sample_cron_job
     ):
         """Test getting next run time for existing job."""
-        mock_db = cron_manager.db
-        mock_db.list_cron_jobs = AsyncMock(return_value=[])
-        mock_db.update_cron_job = AsyncMock()
-        await cron_manager.start(mock_context)
-        cron_manager._schedule_job(sample_cron_job)
+        started_cron_manager._schedule_job(sample_cron_job)
 
-        next_run = cron_manager._get_next_run_time("test-job-id")
+        next_run = started_cron_manager._get_next_run_time("test-job-id")
 
         assert next_run is not None
 
@@ -3,8 +3,6 @@
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
-import pytest
-
 from astrbot.core.tools.cron_tools import FutureTaskTool
 
 
@@ -71,7 +69,6 @@ def test_future_task_schema_has_no_job_type_and_delete_job_id():
     assert "Required for 'delete' and 'edit'" in job_id_description
 
 
-@pytest.mark.asyncio
 async def test_future_task_edit_requires_job_id():
     """Edit mode should require job_id."""
     tool = FutureTaskTool()
@@ -91,7 +88,6 @@ async def test_future_task_edit_requires_job_id():
     assert result == "error: job_id is required when action=edit."
 
 
-@pytest.mark.asyncio
 async def test_future_task_edit_updates_existing_job():
     """Edit mode should update note and one-time scheduling fields."""
     tool = FutureTaskTool()
@@ -156,7 +152,6 @@ async def test_future_task_edit_updates_existing_job():
     assert result == "Updated future task job-1 (new name)."
 
 
-@pytest.mark.asyncio
 async def test_future_task_edit_rejects_same_umo_different_sender():
     """Same-session users should not edit another sender's task."""
     tool = FutureTaskTool()
@@ -177,7 +172,6 @@ async def test_future_task_edit_rejects_same_umo_different_sender():
     cron_mgr.update_job.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_future_task_delete_rejects_same_umo_different_sender():
     """Same-session users should not delete another sender's task."""
     tool = FutureTaskTool()
@@ -197,7 +191,6 @@ async def test_future_task_delete_rejects_same_umo_different_sender():
     cron_mgr.delete_job.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_future_task_list_filters_by_umo_and_sender():
     """List mode should show only tasks owned by the current sender."""
     tool = FutureTaskTool()
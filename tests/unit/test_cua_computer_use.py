@@ -175,7 +175,6 @@ def _agent_computer_use_items():
     return CONFIG_METADATA_3["ai_group"]["metadata"]["agent_computer_use"]["items"]
 
 
-@pytest.mark.asyncio
 async def test_get_booter_creates_cua_booter(monkeypatch):
     from astrbot.core.computer import computer_client
 
@@ -284,7 +283,6 @@ def test_cua_default_config_matches_booter_defaults():
     assert sandbox_defaults["cua_api_key"] == CUA_DEFAULT_CONFIG["api_key"]
 
 
-@pytest.mark.asyncio
 async def test_cua_config_log_does_not_include_api_key(monkeypatch):
     from astrbot.core.computer import computer_client
 
@@ -332,7 +330,6 @@ async def test_cua_config_log_does_not_include_api_key(monkeypatch):
     assert all("api_key" not in message for message in log_messages)
 
 
-@pytest.mark.asyncio
 async def test_get_booter_shuts_down_client_when_skill_sync_fails(monkeypatch):
     from astrbot.core.computer import computer_client
 
@@ -376,7 +373,6 @@ async def test_get_booter_shuts_down_client_when_skill_sync_fails(monkeypatch):
     assert "cua-sync-fail" not in computer_client.session_booter
 
 
-@pytest.mark.asyncio
 async def test_cua_idle_timeout_shuts_down_session_proactively(monkeypatch):
     from astrbot.core.computer import computer_client
 
@@ -424,7 +420,6 @@ async def test_cua_idle_timeout_shuts_down_session_proactively(monkeypatch):
     assert "cua-idle-expire" not in computer_client.session_booter
 
 
-@pytest.mark.asyncio
 async def test_cua_idle_timeout_refreshes_on_reuse(monkeypatch):
     from astrbot.core.computer import computer_client
 
@@ -479,7 +474,6 @@ async def test_cua_idle_timeout_refreshes_on_reuse(monkeypatch):
     assert "cua-idle-refresh" not in computer_client.session_booter
 
 
-@pytest.mark.asyncio
 async def test_cua_idle_timeout_zero_disables_proactive_shutdown(monkeypatch):
     from astrbot.core.computer import computer_client
 
@@ -528,7 +522,6 @@ async def test_cua_idle_timeout_zero_disables_proactive_shutdown(monkeypatch):
     assert "cua-idle-disabled" not in computer_client.cua_idle_state
 
 
-@pytest.mark.asyncio
 async def test_non_cua_booter_does_not_schedule_idle_cleanup(monkeypatch):
     from astrbot.core.computer import computer_client
 
@@ -559,7 +552,6 @@ async def test_non_cua_booter_does_not_schedule_idle_cleanup(monkeypatch):
     assert "shipyard-session" not in computer_client.cua_idle_state
 
 
-@pytest.mark.asyncio
 async def test_cua_components_map_sdk_results(tmp_path):
     from astrbot.core.computer.booters.cua import (
         CuaFileSystemComponent,
@@ -595,7 +587,6 @@ async def test_cua_components_map_sdk_results(tmp_path):
     assert sandbox.keyboard.pressed == ["Enter"]
 
 
-@pytest.mark.asyncio
 async def test_cua_list_dir_returns_entries_list_for_shell_fallback():
     from astrbot.core.computer.booters.cua import CuaFileSystemComponent
 
@@ -609,7 +600,6 @@ async def test_cua_list_dir_returns_entries_list_for_shell_fallback():
     assert sandbox.shell.commands[0][0] == "ls -1 ."
 
 
-@pytest.mark.asyncio
 async def test_cua_shell_filesystem_fallback_shell_quotes_paths():
     from astrbot.core.computer.booters.cua import CuaFileSystemComponent
 
@@ -627,7 +617,6 @@ async def test_cua_shell_filesystem_fallback_shell_quotes_paths():
     assert sandbox.shell.commands[2][0] == f"ls -1 {shlex.quote(path)}"
 
 
-@pytest.mark.asyncio
 async def test_cua_write_file_shell_fallback_uses_python_base64_decoder():
     from astrbot.core.computer.booters.cua import CuaFileSystemComponent
 
@@ -641,7 +630,6 @@ async def test_cua_write_file_shell_fallback_uses_python_base64_decoder():
     assert "base64 -d" not in command
 
 
-@pytest.mark.asyncio
 async def test_cua_write_file_shell_fallback_creates_parent_directory():
     from astrbot.core.computer.booters.cua import CuaFileSystemComponent
 
@@ -654,7 +642,6 @@ async def test_cua_write_file_shell_fallback_creates_parent_directory():
     assert "path.parent.mkdir(parents=True, exist_ok=True)" in command
 
 
-@pytest.mark.asyncio
 async def test_cua_write_file_shell_fallback_chunks_large_payloads():
     from astrbot.core.computer.booters.cua import CuaFileSystemComponent
 
@@ -670,7 +657,6 @@ async def test_cua_write_file_shell_fallback_chunks_large_payloads():
     assert max(len(line) for line in lines) <= 60_000
 
 
-@pytest.mark.asyncio
 async def test_cua_create_file_reports_mode_as_informational():
     from astrbot.core.computer.booters.cua import CuaFileSystemComponent
 
@@ -683,7 +669,6 @@ async def test_cua_create_file_reports_mode_as_informational():
     assert result["mode_applied"] is False
 
 
-@pytest.mark.asyncio
 async def test_cua_write_file_shell_fallback_propagates_shell_failure():
     from astrbot.core.computer.booters.cua import CuaFileSystemComponent
 
@@ -699,7 +684,6 @@ async def test_cua_write_file_shell_fallback_propagates_shell_failure():
     assert result["path"] == "hello.txt"
 
 
-@pytest.mark.asyncio
 async def test_cua_edit_file_propagates_write_failure():
     from astrbot.core.computer.booters.cua import CuaFileSystemComponent
 
@@ -729,7 +713,6 @@ async def test_cua_edit_file_propagates_write_failure():
     assert result["path"] == "hello.txt"
 
 
-@pytest.mark.asyncio
 async def test_cua_list_dir_shell_fallback_returns_filename_only_entries():
     from astrbot.core.computer.booters.cua import CuaFileSystemComponent
 
@@ -743,7 +726,6 @@ async def test_cua_list_dir_shell_fallback_returns_filename_only_entries():
     assert sandbox.shell.commands[0][0] == "ls -1A ."
 
 
-@pytest.mark.asyncio
 async def test_cua_shell_filesystem_fallback_rejects_non_posix_os_type():
     from astrbot.core.computer.booters.cua import CuaFileSystemComponent
 
@@ -763,7 +745,6 @@ async def test_cua_shell_filesystem_fallback_rejects_non_posix_os_type():
     assert sandbox.shell.commands == []
 
 
-@pytest.mark.asyncio
 async def test_cua_shell_and_python_accept_sync_sdk_methods():
     from astrbot.core.computer.booters.cua import CuaPythonComponent, CuaShellComponent
 
@@ -778,7 +759,6 @@ async def test_cua_shell_and_python_accept_sync_sdk_methods():
     assert python_result["data"]["output"]["text"] == "sync"
 
 
-@pytest.mark.asyncio
 async def test_cua_filesystem_prefers_native_files_interface():
     from astrbot.core.computer.booters.cua import CuaFileSystemComponent
 
@@ -795,7 +775,6 @@ async def test_cua_filesystem_prefers_native_files_interface():
     assert sandbox.shell.commands == []
 
 
-@pytest.mark.asyncio
 async def test_cua_filesystem_uses_legacy_filesystem_when_files_lacks_method():
     from astrbot.core.computer.booters.cua import CuaFileSystemComponent
 
@@ -813,7 +792,6 @@ async def test_cua_filesystem_uses_legacy_filesystem_when_files_lacks_method():
     assert sandbox.shell.commands == []
 
 
-@pytest.mark.asyncio
 async def test_cua_shell_normalizes_output_returncode_shape():
     from astrbot.core.computer.booters.cua import CuaShellComponent
 
@@ -830,7 +808,6 @@ async def test_cua_shell_normalizes_output_returncode_shape():
     }
 
 
-@pytest.mark.asyncio
 async def test_cua_shell_normalizes_command_result_object_shape():
     from astrbot.core.computer.booters.cua import CuaShellComponent
 
@@ -847,7 +824,6 @@ async def test_cua_shell_normalizes_command_result_object_shape():
     }
 
 
-@pytest.mark.asyncio
 async def test_cua_shell_prefers_returncode_when_exit_code_is_none():
     from astrbot.core.computer.booters.cua import CuaShellComponent
 
@@ -869,7 +845,6 @@ async def test_cua_shell_prefers_returncode_when_exit_code_is_none():
     assert result["success"] is False
 
 
-@pytest.mark.asyncio
 async def test_cua_python_fallback_preserves_shell_command_result_stdout():
     from astrbot.core.computer.booters.cua import CuaPythonComponent
 
@@ -884,7 +859,6 @@ async def test_cua_python_fallback_preserves_shell_command_result_stdout():
     assert result["data"]["output"]["text"] == "from python fallback\n"
 
 
-@pytest.mark.asyncio
 async def test_cua_shell_background_wrapper_detaches_via_python_subprocess():
     from astrbot.core.computer.booters.cua import CuaShellComponent
 
@@ -906,7 +880,6 @@ async def test_cua_shell_background_wrapper_detaches_via_python_subprocess():
     assert "&" not in command
 
 
-@pytest.mark.asyncio
 async def test_cua_shell_background_rejects_non_posix_os_type():
     from astrbot.core.computer.booters.cua import CuaShellComponent
 
@@ -925,7 +898,6 @@ async def test_cua_shell_background_rejects_non_posix_os_type():
     assert sandbox.shell.commands == []
 
 
-@pytest.mark.asyncio
 async def test_cua_upload_file_fallback_rejects_non_posix_os_type(tmp_path):
     from astrbot.core.computer.booters.cua import (
         CuaBooter,
@@ -955,7 +927,6 @@ async def test_cua_upload_file_fallback_rejects_non_posix_os_type(tmp_path):
     assert sandbox.shell.commands == []
 
 
-@pytest.mark.asyncio
 async def test_cua_upload_file_prefers_native_files_upload(tmp_path):
     from astrbot.core.computer.booters.cua import (
         CuaBooter,
@@ -986,7 +957,6 @@ async def test_cua_upload_file_prefers_native_files_upload(tmp_path):
     assert sandbox.shell.commands == []
 
 
-@pytest.mark.asyncio
 async def test_cua_upload_file_uses_native_write_bytes_when_upload_missing(tmp_path):
     from astrbot.core.computer.booters.cua import (
         CuaBooter,
@@ -1025,7 +995,6 @@ async def test_cua_upload_file_uses_native_write_bytes_when_upload_missing(tmp_p
     assert sandbox.shell.commands == []
 
 
-@pytest.mark.asyncio
 async def test_cua_upload_file_propagates_native_upload_failure_result(tmp_path):
     from astrbot.core.computer.booters.cua import (
         CuaBooter,
@@ -1060,7 +1029,6 @@ async def test_cua_upload_file_propagates_native_upload_failure_result(tmp_path)
     assert result["error"] == "disk full"
 
 
-@pytest.mark.asyncio
 async def test_cua_download_file_shell_quotes_remote_path(tmp_path):
     from astrbot.core.computer.booters.cua import (
         CuaBooter,
@@ -1100,7 +1068,6 @@ async def test_cua_download_file_shell_quotes_remote_path(tmp_path):
     assert local_path.read_bytes() == b"hello"
 
 
-@pytest.mark.asyncio
 async def test_cua_download_file_fallback_rejects_non_posix_os_type(tmp_path):
     from astrbot.core.computer.booters.cua import (
         CuaBooter,
@@ -1128,7 +1095,6 @@ async def test_cua_download_file_fallback_rejects_non_posix_os_type(tmp_path):
     assert sandbox.shell.commands == []
 
 
-@pytest.mark.asyncio
 async def test_cua_boot_cleans_up_sandbox_when_component_setup_fails(monkeypatch):
     from astrbot.core.computer.booters import cua as cua_booter
 
@@ -1179,7 +1145,6 @@ async def test_cua_boot_cleans_up_sandbox_when_component_setup_fails(monkeypatch
     assert booter._runtime is None
 
 
-@pytest.mark.asyncio
 async def test_cua_shell_background_reports_missing_python3_requirement():
     from astrbot.core.computer.booters.cua import CuaShellComponent
 
@@ -1193,7 +1158,6 @@ async def test_cua_shell_background_reports_missing_python3_requirement():
     assert "python3: command not found" in result["stderr"]
 
 
-@pytest.mark.asyncio
 async def test_cua_python_fallback_reports_missing_python3_requirement():
     from astrbot.core.computer.booters.cua import CuaPythonComponent
 
@@ -1208,7 +1172,6 @@ async def test_cua_python_fallback_reports_missing_python3_requirement():
     assert "python3: command not found" in result["error"]
 
 
-@pytest.mark.asyncio
 async def test_cua_gui_reports_missing_mouse_or_keyboard():
     from astrbot.core.computer.booters.cua import CuaGUIComponent
 
@@ -1228,7 +1191,6 @@ async def test_cua_gui_reports_missing_mouse_or_keyboard():
         await gui.press_key("Enter")
 
 
-@pytest.mark.asyncio
 async def test_cua_gui_press_error_lists_probed_methods():
     from astrbot.core.computer.booters.cua import CuaGUIComponent
 
@@ -1246,7 +1208,6 @@ async def test_cua_gui_press_error_lists_probed_methods():
     assert "keyboard.press_key" in message
 
 
-@pytest.mark.asyncio
 async def test_cua_gui_caches_component_methods_after_initialization():
     from astrbot.core.computer.booters.cua import CuaGUIComponent
 
@@ -1323,7 +1284,6 @@ def test_cua_capabilities_reflect_initialized_sandbox_gui_devices():
     assert booter.capabilities == ("python", "shell", "filesystem", "gui", "screenshot")
 
 
-@pytest.mark.asyncio
 async def test_cua_shutdown_clears_cached_components():
     from astrbot.core.computer.booters.cua import (
         CuaBooter,
@@ -1357,7 +1317,6 @@ async def test_cua_shutdown_clears_cached_components():
     assert booter._runtime is None
 
 
-@pytest.mark.asyncio
 async def test_cua_available_checks_shell_health():
     from astrbot.core.computer.booters.cua import (
         CuaBooter,
@@ -1389,7 +1348,6 @@ async def test_cua_available_checks_shell_health():
     assert sandbox.shell.commands[-1][0] == "echo _astrbot_cua_ok_"
 
 
-@pytest.mark.asyncio
 async def test_cua_available_rejects_unknown_health_exit_code():
     from astrbot.core.computer.booters.cua import (
         CuaBooter,
@@ -1417,7 +1375,6 @@ async def test_cua_available_rejects_unknown_health_exit_code():
     assert await booter.available() is False
 
 
-@pytest.mark.asyncio
 async def test_cua_available_returns_false_when_shell_health_fails():
     from astrbot.core.computer.booters.cua import (
         CuaBooter,
@@ -1447,7 +1404,6 @@ async def test_cua_available_returns_false_when_shell_health_fails():
     assert await booter.available() is False
 
 
-@pytest.mark.asyncio
 async def test_cua_available_propagates_cancellation():
     from astrbot.core.computer.booters.cua import (
         CuaBooter,
@@ -1478,7 +1434,6 @@ async def test_cua_available_propagates_cancellation():
         await booter.available()
 
 
-@pytest.mark.asyncio
 async def test_cua_available_allows_shell_health_warning_on_stderr():
     from astrbot.core.computer.booters.cua import (
         CuaBooter,
@@ -1584,7 +1539,6 @@ _PNG_BYTES = base64.b64decode(
 )
 
 
-@pytest.mark.asyncio
 async def test_screenshot_tool_returns_image_and_sends_file(monkeypatch, tmp_path):
     from astrbot.core.tools.computer_tools import cua as cua_tools
     from astrbot.core.tools.computer_tools.cua import CuaScreenshotTool
@@ -1653,7 +1607,6 @@ async def test_screenshot_tool_returns_image_and_sends_file(monkeypatch, tmp_pat
         "base64_dict",
     ],
 )
-@pytest.mark.asyncio
 async def test_screenshot_tool_normalizes_supported_screenshot_shapes(
     monkeypatch,
     tmp_path,
@@ -1727,7 +1680,6 @@ async def test_screenshot_tool_normalizes_supported_screenshot_shapes(
     assert sent_messages
 
 
-@pytest.mark.asyncio
 async def test_screenshot_tool_can_opt_in_to_llm_image_content(monkeypatch, tmp_path):
     from astrbot.core.tools.computer_tools import cua as cua_tools
     from astrbot.core.tools.computer_tools.cua import CuaScreenshotTool
@@ -1778,7 +1730,6 @@ async def test_screenshot_tool_can_opt_in_to_llm_image_content(monkeypatch, tmp_
     assert "base64" not in payload
 
 
-@pytest.mark.asyncio
 async def test_screenshot_tool_can_opt_out_of_llm_image_content(monkeypatch, tmp_path):
     from astrbot.core.tools.computer_tools import cua as cua_tools
     from astrbot.core.tools.computer_tools.cua import CuaScreenshotTool
@@ -1829,7 +1780,6 @@ async def test_screenshot_tool_can_opt_out_of_llm_image_content(monkeypatch, tmp
     assert "base64" not in payload
 
 
-@pytest.mark.asyncio
 async def test_cua_tools_return_permission_error_without_gui_lookup(monkeypatch):
     from astrbot.core.tools.computer_tools import cua as cua_tools
     from astrbot.core.tools.computer_tools.cua import (
@@ -1866,7 +1816,6 @@ async def test_cua_tools_return_permission_error_without_gui_lookup(monkeypatch)
     assert sent_messages == []
 
 
-@pytest.mark.asyncio
 async def test_cua_tools_include_exception_type_for_blank_error(monkeypatch):
     from astrbot.core.tools.computer_tools import cua as cua_tools
     from astrbot.core.tools.computer_tools.cua import CuaMouseClickTool
@@ -1898,7 +1847,6 @@ async def test_cua_tools_include_exception_type_for_blank_error(monkeypatch):
     )
 
 
-@pytest.mark.asyncio
 async def test_cua_mouse_click_tool_happy_path_forwards_args_and_serializes_json(
     monkeypatch,
 ):
@@ -1949,7 +1897,6 @@ async def test_cua_mouse_click_tool_happy_path_forwards_args_and_serializes_json
     }
 
 
-@pytest.mark.asyncio
 async def test_cua_keyboard_type_tool_happy_path_forwards_args_and_serializes_json(
     monkeypatch,
 ):
@@ -1,11 +1,8 @@
 import sqlite3
 
-import pytest
-
 from astrbot.core.db.vec_db.faiss_impl.document_storage import DocumentStorage
 
 
-@pytest.mark.asyncio
 async def test_document_storage_fts_insert_search_and_delete(tmp_path):
     storage = DocumentStorage(str(tmp_path / "doc.db"))
     await storage.initialize()
@@ -34,7 +31,6 @@ async def test_document_storage_fts_insert_search_and_delete(tmp_path):
     await storage.close()
 
 
-@pytest.mark.asyncio
 async def test_document_storage_fts_rebuilds_existing_documents(tmp_path):
     storage = DocumentStorage(str(tmp_path / "doc.db"))
     await storage.initialize()
@@ -57,7 +53,6 @@ async def test_document_storage_fts_rebuilds_existing_documents(tmp_path):
     await storage.close()
 
 
-@pytest.mark.asyncio
 async def test_document_storage_fts_delete_skips_missing_fts_row(tmp_path):
     storage = DocumentStorage(str(tmp_path / "doc.db"))
     await storage.initialize()
@@ -77,7 +72,6 @@ async def test_document_storage_fts_delete_skips_missing_fts_row(tmp_path):
     await storage.close()
 
 
-@pytest.mark.asyncio
 async def test_document_storage_fts_recovers_from_legacy_non_fts_table(tmp_path):
     db_path = tmp_path / "doc.db"
     conn = sqlite3.connect(db_path)
@@ -2,13 +2,73 @@
 
 import asyncio
 from contextlib import suppress
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from astrbot.core import event_bus as event_bus_module
 from astrbot.core.event_bus import EventBus
 
 
+def make_event(
+    origin="test-platform:group:123",
+    *,
+    platform_id="test-platform",
+    platform_name="Test Platform",
+    sender_name="TestUser",
+    sender_id="user123",
+    outline="Hello",
+):
+    """Build a lightweight stand-in for an AstrMessageEvent."""
+    return SimpleNamespace(
+        unified_msg_origin=origin,
+        get_platform_id=lambda: platform_id,
+        get_platform_name=lambda: platform_name,
+        get_sender_name=lambda: sender_name,
+        get_sender_id=lambda: sender_id,
+        get_message_outline=lambda: outline,
+    )
+
+
+class AsyncCounter:
+    """Async stand-in for ``PipelineScheduler.execute`` that records events."""
+
+    def __init__(self, expected: int = 1, error: Exception | None = None) -> None:
+        self.calls = []
+        self.done = asyncio.Event()
+        self._expected = expected
+        self._error = error
+
+    async def __call__(self, event) -> None:
+        self.calls.append(event)
+        if len(self.calls) >= self._expected:
+            self.done.set()
+        if self._error is not None:
+            raise self._error
+
+
+class PrefixConfigManager:
+    """Config manager stub routing origins by the first matching prefix."""
+
+    def __init__(self, routes: list[tuple[str, str]]) -> None:
+        self._routes = routes
+        self.lookups: list[tuple[str, str]] = []
+
+    def get_conf_info(self, umo: str) -> dict:
+        conf_id = next(conf for prefix, conf in self._routes if umo.startswith(prefix))
+        self.lookups.append((umo, conf_id))
+        return {"id": conf_id, "name": conf_id}
+
+
+async def run_dispatch_once(event_bus, n=1):
+    """Dispatch ``n`` queued events and wait for their pipeline tasks."""
+    for _ in range(n):
+        event_bus._dispatch_event(await event_bus.event_queue.get())
+    if event_bus._pending_tasks:
+        await asyncio.wait(set(event_bus._pending_tasks))
+
+
 @pytest.fixture
 def event_queue():
     """Create an event queue."""
@@ -16,23 +76,56 @@ def event_queue():
 
 
 @pytest.fixture
-def mock_pipeline_scheduler():
-    """Create a mock pipeline scheduler."""
+def captured_log(monkeypatch):
+    """Replace the event bus logger with a mock for the test."""
+    recorder = MagicMock()
+    monkeypatch.setattr(event_bus_module, "logger", recorder)
+    return recorder
+
+
+@pytest.fixture(scope="module")
+def _pipeline_scheduler_template():
     scheduler = MagicMock()
     scheduler.execute = AsyncMock()
     return scheduler
 
 
-@pytest.fixture
-def mock_config_manager():
-    """Create a mock config manager."""
+@pytest.fixture(scope="module")
+def _config_manager_template():
     config_mgr = MagicMock()
-    config_mgr.get_conf_info = MagicMock(
-        return_value={"id": "test-conf-id", "name": "Test Config"}
-    )
+    config_mgr.get_conf_info = MagicMock()
     return config_mgr
 
 
+@pytest.fixture
+def mock_pipeline_scheduler(_pipeline_scheduler_template):
+    """Create a mock pipeline scheduler."""
+    _pipeline_scheduler_template.reset_mock()
+    _pipeline_scheduler_template.execute.side_effect = None
+    return _pipeline_scheduler_template
+
+
+@pytest.fixture
+def mock_config_manager(_config_manager_template):
+    """Create a mock config manager."""
+    _config_manager_template.reset_mock()
+    _config_manager_template.get_conf_info.side_effect = None
+    _config_manager_template.get_conf_info.return_value = {
+        "id": "test-conf-id",
+        "name": "Test Config",
+    }
+    return _config_manager_template
+
+
+@pytest.fixture
+def scheduler_mapping():
+    """Create two pipeline scheduler stubs keyed by config id."""
+    return {
+        conf_id: SimpleNamespace(execute=AsyncCounter())
+        for conf_id in ("conf-id-1", "conf-id-2")
+    }
+
+
 @pytest.fixture
 def event_bus(event_queue, mock_pipeline_scheduler, mock_config_manager):
     """Create an EventBus instance."""
@@ -62,38 +155,17 @@ class TestEventBusInit:
 class TestEventBusDispatch:
     """Tests for EventBus dispatch method."""
 
-    @pytest.mark.asyncio
     async def test_dispatch_processes_event(
         self, event_bus, event_queue, mock_pipeline_scheduler, mock_config_manager
     ):
         """Test that dispatch processes an event from the queue."""
-        processed = asyncio.Event()
-
-        async def execute_and_signal(event):  # noqa: ARG001
-            processed.set()
-
-        mock_pipeline_scheduler.execute.side_effect = execute_and_signal
-
         # Create a mock event
-        mock_event = MagicMock()
-        mock_event.unified_msg_origin = "test-platform:group:123"
-        mock_event.get_platform_id.return_value = "test-platform"
-        mock_event.get_platform_name.return_value = "Test Platform"
-        mock_event.get_sender_name.return_value = "TestUser"
-        mock_event.get_sender_id.return_value = "user123"
-        mock_event.get_message_outline.return_value = "Hello"
+        mock_event = make_event()
 
         # Put event in queue
-        await event_queue.put(mock_event)
+        event_queue.put_nowait(mock_event)
 
-        # Start dispatch in background and cancel after processing
-        task = asyncio.create_task(event_bus.dispatch())
-        try:
-            await asyncio.wait_for(processed.wait(), timeout=1.0)
-        finally:
-            task.cancel()
-            with suppress(asyncio.CancelledError):
-                await task
+        await run_dispatch_once(event_bus)
 
         # Verify scheduler was called
         mock_pipeline_scheduler.execute.assert_called_once_with(mock_event)
@@ -101,194 +173,141 @@ class TestEventBusDispatch:
             "test-platform:group:123"
         )
 
-    @pytest.mark.asyncio
     async def test_dispatch_handles_missing_scheduler(
         self,
         event_bus,
         event_queue,
         mock_config_manager,
         mock_pipeline_scheduler,
+        captured_log,
     ):
         """Test that dispatch handles missing scheduler gracefully."""
-        logged = asyncio.Event()
-
-        def error_and_signal(*args, **kwargs):  # noqa: ARG001
-            logged.set()
-
         # Configure to return a config ID that has no scheduler
         mock_config_manager.get_conf_info.return_value = {
             "id": "missing-scheduler",
             "name": "Missing Config",
         }
 
-        mock_event = MagicMock()
-        mock_event.unified_msg_origin = "test-platform:group:123"
-        mock_event.get_platform_id.return_value = "test-platform"
-        mock_event.get_platform_name.return_value = "Test Platform"
-        mock_event.get_sender_name.return_value = None
-        mock_event.get_sender_id.return_value = "user123"
-        mock_event.get_message_outline.return_value = "Hello"
-
-        await event_queue.put(mock_event)
-
-        with patch("astrbot.core.event_bus.logger") as mock_logger:
-            mock_logger.error.side_effect = error_and_signal
-            task = asyncio.create_task(event_bus.dispatch())
-            try:
-                await asyncio.wait_for(logged.wait(), timeout=1.0)
-            finally:
-                task.cancel()
-                with suppress(asyncio.CancelledError):
-                    await task
-
-            mock_logger.error.assert_called_once()
-            assert "missing-scheduler" in mock_logger.error.call_args[0][0]
+        mock_event = make_event(sender_name=None)
+
+        event_queue.put_nowait(mock_event)
+
+        await run_dispatch_once(event_bus)
+
+        captured_log.error.assert_called_once()
+        assert "missing-scheduler" in captured_log.error.call_args[0][0]
 
         mock_pipeline_scheduler.execute.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_dispatch_multiple_events(
-        self, event_bus, event_queue, mock_pipeline_scheduler, mock_config_manager
-    ):
+    async def test_dispatch_multiple_events(self, event_bus, event_queue):
         """Test that dispatch processes multiple events."""
-        processed_all = asyncio.Event()
-        processed_count = 0
-
-        async def execute_and_count(event):  # noqa: ARG001
-            nonlocal processed_count
-            processed_count += 1
-            if processed_count == 3:
-                processed_all.set()
-
-        mock_pipeline_scheduler.execute.side_effect = execute_and_count
-
-        events = []
-        for i in range(3):
-            mock_event = MagicMock()
-            mock_event.unified_msg_origin = f"test-platform:group:{i}"
-            mock_event.get_platform_id.return_value = "test-platform"
-            mock_event.get_platform_name.return_value = "Test Platform"
-            mock_event.get_sender_name.return_value = f"User{i}"
-            mock_event.get_sender_id.return_value = f"user{i}"
-            mock_event.get_message_outline.return_value = f"Message {i}"
-            events.append(mock_event)
-            await event_queue.put(mock_event)
+        execute = AsyncCounter(expected=3)
+        event_bus.pipeline_scheduler_mapping["test-conf-id"] = SimpleNamespace(
+            execute=execute
+        )
+
+        events = [
+            make_event(
+                f"test-platform:group:{i}",
+                sender_name=f"User{i}",
+                sender_id=f"user{i}",
+                outline=f"Message {i}",
+            )
+            for i in range(3)
+        ]
+        for event in events:
+            event_queue.put_nowait(event)
 
         task = asyncio.create_task(event_bus.dispatch())
         try:
-            await asyncio.wait_for(processed_all.wait(), timeout=1.0)
+            await asyncio.wait_for(execute.done.wait(), timeout=1.0)
         finally:
             task.cancel()
             with suppress(asyncio.CancelledError):
                 await task
 
-        assert mock_pipeline_scheduler.execute.call_count == 3
+        assert execute.calls == events
 
-    @pytest.mark.asyncio
     async def test_dispatch_falls_back_to_conf_id_when_name_missing(
         self,
         event_bus,
         event_queue,
         mock_config_manager,
         mock_pipeline_scheduler,
+        monkeypatch,
     ):
         """Test that missing conf name does not block dispatch."""
-        processed = asyncio.Event()
         mock_config_manager.get_conf_info.return_value = {
             "id": "test-conf-id",
         }
 
-        async def execute_and_signal(event):  # noqa: ARG001
-            processed.set()
-
-        mock_pipeline_scheduler.execute.side_effect = execute_and_signal
-
-        mock_event = MagicMock()
-        mock_event.unified_msg_origin = "test-platform:group:123"
-        mock_event.get_platform_id.return_value = "test-platform"
-        mock_event.get_platform_name.return_value = "Test Platform"
-        mock_event.get_sender_name.return_value = "TestUser"
-        mock_event.get_sender_id.return_value = "user123"
-        mock_event.get_message_outline.return_value = "Hello"
+        mock_event = make_event()
 
-        await event_queue.put(mock_event)
+        event_queue.put_nowait(mock_event)
+        printed = []
+        monkeypatch.setattr(
+            event_bus, "_print_event", lambda *args: printed.append(args)
+        )
 
-        with patch.object(event_bus, "_print_event") as mock_print_event:
-            task = asyncio.create_task(event_bus.dispatch())
-            try:
-                await asyncio.wait_for(processed.wait(), timeout=1.0)
-            finally:
-                task.cancel()
-                with suppress(asyncio.CancelledError):
-                    await task
+        await run_dispatch_once(event_bus)
 
-        mock_print_event.assert_called_once_with(mock_event, "test-conf-id")
+        assert printed == [(mock_event, "test-conf-id")]
         mock_pipeline_scheduler.execute.assert_called_once_with(mock_event)
 
 
 class TestPrintEvent:
     """Tests for _print_event method."""
 
-    def test_print_event_with_sender_name(self, event_bus):
+    def test_print_event_with_sender_name(self, event_bus, captured_log):
         """Test printing event with sender name."""
-        mock_event = MagicMock()
-        mock_event.get_platform_id.return_value = "test-platform"
-        mock_event.get_platform_name.return_value = "Test Platform"
-        mock_event.get_sender_name.return_value = "TestUser"
-        mock_event.get_sender_id.return_value = "user123"
-        mock_event.get_message_outline.return_value = "Hello"
-
-        with patch("astrbot.core.event_bus.logger") as mock_logger:
-            event_bus._print_event(mock_event, "TestConfig")
-
-        mock_logger.info.assert_called_once()
-        call_args = mock_logger.info.call_args[0][0]
-        assert "TestConfig" in call_args
-        assert "TestUser" in call_args
-        assert "user123" in call_args
-        assert "Hello" in call_args
-
-    def test_print_event_without_sender_name(self, event_bus):
+        mock_event = make_event()
+
+        event_bus._print_event(mock_event, "TestConfig")
+
+        captured_log.info.assert_called_once()
+        _, *args = captured_log.info.call_args.args
+        assert args == [
+            "TestConfig",
+            "test-platform",
+            "Test Platform",
+            "TestUser",
+            "user123",
+            "Hello",
+        ]
+
+    def test_print_event_without_sender_name(self, event_bus, captured_log):
         """Test printing event without sender name."""
-        mock_event = MagicMock()
-        mock_event.get_platform_id.return_value = "test-platform"
-        mock_event.get_platform_name.return_value = "Test Platform"
-        mock_event.get_sender_name.return_value = None
-        mock_event.get_sender_id.return_value = "user123"
-        mock_event.get_message_outline.return_value = "Hello"
-
-        with patch("astrbot.core.event_bus.logger") as mock_logger:
-            event_bus._print_event(mock_event, "TestConfig")
-
-        mock_logger.info.assert_called_once()
-        call_args = mock_logger.info.call_args[0][0]
-        assert "TestConfig" in call_args
-        assert "user123" in call_args
-        assert "Hello" in call_args
+        mock_event = make_event(sender_name=None)
+
+        event_bus._print_event(mock_event, "TestConfig")
+
+        captured_log.info.assert_called_once()
+        fmt, *args = captured_log.info.call_args.args
+        assert args == [
+            "TestConfig",
+            "test-platform",
+            "Test Platform",
+            "user123",
+            "Hello",
+        ]
         # Should not have sender name separator
-        assert "/" not in call_args
+        assert "/" not in fmt
 
 
 class TestEventSubscription:
     """Tests for event subscription functionality."""
 
-    @pytest.mark.asyncio
-    async def test_subscriber_registration(self, event_queue, mock_config_manager):
+    def test_subscriber_registration(
+        self, event_queue, mock_config_manager, scheduler_mapping
+    ):
         """Test registering a subscriber (scheduler) to the event bus."""
-        # Create multiple schedulers as subscribers
-        scheduler1 = MagicMock()
-        scheduler1.execute = AsyncMock()
-        scheduler2 = MagicMock()
-        scheduler2.execute = AsyncMock()
+        scheduler1 = scheduler_mapping["conf-id-1"]
+        scheduler2 = scheduler_mapping["conf-id-2"]
 
         # Create EventBus with multiple subscribers
-        pipeline_mapping = {
-            "conf-id-1": scheduler1,
-            "conf-id-2": scheduler2,
-        }
         event_bus = EventBus(
             event_queue=event_queue,
-            pipeline_scheduler_mapping=pipeline_mapping,
+            pipeline_scheduler_mapping=scheduler_mapping,
             astrbot_config_mgr=mock_config_manager,
         )
 
@@ -298,404 +317,179 @@ class TestEventSubscription:
         assert event_bus.pipeline_scheduler_mapping["conf-id-1"] == scheduler1
         assert event_bus.pipeline_scheduler_mapping["conf-id-2"] == scheduler2
 
-    @pytest.mark.asyncio
     async def test_multiple_subscribers_receive_events(
-        self, event_queue, mock_config_manager
+        self, event_queue, mock_config_manager, scheduler_mapping
     ):
         """Test that events are dispatched to the correct subscriber based on config."""
-        processed = asyncio.Event()
-        call_tracker = {"scheduler1": False, "scheduler2": False}
         mock_config_manager.get_conf_info.return_value = {
             "id": "conf-id-1",
             "name": "Test Config",
         }
 
-        scheduler1 = MagicMock()
-        scheduler1.execute = AsyncMock()
-
-        async def execute_scheduler1(event):  # noqa: ARG001
-            call_tracker["scheduler1"] = True
-            processed.set()
+        scheduler1 = scheduler_mapping["conf-id-1"]
+        scheduler2 = scheduler_mapping["conf-id-2"]
 
-        scheduler1.execute.side_effect = execute_scheduler1
-
-        scheduler2 = MagicMock()
-        scheduler2.execute = AsyncMock()
-
-        async def execute_scheduler2(event):  # noqa: ARG001
-            call_tracker["scheduler2"] = True
-
-        scheduler2.execute.side_effect = execute_scheduler2
-
-        pipeline_mapping = {
-            "conf-id-1": scheduler1,
-            "conf-id-2": scheduler2,
-        }
         event_bus = EventBus(
             event_queue=event_queue,
-            pipeline_scheduler_mapping=pipeline_mapping,
+            pipeline_scheduler_mapping=scheduler_mapping,
             astrbot_config_mgr=mock_config_manager,
         )
 
-        mock_event = MagicMock()
-        mock_event.unified_msg_origin = "platform:group:123"
-        mock_event.get_platform_id.return_value = "platform"
-        mock_event.get_platform_name.return_value = "Platform"
-        mock_event.get_sender_name.return_value = "User"
-        mock_event.get_sender_id.return_value = "user1"
-        mock_event.get_message_outline.return_value = "Test"
+        mock_event = make_event(
+            "platform:group:123",
+            platform_id="platform",
+            platform_name="Platform",
+            sender_name="User",
+            sender_id="user1",
+            outline="Test",
+        )
 
-        await event_queue.put(mock_event)
+        event_queue.put_nowait(mock_event)
 
-        task = asyncio.create_task(event_bus.dispatch())
-        try:
-            await asyncio.wait_for(processed.wait(), timeout=1.0)
-        finally:
-            task.cancel()
-            with suppress(asyncio.CancelledError):
-                await task
+        await run_dispatch_once(event_bus)
 
         # Only scheduler1 should have been called (based on mock_config_manager default)
-        assert call_tracker["scheduler1"] is True
-        assert call_tracker["scheduler2"] is False
+        assert scheduler1.execute.calls == [mock_event]
+        assert scheduler2.execute.calls == []
 
-    @pytest.mark.asyncio
-    async def test_unsubscribe_by_removing_scheduler(
-        self, event_queue, mock_config_manager
+    def test_unsubscribe_by_removing_scheduler(
+        self, event_queue, mock_config_manager, scheduler_mapping
     ):
         """Test that removing a scheduler effectively unsubscribes it."""
-        scheduler = MagicMock()
-        scheduler.execute = AsyncMock()
-
-        pipeline_mapping = {"conf-id": scheduler}
         event_bus = EventBus(
             event_queue=event_queue,
-            pipeline_scheduler_mapping=pipeline_mapping,
+            pipeline_scheduler_mapping=scheduler_mapping,
             astrbot_config_mgr=mock_config_manager,
         )
 
         # Verify scheduler is registered
-        assert "conf-id" in event_bus.pipeline_scheduler_mapping
+        assert "conf-id-1" in event_bus.pipeline_scheduler_mapping
 
         # Remove the scheduler (unsubscribe)
-        del event_bus.pipeline_scheduler_mapping["conf-id"]
+        del event_bus.pipeline_scheduler_mapping["conf-id-1"]
 
         # Verify scheduler is no longer registered
-        assert "conf-id" not in event_bus.pipeline_scheduler_mapping
+        assert "conf-id-1" not in event_bus.pipeline_scheduler_mapping
 
-    @pytest.mark.asyncio
     async def test_subscriber_exception_handling(
-        self, event_queue, mock_config_manager
+        self, event_queue, mock_config_manager, scheduler_mapping
     ):
         """Test that exceptions in subscriber execution don't crash the event bus."""
-        exception_raised = asyncio.Event()
-        second_event_processed = asyncio.Event()
         mock_config_manager.get_conf_info.return_value = {
             "id": "conf-id-1",
             "name": "Test Config",
         }
 
-        scheduler1 = MagicMock()
-        scheduler1.execute = AsyncMock()
-
-        async def execute_with_exception(event):  # noqa: ARG001
-            exception_raised.set()
-            raise RuntimeError("Subscriber error")
-
-        scheduler1.execute.side_effect = execute_with_exception
-
-        scheduler2 = MagicMock()
-        scheduler2.execute = AsyncMock()
-
-        async def execute_normal(event):  # noqa: ARG001
-            second_event_processed.set()
+        scheduler1 = scheduler_mapping["conf-id-1"]
+        scheduler1.execute = AsyncCounter(error=RuntimeError("Subscriber error"))
 
-        scheduler2.execute.side_effect = execute_normal
-
-        pipeline_mapping = {
-            "conf-id-1": scheduler1,
-            "conf-id-2": scheduler2,
-        }
         event_bus = EventBus(
             event_queue=event_queue,
-            pipeline_scheduler_mapping=pipeline_mapping,
+            pipeline_scheduler_mapping=scheduler_mapping,
             astrbot_config_mgr=mock_config_manager,
         )
 
         # First event will cause exception
-        mock_event1 = MagicMock()
-        mock_event1.unified_msg_origin = "platform:group:1"
-        mock_event1.get_platform_id.return_value = "platform"
-        mock_event1.get_platform_name.return_value = "Platform"
-        mock_event1.get_sender_name.return_value = "User"
-        mock_event1.get_sender_id.return_value = "user1"
-        mock_event1.get_message_outline.return_value = "Test"
+        mock_event1 = make_event(
+            "platform:group:1",
+            platform_id="platform",
+            platform_name="Platform",
+            sender_name="User",
+            sender_id="user1",
+            outline="Test",
+        )
 
-        await event_queue.put(mock_event1)
+        event_queue.put_nowait(mock_event1)
 
-        task = asyncio.create_task(event_bus.dispatch())
-        try:
-            await asyncio.wait_for(exception_raised.wait(), timeout=1.0)
-        finally:
-            task.cancel()
-            with suppress(asyncio.CancelledError):
-                await task
+        await run_dispatch_once(event_bus)
 
         # Verify the scheduler was called (exception occurred but didn't crash)
-        scheduler1.execute.assert_called_once()
+        assert scheduler1.execute.calls == [mock_event1]
+        assert not event_bus._pending_tasks
 
 
 class TestEventFiltering:
     """Tests for event filtering functionality."""
 
-    @pytest.mark.asyncio
-    async def test_filter_by_event_origin(self, event_queue):
-        """Test filtering events by their unified_msg_origin."""
-        scheduler1 = MagicMock()
-        scheduler1.execute = AsyncMock()
-        scheduler2 = MagicMock()
-        scheduler2.execute = AsyncMock()
-
-        config_mgr = MagicMock()
-
-        # Route different origins to different schedulers
-        def get_conf_info(origin):
-            if origin.startswith("telegram"):
-                return {"id": "telegram-conf", "name": "Telegram Config"}
-            elif origin.startswith("discord"):
-                return {"id": "discord-conf", "name": "Discord Config"}
-            return {"id": "default-conf", "name": "Default Config"}
-
-        config_mgr.get_conf_info = MagicMock(side_effect=get_conf_info)
-
-        pipeline_mapping = {
-            "telegram-conf": scheduler1,
-            "discord-conf": scheduler2,
-        }
-        event_bus = EventBus(
-            event_queue=event_queue,
-            pipeline_scheduler_mapping=pipeline_mapping,
-            astrbot_config_mgr=config_mgr,
-        )
-
-        processed = asyncio.Event()
-        scheduler1.execute.side_effect = lambda e: processed.set()  # noqa: ARG001
-
-        # Create Telegram event
-        mock_event = MagicMock()
-        mock_event.unified_msg_origin = "telegram:private:123"
-        mock_event.get_platform_id.return_value = "telegram"
-        mock_event.get_platform_name.return_value = "Telegram"
-        mock_event.get_sender_name.return_value = "TGUser"
-        mock_event.get_sender_id.return_value = "tg123"
-        mock_event.get_message_outline.return_value = "TG Message"
-
-        await event_queue.put(mock_event)
-
-        task = asyncio.create_task(event_bus.dispatch())
-        try:
-            await asyncio.wait_for(processed.wait(), timeout=1.0)
-        finally:
-            task.cancel()
-            with suppress(asyncio.CancelledError):
-                await task
-
-        # Only telegram scheduler should be called
-        scheduler1.execute.assert_called_once()
-        scheduler2.execute.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_filter_by_message_content_type(
-        self, event_queue, mock_config_manager
+    @pytest.mark.parametrize(
+        ("routes", "scheduler_ids", "origin", "expected"),
+        [
+            pytest.param(
+                [
+                    ("telegram", "telegram-conf"),
+                    ("discord", "discord-conf"),
+                    ("", "default-conf"),
+                ],
+                ["telegram-conf", "discord-conf"],
+                "telegram:private:123",
+                "telegram-conf",
+                id="by_event_origin",
+            ),
+            pytest.param(
+                [("", "test-conf-id")],
+                ["test-conf-id"],
+                "platform:group:456",
+                "test-conf-id",
+                id="by_message_content_type",
+            ),
+            pytest.param(
+                [
+                    ("telegram:group", "tg-group-conf"),
+                    ("telegram:private", "tg-private-conf"),
+                    ("discord", "discord-conf"),
+                    ("", "unknown"),
+                ],
+                ["tg-group-conf", "tg-private-conf", "discord-conf"],
+                "telegram:group:789",
+                "tg-group-conf",
+                id="combined_conditions",
+            ),
+            pytest.param(
+                [("", "nonexistent-conf")],
+                ["existing-conf"],
+                "unknown:platform:123",
+                None,
+                id="no_matching_filter",
+            ),
+            pytest.param(
+                [("", "some-conf")],
+                [],
+                "platform:group:123",
+                None,
+                id="empty_pipeline_mapping",
+            ),
+        ],
+    )
+    async def test_filter_routes_event(
+        self, event_queue, captured_log, routes, scheduler_ids, origin, expected
     ):
-        """Test filtering based on message content (e.g., group vs private)."""
-        processed = asyncio.Event()
-        scheduler = MagicMock()
-        scheduler.execute = AsyncMock()
-
-        async def execute_and_signal(event):  # noqa: ARG001
-            processed.set()
-
-        scheduler.execute.side_effect = execute_and_signal
-
-        pipeline_mapping = {"test-conf-id": scheduler}
-        event_bus = EventBus(
-            event_queue=event_queue,
-            pipeline_scheduler_mapping=pipeline_mapping,
-            astrbot_config_mgr=mock_config_manager,
-        )
-
-        # Create event with group message origin
-        mock_event = MagicMock()
-        mock_event.unified_msg_origin = "platform:group:456"
-        mock_event.get_platform_id.return_value = "platform"
-        mock_event.get_platform_name.return_value = "Platform"
-        mock_event.get_sender_name.return_value = "GroupUser"
-        mock_event.get_sender_id.return_value = "user456"
-        mock_event.get_message_outline.return_value = "Group message"
-
-        await event_queue.put(mock_event)
-
-        task = asyncio.create_task(event_bus.dispatch())
-        try:
-            await asyncio.wait_for(processed.wait(), timeout=1.0)
-        finally:
-            task.cancel()
-            with suppress(asyncio.CancelledError):
-                await task
-
-        # Verify config was queried with correct origin
-        mock_config_manager.get_conf_info.assert_called_once_with("platform:group:456")
-        scheduler.execute.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_combined_filter_conditions(self, event_queue):
-        """Test filtering with combined conditions (platform + message type)."""
-        scheduler_telegram_group = MagicMock()
-        scheduler_telegram_group.execute = AsyncMock()
-        scheduler_telegram_private = MagicMock()
-        scheduler_telegram_private.execute = AsyncMock()
-        scheduler_discord = MagicMock()
-        scheduler_discord.execute = AsyncMock()
-
-        config_mgr = MagicMock()
-
-        def get_conf_info(origin):
-            # Combined filtering based on platform and message type
-            if origin.startswith("telegram:group"):
-                return {"id": "tg-group-conf", "name": "Telegram Group"}
-            elif origin.startswith("telegram:private"):
-                return {"id": "tg-private-conf", "name": "Telegram Private"}
-            elif origin.startswith("discord"):
-                return {"id": "discord-conf", "name": "Discord"}
-            return {"id": "unknown", "name": "Unknown"}
-
-        config_mgr.get_conf_info = MagicMock(side_effect=get_conf_info)
-
-        pipeline_mapping = {
-            "tg-group-conf": scheduler_telegram_group,
-            "tg-private-conf": scheduler_telegram_private,
-            "discord-conf": scheduler_discord,
+        """Test events reach only the scheduler of their config, or are ignored.
+
+        ``routes`` maps origin prefixes to config ids, first match wins.
+        """
+        config_mgr = PrefixConfigManager(routes)
+        schedulers = {
+            scheduler_id: SimpleNamespace(execute=AsyncCounter())
+            for scheduler_id in scheduler_ids
         }
         event_bus = EventBus(
             event_queue=event_queue,
-            pipeline_scheduler_mapping=pipeline_mapping,
-            astrbot_config_mgr=config_mgr,
-        )
-
-        processed = asyncio.Event()
-        scheduler_telegram_group.execute.side_effect = lambda e: processed.set()  # noqa: ARG001
-
-        # Create Telegram group event
-        mock_event = MagicMock()
-        mock_event.unified_msg_origin = "telegram:group:789"
-        mock_event.get_platform_id.return_value = "telegram"
-        mock_event.get_platform_name.return_value = "Telegram"
-        mock_event.get_sender_name.return_value = "GroupUser"
-        mock_event.get_sender_id.return_value = "user789"
-        mock_event.get_message_outline.return_value = "Group msg"
-
-        await event_queue.put(mock_event)
-
-        task = asyncio.create_task(event_bus.dispatch())
-        try:
-            await asyncio.wait_for(processed.wait(), timeout=1.0)
-        finally:
-            task.cancel()
-            with suppress(asyncio.CancelledError):
-                await task
-
-        # Only telegram group scheduler should be called
-        scheduler_telegram_group.execute.assert_called_once()
-        scheduler_telegram_private.execute.assert_not_called()
-        scheduler_discord.execute.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_no_matching_filter_ignores_event(self, event_queue):
-        """Test that events with no matching filter are ignored."""
-        error_logged = asyncio.Event()
-
-        scheduler = MagicMock()
-        scheduler.execute = AsyncMock()
-
-        config_mgr = MagicMock()
-        # Return a config ID that doesn't exist in pipeline_mapping
-        config_mgr.get_conf_info.return_value = {
-            "id": "nonexistent-conf",
-            "name": "Nonexistent",
-        }
-
-        pipeline_mapping = {"existing-conf": scheduler}
-        event_bus = EventBus(
-            event_queue=event_queue,
-            pipeline_scheduler_mapping=pipeline_mapping,
-            astrbot_config_mgr=config_mgr,
-        )
-
-        mock_event = MagicMock()
-        mock_event.unified_msg_origin = "unknown:platform:123"
-        mock_event.get_platform_id.return_value = "unknown"
-        mock_event.get_platform_name.return_value = "Unknown"
-        mock_event.get_sender_name.return_value = "User"
-        mock_event.get_sender_id.return_value = "user123"
-        mock_event.get_message_outline.return_value = "Test"
-
-        await event_queue.put(mock_event)
-
-        with patch("astrbot.core.event_bus.logger") as mock_logger:
-            mock_logger.error.side_effect = lambda *args, **kwargs: error_logged.set()  # noqa: ARG001
-            task = asyncio.create_task(event_bus.dispatch())
-            try:
-                await asyncio.wait_for(error_logged.wait(), timeout=1.0)
-            finally:
-                task.cancel()
-                with suppress(asyncio.CancelledError):
-                    await task
-
-            # Verify error was logged
-            mock_logger.error.assert_called_once()
-            assert "nonexistent-conf" in mock_logger.error.call_args[0][0]
-
-        # Scheduler should not have been called
-        scheduler.execute.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_empty_pipeline_mapping_filters_all(self, event_queue):
-        """Test that empty pipeline mapping filters out all events."""
-        error_logged = asyncio.Event()
-
-        config_mgr = MagicMock()
-        config_mgr.get_conf_info.return_value = {
-            "id": "some-conf",
-            "name": "Some Config",
-        }
-
-        pipeline_mapping = {}  # Empty mapping
-        event_bus = EventBus(
-            event_queue=event_queue,
-            pipeline_scheduler_mapping=pipeline_mapping,
+            pipeline_scheduler_mapping=schedulers,
             astrbot_config_mgr=config_mgr,
         )
 
-        mock_event = MagicMock()
-        mock_event.unified_msg_origin = "platform:group:123"
-        mock_event.get_platform_id.return_value = "platform"
-        mock_event.get_platform_name.return_value = "Platform"
-        mock_event.get_sender_name.return_value = "User"
-        mock_event.get_sender_id.return_value = "user123"
-        mock_event.get_message_outline.return_value = "Test"
-
-        await event_queue.put(mock_event)
-
-        with patch("astrbot.core.event_bus.logger") as mock_logger:
-            mock_logger.error.side_effect = lambda *args, **kwargs: error_logged.set()  # noqa: ARG001
-            task = asyncio.create_task(event_bus.dispatch())
-            try:
-                await asyncio.wait_for(error_logged.wait(), timeout=1.0)
-            finally:
-                task.cancel()
-                with suppress(asyncio.CancelledError):
-                    await task
-
-            # Verify error was logged for missing scheduler
-            mock_logger.error.assert_called_once()
+        mock_event = make_event(origin)
+        event_queue.put_nowait(mock_event)
+
+        await run_dispatch_once(event_bus)
+
+        [(queried_origin, conf_id)] = config_mgr.lookups
+        assert queried_origin == origin
+        for scheduler_id, scheduler in schedulers.items():
+            expected_calls = [mock_event] if scheduler_id == expected else []
+            assert scheduler.execute.calls == expected_calls
+        if expected is None:
+            captured_log.error.assert_called_once()
+            assert conf_id in captured_log.error.call_args[0][0]
+        else:
+            captured_log.error.assert_not_called()
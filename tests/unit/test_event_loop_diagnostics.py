@@ -1,7 +1,5 @@
 import asyncio
 
-import pytest
-
 from astrbot.core.utils import event_loop_diagnostics as diagnostics
 
 
@@ -18,7 +16,6 @@ def test_load_event_loop_diagnostic_settings_defaults():
     assert settings.watchdog_log_max_bytes == diagnostics.DEFAULT_WATCHDOG_LOG_MAX_BYTES
 
 
-@pytest.mark.asyncio
 async def test_create_event_loop_diagnostic_tasks_defaults():
     """Default diagnostics should create both event loop diagnostic tasks."""
     tasks = diagnostics.create_event_loop_diagnostic_tasks()
@@ -34,7 +31,6 @@ async def test_create_event_loop_diagnostic_tasks_defaults():
         await asyncio.gather(*tasks, return_exceptions=True)
 
 
-@pytest.mark.asyncio
 async def test_faulthandler_watchdog_cancels_pending_dump(monkeypatch):
     """The faulthandler watchdog should cancel its pending dump on shutdown."""
     calls = []
@@ -60,7 +56,6 @@ async def test_faulthandler_watchdog_cancels_pending_dump(monkeypatch):
     assert calls[-1] == "cancel"
 
 
-@pytest.mark.asyncio
 async def test_faulthandler_watchdog_writes_rotating_log(tmp_path, monkeypatch):
     """The faulthandler watchdog should write to and rotate its log file."""
     log_path = tmp_path / "logs" / "event_loop_watchdog.log"
@@ -99,7 +94,6 @@ async def test_faulthandler_watchdog_writes_rotating_log(tmp_path, monkeypatch):
     assert any(isinstance(call, tuple) and call[0] == "dump" for call in calls)
 
 
-@pytest.mark.asyncio
 async def test_faulthandler_watchdog_survives_dump_failure(tmp_path, monkeypatch):
     """The watchdog should keep running after faulthandler arm failures."""
     log_path = tmp_path / "event_loop_watchdog.log"
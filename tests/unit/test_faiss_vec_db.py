@@ -6,7 +6,6 @@ from astrbot.core.db.vec_db.faiss_impl.vec_db import FaissVecDB
 from astrbot.core.exceptions import KnowledgeBaseUploadError
 
 
-@pytest.mark.asyncio
 async def test_insert_batch_skips_empty_contents() -> None:
     vec_db = FaissVecDB.__new__(FaissVecDB)
     vec_db.embedding_provider = AsyncMock()
@@ -21,7 +20,6 @@ async def test_insert_batch_skips_empty_contents() -> None:
     vec_db.embedding_storage.insert_batch.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_insert_batch_raises_friendly_error_for_embedding_count_mismatch() -> (
     None
 ):
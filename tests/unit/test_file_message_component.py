@@ -1,11 +1,8 @@
 from pathlib import Path
 
-import pytest
-
 from astrbot.core.message import components
 
 
-@pytest.mark.asyncio
 async def test_file_component_download_sanitizes_remote_name(monkeypatch, tmp_path):
     temp_dir = tmp_path / "temp"
     downloaded_paths: list[Path] = []
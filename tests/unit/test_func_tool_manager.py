@@ -51,7 +51,6 @@ def test_computer_tools_are_registered_as_builtin_tools():
     assert manager.is_builtin_tool("astrbot_execute_shell") is True
 
 
-@pytest.mark.asyncio
 async def test_execute_shell_defaults_to_foreground(monkeypatch):
     from astrbot.core.tools.computer_tools import shell as shell_tools
 
@@ -95,7 +94,6 @@ async def test_execute_shell_defaults_to_foreground(monkeypatch):
     assert calls == [{"command": "chromium https://example.com", "background": False}]
 
 
-@pytest.mark.asyncio
 async def test_execute_shell_uses_fresh_default_env_per_call(monkeypatch):
     from astrbot.core.tools.computer_tools import shell as shell_tools
 
@@ -141,7 +139,6 @@ async def test_execute_shell_uses_fresh_default_env_per_call(monkeypatch):
     assert calls[1] == {"MUTATED_BY_FAKE_SHELL": "second"}
 
 
-@pytest.mark.asyncio
 async def test_execute_shell_copies_user_env_before_execution(monkeypatch):
     from astrbot.core.tools.computer_tools import shell as shell_tools
 
@@ -185,7 +182,6 @@ async def test_execute_shell_copies_user_env_before_execution(monkeypatch):
     assert calls == [{"FOO": "bar", "MUTATED_BY_FAKE_SHELL": "first"}]
 
 
-@pytest.mark.asyncio
 async def test_execute_shell_avoids_double_background_for_detached_commands(
     monkeypatch,
 ):
@@ -232,7 +228,6 @@ async def test_execute_shell_avoids_double_background_for_detached_commands(
     assert calls == [{"command": command, "background": False}]
 
 
-@pytest.mark.asyncio
 async def test_execute_shell_recognizes_commented_background_command(monkeypatch):
     from astrbot.core.tools.computer_tools import shell as shell_tools
 
@@ -295,7 +290,6 @@ def test_is_self_detached_command_handles_quotes_and_comments(command, expected)
     assert _is_self_detached_command(command) is expected
 
 
-@pytest.mark.asyncio
 async def test_execute_shell_reports_blank_exception_type(monkeypatch):
     from astrbot.core.tools.computer_tools import shell as shell_tools
 
@@ -349,7 +343,6 @@ def test_firecrawl_tools_are_registered_as_builtin_tools():
     assert manager.is_builtin_tool("firecrawl_extract_web_page") is True
 
 
-@pytest.mark.asyncio
 async def test_mcp_shutdown_cleanup_runs_in_lifecycle_task(monkeypatch):
     """Disabling an MCP server must clean up in the task that connected.
 
@@ -380,7 +373,6 @@ async def test_mcp_shutdown_cleanup_runs_in_lifecycle_task(monkeypatch):
     assert "dummy" not in manager.mcp_client_dict
 
 
-@pytest.mark.asyncio
 async def test_mcp_shutdown_cleanup_survives_late_cancellation(monkeypatch):
     """A cancellation arriving mid-cleanup must not abort the cleanup."""
     manager = FunctionToolManager()
@@ -408,7 +400,6 @@ async def test_mcp_shutdown_cleanup_survives_late_cancellation(monkeypatch):
     assert "dummy" not in manager.mcp_client_dict
 
 
-@pytest.mark.asyncio
 async def test_modelscope_sync_enables_only_synced_servers(monkeypatch):
     class FakeResponse:
         status = 200
@@ -1,8 +1,6 @@
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 from astrbot.api.message_components import Plain
 from astrbot.builtin_stars.astrbot.main import Main
 
@@ -44,7 +42,6 @@ def make_event(
     return event
 
 
-@pytest.mark.asyncio
 async def test_active_reply_does_not_create_conversation_when_current_missing():
     conv_mgr = SimpleNamespace(
         get_curr_conversation_id=AsyncMock(return_value=None),
@@ -74,7 +71,6 @@ async def test_active_reply_does_not_create_conversation_when_current_missing():
     event.request_llm.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_active_reply_reuses_current_umo_conversation():
     conv = SimpleNamespace(cid="cid-1")
     conv_mgr = SimpleNamespace(
@@ -115,7 +111,6 @@ async def test_active_reply_reuses_current_umo_conversation():
     )
 
 
-@pytest.mark.asyncio
 async def test_on_message_does_not_clear_group_context_on_first_enabled_message():
     main = Main.__new__(Main)
     main.context = MagicMock()
@@ -140,7 +135,6 @@ async def test_on_message_does_not_clear_group_context_on_first_enabled_message(
     main.group_chat_context.remove_session.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_on_message_skips_recording_when_command_handler_matched():
     """A slash-command message (handlers_parsed_params non-empty) must not be
     recorded into the group context buffer."""
@@ -55,7 +55,6 @@ def _patch_download_sessions(monkeypatch, responses: list[_FakeResponse | Except
     )
 
 
-@pytest.mark.asyncio
 async def test_download_file_rejects_non_200_response(monkeypatch, tmp_path):
     target_path = tmp_path / "missing.bin"
     _patch_download_session(
@@ -69,7 +68,6 @@ async def test_download_file_rejects_non_200_response(monkeypatch, tmp_path):
     assert not target_path.exists()
 
 
-@pytest.mark.asyncio
 async def test_download_file_rejects_non_200_response_after_ssl_fallback(
     monkeypatch,
     tmp_path,
@@ -94,7 +92,6 @@ async def test_download_file_rejects_non_200_response_after_ssl_fallback(
     assert not target_path.exists()
 
 
-@pytest.mark.asyncio
 async def test_download_file_writes_successful_response(monkeypatch, tmp_path):
     target_path = tmp_path / "ok.bin"
     _patch_download_session(
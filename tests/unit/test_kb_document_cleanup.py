@@ -8,7 +8,6 @@ Tests the following scenarios:
 
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
 import pytest_asyncio
 
 from astrbot.core.knowledge_base.kb_db_sqlite import KBSQLiteDatabase
@@ -88,7 +87,6 @@ async def seeded_media(kb_db, seeded_doc):
     return kb_id, doc_id, (media1.media_id, media2.media_id)
 
 
-@pytest.mark.asyncio
 async def test_delete_document_cleans_media_records(kb_db, seeded_media):
     """删除文档时, kb_media 表中关联的多媒体记录应一并被删除。"""
     kb_id, doc_id, (media_id1, media_id2) = seeded_media
@@ -113,7 +111,6 @@ async def test_delete_document_cleans_media_records(kb_db, seeded_media):
     )
 
 
-@pytest.mark.asyncio
 async def test_delete_document_keeps_other_doc_media(kb_db, seeded_kb):
     """删除一个文档时, 其他文档的多媒体记录不应受影响。"""
     kb_id = seeded_kb
@@ -157,7 +154,6 @@ async def test_delete_document_keeps_other_doc_media(kb_db, seeded_kb):
     assert remaining_b[0].file_name == "b.png"
 
 
-@pytest.mark.asyncio
 async def test_delete_document_removes_doc_record(kb_db, seeded_media):
     """删除文档时, KBDocument 记录应被删除。"""
     kb_id, doc_id, _ = seeded_media
@@ -171,7 +167,6 @@ async def test_delete_document_removes_doc_record(kb_db, seeded_media):
     assert doc is None
 
 
-@pytest.mark.asyncio
 async def test_update_kb_stats_counts_chunks_for_single_kb(kb_db, seeded_kb):
     """update_kb_stats 应只统计指定知识库的 chunk 数量。"""
     kb_id1 = seeded_kb
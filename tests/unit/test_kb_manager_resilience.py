@@ -87,7 +87,6 @@ def mock_embedding_provider():
     return provider
 
 
-@pytest.mark.asyncio
 async def test_update_kb_preserves_old_instance_when_reinit_fails(
     stub_provider_manager_module,
     mock_provider_manager,
@@ -151,7 +150,6 @@ async def test_update_kb_preserves_old_instance_when_reinit_fails(
         assert result.kb.embedding_provider_id == "test-embedding-provider"
 
 
-@pytest.mark.asyncio
 async def test_update_kb_switches_instance_only_after_new_reinit_success(
     stub_provider_manager_module,
     mock_provider_manager,
@@ -218,7 +216,6 @@ async def test_update_kb_switches_instance_only_after_new_reinit_success(
         old_helper.terminate.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_ensure_vec_db_clears_stale_init_error(
     stub_provider_manager_module,
     mock_provider_manager,
@@ -264,7 +261,6 @@ async def test_ensure_vec_db_clears_stale_init_error(
         assert helper.vec_db is mock_vec_db
 
 
-@pytest.mark.asyncio
 async def test_ensure_vec_db_sets_init_error_on_failure(
     stub_provider_manager_module,
     mock_provider_manager,
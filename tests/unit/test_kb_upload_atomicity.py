@@ -129,7 +129,6 @@ async def _make_real_vec_db(tmp_path: Path, dim: int = 4) -> FaissVecDB:
     return vec_db
 
 
-@pytest.mark.asyncio
 async def test_insert_batch_rolls_back_documents_when_faiss_fails() -> None:
     """FAISS write failure should delete rows already committed to DocumentStorage."""
     vec_db = _make_vec_db()
@@ -156,7 +155,6 @@ async def test_insert_batch_rolls_back_documents_when_faiss_fails() -> None:
     vec_db.document_storage.delete_document_by_doc_id.assert_any_await("c2")
 
 
-@pytest.mark.asyncio
 async def test_insert_batch_rolls_back_on_int_id_count_mismatch() -> None:
     """Mismatched int_id count after document insert should roll back those docs."""
     vec_db = _make_vec_db()
@@ -180,7 +178,6 @@ async def test_insert_batch_rolls_back_on_int_id_count_mismatch() -> None:
     assert vec_db.document_storage.delete_document_by_doc_id.await_count == 2
 
 
-@pytest.mark.asyncio
 async def test_insert_batch_dimension_mismatch_does_not_write_documents() -> None:
     """Dimension validation must fail before DocumentStorage is written."""
     vec_db = _make_vec_db()
@@ -203,7 +200,6 @@ async def test_insert_batch_dimension_mismatch_does_not_write_documents() -> Non
     vec_db.embedding_storage.insert_batch.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_insert_batch_real_storage_rolls_back_on_faiss_failure(
     tmp_path: Path,
 ) -> None:
@@ -247,7 +243,6 @@ async def test_insert_batch_real_storage_rolls_back_on_faiss_failure(
     await vec_db.close()
 
 
-@pytest.mark.asyncio
 async def test_insert_batch_real_storage_dimension_mismatch_leaves_no_docs(
     tmp_path: Path,
 ) -> None:
@@ -277,7 +272,6 @@ async def test_insert_batch_real_storage_dimension_mismatch_leaves_no_docs(
     await vec_db.close()
 
 
-@pytest.mark.asyncio
 async def test_upload_document_cleans_up_on_storage_failure(
     tmp_path: Path,
     stub_provider_manager_module,
@@ -349,7 +343,6 @@ async def test_upload_document_cleans_up_on_storage_failure(
     assert not media_file.exists()
 
 
-@pytest.mark.asyncio
 async def test_upload_document_cleans_up_on_metadata_failure(
     stub_provider_manager_module,
 ) -> None:
@@ -387,7 +380,6 @@ async def test_upload_document_cleans_up_on_metadata_failure(
     helper.vec_db.delete_documents.assert_awaited()
 
 
-@pytest.mark.asyncio
 async def test_upload_document_skips_rollback_after_metadata_commit(
     stub_provider_manager_module,
 ) -> None:
@@ -429,7 +421,6 @@ async def test_upload_document_skips_rollback_after_metadata_commit(
     helper.vec_db.delete_documents.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_upload_document_skips_rollback_when_refresh_fails_after_commit(
     stub_provider_manager_module,
 ) -> None:
@@ -469,7 +460,6 @@ async def test_upload_document_skips_rollback_when_refresh_fails_after_commit(
     helper.vec_db.delete_documents.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_cleanup_failed_upload_deletes_vectors_before_metadata(
     tmp_path: Path,
     stub_provider_manager_module,
@@ -513,7 +503,6 @@ async def test_cleanup_failed_upload_deletes_vectors_before_metadata(
     )
 
 
-@pytest.mark.asyncio
 async def test_cleanup_failed_upload_is_best_effort(
     tmp_path: Path,
     stub_provider_manager_module,
@@ -538,7 +527,6 @@ async def test_cleanup_failed_upload_is_best_effort(
     assert not media.exists()
 
 
-@pytest.mark.asyncio
 async def test_cleanup_failed_upload_real_vec_db_by_kb_doc_id(
     tmp_path: Path,
     stub_provider_manager_module,
@@ -68,7 +68,6 @@ def make_request(query_string: bytes) -> Request:
     )
 
 
-@pytest.mark.asyncio
 async def test_list_kbs_applies_pagination():
     kb_manager = MagicMock()
     kb_manager.list_kbs = AsyncMock(
@@ -93,7 +92,6 @@ async def test_list_kbs_applies_pagination():
     }
 
 
-@pytest.mark.asyncio
 async def test_list_route_uses_default_page_size_without_query_params():
     service = MagicMock()
     service.list_kbs = AsyncMock(return_value={"items": [], "total": 0})
@@ -108,7 +106,6 @@ async def test_list_route_uses_default_page_size_without_query_params():
     service.list_kbs.assert_awaited_once_with(page=1, page_size=20)
 
 
-@pytest.mark.asyncio
 async def test_list_route_uses_default_page_size_when_page_is_explicit():
     service = MagicMock()
     service.list_kbs = AsyncMock(return_value={"items": [], "total": 0})
@@ -123,7 +120,6 @@ async def test_list_route_uses_default_page_size_when_page_is_explicit():
     service.list_kbs.assert_awaited_once_with(page=2, page_size=20)
 
 
-@pytest.mark.asyncio
 async def test_create_kb_accepts_legacy_name_field():
     kb = make_kb("kb-1", "From Name")
     kb_manager = MagicMock()
@@ -159,7 +155,6 @@ async def test_create_kb_accepts_legacy_name_field():
     )
 
 
-@pytest.mark.asyncio
 async def test_update_kb_preserves_omitted_fields():
     kb = make_kb("kb-1", "Docs")
     kb_manager = MagicMock()
@@ -184,7 +179,6 @@ async def test_update_kb_preserves_omitted_fields():
     )
 
 
-@pytest.mark.asyncio
 async def test_update_kb_allows_explicit_rerank_provider_clear():
     kb = make_kb("kb-1", "Docs")
     kb_manager = MagicMock()
@@ -236,7 +230,6 @@ def test_knowledge_base_request_uses_legacy_name_as_input_alias():
     assert payload == {"kb_name": "Legacy Name"}
 
 
-@pytest.mark.asyncio
 async def test_create_kb_raises_when_kb_name_is_missing():
     kb_manager = MagicMock()
     service = make_service(kb_manager)
@@ -245,7 +238,6 @@ async def test_create_kb_raises_when_kb_name_is_missing():
         await service.create_kb({"embedding_provider_id": "embedding-1"})
 
 
-@pytest.mark.asyncio
 async def test_create_kb_raises_when_embedding_provider_is_missing():
     kb_manager = MagicMock()
     service = make_service(kb_manager)
@@ -254,7 +246,6 @@ async def test_create_kb_raises_when_embedding_provider_is_missing():
         await service.create_kb({"kb_name": "Test KB"})
 
 
-@pytest.mark.asyncio
 async def test_create_kb_raises_when_embedding_provider_is_invalid():
     kb_manager = MagicMock()
     kb_manager.provider_manager.get_provider_by_id = AsyncMock(return_value=None)
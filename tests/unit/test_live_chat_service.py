@@ -3,7 +3,6 @@ from datetime import UTC, datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
-import pytest
 from starlette.websockets import WebSocketDisconnect
 
 from astrbot.core.platform.sources.webchat.webchat_queue_mgr import webchat_queue_mgr
@@ -19,7 +18,6 @@ def _service() -> LiveChatService:
     return LiveChatService(SimpleNamespace(), core_lifecycle)
 
 
-@pytest.mark.asyncio
 async def test_run_websocket_session_closes_when_token_is_missing():
     service = _service()
     closed: list[tuple[int, str]] = []
@@ -45,7 +43,6 @@ async def test_run_websocket_session_closes_when_token_is_missing():
     assert service.sessions == {}
 
 
-@pytest.mark.asyncio
 async def test_run_websocket_session_routes_messages_and_cleans_session(monkeypatch):
     service = _service()
     messages = iter(
@@ -94,7 +91,6 @@ async def test_run_websocket_session_routes_messages_and_cleans_session(monkeypa
     assert service.sessions == {}
 
 
-@pytest.mark.asyncio
 async def test_run_websocket_session_handles_disconnect_without_error_log(
     monkeypatch,
 ):
@@ -146,7 +142,6 @@ async def test_run_websocket_session_handles_disconnect_without_error_log(
     assert service.sessions == {}
 
 
-@pytest.mark.asyncio
 async def test_run_websocket_session_multiplexes_chat_requests_by_default(
     monkeypatch,
 ):
@@ -205,7 +200,6 @@ async def test_run_websocket_session_multiplexes_chat_requests_by_default(
     assert service.sessions == {}
 
 
-@pytest.mark.asyncio
 async def test_handle_chat_interrupt_without_message_id_targets_all_requests():
     service = _service()
     session = service.create_session("alice")
@@ -239,7 +233,6 @@ async def test_handle_chat_interrupt_without_message_id_targets_all_requests():
         await service.cleanup_session(session)
 
 
-@pytest.mark.asyncio
 async def test_handle_chat_message_scopes_events_to_request_by_default():
     service = _service()
     session = service.create_session("alice")
@@ -12,7 +12,6 @@ from astrbot.core.agent.mcp_oauth import (
 from astrbot.core.provider.func_tool_manager import FunctionToolManager
 
 
-@pytest.mark.asyncio
 async def test_mcp_oauth_tokens_are_stored_in_matching_mcp_config(
     tmp_path,
     monkeypatch,
@@ -77,7 +76,6 @@ async def test_mcp_oauth_tokens_are_stored_in_matching_mcp_config(
     assert tokens.refresh_token == "refresh-token"
 
 
-@pytest.mark.asyncio
 async def test_pending_flow_logs_authorization_url_when_enabled(monkeypatch):
     logged = []
 
@@ -101,7 +99,6 @@ async def test_pending_flow_logs_authorization_url_when_enabled(monkeypatch):
     assert flow.status == "awaiting_user"
 
 
-@pytest.mark.asyncio
 async def test_function_tool_manager_starts_log_oauth_flow_on_invalid_token(
     monkeypatch,
 ):
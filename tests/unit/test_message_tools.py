@@ -3,8 +3,6 @@
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
-import pytest
-
 from astrbot.core.message.message_event_result import MessageEventResult
 from astrbot.core.pipeline.respond.stage import RespondStage
 from astrbot.core.tools.message_tools import SendMessageToUserTool
@@ -102,7 +100,6 @@ def _make_respond_stage() -> RespondStage:
     return stage
 
 
-@pytest.mark.asyncio
 async def test_send_message_with_full_three_part_session():
     """LLM passes a complete three-part session string."""
     tool = SendMessageToUserTool()
@@ -115,7 +112,6 @@ async def test_send_message_with_full_three_part_session():
     assert "Message sent to session" in result
 
 
-@pytest.mark.asyncio
 async def test_send_message_with_partial_session_id_fallback():
     """LLM passes only session_id (no colons) — fallback to current_session's prefix."""
     tool = SendMessageToUserTool()
@@ -134,7 +130,6 @@ async def test_send_message_with_partial_session_id_fallback():
     assert target_session.session_id == "oc_abc"
 
 
-@pytest.mark.asyncio
 async def test_send_message_defaults_to_current_session():
     """LLM does not pass session — uses current_session directly."""
     tool = SendMessageToUserTool()
@@ -153,7 +148,6 @@ async def test_send_message_defaults_to_current_session():
     ) == ["hello"]
 
 
-@pytest.mark.asyncio
 async def test_send_message_other_session_does_not_record_current_text():
     """Messages sent to another session do not affect current-session dedupe."""
     tool = SendMessageToUserTool()
@@ -173,7 +167,6 @@ async def test_send_message_other_session_does_not_record_current_text():
     )
 
 
-@pytest.mark.asyncio
 async def test_respond_stage_skips_same_text_after_send_message_to_user():
     """RespondStage skips only when the tool already sent the same text."""
     stage = _make_respond_stage()
@@ -188,7 +181,6 @@ async def test_respond_stage_skips_same_text_after_send_message_to_user():
     event.send.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_respond_stage_sends_different_text_after_send_message_to_user():
     """RespondStage still sends a distinct completion after the tool call."""
     stage = _make_respond_stage()
@@ -204,7 +196,6 @@ async def test_respond_stage_sends_different_text_after_send_message_to_user():
     assert event.get_result() is None
 
 
-@pytest.mark.asyncio
 async def test_send_message_partial_session_falls_back_to_current():
     """LLM passes session_id matching current_session's id — same session, just incomplete format."""
     tool = SendMessageToUserTool()
@@ -222,7 +213,6 @@ async def test_send_message_partial_session_falls_back_to_current():
     assert target_session.session_id == "g123"
 
 
-@pytest.mark.asyncio
 async def test_cron_context_current_session_is_target_session():
     """在 cron 场景中，current_session 就是 cron 任务的目标 session。
 
@@ -252,7 +242,6 @@ async def test_cron_context_current_session_is_target_session():
     assert target_session.session_id == "oc_cron_target"
 
 
-@pytest.mark.asyncio
 async def test_send_message_empty_messages_returns_error():
     """Empty or missing messages returns error before session resolution."""
     tool = SendMessageToUserTool()
@@ -262,7 +251,6 @@ async def test_send_message_empty_messages_returns_error():
     assert "messages" in result.lower()
 
 
-@pytest.mark.asyncio
 async def test_send_message_missing_image_path_stops_before_send(tmp_path, monkeypatch):
     """Missing image paths fail before sending any message components."""
     tool = SendMessageToUserTool()
@@ -290,7 +278,6 @@ async def test_send_message_missing_image_path_stops_before_send(tmp_path, monke
     ctx.context.context.send_message.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_non_admin_cannot_send_arbitrary_local_absolute_file(tmp_path):
     """Non-admin users cannot send host files outside the allowed local roots."""
     tool = SendMessageToUserTool()
@@ -308,7 +295,6 @@ async def test_non_admin_cannot_send_arbitrary_local_absolute_file(tmp_path):
     ctx.context.context.send_message.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_non_admin_can_send_workspace_file(tmp_path, monkeypatch):
     """Non-admin users can send files inside their per-session workspace."""
     tool = SendMessageToUserTool()
@@ -335,7 +321,6 @@ async def test_non_admin_can_send_workspace_file(tmp_path, monkeypatch):
     ctx.context.context.send_message.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_non_admin_can_send_temp_file(tmp_path, monkeypatch):
     """Non-admin users can send generated files under AstrBot temp."""
     tool = SendMessageToUserTool()
@@ -358,7 +343,6 @@ async def test_non_admin_can_send_temp_file(tmp_path, monkeypatch):
     ctx.context.context.send_message.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_send_message_downloads_windows_sandbox_file_with_original_name(
     tmp_path, monkeypatch
 ):
@@ -406,7 +390,6 @@ async def test_send_message_downloads_windows_sandbox_file_with_original_name(
     assert sent_file.name == "report.txt"
 
 
-@pytest.mark.asyncio
 async def test_send_message_downloads_trailing_slash_sandbox_file_with_basename(
     tmp_path, monkeypatch
 ):
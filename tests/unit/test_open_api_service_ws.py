@@ -1,7 +1,5 @@
 from types import SimpleNamespace
 
-import pytest
-
 from astrbot.dashboard.services.open_api_service import (
     OpenApiService,
     OpenApiWebSocketChatBridge,
@@ -38,7 +36,6 @@ def _bridge() -> OpenApiWebSocketChatBridge:
     )
 
 
-@pytest.mark.asyncio
 async def test_run_chat_websocket_closes_when_api_key_is_invalid(monkeypatch):
     service = _service()
     sent: list[dict] = []
@@ -73,7 +70,6 @@ async def test_run_chat_websocket_closes_when_api_key_is_invalid(monkeypatch):
     assert closed == [(1008, "Invalid API key")]
 
 
-@pytest.mark.asyncio
 async def test_run_chat_websocket_handles_control_messages(monkeypatch):
     service = _service()
     messages = iter(
@@ -9,7 +9,6 @@ from astrbot.core.pipeline.process_stage.method.agent_sub_stages import internal
 from astrbot.core.provider.entities import ProviderRequest, TokenUsage
 
 
-@pytest.mark.asyncio
 async def test_record_internal_agent_stats_persists_provider_stat(
     temp_db,
     monkeypatch: pytest.MonkeyPatch,
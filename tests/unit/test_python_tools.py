@@ -2,8 +2,6 @@ import platform
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
-import pytest
-
 from astrbot.core.agent.run_context import ContextWrapper
 from astrbot.core.tools.computer_tools.python import LocalPythonTool, PythonTool
 
@@ -25,7 +23,6 @@ def test_local_python_tool_description_contains_os():
     assert "system-compatible" in tool.description
 
 
-@pytest.mark.asyncio
 async def test_local_python_tool_uses_session_workspace(tmp_path, monkeypatch):
     """Local Python execution should use the same workspace as local shell."""
     tool = LocalPythonTool()
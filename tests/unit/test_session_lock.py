@@ -20,7 +20,6 @@ class TestSessionLockManagerBasic:
         assert manager._state_guard is not None
         assert manager._loop_managers is not None
 
-    @pytest.mark.asyncio
     async def test_acquire_release_lock(self):
         """Test basic lock acquire and release."""
         manager = SessionLockManager()
@@ -35,7 +34,6 @@ class TestSessionLockManagerBasic:
         assert session_id not in state._locks
         assert session_id not in state._lock_count
 
-    @pytest.mark.asyncio
     async def test_lock_is_reusable(self):
         """Test that locks can be acquired multiple times."""
         manager = SessionLockManager()
@@ -53,7 +51,6 @@ class TestSessionLockManagerBasic:
 class TestCrossLoopIsolation:
     """Tests for event loop isolation."""
 
-    @pytest.mark.asyncio
     async def test_different_loops_have_different_managers(self):
         """Test that different event loops get different per-loop managers."""
         manager = SessionLockManager()
@@ -82,7 +79,6 @@ class TestCrossLoopIsolation:
         # Should be different manager instances
         assert manager1 is not manager2
 
-    @pytest.mark.asyncio
     async def test_locks_isolated_across_loops(self):
         """Test that locks from different loops are isolated."""
         manager = SessionLockManager()
@@ -116,7 +112,6 @@ class TestCrossLoopIsolation:
         # Order should show interleaved acquisitions, not sequential
         assert len(results) == 4
 
-    @pytest.mark.asyncio
     async def test_same_loop_blocks_on_same_session(self):
         """Test that same loop blocks when acquiring same session lock."""
         manager = SessionLockManager()
@@ -145,7 +140,6 @@ class TestCrossLoopIsolation:
 class TestConcurrency:
     """Tests for concurrent access."""
 
-    @pytest.mark.asyncio
     async def test_concurrent_acquisitions_same_loop(self):
         """Test concurrent lock acquisitions on the same loop."""
         manager = SessionLockManager()
@@ -171,7 +165,6 @@ class TestConcurrency:
         # Max concurrent should be 1 (lock serializes access)
         assert max_concurrent == 1
 
-    @pytest.mark.asyncio
     async def test_thread_safety_of_loop_manager_creation(self):
         """Test that _get_loop_manager is thread-safe."""
         manager = SessionLockManager()
@@ -212,7 +205,6 @@ class TestConcurrency:
 class TestEventLoopCleanup:
     """Tests for event loop cleanup behavior."""
 
-    @pytest.mark.asyncio
     async def test_weakref_cleanup_on_loop_close(self):
         """Test that per-loop managers are cleaned up when loop is closed."""
         manager = SessionLockManager()
@@ -252,7 +244,6 @@ class TestEventLoopCleanup:
         loop = loop_ref() if loop_ref is not None else None
         assert per_loop_mgr is None or loop is None
 
-    @pytest.mark.asyncio
     async def test_access_after_loop_close_in_new_loop_works(self):
         """Test that accessing from a new loop after old loop closes works."""
         manager = SessionLockManager()
@@ -291,7 +282,6 @@ class TestIssue5464:
     "is bound to a different event loop" error.
     """
 
-    @pytest.mark.asyncio
     async def test_multiple_event_loops_no_cross_loop_error(self):
         """Test that multiple event loops don't cause cross-loop binding errors.
 
@@ -342,7 +332,6 @@ class TestIssue5464:
         assert len(errors) == 0, f"Errors occurred: {errors}"
         assert len(results) == 12  # 4 instances * 3 sessions each
 
-    @pytest.mark.asyncio
     async def test_lock_object_not_shared_across_loops(self):
         """Verify that asyncio.Lock objects are not shared across event loops.
 
@@ -386,7 +375,6 @@ class TestIssue5464:
         # If locks were shared, we'd only have 1 lock_id
         assert len(lock_ids) == 5, "Each event loop should have its own Lock object"
 
-    @pytest.mark.asyncio
     async def test_concurrent_access_same_session_different_loops(self):
         """Test that same session ID accessed from different loops doesn't block.
 
@@ -441,7 +429,6 @@ class TestIssue5464:
 class TestEdgeCases:
     """Tests for edge cases."""
 
-    @pytest.mark.asyncio
     async def test_empty_session_id(self):
         """Test with empty session ID."""
         manager = SessionLockManager()
@@ -451,7 +438,6 @@ class TestEdgeCases:
 
         # Should work without issues
 
-    @pytest.mark.asyncio
     async def test_special_characters_in_session_id(self):
         """Test with special characters in session ID."""
         manager = SessionLockManager()
@@ -462,7 +448,6 @@ class TestEdgeCases:
 
         # Should work without issues
 
-    @pytest.mark.asyncio
     async def test_very_long_session_id(self):
         """Test with very long session ID."""
         manager = SessionLockManager()
@@ -473,7 +458,6 @@ class TestEdgeCases:
 
         # Should work without issues
 
-    @pytest.mark.asyncio
     async def test_lock_not_held_after_context_exit(self):
         """Test that lock is released after context manager exit."""
         manager = SessionLockManager()
@@ -490,7 +474,6 @@ class TestEdgeCases:
         assert session_id not in state._locks
         assert session_id not in state._lock_count
 
-    @pytest.mark.asyncio
     async def test_exception_during_lock(self):
         """Test that lock is released even if exception occurs."""
         manager = SessionLockManager()
@@ -505,7 +488,6 @@ class TestEdgeCases:
         assert session_id not in state._locks
         assert session_id not in state._lock_count
 
-    @pytest.mark.asyncio
     async def test_nested_lock_different_sessions(self):
         """Test nested locks on different sessions."""
         manager = SessionLockManager()
@@ -522,7 +504,6 @@ class TestEdgeCases:
         assert "session-1" not in state._locks
         assert "session-2" not in state._locks
 
-    @pytest.mark.asyncio
     async def test_reentrant_lock_same_session(self):
         """Test reentrant locking on same session (should block)."""
         manager = SessionLockManager()
@@ -1,8 +1,6 @@
 import json
 from types import SimpleNamespace
 
-import pytest
-
 from astrbot.core.knowledge_base.retrieval.sparse_retriever import SparseRetriever
 
 
@@ -59,7 +57,6 @@ class FallbackStorage:
         ]
 
 
-@pytest.mark.asyncio
 async def test_sparse_retriever_uses_fts5_when_available():
     storage = FTSStorage()
     vec_db = SimpleNamespace(document_storage=storage)
@@ -76,7 +73,6 @@ async def test_sparse_retriever_uses_fts5_when_available():
     assert storage.get_documents_calls == 0
 
 
-@pytest.mark.asyncio
 async def test_sparse_retriever_falls_back_to_bm25_when_fts5_is_unavailable():
     storage = FallbackStorage()
     vec_db = SimpleNamespace(document_storage=storage)
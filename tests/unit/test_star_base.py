@@ -1,165 +1,151 @@
 """Tests for astrbot.core.star.base module."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
+from astrbot.core.star import Star, star_map, star_registry
+from astrbot.core.star.base import html_renderer
+from astrbot.core.star.star import StarMetadata
 
-class TestStarBase:
-    """Test cases for the Star base class."""
-
-    def test_star_class_exists(self):
-        """Test that Star class can be imported."""
-        from astrbot.core.star import Star
+_CALL_T2I_WITH_CONFIG = call(
+    "test text", return_url=True, template_name="default_template"
+)
+_CALL_T2I_WITHOUT_CONFIG = call("test text", return_url=False, template_name=None)
+_CALL_HTML_RENDER = call(
+    "<html>{{ data }}</html>", {"data": "test"}, return_url=True, options=None
+)
 
-        assert Star is not None
-
-    def test_star_init_with_context(self):
-        """Test Star initialization with a context-like object."""
-        from astrbot.core.star import Star
 
-        # Create a mock context with get_config method
-        mock_context = MagicMock()
-        mock_context.get_config.return_value = MagicMock()
+class StubContext:
+    """Context stand-in exposing only get_config."""
 
-        # Create a concrete Star subclass for testing
-        class TestStar(Star):
-            name = "test_star"
-            author = "test_author"
+    __slots__ = ("config",)
 
-        star = TestStar(context=mock_context)
+    def __init__(self, config=None) -> None:
+        self.config = config
 
-        assert star.context is mock_context
+    def get_config(self):
+        return self.config
 
-    @pytest.mark.asyncio
-    async def test_text_to_image_with_config(self):
-        """Test text_to_image method with valid config."""
-        from astrbot.core.star import Star
 
-        mock_context = MagicMock()
-        mock_config = MagicMock()
-        mock_config.get.return_value = "default_template"
-        mock_context.get_config.return_value = mock_config
+@pytest.fixture(scope="module")
+def star_cls():
+    """A concrete Star subclass, defined once per module."""
 
-        class TestStar(Star):
-            name = "test_star"
-            author = "test_author"
+    class TestStar(Star):
+        name = "test_star"
+        author = "test_author"
 
-        star = TestStar(context=mock_context)
+        async def initialize(self) -> None:
+            self.initialized = True
 
-        with patch(
-            "astrbot.core.star.base.html_renderer.render_t2i",
-            new_callable=AsyncMock,
-        ) as mock_render:
-            mock_render.return_value = "http://example.com/image.png"
-            result = await star.text_to_image("test text", return_url=True)
+        async def terminate(self) -> None:
+            self.terminated = True
 
-            mock_render.assert_called_once_with(
-                "test text",
-                return_url=True,
-                template_name="default_template",
-            )
-            assert result == "http://example.com/image.png"
+    return TestStar
 
-    @pytest.mark.asyncio
-    async def test_text_to_image_without_config(self):
-        """Test text_to_image method when get_config returns None."""
-        from astrbot.core.star import Star
 
-        mock_context = MagicMock()
-        mock_context.get_config.return_value = None
+@pytest.fixture
+def star(star_cls):
+    """Return a star instance together with its stub context."""
+    context = StubContext()
+    return star_cls(context=context), context
 
-        class TestStar(Star):
-            name = "test_star"
-            author = "test_author"
 
-        star = TestStar(context=mock_context)
+@pytest.fixture
+def mock_renderer(monkeypatch):
+    """Replace the html_renderer render coroutines with AsyncMocks."""
+    mocks = SimpleNamespace(
+        render_t2i=AsyncMock(return_value="http://example.com/image.png"),
+        render_custom_template=AsyncMock(
+            return_value="http://example.com/rendered.png"
+        ),
+    )
+    monkeypatch.setattr(html_renderer, "render_t2i", mocks.render_t2i)
+    monkeypatch.setattr(
+        html_renderer, "render_custom_template", mocks.render_custom_template
+    )
+    return mocks
 
-        with patch(
-            "astrbot.core.star.base.html_renderer.render_t2i",
-            new_callable=AsyncMock,
-        ) as mock_render:
-            mock_render.return_value = "http://example.com/image.png"
-            result = await star.text_to_image("test text", return_url=False)
 
-            mock_render.assert_called_once_with(
-                "test text",
-                return_url=False,
-                template_name=None,
-            )
-            assert result == "http://example.com/image.png"
+class TestStarBase:
+    """Test cases for the Star base class."""
 
-    @pytest.mark.asyncio
-    async def test_html_render(self):
+    def test_star_init_with_context(self, star):
+        """Test Star initialization with a context-like object."""
+        star, context = star
+
+        assert star.context is context
+
+    @pytest.mark.parametrize(
+        ("config", "return_url", "expected_call"),
+        [
+            (
+                MagicMock(spec_set=["get"], **{"get.return_value": "default_template"}),
+                True,
+                _CALL_T2I_WITH_CONFIG,
+            ),
+            (None, False, _CALL_T2I_WITHOUT_CONFIG),
+        ],
+        ids=["with_config", "without_config"],
+    )
+    async def test_text_to_image(
+        self, star, mock_renderer, config, return_url, expected_call
+    ):
+        """Test text_to_image picks the template from config when available."""
+        star, context = star
+        context.config = config
+
+        result = await star.text_to_image("test text", return_url=return_url)
+
+        assert mock_renderer.render_t2i.call_args_list == [expected_call]
+        assert result == "http://example.com/image.png"
+
+    async def test_html_render(self, star, mock_renderer):
         """Test html_render method."""
-        from astrbot.core.star import Star
+        star, _ = star
 
-        mock_context = MagicMock()
+        result = await star.html_render(
+            "<html>{{ data }}</html>",
+            {"data": "test"},
+            return_url=True,
+        )
 
-        class TestStar(Star):
-            name = "test_star"
-            author = "test_author"
+        assert mock_renderer.render_custom_template.call_args_list == [
+            _CALL_HTML_RENDER
+        ]
+        assert result == "http://example.com/rendered.png"
 
-        star = TestStar(context=mock_context)
-
-        with patch(
-            "astrbot.core.star.base.html_renderer.render_custom_template",
-            new_callable=AsyncMock,
-        ) as mock_render:
-            mock_render.return_value = "http://example.com/rendered.png"
-            result = await star.html_render(
-                "<html>{{ data }}</html>",
-                {"data": "test"},
-                return_url=True,
-            )
-
-            mock_render.assert_called_once_with(
-                "<html>{{ data }}</html>",
-                {"data": "test"},
-                return_url=True,
-                options=None,
-            )
-            assert result == "http://example.com/rendered.png"
-
-    @pytest.mark.asyncio
-    async def test_initialize_and_terminate(self):
+    async def test_initialize_and_terminate(self, star):
         """Test that initialize and terminate methods can be overridden."""
-        from astrbot.core.star import Star
-
-        class TestStar(Star):
-            name = "test_star"
-            author = "test_author"
-
-            async def initialize(self) -> None:
-                self.initialized = True
+        star, _ = star
 
-            async def terminate(self) -> None:
-                self.terminated = True
+        await asyncio.gather(star.initialize(), star.terminate())
 
-        mock_context = MagicMock()
-        star = TestStar(context=mock_context)
-
-        await star.initialize()
         assert star.initialized is True
-
-        await star.terminate()
         assert star.terminated is True
 
     def test_star_metadata_registration(self):
         """Test that Star subclass is automatically registered."""
-        from astrbot.core.star import star_registry
-
-        class UniqueTestStar:
-            """Not a Star subclass, should not be registered."""
-
-            pass
-
-        # Verify Star subclass gets registered
+        module_path = "tests.unit.probe_star"
         initial_count = len(star_registry)
 
-        # Note: This test verifies the __init_subclass__ mechanism
-        # The actual registration happens when a class inherits from Star
-        assert len(star_registry) >= initial_count
+        class ProbeStar(Star):
+            __module__ = module_path
+            name = "probe"
+            author = "test_author"
+
+        try:
+            assert len(star_registry) == initial_count + 1
+            assert star_map[module_path].star_cls_type is ProbeStar
+        finally:
+            star_registry.remove(star_map.pop(module_path))
 
 
 class TestStarMetadataPluginId:
@@ -173,76 +159,64 @@ class TestStarMetadataPluginId:
     """
 
     def test_plugin_id_defaults_to_unknown_when_empty(self):
-        from astrbot.core.star.star import StarMetadata
-
         assert StarMetadata().plugin_id == "unknown/unknown"
 
     def test_plugin_id_uses_name_and_author(self):
-        from astrbot.core.star.star import StarMetadata
-
         metadata = StarMetadata(name="Hello", author="AstrBot")
         assert metadata.plugin_id == "astrbot/hello"
 
     def test_plugin_id_recomputes_after_attribute_assignment(self):
-        from astrbot.core.star.star import StarMetadata
-
         metadata = StarMetadata()
         metadata.name = "A"
         metadata.author = "B"
         assert metadata.plugin_id == "b/a"
 
     def test_plugin_id_lowercases_and_escapes_slash(self):
-        from astrbot.core.star.star import StarMetadata
-
         metadata = StarMetadata(name="A/B", author="C")
         assert metadata.plugin_id == "c/a_b"
 
     def test_plugin_id_reflects_latest_name_after_change(self):
-        from astrbot.core.star.star import StarMetadata
-
         metadata = StarMetadata(name="old", author="author")
         assert metadata.plugin_id == "author/old"
         metadata.name = "new"
         assert metadata.plugin_id == "author/new"
 
     def test_plugin_id_only_name_set(self):
-        from astrbot.core.star.star import StarMetadata
-
         assert StarMetadata(name="OnlyName").plugin_id == "unknown/onlyname"
 
     def test_plugin_id_only_author_set(self):
-        from astrbot.core.star.star import StarMetadata
-
         assert StarMetadata(author="OnlyAuthor").plugin_id == "onlyauthor/unknown"
 
 
 class TestNoCircularImports:
     """Test that there are no circular import issues."""
 
-    def test_import_star_module(self):
-        """Test that star module can be imported without circular import errors."""
-        import astrbot.core.star
-
-        assert astrbot.core.star is not None
-
-    def test_import_pipeline_module(self):
-        """Test that pipeline module can be imported without circular import errors."""
-        import astrbot.core.pipeline
-
-        assert astrbot.core.pipeline is not None
-
-    def test_import_both_modules(self):
-        """Test that both modules can be imported together."""
-
-        # Verify key exports are available
-        from astrbot.core.star import Context, PluginManager, Star
-
-        assert Context is not None
-        assert Star is not None
-        assert PluginManager is not None
-
-    def test_import_pipeline_context(self):
-        """Test that PipelineContext can be imported."""
-        from astrbot.core.pipeline.context import PipelineContext
-
-        assert PipelineContext is not None
+    @pytest.mark.parametrize(
+        "statements",
+        [
+            (
+                "from astrbot.core.star import Context, PluginManager, Star",
+                "from astrbot.core.pipeline.context import PipelineContext",
+            ),
+            (
+                "from astrbot.core.pipeline.context import PipelineContext",
+                "from astrbot.core.star import Context, PluginManager, Star",
+            ),
+        ],
+        ids=["star_first", "pipeline_first"],
+    )
+    def test_import_in_clean_interpreter(self, statements):
+        """Test that star and pipeline import cleanly in either order.
+
+        The imports run in a fresh interpreter, since this process has already
+        loaded both packages.
+        """
+        result = subprocess.run(
+            [sys.executable, "-c", "; ".join(statements)],
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+        assert result.returncode == 0, result.stderr
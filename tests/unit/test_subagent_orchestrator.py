@@ -19,7 +19,6 @@ def _build_cfg(agent_overrides: dict) -> dict:
     return {"agents": [agent]}
 
 
-@pytest.mark.asyncio
 async def test_reload_from_config_default_persona_is_resolved():
     tool_mgr = MagicMock()
     persona_mgr = MagicMock()
@@ -41,7 +40,6 @@ async def test_reload_from_config_default_persona_is_resolved():
     assert handoff.agent.begin_dialogs == default_persona["_begin_dialogs_processed"]
 
 
-@pytest.mark.asyncio
 async def test_reload_from_config_missing_persona_falls_back_to_inline_and_warns():
     tool_mgr = MagicMock()
     persona_mgr = MagicMock()
@@ -62,7 +60,6 @@ async def test_reload_from_config_missing_persona_falls_back_to_inline_and_warns
     )
 
 
-@pytest.mark.asyncio
 async def test_reload_from_config_uses_processed_begin_dialogs_and_deepcopy():
     tool_mgr = MagicMock()
     persona_mgr = MagicMock()
@@ -84,7 +81,6 @@ async def test_reload_from_config_uses_processed_begin_dialogs_and_deepcopy():
     assert handoff.agent.begin_dialogs[0]["content"] == "hello"
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("raw_tools", "expected_tools"),
     [
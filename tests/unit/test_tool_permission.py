@@ -85,7 +85,6 @@ def test_default_permission_is_member():
 # ── _check_tool_permission ───────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_check_permission_passes_when_no_config():
     _clear_tool_permissions()
     mgr = FunctionToolManager()
@@ -95,7 +94,6 @@ async def test_check_permission_passes_when_no_config():
     assert error is None
 
 
-@pytest.mark.asyncio
 async def test_check_permission_passes_for_admin_with_admin_tool():
     sp.put(
         "tool_permissions",
@@ -112,7 +110,6 @@ async def test_check_permission_passes_for_admin_with_admin_tool():
         _clear_tool_permissions()
 
 
-@pytest.mark.asyncio
 async def test_check_permission_denies_member_for_admin_tool():
     sp.put(
         "tool_permissions",
@@ -132,7 +129,6 @@ async def test_check_permission_denies_member_for_admin_tool():
         _clear_tool_permissions()
 
 
-@pytest.mark.asyncio
 async def test_check_permission_denies_when_no_event():
     sp.put(
         "tool_permissions",
@@ -153,7 +149,6 @@ async def test_check_permission_denies_when_no_event():
         _clear_tool_permissions()
 
 
-@pytest.mark.asyncio
 async def test_check_permission_passes_for_member_when_configured_member():
     sp.put(
         "tool_permissions",
@@ -173,7 +168,6 @@ async def test_check_permission_passes_for_member_when_configured_member():
 # ── _PermissionGuardedTool ───────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_guarded_tool_delegates_handler_with_event_when_permission_passes():
     _clear_tool_permissions()
     mgr = FunctionToolManager()
@@ -203,7 +197,6 @@ async def test_guarded_tool_delegates_handler_with_event_when_permission_passes(
     assert result == "ok:user_123:sentinel"
 
 
-@pytest.mark.asyncio
 async def test_guarded_tool_blocks_when_permission_denied():
     sp.put(
         "tool_permissions",
@@ -237,7 +230,6 @@ async def test_guarded_tool_blocks_when_permission_denied():
         _clear_tool_permissions()
 
 
-@pytest.mark.asyncio
 async def test_guarded_tool_delegates_to_wrapped_call():
     _clear_tool_permissions()
     mgr = FunctionToolManager()
@@ -258,7 +250,6 @@ async def test_guarded_tool_delegates_to_wrapped_call():
     assert result == "from call()"
 
 
-@pytest.mark.asyncio
 async def test_guarded_tool_delegates_to_wrapped_run():
     _clear_tool_permissions()
     mgr = FunctionToolManager()
@@ -279,7 +270,6 @@ async def test_guarded_tool_delegates_to_wrapped_run():
     assert result == "from run(): runner ok"
 
 
-@pytest.mark.asyncio
 async def test_guarded_tool_handles_async_generator_handler():
     _clear_tool_permissions()
     mgr = FunctionToolManager()
@@ -337,7 +327,6 @@ def test_get_full_tool_set_wraps_non_builtin():
 
 
 class TestGetToolListPermission:
-    @pytest.mark.asyncio
     async def test_list_includes_permission_fields_for_non_builtin(self):
         service = _make_tools_service()
         sp.put(
@@ -357,7 +346,6 @@ class TestGetToolListPermission:
         finally:
             _clear_tool_permissions()
 
-    @pytest.mark.asyncio
     async def test_list_no_permission_fields_for_builtin(self):
         service = _make_tools_service()
         tools = service.get_tool_list()
@@ -372,7 +360,6 @@ class TestGetToolListPermission:
 
 
 class TestUpdateToolPermission:
-    @pytest.mark.asyncio
     async def test_set_admin_permission(self):
         service = _make_tools_service()
         service.tool_mgr.func_list.append(_dummy_tool("target_tool"))
@@ -386,7 +373,6 @@ class TestUpdateToolPermission:
         stored = sp.get("tool_permissions", {}, scope="global", scope_id="global")
         assert stored["_default"]["target_tool"] == "admin"
 
-    @pytest.mark.asyncio
     async def test_reject_builtin_tool(self):
         service = _make_tools_service()
 
@@ -395,7 +381,6 @@ class TestUpdateToolPermission:
                 {"name": "astrbot_execute_shell", "permission": "admin"}
             )
 
-    @pytest.mark.asyncio
     async def test_reject_unknown_tool(self):
         service = _make_tools_service()
 
@@ -404,7 +389,6 @@ class TestUpdateToolPermission:
                 {"name": "ghost_tool", "permission": "admin"}
             )
 
-    @pytest.mark.asyncio
     async def test_reject_invalid_permission_value(self):
         service = _make_tools_service()
         service.tool_mgr.func_list.append(_dummy_tool("target_tool"))
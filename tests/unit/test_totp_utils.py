@@ -30,7 +30,6 @@ def test_is_totp_enabled_requires_enable_secret_and_recovery_hash(
     assert is_totp_enabled(config) is expected
 
 
-@pytest.mark.asyncio
 async def test_consume_totp_code_prevents_replay_same_timecode():
     secret = pyotp.random_base32()
     code = pyotp.TOTP(secret).now()
@@ -51,7 +50,6 @@ def test_verify_recovery_code_rejects_malformed_or_wrong_length():
     assert verify_recovery_code(config, recovery_code[:-1]) is False
 
 
-@pytest.mark.asyncio
 async def test_issue_and_validate_trusted_device_token(tmp_path):
     db = SQLiteDatabase(str(tmp_path / "trusted-device.db"))
     config = {
@@ -72,7 +70,6 @@ async def test_issue_and_validate_trusted_device_token(tmp_path):
         await db.engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_trusted_device_invalid_after_totp_secret_change(tmp_path):
     db = SQLiteDatabase(str(tmp_path / "trusted-device.db"))
     old_secret = pyotp.random_base32()
@@ -26,7 +26,6 @@ def test_normalize_legacy_web_search_config_migrates_firecrawl_key():
     assert config.saved is True
 
 
-@pytest.mark.asyncio
 async def test_firecrawl_search_maps_web_results(monkeypatch):
     async def fake_firecrawl_search(provider_settings, payload):
         assert provider_settings["websearch_firecrawl_key"] == ["firecrawl-key"]
@@ -62,7 +61,6 @@ async def test_firecrawl_search_maps_web_results(monkeypatch):
     ]
 
 
-@pytest.mark.asyncio
 async def test_firecrawl_search_maps_v2_data_list(monkeypatch):
     session = _FakeFirecrawlSession(
         _FakeFirecrawlResponse(
@@ -106,7 +104,6 @@ async def test_firecrawl_search_maps_v2_data_list(monkeypatch):
     ]
 
 
-@pytest.mark.asyncio
 async def test_firecrawl_search_maps_v2_grouped_web_data(monkeypatch):
     session = _FakeFirecrawlSession(
         _FakeFirecrawlResponse(
@@ -144,7 +141,6 @@ async def test_firecrawl_search_maps_v2_grouped_web_data(monkeypatch):
     ]
 
 
-@pytest.mark.asyncio
 async def test_firecrawl_search_payload_omits_tbs_and_uses_default_limit(monkeypatch):
     async def fake_firecrawl_search(provider_settings, payload):
         assert payload == {
@@ -178,7 +174,6 @@ async def test_firecrawl_search_payload_omits_tbs_and_uses_default_limit(monkeyp
     assert "tbs" not in tool.parameters["properties"]
 
 
-@pytest.mark.asyncio
 async def test_firecrawl_extract_returns_scraped_markdown(monkeypatch):
     async def fake_firecrawl_scrape(provider_settings, payload):
         assert provider_settings["websearch_firecrawl_key"] == ["firecrawl-key"]
@@ -200,7 +195,6 @@ async def test_firecrawl_extract_returns_scraped_markdown(monkeypatch):
     assert result == "URL: https://example.com\nContent: # Example"
 
 
-@pytest.mark.asyncio
 async def test_firecrawl_search_uses_session_context(monkeypatch):
     session = _FakeFirecrawlSession(
         _FakeFirecrawlResponse(
@@ -242,7 +236,6 @@ async def test_firecrawl_search_uses_session_context(monkeypatch):
     }
 
 
-@pytest.mark.asyncio
 async def test_firecrawl_search_raises_error_for_http_errors(monkeypatch):
     session = _FakeFirecrawlSession(
         _FakeFirecrawlResponse(status=401, text_data="Unauthorized")
@@ -268,7 +261,6 @@ async def test_firecrawl_search_raises_error_for_http_errors(monkeypatch):
     assert session.exited is True
 
 
-@pytest.mark.asyncio
 async def test_firecrawl_scrape_uses_request_setup(monkeypatch):
     session = _FakeFirecrawlSession(
         _FakeFirecrawlResponse(
@@ -305,7 +297,6 @@ async def test_firecrawl_scrape_uses_request_setup(monkeypatch):
     }
 
 
-@pytest.mark.asyncio
 async def test_firecrawl_scrape_raises_error_for_http_errors(monkeypatch):
     session = _FakeFirecrawlSession(
         _FakeFirecrawlResponse(status=401, text_data="Unauthorized")
@@ -437,7 +428,6 @@ def _resetKeyRotators():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_tavily_search_raises_value_error_when_no_key_configured():
     """Raise ValueError when no Tavily API key is configured."""
     with pytest.raises(
@@ -447,7 +437,6 @@ async def test_tavily_search_raises_value_error_when_no_key_configured():
         await tools._tavily_search({}, {"query": "test"})
 
 
-@pytest.mark.asyncio
 async def test_tavily_search_key_failover_on_quota_exceeded_432(
     monkeypatch,
 ):
@@ -485,7 +474,6 @@ async def test_tavily_search_key_failover_on_quota_exceeded_432(
     assert len(session.calls) == 2  # Both keys were attempted.
 
 
-@pytest.mark.asyncio
 async def test_tavily_search_key_failover_on_rate_limited_429(
     monkeypatch,
 ):
@@ -522,7 +510,6 @@ async def test_tavily_search_key_failover_on_rate_limited_429(
     assert len(session.calls) == 2  # Both keys were attempted.
 
 
-@pytest.mark.asyncio
 async def test_tavily_search_fails_when_all_keys_exhausted_8886(
     monkeypatch,
 ):
@@ -558,7 +545,6 @@ async def test_tavily_search_fails_when_all_keys_exhausted_8886(
     assert len(session.calls) == 2  # Both keys were attempted.
 
 
-@pytest.mark.asyncio
 async def test_tavily_search_does_not_failover_on_server_error_500(
     monkeypatch,
 ):
@@ -619,7 +605,6 @@ def test_normalize_legacy_web_search_config_migrates_exa_key():
     assert config.saved is True
 
 
-@pytest.mark.asyncio
 async def test_exa_search_maps_results(monkeypatch):
     async def fake_exa_search(provider_settings, payload):
         assert provider_settings["websearch_exa_key"] == ["exa-key"]
@@ -645,7 +630,6 @@ async def test_exa_search_maps_results(monkeypatch):
     assert parsed["results"][0]["snippet"] == "AI Agent Assistant"
 
 
-@pytest.mark.asyncio
 async def test_exa_search_raw_api_call(monkeypatch):
     session = _FakeFirecrawlSession(
         _FakeFirecrawlResponse(
@@ -682,7 +666,6 @@ async def test_exa_search_raw_api_call(monkeypatch):
     ]
 
 
-@pytest.mark.asyncio
 async def test_exa_search_raises_on_http_error(monkeypatch):
     session = _FakeFirecrawlSession(
         _FakeFirecrawlResponse(status=401, text_data="Unauthorized")
@@ -704,7 +687,6 @@ async def test_exa_search_raises_on_http_error(monkeypatch):
         )
 
 
-@pytest.mark.asyncio
 async def test_exa_get_contents_returns_text(monkeypatch):
     async def fake_exa_get_contents(provider_settings, payload):
         assert provider_settings["websearch_exa_key"] == ["exa-key"]
@@ -720,7 +702,6 @@ async def test_exa_get_contents_returns_text(monkeypatch):
     assert result == "URL: https://example.com\nContent: # Example Content"
 
 
-@pytest.mark.asyncio
 async def test_exa_get_contents_raises_on_http_error(monkeypatch):
     session = _FakeFirecrawlSession(
         _FakeFirecrawlResponse(status=403, text_data="Forbidden")
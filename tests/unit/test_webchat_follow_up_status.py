@@ -1,4 +1,3 @@
-import pytest
 
 from astrbot.core.platform.astrbot_message import AstrBotMessage, MessageMember
 from astrbot.core.platform.message_type import MessageType
@@ -32,7 +31,6 @@ def _event(message_id: str) -> WebChatMessageEvent:
     )
 
 
-@pytest.mark.asyncio
 async def test_webchat_run_started_is_emitted_by_default():
     event = _event("default-request")
     queue = webchat_queue_mgr.get_or_create_back_queue("default-request")
@@ -58,7 +56,6 @@ async def test_webchat_run_started_is_emitted_by_default():
         webchat_queue_mgr.remove_back_queue("default-request")
 
 
-@pytest.mark.asyncio
 async def test_webchat_follow_up_captured_is_emitted_by_default():
     event = _event("follow-up-request")
     queue = webchat_queue_mgr.get_or_create_back_queue("follow-up-request")
@@ -1,8 +1,6 @@
 import asyncio
 from types import SimpleNamespace
 
-import pytest
-
 from astrbot.api.event import MessageChain
 from astrbot.api.message_components import File
 from astrbot.core.platform.sources.webchat import webchat_event
@@ -12,7 +10,6 @@ from astrbot.core.platform.sources.webchat.message_parts_helper import (
 )
 
 
-@pytest.mark.asyncio
 async def test_webchat_file_send_keeps_original_filename(tmp_path, monkeypatch):
     """WebChat file payloads should carry both stored and display filenames."""
     queue = asyncio.Queue()
@@ -47,7 +44,6 @@ async def test_webchat_file_send_keeps_original_filename(tmp_path, monkeypatch):
     assert (attachments_dir / stored_name).exists()
 
 
-@pytest.mark.asyncio
 async def test_attachment_part_uses_display_filename_with_stored_filename(tmp_path):
     """Attachment parts should show the display name while keeping the stored name."""
     stored_file = tmp_path / "uuid.txt"
@@ -77,7 +73,6 @@ async def test_attachment_part_uses_display_filename_with_stored_filename(tmp_pa
     }
 
 
-@pytest.mark.asyncio
 async def test_build_webchat_message_parts_preserves_payload_filename(tmp_path):
     """Attachment lookup should not overwrite the payload filename with disk name."""
     stored_file = tmp_path / "uuid.txt"
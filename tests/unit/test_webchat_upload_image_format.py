@@ -1,13 +1,11 @@
 from io import BytesIO
 from types import SimpleNamespace
 
-import pytest
 from PIL import Image as PILImage
 
 from astrbot.dashboard.services.chat_service import ChatService
 
 
-@pytest.mark.asyncio
 async def test_webchat_upload_uses_detected_image_type(tmp_path):
     image_buffer = BytesIO()
     PILImage.new("RGB", (2, 2), (255, 0, 0)).save(image_buffer, format="JPEG")